@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Benchmark the retained-memory footprint of PageArtifact records.
+
+Builds the same synthetic pages twice — once with ``__dict__``-based copies
+of the model classes and plain (non-interned) strings, once with the slotted
+classes from :mod:`crawlit.models.page_artifact` and interned strings — and
+reports the traced allocation per page.  Page HTML is left out so the
+numbers show the per-record overhead that dominates crawls retaining
+millions of metadata-only artifacts.
+
+It then crawls a synthetic site (no network) with and without a pipeline
+stage and reports what the crawler retains per page — artifacts plus
+``get_results()`` records — and whether each record still shares its
+``links`` list with the artifact.
+
+    python benchmarks/bench_artifact_memory.py [--pages 20000] [--crawl-pages 2000]
+"""
+
+import argparse
+import dataclasses
+import gc
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crawlit import Crawler  # noqa: E402
+from crawlit.interfaces import Fetcher, FetchResult, Pipeline  # noqa: E402
+from crawlit.models import page_artifact  # noqa: E402
+from crawlit.models.page_artifact import intern_headers  # noqa: E402
+
+_CLASSES = ("HTTPInfo", "ContentInfo", "ArtifactSource", "CrawlMeta", "DownloadRecord",
+            "CrawlError", "PageArtifact")
+
+
+def _dict_based(cls):
+    """Re-declare *cls* as a regular dataclass (with __dict__, no interning)."""
+    fields = [(f.name, f.type, dataclasses.field(default=f.default, default_factory=f.default_factory))
+              for f in dataclasses.fields(cls)]
+    return dataclasses.make_dataclass(cls.__name__ + "Dict", fields)
+
+
+LEGACY = {name: _dict_based(getattr(page_artifact, name)) for name in _CLASSES}
+SLOTTED = {name: getattr(page_artifact, name) for name in _CLASSES}
+
+
+def _fresh(text: str) -> str:
+    # A new string object per page, as produced by parsing each response
+    return "".join(list(text))
+
+
+def make_page(models, i: int, intern: bool):
+    headers = {_fresh(name): _fresh(value) for name, value in (
+        ("Content-Type", "text/html; charset=utf-8"),
+        ("Server", "nginx"),
+        ("Cache-Control", "max-age=600"),
+        ("Date", f"Mon, 01 Jan 2024 00:{i % 60:02d}:00 GMT"),
+        ("ETag", f'"{i:x}"'),
+    )}
+    if intern:
+        headers = intern_headers(headers)
+    return models["PageArtifact"](
+        url=f"https://example.com/page/{i}",
+        fetched_at=datetime.now(timezone.utc),
+        http=models["HTTPInfo"](status=200, headers=headers,
+                                content_type=_fresh("text/html; charset=utf-8"),
+                                etag=headers["ETag"], elapsed_ms=12.5),
+        content=models["ContentInfo"](size_bytes=4096),
+        source=models["ArtifactSource"](type=_fresh("html_link"), site=_fresh("example.com")),
+        crawl=models["CrawlMeta"](depth=2, discovered_from="https://example.com/",
+                                  discovery_method=_fresh("link"),
+                                  run_id=_fresh("6f1c2a8e-0d4b-4e61-9c5a-3b7f2d1e8a90")),
+        errors=[models["CrawlError"](code=_fresh("EXTRACTOR_ERROR"), message="boom",
+                                     source=_fresh("tables"))],
+    )
+
+
+def measure(label: str, models, pages: int, intern: bool) -> float:
+    gc.collect()
+    tracemalloc.start()
+    retained = [make_page(models, i, intern) for i in range(pages)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_page = current / pages
+    print(f"{label:<34} {per_page:8.0f} B/page {current / 1e6:8.1f} MB total")
+    del retained
+    return per_page
+
+
+class SiteFetcher(Fetcher):
+    """Serve a hub page linking to *pages* - 1 leaves, each with a few links."""
+
+    def __init__(self, pages: int):
+        self.pages = pages
+
+    def fetch(self, url, headers=None):
+        if url == "https://example.com/":
+            body = "".join(f'<a href="/page/{i}">{i}</a>' for i in range(1, self.pages))
+        else:
+            body = "".join(f'<a href="https://other.example/{url[-4:]}/{j}">x</a>' for j in range(8))
+        return FetchResult(success=True, url=url, status_code=200, content_type="text/html",
+                           headers={"Content-Type": "text/html"},
+                           text=f"<html><head><title>{url}</title></head><body>{body}</body></html>")
+
+
+class TagLinks(Pipeline):
+    """Touch every artifact's links in place, as enriching pipelines do."""
+
+    def process(self, artifact):
+        artifact.links.append(artifact.url + "#seen")
+        return artifact
+
+
+def measure_crawl(label: str, pages: int, pipelines) -> float:
+    gc.collect()
+    tracemalloc.start()
+    crawler = Crawler("https://example.com/", max_depth=1, respect_robots=False, delay=0,
+                      internal_only=False, fetcher=SiteFetcher(pages), pipelines=pipelines,
+                      store_html_content=False)
+    crawler.crawl()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    shared = all(crawler.results[url]["links"] is artifact.links
+                 for url, artifact in crawler.artifacts.items())
+    per_page = current / pages
+    print(f"{label:<34} {per_page:8.0f} B/page {current / 1e6:8.1f} MB total"
+          f"   links shared: {'yes' if shared else 'NO'}")
+    return per_page
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=20000)
+    parser.add_argument("--crawl-pages", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{args.pages} pages, Python {sys.version.split()[0]} "
+          f"(slotted models: {'yes' if page_artifact.SLOTTED else 'no'})\n")
+    base = measure("dict-based, no interning", LEGACY, args.pages, intern=False)
+    measure("dict-based, interned strings", LEGACY, args.pages, intern=True)
+    slotted = measure("slotted, interned strings", SLOTTED, args.pages, intern=True)
+    print(f"\nsaving: {100 * (1 - slotted / base):.0f}% per page")
+
+    print(f"\ncrawl of {args.crawl_pages} pages (artifacts and results retained)\n")
+    measure_crawl("crawl, no pipeline", args.crawl_pages, [])
+    measure_crawl("crawl, one pipeline", args.crawl_pages, [TagLinks()])
+
+
+if __name__ == "__main__":
+    main()
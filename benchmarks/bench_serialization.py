@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark PageArtifact JSON serialisation.
+
+Compares the previous path (``dataclasses.asdict`` + a conversion walk +
+``json.dumps``) with :class:`crawlit.models.ArtifactSerializer` on large
+synthetic pages.
+
+    python benchmarks/bench_serialization.py [--pages 200] [--html-kb 512]
+"""
+
+import argparse
+import dataclasses
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crawlit.models import ArtifactSerializer, ContentInfo, HTTPInfo, PageArtifact  # noqa: E402
+from crawlit.models.serialization import BACKENDS, _MSGSPEC_AVAILABLE, _ORJSON_AVAILABLE  # noqa: E402
+
+
+def legacy_dumps(artifact: PageArtifact) -> bytes:
+    """The pre-serializer path used by JSONLWriter / ArtifactStore."""
+
+    def _convert(obj):
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            return {k: _convert(v) for k, v in dataclasses.asdict(obj).items()}
+        if isinstance(obj, list):
+            return [_convert(i) for i in obj]
+        if isinstance(obj, dict):
+            return {k: _convert(v) for k, v in obj.items()}
+        return obj
+
+    data = _convert(dataclasses.asdict(artifact))
+    return json.dumps(data, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def make_artifact(i: int, html_kb: int) -> PageArtifact:
+    row = "<tr>" + "<td>cell value</td>" * 8 + "</tr>\n"
+    html = "<html><body><table>" + row * (html_kb * 1024 // len(row)) + "</table></body></html>"
+    return PageArtifact(
+        url=f"https://example.com/page/{i}",
+        fetched_at=datetime.now(timezone.utc),
+        http=HTTPInfo(status=200, content_type="text/html; charset=utf-8",
+                      headers={f"X-Header-{n}": "value" for n in range(20)}),
+        content=ContentInfo(raw_html=html, size_bytes=len(html),
+                            blob_path=f"blobs/html/{i:02x}/{i:064x}.html"),
+        links=[f"https://example.com/page/{i}/{n}" for n in range(300)],
+        extracted={
+            "title": f"Page {i}",
+            "tables": [[["cell value"] * 8 for _ in range(50)] for _ in range(5)],
+            "headings": {"h1": ["Heading"], "h2": [f"Section {n}" for n in range(30)]},
+            "published": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        },
+    )
+
+
+def measure(label: str, func, artifacts) -> None:
+    start = time.perf_counter()
+    total = 0
+    for artifact in artifacts:
+        total += len(func(artifact))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed * 1000 / len(artifacts):8.3f} ms/page "
+          f"{total / elapsed / 1e6:9.1f} MB/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--html-kb", type=int, default=512)
+    args = parser.parse_args()
+
+    artifacts = [make_artifact(i, args.html_kb) for i in range(args.pages)]
+    print(f"{args.pages} pages, ~{args.html_kb} KiB HTML each "
+          f"(orjson={'yes' if _ORJSON_AVAILABLE else 'no'}, "
+          f"msgspec={'yes' if _MSGSPEC_AVAILABLE else 'no'})\n")
+
+    measure("legacy asdict + json.dumps", legacy_dumps, artifacts)
+    for backend in BACKENDS[1:]:
+        try:
+            serializer = ArtifactSerializer(backend=backend)
+        except ImportError:
+            continue
+        measure(f"ArtifactSerializer[{backend}]", serializer.dumps, artifacts)
+        projected = ArtifactSerializer(backend=backend, skip_blob_html=True)
+        measure(f"  + skip_blob_html", projected.dumps, artifacts)
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,9 @@ from crawlit.models import (
     ERROR_CODES,
     CrawlError,
     CrawlJob,
+    ArtifactSerializer,
+    ArtifactJournal,
+    ResultView,
 )
 
 # Export composable config (v1.1+)
@@ -26,18 +29,21 @@ from crawlit.config import CrawlerConfig, FetchConfig, RateLimitConfig, OutputCo
 
 # Export plugin interfaces (v1.2+)
 from crawlit.interfaces import (
-    Extractor, AsyncExtractor, Pipeline, AsyncPipeline,
+    Extractor, AsyncExtractor, Pipeline, AsyncPipeline, BatchPipeline, AsyncBatchPipeline,
     FetchRequest, FetchResult, Fetcher, AsyncFetcher,
 )
 
 # Export default fetcher implementations (v1.1+)
-from crawlit.fetchers import DefaultFetcher, DefaultAsyncFetcher
+from crawlit.fetchers import DefaultFetcher, DefaultAsyncFetcher, WARCFetcher, AsyncWARCFetcher
 
 # Export content-type router (v1.2+)
 from crawlit.content_router import ContentRouter
 
 # Export built-in pipelines (v1.2+)
-from crawlit.pipelines import JSONLWriter, BlobStore, EdgesWriter, ArtifactStore
+from crawlit.pipelines import (
+    JSONLWriter, BlobStore, PackedBlobStore, EdgesWriter, ArtifactStore, WARCWriter,
+    DatabasePipeline,
+)
 
 # Export cross-run deduplication store (v1.2+)
 from crawlit.utils.content_hash_store import ContentHashStore
@@ -46,7 +52,7 @@ from crawlit.utils.content_hash_store import ContentHashStore
 from crawlit.utils.event_log import (
     CrawlEventLog,
     EVENT_TYPES,
-    CRAWL_START, CRAWL_END,
+    CRAWL_START, CRAWL_RESUME, CRAWL_END,
     FETCH_RETRY, FETCH_ERROR,
     ROBOTS_REJECT,
     PIPELINE_DROP, PIPELINE_ERROR,
@@ -58,7 +64,7 @@ from crawlit.utils.event_log import (
 # Export core functionality
 from crawlit.crawler.engine import Crawler
 from crawlit.crawler.async_engine import AsyncCrawler
-from crawlit.output.formatters import save_results, generate_summary_report
+from crawlit.output.formatters import save_results, generate_summary_report, open_sink, ResultSink
 
 # Export fetcher functionality
 from crawlit.crawler.fetcher import fetch_url, fetch_page
@@ -70,7 +76,7 @@ from crawlit.extractors.image_extractor import ImageTagParser
 from crawlit.extractors.keyword_extractor import KeywordExtractor
 from crawlit.extractors.forms import FormExtractor, Form, FormField, extract_forms
 from crawlit.extractors.structured_data import StructuredDataExtractor, StructuredData, extract_structured_data
-from crawlit.extractors.language import LanguageDetector, LanguageDetection, detect_language
+from crawlit.extractors.language import LanguageDetector, LanguageDetection, detect_language, detect_languages
 from crawlit.extractors.pdf_extractor import PDFExtractor, extract_pdf_text, is_pdf_available
 from crawlit.extractors.js_embedded_data import JSEmbeddedDataExtractor, extract_js_embedded_data
 
@@ -86,6 +92,10 @@ from crawlit.utils import (
     QueueManager,
     PageCache,
     CrawlResume,
+    CheckpointWriter,
+    PeriodicCheckpointer,
+    load_checkpoint,
+    read_checkpoint_info,
     StorageManager,
     SitemapParser,
     get_sitemaps_from_robots,
@@ -95,6 +105,7 @@ from crawlit.utils import (
     DynamicRateLimiter,
     AsyncDynamicRateLimiter,
     ContentDeduplicator,
+    PrefetchDeduplicator,
     BudgetTracker,
     AsyncBudgetTracker,
     BudgetLimits,
@@ -195,7 +206,9 @@ from crawlit.security import (
     detect_honeypots,
     CaptchaDetector,
     CaptchaType,
-    detect_captcha
+    detect_captcha,
+    SecurityScanner,
+    scan_security
 )
 
 # CLI functionality (but not executed on import)
@@ -217,6 +230,9 @@ __all__ = [
     'DownloadRecord',
     'CrawlMeta',
     'ArtifactSource',
+    'ArtifactSerializer',  # Fast artifact → JSON bytes with field projection
+    'ArtifactJournal',  # Copy-on-write undo log used between pipeline stages
+    'ResultView',  # Legacy get_results() record backed by a PageArtifact
     # Composable config (v1.1+)
     'CrawlerConfig',
     'FetchConfig',
@@ -227,6 +243,8 @@ __all__ = [
     'AsyncExtractor',
     'Pipeline',
     'AsyncPipeline',
+    'BatchPipeline',       # Pipeline handed micro-batches of artifacts
+    'AsyncBatchPipeline',
     'FetchRequest',
     'FetchResult',
     'Fetcher',
@@ -234,19 +252,24 @@ __all__ = [
     # Default fetcher implementations (v1.1+)
     'DefaultFetcher',
     'DefaultAsyncFetcher',
+    'WARCFetcher',       # Replay archived WARC responses
+    'AsyncWARCFetcher',
     # Content-type router (v1.2+)
     'ContentRouter',
     # Built-in pipelines (v1.2+)
     'JSONLWriter',
     'BlobStore',
+    'PackedBlobStore',   # Compressed segment-file blob backend
     'EdgesWriter',
     'ArtifactStore',
+    'WARCWriter',        # Archive responses as rotating WARC files
+    'DatabasePipeline',  # Batched database writes during the crawl
     # Cross-run deduplication (v1.2+)
     'ContentHashStore',
     # Operational event log (v1.3+)
     'CrawlEventLog',
     'EVENT_TYPES',
-    'CRAWL_START', 'CRAWL_END',
+    'CRAWL_START', 'CRAWL_RESUME', 'CRAWL_END',
     'FETCH_RETRY', 'FETCH_ERROR',
     'ROBOTS_REJECT',
     'PIPELINE_DROP', 'PIPELINE_ERROR',
@@ -265,6 +288,8 @@ __all__ = [
     'is_async_context',  # Context detection
     'save_results',      # Output formatters 
     'generate_summary_report',
+    'open_sink',         # Streaming result sinks
+    'ResultSink',
     'cli_main',          # CLI entry point
     
     # Data extraction modules (v0.2.0+)
@@ -284,6 +309,7 @@ __all__ = [
     'LanguageDetector',  # Language detection (NEW)
     'LanguageDetection', # Language detection result
     'detect_language',   # Convenience function
+    'detect_languages',  # Batch language detection
     'PDFExtractor',      # PDF text extraction (NEW)
     'extract_pdf_text',  # Convenience function
     'is_pdf_available',  # Check PDF support
@@ -298,6 +324,10 @@ __all__ = [
     'QueueManager',      # Queue management
     'PageCache',         # Page caching
     'CrawlResume',       # Crawl resume utilities
+    'CheckpointWriter',  # Binary crawl checkpoints with incremental deltas
+    'PeriodicCheckpointer',  # Background-thread checkpointing of a running crawl
+    'load_checkpoint',   # Restore state from a binary checkpoint
+    'read_checkpoint_info',  # Checkpoint header (counts, metadata) only
     'StorageManager',    # HTML content storage management
     'SitemapParser',     # Sitemap parsing
     'get_sitemaps_from_robots',  # Extract sitemaps from robots.txt
@@ -307,6 +337,7 @@ __all__ = [
     'DynamicRateLimiter',  # Dynamic rate limiting (sync)
     'AsyncDynamicRateLimiter',  # Dynamic rate limiting (async)
     'ContentDeduplicator',  # Content-based deduplication
+    'PrefetchDeduplicator',  # Skip likely duplicates before fetching
     'BudgetTracker',     # Crawl budget tracking (sync)
     'AsyncBudgetTracker',  # Crawl budget tracking (async)
     'BudgetLimits',      # Budget limits configuration
@@ -376,6 +407,8 @@ __all__ = [
     'CaptchaDetector',      # Detect CAPTCHA challenges
     'CaptchaType',          # CAPTCHA type enum
     'detect_captcha',       # Convenience function
+    'SecurityScanner',      # Single-pass CAPTCHA/WAF/honeypot/CSRF scan
+    'scan_security',        # Convenience function
     
     # Distributed crawling (only available when crawlit[distributed] is installed)
     # Check _DISTRIBUTED_AVAILABLE before using these.
@@ -73,6 +73,7 @@ class OutputConfig:
     # Blob store  (raw HTML / PDF files by content-hash)
     write_blobs: bool = False
     blobs_dir: Optional[str] = None
+    packed_blobs: bool = False  # compressed segment files instead of one file per hash
 
     # Navigation edge stream  (from_url → to_url)
     write_edges: bool = False
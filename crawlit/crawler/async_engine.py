@@ -4,16 +4,19 @@ async_engine.py - Asynchronous crawler engine
 """
 
 import asyncio
+import functools
 import inspect
 import logging
 import re
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from urllib.parse import urlparse, urljoin
-from typing import List, Dict, Set, Optional, Any
+from typing import Iterable, List, Dict, Set, Optional, Any, Tuple
 import time
+import aiohttp
 
-from .async_fetcher import fetch_page_async as async_fetch_page
+from .async_fetcher import fetch_page_async as async_fetch_page, ResponseLike
 from .parser import extract_links
 from .robots import AsyncRobotsHandler
 
@@ -32,7 +35,19 @@ from ..utils.progress import ProgressTracker
 from ..utils.url_filter import URLFilter
 from ..utils.session_manager import SessionManager
 from ..utils.queue_manager import QueueManager
-from ..utils.cache import PageCache, CrawlResume
+from ..utils.checkpoint import CheckpointWriter, PeriodicCheckpointer
+from .stages import (
+    DEFAULT_PIPELINE_BATCH_LATENCY_MS,
+    DEFAULT_PIPELINE_BATCH_SIZE,
+    MicroBatcher,
+    Stage,
+    batch_results,
+    classify_stage,
+    classify_stages,
+    make_batchers,
+    next_deadline,
+)
+from ..utils.cache import PageCache, CrawlResume, OFFLINE_CACHE_MISS
 from ..utils.storage import StorageManager
 from ..utils.sitemap import SitemapParser, get_sitemaps_from_robots_async
 from ..utils.rate_limiter import AsyncRateLimiter
@@ -40,8 +55,10 @@ from ..utils.deduplication import ContentDeduplicator
 from ..utils.budget_tracker import AsyncBudgetTracker
 from ..models.page_artifact import (
     PageArtifact, HTTPInfo, ContentInfo, CrawlMeta, DownloadRecord,
-    CrawlJob, CrawlError, ArtifactSource,
+    CrawlJob, CrawlError, ArtifactSource, intern_headers,
 )
+from ..models.journal import ArtifactJournal, journaled
+from ..models.result_view import CONTENT_RESULT_KEYS, ResultView
 
 logger = logging.getLogger(__name__)
 
@@ -109,12 +126,27 @@ class AsyncCrawler:
         fetcher: Optional[Any] = None,
         # --- Incremental crawling ---
         incremental: Optional[Any] = None,
+        # --- Pre-fetch deduplication ---
+        prefetch_deduplicator: Optional[Any] = None,
+        # --- Offline replay ---
+        offline: bool = False,
         # --- Crawl job metadata ---
         run_id: Optional[str] = None,
         # --- Operational event log ---
         event_log: Optional[Any] = None,
         # --- Memory management ---
         retain_artifacts: bool = True,
+        retain_results: bool = True,
+        # --- Streaming result output ---
+        result_sinks: Optional[List[Any]] = None,
+        # --- Periodic checkpointing ---
+        checkpoint_path: Optional[str] = None,
+        checkpoint_interval: Optional[float] = 60.0,
+        checkpoint_every_pages: Optional[int] = None,
+        # --- Plugin execution ---
+        pipeline_batch_size: int = DEFAULT_PIPELINE_BATCH_SIZE,
+        pipeline_batch_latency_ms: Optional[float] = DEFAULT_PIPELINE_BATCH_LATENCY_MS,
+        plugin_workers: int = 1,
     ):
         """Initialize the crawler with given parameters.
         
@@ -159,6 +191,7 @@ class AsyncCrawler:
         # Queue management
         self.max_queue_size: Optional[int] = max_queue_size
         self._paused: bool = False
+        self._checkpoint_writer: Optional[CheckpointWriter] = None  # reused by save_state()
 
         # Request parameters
         self.user_agent = user_agent
@@ -363,6 +396,61 @@ class AsyncCrawler:
         self.retain_artifacts: bool = retain_artifacts
         self.artifacts: Dict[str, PageArtifact] = {}
 
+        # Result sinks (crawlit.output.ResultSink): each URL's legacy result
+        # record is written to every sink as soon as the URL is processed.
+        # With retain_results=False the record is then dropped from
+        # self.results, so a crawl streaming its output to a sink runs in
+        # constant memory.
+        self.result_sinks: List[Any] = list(result_sinks or [])
+        self.retain_results: bool = retain_results
+
+        # Periodic checkpointing (crawlit.utils.checkpoint): while the crawl
+        # runs, a background thread writes the queue, visited set and
+        # finished results to checkpoint_path every checkpoint_interval
+        # seconds and/or checkpoint_every_pages pages.  The state is copied
+        # on the event loop; URLs being processed are tracked in _in_flight
+        # so that a checkpoint re-queues them instead of recording them as
+        # visited.
+        self.checkpoint_path: Optional[str] = checkpoint_path
+        self._in_flight: Dict[str, int] = {}
+        self._checkpoint_pending: Dict[str, Any] = {}
+        self._checkpoint_visited: List[str] = []
+        # Set by resume_from(): crawl() continues the restored queue instead
+        # of seeding a new crawl
+        self._resumed = False
+        self._resumed_from: Optional[str] = None
+        self._checkpoint_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._checkpointer: Optional[PeriodicCheckpointer] = None
+        if checkpoint_path:
+            self._checkpointer = PeriodicCheckpointer(
+                CheckpointWriter(checkpoint_path),
+                self._checkpoint_snapshot,
+                interval=checkpoint_interval,
+                every_pages=checkpoint_every_pages,
+            )
+
+        # Plugin execution (crawlit.crawler.stages): extractors and pipelines
+        # are classified as sync/async/batch-capable once per crawl by
+        # _register_plugins().  Sync pipeline stages block on I/O, so they
+        # run in a dedicated executor of plugin_workers threads; the default
+        # of one thread calls them one at a time and in order, as before.
+        # Batch-capable pipelines (process_batch) are handed
+        # pipeline_batch_size artifacts per call, or fewer once the oldest
+        # has waited pipeline_batch_latency_ms (the _batch_timer task), unless
+        # they set their own batch_size / max_latency_ms.
+        if plugin_workers < 1:
+            raise ValueError(f"plugin_workers must be >= 1, got {plugin_workers}")
+        self.pipeline_batch_size: int = pipeline_batch_size
+        self.pipeline_batch_latency_ms: Optional[float] = pipeline_batch_latency_ms
+        self.plugin_workers: int = plugin_workers
+        self._plugin_executor: Optional[ThreadPoolExecutor] = None
+        self._extractor_stages: List[Stage] = []
+        self._pipeline_stages: List[Stage] = []
+        self._batchers: Dict[int, MicroBatcher] = {}
+        self._batch_locks: Dict[int, asyncio.Lock] = {}
+        self._batch_timer: Optional[asyncio.Task] = None
+        self._batch_wake: Optional[asyncio.Event] = None
+
         # Discovery metadata (populated when enqueuing, consumed in _process_url)
         self._discovered_from: Dict[str, str] = {}
         self._discovery_method: Dict[str, str] = {}
@@ -375,6 +463,23 @@ class AsyncCrawler:
         if self.incremental:
             logger.info("Incremental crawling enabled")
 
+        # --- Pre-fetch deduplication (skip likely duplicates before fetching) ---
+        self.prefetch_deduplicator: Optional[Any] = prefetch_deduplicator
+        if self.prefetch_deduplicator is not None and self.prefetch_deduplicator.enabled:
+            logger.info("Pre-fetch deduplication enabled")
+
+        # --- Offline replay (every page is served from page_cache) ---
+        self.offline: bool = offline
+        if self.offline:
+            if self.page_cache is None:
+                raise ValueError("offline=True requires a page_cache to replay from")
+            # Nothing may touch the network in replay mode
+            self.respect_robots = False
+            self.robots_handler = None
+            self.use_sitemap = False
+            self.sitemap_parser = None
+            logger.info("Offline replay enabled: pages are served from the page cache only")
+
         # --- Crawl job / run metadata ---
         self.job = CrawlJob(
             run_id=run_id or __import__("uuid").uuid4().hex,
@@ -393,6 +498,31 @@ class AsyncCrawler:
             logger.info(f"Registered extractors: {[e.name for e in self.extractors]}")
         if self.pipelines:
             logger.info(f"Registered pipelines: {[type(p).__name__ for p in self.pipelines]}")
+        self._register_plugins()
+
+    def _register_plugins(self) -> None:
+        """Classify the extractors, pipelines and fetcher (sync, async, batched) once.
+
+        Called again at the start of every :meth:`crawl`, so plugins added to
+        ``self.extractors`` / ``self.pipelines`` after construction are picked up.
+        """
+        self._extractor_stages = classify_stages(self.extractors, "extract")
+        self._pipeline_stages = classify_stages(
+            self.pipelines, "process",
+            batch_size=self.pipeline_batch_size,
+            max_latency_ms=self.pipeline_batch_latency_ms,
+        )
+        self._fetcher_stage = classify_stage(self.fetcher, "fetch") if self.fetcher is not None else None
+        self._batchers = make_batchers(self._pipeline_stages)
+        self._batch_locks = {}
+
+    def _get_plugin_executor(self) -> ThreadPoolExecutor:
+        """Return the executor that runs sync pipeline stages, creating it on first use."""
+        if self._plugin_executor is None:
+            self._plugin_executor = ThreadPoolExecutor(
+                max_workers=self.plugin_workers, thread_name_prefix="crawlit-plugin"
+            )
+        return self._plugin_executor
 
     def _apply_config(self, config: Any) -> None:
         """Apply CrawlerConfig fields to override current instance settings."""
@@ -428,8 +558,12 @@ class AsyncCrawler:
                 from ..pipelines.jsonl_writer import JSONLWriter
                 self.pipelines.append(JSONLWriter(out.jsonl_path))
             if getattr(out, "write_blobs", False) and getattr(out, "blobs_dir", None):
-                from ..pipelines.blob_store import BlobStore
-                self.pipelines.append(BlobStore(out.blobs_dir))
+                if getattr(out, "packed_blobs", False):
+                    from ..pipelines.packed_blob_store import PackedBlobStore
+                    self.pipelines.append(PackedBlobStore(out.blobs_dir))
+                else:
+                    from ..pipelines.blob_store import BlobStore
+                    self.pipelines.append(BlobStore(out.blobs_dir))
             if getattr(out, "write_edges", False) and getattr(out, "edges_path", None):
                 from ..pipelines.edges_writer import EdgesWriter
                 self.pipelines.append(EdgesWriter(out.edges_path))
@@ -451,18 +585,32 @@ class AsyncCrawler:
         """Start the asynchronous crawling process"""
         # Record job start time
         self.job.started_at = datetime.now(timezone.utc)
+        self._register_plugins()
 
-        # Emit CRAWL_START event
+        # Emit CRAWL_START event (CRAWL_RESUME when continuing a saved crawl)
         if self.event_log is not None:
-            self.event_log.crawl_start(
-                seed_urls=self.job.seed_urls,
-                max_depth=self.max_depth,
-                run_id=self.job.run_id,
-            )
+            if self._resumed:
+                self.event_log.crawl_resume(
+                    source=self._resumed_from,
+                    visited=len(self.visited_urls),
+                    run_id=self.job.run_id,
+                )
+            else:
+                self.event_log.crawl_start(
+                    seed_urls=self.job.seed_urls,
+                    max_depth=self.max_depth,
+                    run_id=self.job.run_id,
+                )
 
         # Reset queue and semaphore at the start of each crawl so that
         # crawl() can safely be called more than once on the same instance.
+        # URLs restored by load_state() are carried over.
+        restored = []
+        while not self.queue.empty():
+            restored.append(self.queue.get_nowait())
         self.queue = asyncio.Queue()
+        for item in restored:
+            self.queue.put_nowait(item)
         self.semaphore = asyncio.Semaphore(self.max_concurrent_requests)
 
         # Start progress tracker if provided
@@ -472,28 +620,48 @@ class AsyncCrawler:
         # Get async session from session manager
         session = await self.session_manager.get_async_session()
 
-        # Discover and parse sitemaps if enabled
-        if self.use_sitemap and self.sitemap_parser:
-            await self._discover_sitemaps(session)
-
-        # Add the starting URL to the queue with depth 0
-        await self.queue.put((self.start_url, 0))
-
-        # Create worker tasks using the running loop's create_task
-        workers = []
-        for _ in range(self.max_concurrent_requests):
-            task = asyncio.create_task(self._worker())
-            workers.append(task)
-        
-        # Wait until the queue is empty
-        await self.queue.join()
-        
-        # Cancel all worker tasks
-        for worker in workers:
-            worker.cancel()
-        
-        # Wait for all worker tasks to be cancelled
-        await asyncio.gather(*workers, return_exceptions=True)
+        # A resumed crawl's seeds and sitemap URLs are already in the
+        # restored queue or visited set
+        if not self._resumed:
+            # Discover and parse sitemaps if enabled
+            if self.use_sitemap and self.sitemap_parser:
+                await self._discover_sitemaps(session)
+
+            # Add the starting URL to the queue with depth 0
+            await self.queue.put((self.start_url, 0))
+
+        if self._checkpointer is not None:
+            self._checkpoint_loop = asyncio.get_running_loop()
+            self._checkpointer.start()
+        if any(batcher.max_latency is not None for batcher in self._batchers.values()):
+            self._batch_wake = asyncio.Event()
+            self._batch_timer = asyncio.create_task(self._run_batch_timer())
+        try:
+            # Create worker tasks using the running loop's create_task
+            workers = []
+            for _ in range(self.max_concurrent_requests):
+                task = asyncio.create_task(self._worker())
+                workers.append(task)
+            
+            # Wait until the queue is empty
+            await self.queue.join()
+            
+            # Cancel all worker tasks
+            for worker in workers:
+                worker.cancel()
+            
+            # Wait for all worker tasks to be cancelled
+            await asyncio.gather(*workers, return_exceptions=True)
+        finally:
+            await self._stop_batch_timer()
+            try:
+                # Batched pages are processed, also when the crawl is interrupted
+                await self._flush_batches()
+            finally:
+                if self._checkpointer is not None:
+                    # Final checkpoint, also when the crawl is interrupted.  Stop
+                    # off the loop: the checkpoint thread needs it to copy state.
+                    await asyncio.get_running_loop().run_in_executor(None, self._checkpointer.stop)
         
         # Report skipped external URLs
         if self.skipped_external_urls and self.internal_only:
@@ -520,10 +688,24 @@ class AsyncCrawler:
         except Exception as e:
             logger.warning(f"Error closing async session: {e}")
 
+        # Persist canonical hints / learned URL rules for the next run
+        if self.prefetch_deduplicator is not None and self.prefetch_deduplicator.state_path:
+            try:
+                self.prefetch_deduplicator.save()
+            except Exception as e:
+                logger.warning(f"Could not save pre-fetch dedup state: {e}")
+
         # Emit CRAWL_END event
         if self.event_log is not None:
             self.event_log.crawl_end(pages_crawled=len(self.visited_urls))
 
+        try:
+            await self._flush_outputs()
+        finally:
+            if self._plugin_executor is not None:
+                self._plugin_executor.shutdown(wait=True)
+                self._plugin_executor = None
+
     async def _discover_sitemaps(self, session):
         """Discover and parse sitemaps to populate the queue asynchronously"""
         from ..utils.sitemap import get_sitemaps_from_robots_async
@@ -594,13 +776,6 @@ class AsyncCrawler:
             current_url, depth = await self.queue.get()
 
             try:
-                # Check budget before processing this URL
-                if self.budget_tracker:
-                    can_crawl, reason = await self.budget_tracker.can_crawl_page()
-                    if not can_crawl:
-                        logger.warning(f"Stopping crawl: {reason}")
-                        break
-
                 # Skip if we've already visited this URL
                 if current_url in self.visited_urls:
                     continue
@@ -609,11 +784,32 @@ class AsyncCrawler:
                 if depth > self.max_depth:
                     continue
 
-                # Mark as visited before processing to prevent duplicates
+                # Mark as visited before processing to prevent duplicates.
+                # Claim the URL before the first await so a checkpoint always
+                # finds it either queued or in flight.
                 self.visited_urls.add(current_url)
+                self._in_flight[current_url] = depth
 
-                # Process the URL
-                await self._process_url(current_url, depth)
+                # Check budget before processing this URL
+                if self.budget_tracker:
+                    can_crawl, reason = await self.budget_tracker.can_crawl_page()
+                    if not can_crawl:
+                        logger.warning(f"Stopping crawl: {reason}")
+                        # Not crawled: left in flight, so checkpoints keep it queued
+                        self.visited_urls.discard(current_url)
+                        break
+
+                # Process the URL.  A page interrupted by cancellation or
+                # KeyboardInterrupt stays in flight, so the final checkpoint
+                # queues it again instead of recording it as visited.
+                try:
+                    await self._process_url(current_url, depth)
+                except Exception:
+                    self._finish_page(current_url)
+                    self._emit_result(current_url)
+                    raise
+                self._finish_page(current_url)
+                self._emit_result(current_url)
 
             except Exception as e:
                 logger.error(f"Error processing {current_url}: {e}")
@@ -661,8 +857,9 @@ class AsyncCrawler:
             )
             _site = urlparse(url).netloc or None
 
-            # Build the PageArtifact early so extractors/pipelines always receive one
-            artifact = PageArtifact(
+            # Build the PageArtifact early so extractors/pipelines always receive one.
+            # Journaled containers let pipeline stages roll back without copying them.
+            artifact = journaled(PageArtifact(
                 url=url,
                 fetched_at=datetime.now(timezone.utc),
                 source=ArtifactSource(type=_source_type, site=_site),
@@ -672,18 +869,21 @@ class AsyncCrawler:
                     discovery_method=discovery_method,
                     run_id=self.job.run_id,
                 ),
+            ))
+
+            # Initialize the legacy result view for this URL; data that lives
+            # on the artifact is bound to it rather than copied
+            record = ResultView(
+                artifact,
+                depth=depth,
+                status=None,
+                headers=None,
+                links=[],
+                content_type=None,
+                error=None,
+                success=False,
             )
-
-            # Initialize result data for this URL
-            self.results[url] = {
-                'depth': depth,
-                'status': None,
-                'headers': None,
-                'links': [],
-                'content_type': None,
-                'error': None,
-                'success': False
-            }
+            self.results[url] = record
 
             # --- Incremental: get conditional headers (If-None-Match / If-Modified-Since) ---
             incremental_headers: Dict[str, str] = {}
@@ -695,27 +895,76 @@ class AsyncCrawler:
 
             # Get async session from session manager
             session = await self.session_manager.get_async_session()
+            request_headers = getattr(session, 'headers', None)
+
+            # --- Page cache: replay fresh entries without touching the network ---
+            cached_data = None
+            cache_validators: Dict[str, str] = {}
+            if self.page_cache:
+                cached_data = await self._cache_call(
+                    self.page_cache.get, url, request_headers, self.offline
+                )
+                if cached_data is None and not self.offline and self.page_cache.http_semantics:
+                    # Stale entry: revalidate it with a conditional request
+                    cache_validators = await self._cache_call(
+                        self.page_cache.get_conditional_headers, url, request_headers
+                    )
+                    if cache_validators:
+                        incremental_headers = {**incremental_headers, **cache_validators}
 
-            # Fetch the page asynchronously with session (capture wall-clock time)
-            _t0 = time.perf_counter()
-            success, response_or_error, status_code = await async_fetch_page(
-                url,
-                self.user_agent,
-                self.max_retries,
-                self.timeout,
-                session=session,
-                use_js_rendering=self.use_js_rendering,
-                js_renderer=self.js_renderer,
-                wait_for_selector=self.js_wait_for_selector,
-                wait_for_timeout=self.js_wait_for_timeout,
-                proxy=self.proxy,
-                proxy_manager=self.proxy_manager,
-                extra_headers=incremental_headers if incremental_headers else None,
-                on_retry=(
-                    self.event_log.fetch_retry if self.event_log is not None else None
-                ),
-            )
-            _elapsed_ms = (time.perf_counter() - _t0) * 1000
+            if cached_data is None and self.offline:
+                logger.info(f"Not in cache, skipped (offline replay): {url}")
+                artifact.add_error(CrawlError.fetch(OFFLINE_CACHE_MISS))
+                record['error'] = OFFLINE_CACHE_MISS
+                if self.progress_tracker:
+                    self.progress_tracker.record_url(url, False, links_found=0, depth=depth)
+                if self.retain_artifacts:
+                    self.artifacts[url] = artifact
+                return
+
+            if cached_data is not None:
+                logger.debug(f"Using cached data for {url}")
+                success, response_or_error, status_code = self._cached_response(url, cached_data)
+                _elapsed_ms = 0.0
+            else:
+                # --- Pre-fetch dedup: skip likely duplicates before downloading them ---
+                if self.prefetch_deduplicator is not None and await self._skip_prefetch_duplicate(url, depth, session):
+                    return
+
+                # Fetch the page asynchronously with session (capture wall-clock time)
+                _t0 = time.perf_counter()
+                if self.fetcher is not None:
+                    success, response_or_error, status_code = await self._fetch_with_plugin(
+                        url, incremental_headers
+                    )
+                else:
+                    success, response_or_error, status_code = await async_fetch_page(
+                        url,
+                        self.user_agent,
+                        self.max_retries,
+                        self.timeout,
+                        session=session,
+                        use_js_rendering=self.use_js_rendering,
+                        js_renderer=self.js_renderer,
+                        wait_for_selector=self.js_wait_for_selector,
+                        wait_for_timeout=self.js_wait_for_timeout,
+                        proxy=self.proxy,
+                        proxy_manager=self.proxy_manager,
+                        extra_headers=incremental_headers if incremental_headers else None,
+                        on_retry=(
+                            self.event_log.fetch_retry if self.event_log is not None else None
+                        ),
+                    )
+                _elapsed_ms = (time.perf_counter() - _t0) * 1000
+
+                # --- HTTP cache: 304 for a stale entry turns it back into a hit ---
+                if status_code == 304 and cache_validators:
+                    cached_data = await self._cache_call(self.page_cache.revalidate, url)
+                    if cached_data is not None:
+                        logger.debug(f"304 Not Modified for {url} — serving revalidated cache entry")
+                        if self.event_log is not None:
+                            self.event_log.incremental_hit(url)
+                        success, response_or_error, status_code = self._cached_response(url, cached_data)
 
             # --- Incremental: handle 304 Not Modified ---
             if status_code == 304:
@@ -724,7 +973,7 @@ class AsyncCrawler:
                 artifact.add_error(CrawlError.not_modified())
                 if self.event_log is not None:
                     self.event_log.incremental_hit(url)
-                self.results[url]['status'] = 304
+                record['status'] = 304
                 if self.retain_artifacts:
                     self.artifacts[url] = artifact
                 if self.incremental:
@@ -735,21 +984,20 @@ class AsyncCrawler:
                 return
 
             # Record the HTTP status code
-            self.results[url]['status'] = status_code
+            record['status'] = status_code
 
             # Update success flag based on fetch result
-            self.results[url]['success'] = success
+            record['success'] = success
             
             if success:
                 response = response_or_error
                 
-                # Store response headers
-                headers = dict(response.headers)
-                self.results[url]['headers'] = headers
-                self.results[url]['content_type'] = response.headers.get('Content-Type')
+                # Response headers, copied once and shared by the artifact,
+                # the result view and the page cache
+                headers = intern_headers(response.headers)
                 
                 # Record bytes downloaded for budget tracking
-                if self.budget_tracker:
+                if self.budget_tracker and cached_data is None:
                     # Try to get content length from header
                     content_length = headers.get('Content-Length')
                     if content_length:
@@ -778,10 +1026,9 @@ class AsyncCrawler:
                     pass
 
                 # Populate artifact HTTP info (with timing and size metrics)
-                headers_dict = dict(response.headers)
                 artifact.http = HTTPInfo(
                     status=status_code,
-                    headers=headers_dict,
+                    headers=headers,
                     content_type=response.headers.get('Content-Type'),
                     etag=response.headers.get('ETag'),
                     last_modified=response.headers.get('Last-Modified'),
@@ -789,6 +1036,8 @@ class AsyncCrawler:
                     elapsed_ms=round(_elapsed_ms, 2),
                     response_bytes=_response_bytes,
                 )
+                record.bind('headers')
+                record['content_type'] = artifact.http.content_type
 
                 try:
                     # Initialize links list for all URLs
@@ -803,60 +1052,61 @@ class AsyncCrawler:
                         html_content = await response.text()
 
                         # Check for duplicate content
-                        if self.content_deduplicator.enabled:
-                            if self.content_deduplicator.is_duplicate(html_content, url):
-                                logger.info(f"Skipping duplicate content at {url}")
-                                if self.event_log is not None:
-                                    import hashlib as _hl
-                                    _h = _hl.sha256(html_content.encode("utf-8", errors="replace")).hexdigest()[:16]
-                                    self.event_log.dedupe_hit(url, content_hash=_h)
-                                duplicate_urls = self.content_deduplicator.get_duplicate_urls(url)
-                                self.results[url]['duplicate'] = True
-                                if duplicate_urls:
-                                    self.results[url]['duplicate_of'] = list(duplicate_urls)
-
-                                # Still record progress but mark as duplicate
-                                if self.progress_tracker:
-                                    self.progress_tracker.record_url(
-                                        url,
-                                        True,
-                                        links_found=0,
-                                        depth=depth,
-                                        metadata={'duplicate': True}
-                                    )
-                                return  # Skip processing duplicate content
-
-                        # Store HTML content using storage manager
-                        stored_html = self.storage_manager.store_html(url, html_content)
-                        if stored_html is not None:
-                            self.results[url]['html_content'] = stored_html
+                        is_duplicate = (self.content_deduplicator.enabled
+                                        and self.content_deduplicator.is_duplicate(html_content, url))
+
+                        if self.prefetch_deduplicator is not None:
+                            # Audit skips with the same (normalised) hash the URL rules were learned from
+                            self.prefetch_deduplicator.record_fetch(
+                                url, headers, html_content,
+                                content_hash=self.content_deduplicator.get_content_hash(url),
+                            )
+
+                        if is_duplicate:
+                            logger.info(f"Skipping duplicate content at {url}")
+                            if self.event_log is not None:
+                                import hashlib as _hl
+                                _h = _hl.sha256(html_content.encode("utf-8", errors="replace")).hexdigest()[:16]
+                                self.event_log.dedupe_hit(url, content_hash=_h)
+                            duplicate_urls = self.content_deduplicator.get_duplicate_urls(url)
+                            if self.prefetch_deduplicator is not None and duplicate_urls:
+                                self.prefetch_deduplicator.record_duplicate(url, duplicate_urls)
+                            record['duplicate'] = True
+                            if duplicate_urls:
+                                record['duplicate_of'] = list(duplicate_urls)
+
+                            # Still record progress but mark as duplicate
+                            if self.progress_tracker:
+                                self.progress_tracker.record_url(
+                                    url,
+                                    True,
+                                    links_found=0,
+                                    depth=depth,
+                                    metadata={'duplicate': True}
+                                )
+                            return  # Skip processing duplicate content
 
                         # Populate artifact content
                         artifact.content = ContentInfo(raw_html=html_content)
 
+                        # Store HTML content using storage manager; in-memory
+                        # storage shares the artifact's string
+                        stored_html = self.storage_manager.store_html(url, html_content)
+                        if stored_html is html_content:
+                            record.bind('html_content')
+                        elif stored_html is not None:
+                            record['html_content'] = stored_html
+
                         # Use ContentExtractor to extract all page metadata (async version) if enabled
                         if self.content_extraction_enabled and self.content_extractor:
                             content_data = await self.content_extractor.extract_content_async(html_content, url, response)
 
-                            # Merge content extractor results with page results
-                            self.results[url].update({
-                                'title': content_data.get('title'),
-                                'meta_description': content_data.get('meta_description'),
-                                'meta_keywords': content_data.get('meta_keywords'),
-                                'canonical_url': content_data.get('canonical_url'),
-                                'language': content_data.get('language'),
-                                'headings': content_data.get('headings'),
-                                'images_with_context': content_data.get('images_with_context'),
-                                'page_type': content_data.get('page_type'),
-                                'last_modified': content_data.get('last_modified')
-                            })
-                            # Mirror into artifact
-                            for key in ('title', 'meta_description', 'meta_keywords',
-                                        'canonical_url', 'language', 'headings',
-                                        'images_with_context', 'page_type', 'last_modified'):
+                            # Store in the artifact; the result view shares the values
+                            for key in CONTENT_RESULT_KEYS:
                                 val = content_data.get(key)
                                 if val is not None:
                                     artifact.extracted[key] = val
+                            record.bind(*CONTENT_RESULT_KEYS)
                             logger.debug(f"Extracted metadata for {url}")
 
                         # Extract links from HTML content
@@ -866,56 +1116,58 @@ class AsyncCrawler:
                         # Extract images from the page if extraction is enabled
                         if self.image_extraction_enabled:
                             images = self.image_extractor.extract_images(html_content)
-                            self.results[url]['images'] = images
                             artifact.extracted['images'] = images
+                            record.bind('images')
                             logger.debug(f"Extracted {len(images)} images from {url}")
 
                         # Extract keywords from the page if extraction is enabled
                         if self.keyword_extraction_enabled:
                             keywords_data = self.keyword_extractor.extract_keywords(html_content, include_scores=True)
-                            self.results[url]['keywords'] = keywords_data['keywords']
-                            self.results[url]['keyword_scores'] = keywords_data['scores']
                             keyphrases = self.keyword_extractor.extract_keyphrases(html_content)
-                            self.results[url]['keyphrases'] = keyphrases
                             artifact.extracted['keywords'] = keywords_data['keywords']
                             artifact.extracted['keyword_scores'] = keywords_data['scores']
                             artifact.extracted['keyphrases'] = keyphrases
+                            record.bind('keywords', 'keyword_scores', 'keyphrases')
                             logger.debug(f"Extracted {len(keywords_data['keywords'])} keywords and {len(keyphrases)} keyphrases from {url}")
 
                         # Extract tables from the page if extraction is enabled
                         if self.table_extraction_enabled:
                             try:
                                 tables = extract_tables(html_content, min_rows=1, min_columns=1)
-                                self.results[url]['tables'] = tables
                                 artifact.extracted['tables'] = tables
+                                record.bind('tables')
                                 logger.debug(f"Extracted {len(tables)} tables from {url}")
                             except Exception as e:
                                 logger.error(f"Error extracting tables from {url}: {e}")
-                                self.results[url]['tables'] = []
+                                record['tables'] = []
 
                         # Run plugin extractors on the HTML
-                        for extractor in self.extractors:
+                        # (sync ones inline: parsing is CPU-bound and gains
+                        # nothing from a thread hop)
+                        for stage in self._extractor_stages:
                             try:
-                                if inspect.iscoroutinefunction(extractor.extract):
-                                    result = await extractor.extract(html_content, artifact)
+                                if stage.is_async:
+                                    result = await stage.plugin.extract(html_content, artifact)
                                 else:
-                                    result = extractor.extract(html_content, artifact)
+                                    result = stage.plugin.extract(html_content, artifact)
                                 if result is not None:
-                                    artifact.extracted[extractor.name] = result
+                                    artifact.extracted[stage.name] = result
                             except Exception as exc:
-                                logger.warning(f"Extractor '{extractor.name}' failed for {url}: {exc}")
-                                artifact.add_error(CrawlError.extractor(extractor.name, str(exc)))
+                                logger.warning(f"Extractor '{stage.name}' failed for {url}: {exc}")
+                                artifact.add_error(CrawlError.extractor(stage.name, str(exc)))
                                 if self.event_log is not None:
-                                    self.event_log.extractor_error(url, extractor.name, str(exc))
+                                    self.event_log.extractor_error(url, stage.name, str(exc))
 
-                        # Cache the response if cache is enabled
-                        if self.page_cache:
-                            self.page_cache.set(
+                        # Cache the response if cache is enabled (replayed pages are already cached)
+                        if self.page_cache and cached_data is None:
+                            await self._cache_call(
+                                self.page_cache.set,
                                 url,
-                                self.results[url],
+                                record.copy(),
                                 status_code,
-                                dict(response.headers),
-                                html_content
+                                headers,
+                                html_content,
+                                request_headers,
                             )
 
                     elif content_type_base == 'application/pdf' and self.enable_pdf_extraction:
@@ -926,8 +1178,8 @@ class AsyncCrawler:
                                 pdf_bytes = await response.read()
                                 pdf_extractor = PDFExtractor()
                                 pdf_result = pdf_extractor.extract_from_bytes(pdf_bytes)
-                                self.results[url]['pdf_data'] = pdf_result
                                 artifact.extracted['pdf'] = pdf_result
+                                record.bind('pdf_data')
                                 artifact.content = ContentInfo(
                                     raw_html=pdf_bytes.decode('latin-1', errors='replace'),
                                     size_bytes=len(pdf_bytes),
@@ -946,14 +1198,14 @@ class AsyncCrawler:
                         logger.debug(f"Skipping content extraction for non-HTML content type: {content_type} at {url}")
 
                     # Store the links in the results (even if empty for non-HTML content)
-                    artifact.links = links
-                    self.results[url]['links'] = links
+                    artifact.links.extend(links)
+                    record.bind('links')
 
                     # Record progress for successful URL
                     if self.progress_tracker:
-                        images_count = len(self.results[url].get('images', []))
-                        keywords_count = len(self.results[url].get('keywords', []))
-                        tables_count = len(self.results[url].get('tables', []))
+                        images_count = len(record.get('images', []))
+                        keywords_count = len(record.get('keywords', []))
+                        tables_count = len(record.get('tables', []))
                         self.progress_tracker.record_url(
                             url,
                             True,
@@ -967,7 +1219,7 @@ class AsyncCrawler:
                         )
 
                     # --- Incremental: record ETag/Last-Modified for next run ---
-                    if self.incremental:
+                    if self.incremental and cached_data is None:
                         try:
                             self.incremental.record_response(
                                 url,
@@ -979,8 +1231,10 @@ class AsyncCrawler:
                         except Exception as _e:
                             logger.debug(f"Incremental record failed for {url}: {_e}")
 
-                    # Run pipeline stages on the completed artifact
+                    # Run pipeline stages on the completed artifact, then share
+                    # any container a stage replaced with the result view
                     await self._run_pipelines(artifact)
+                    record.rebind()
 
                     # Add new links to the queue (will be empty for non-HTML content)
                     for link in links:
@@ -995,7 +1249,7 @@ class AsyncCrawler:
                 except Exception as e:
                     logger.error(f"Error processing {url}: {e}")
                     artifact.add_error(CrawlError(code="UNKNOWN", message=str(e), source="engine"))
-                    self.results[url]['error'] = str(e)
+                    record['error'] = str(e)
                     # Record progress for failed URL
                     if self.progress_tracker:
                         self.progress_tracker.record_url(
@@ -1011,7 +1265,7 @@ class AsyncCrawler:
                 artifact.add_error(CrawlError.fetch(err_msg, http_status=status_code))
                 if self.event_log is not None:
                     self.event_log.fetch_error(url, err_msg, status_code=status_code)
-                self.results[url]['error'] = err_msg
+                record['error'] = err_msg
                 # Record progress for failed URL
                 if self.progress_tracker:
                     self.progress_tracker.record_url(
@@ -1024,7 +1278,106 @@ class AsyncCrawler:
             # Store artifact (always, even on failure)
             if self.retain_artifacts:
                 self.artifacts[url] = artifact
+            else:
+                record.detach()  # let the artifact (and its HTML) be freed
     
+    async def _fetch_with_plugin(self, url: str, headers: Dict[str, str]):
+        """
+        Fetch *url* through the injected fetcher.
+
+        Accepts :class:`~crawlit.interfaces.AsyncFetcher` implementations as
+        well as synchronous :class:`~crawlit.interfaces.Fetcher` ones (run in
+        the default executor).  Returns the same ``(success, response_or_error,
+        status_code)`` triple as :func:`async_fetch_page`.
+        """
+        if self._fetcher_stage.is_async:
+            result = await self.fetcher.fetch(url, headers=headers or None)
+        else:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(None, self.fetcher.fetch, url, headers or None)
+        if result.not_modified:
+            return False, result.error or "304 Not Modified", 304
+        if not result.success:
+            return False, result.error or f"HTTP Error: {result.status_code}", result.status_code
+        resp_headers = dict(result.headers or {})
+        if result.content_type and not any(k.lower() == 'content-type' for k in resp_headers):
+            resp_headers['Content-Type'] = result.content_type
+        if result.text is not None:
+            response = ResponseLike(result.url or url, result.status_code or 200, resp_headers, result.text)
+        else:
+            response = ResponseLike(
+                result.url or url, result.status_code or 200, resp_headers,
+                result.raw_bytes or b'', is_binary=True,
+            )
+        return True, response, response.status_code
+
+    async def _cache_call(self, func, *args):
+        """Call a page cache method, off the event loop when it may touch the disk."""
+        if self.page_cache.enable_disk_cache:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, func, *args)
+        return func(*args)
+
+    @staticmethod
+    def _cached_response(url: str, cached_data: Dict[str, Any]):
+        """Turn a page cache entry into the ``(success, response, status)`` of a fetch."""
+        status_code = cached_data.get('status_code', 200)
+        if status_code != 200:
+            return False, f"HTTP Error: {status_code}", status_code
+        response = ResponseLike(
+            url=url,
+            status_code=status_code,
+            headers=dict(cached_data.get('headers') or {}),
+            text=cached_data.get('content') or '',
+        )
+        return True, response, status_code
+
+    async def _skip_prefetch_duplicate(self, url: str, depth: int, session) -> bool:
+        """Consult the pre-fetch deduplicator; mark and report *url* if it is skipped."""
+        dedup = self.prefetch_deduplicator
+        if not dedup.enabled:
+            return False
+
+        duplicate_of = dedup.check_url(url)
+        if duplicate_of is None and dedup.head_requests:
+            proxy_url = None
+            if self.proxy_manager:
+                current_proxy = self.proxy_manager.get_next_proxy()
+                if current_proxy:
+                    proxy_url = current_proxy.get_dict().get('http')
+            elif isinstance(self.proxy, str):
+                proxy_url = self.proxy
+            try:
+                async with session.head(
+                    url,
+                    allow_redirects=True,
+                    proxy=proxy_url,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                ) as head:
+                    if head.status == 200:
+                        duplicate_of = dedup.check_headers(url, dict(head.headers))
+            except Exception as e:
+                logger.debug(f"HEAD request failed for {url}: {e}")
+
+        if duplicate_of is None:
+            return False
+
+        logger.info(f"Skipping likely duplicate {url} (of {duplicate_of}) before fetching")
+        self.results[url]['duplicate'] = True
+        self.results[url]['duplicate_of'] = [duplicate_of]
+        self.results[url]['prefetch_skipped'] = True
+        if self.event_log is not None:
+            self.event_log.dedupe_hit(url)
+        if self.progress_tracker:
+            self.progress_tracker.record_url(
+                url,
+                True,
+                links_found=0,
+                depth=depth,
+                metadata={'duplicate': True}
+            )
+        return True
+
     async def _should_crawl(self, url):
         """Determine if a URL should be crawled based on settings"""
         # Check if URL is already visited
@@ -1071,49 +1424,247 @@ class AsyncCrawler:
     async def _run_pipelines(self, artifact: PageArtifact) -> None:
         """Run all registered pipeline stages on *artifact*.
 
-        Each stage receives a :meth:`~PageArtifact.copy` of the current artifact
-        so that a failing stage cannot corrupt the state seen by later stages.
-        Supports both sync and async pipeline ``process`` methods.
+        Each stage runs under an :class:`~crawlit.models.journal.ArtifactJournal`
+        so that a failing stage is rolled back and cannot corrupt the state seen
+        by later stages; containers are only copied when a stage mutates them.
+        Async stages are awaited; sync stages run in the plugin executor so
+        blocking writes do not stall the event loop.
 
         Pipeline contract
         ----------------
         * Return the (modified) artifact to pass it to the next stage.
         * Return ``None`` to *drop* the artifact — it will not be stored in
           ``self.artifacts`` and will not reach subsequent pipeline stages.
+
+        At a batch-capable stage the artifact is buffered; it continues
+        through the remaining stages when its batch is processed (see
+        :meth:`_process_batch`).
         """
-        current: Optional[PageArtifact] = artifact
-        for pipeline in self.pipelines:
-            if current is None:
-                break
-            pipeline_name = type(pipeline).__name__
-            snapshot = current.copy()  # snapshot before each stage
+        await self._run_stages(artifact.url, artifact, 0)
+
+    async def _run_stages(self, url: str, current: PageArtifact, start: int) -> None:
+        """Run pipeline stages ``start..`` on *current*, the artifact of *url*."""
+        loop = asyncio.get_running_loop()
+        for index in range(start, len(self._pipeline_stages)):
+            stage = self._pipeline_stages[index]
+            if stage.batch_size:
+                batcher = self._batchers[index]
+                batch = batcher.add((url, current))
+                if batch:
+                    await self._process_batch(index, batch)
+                elif len(batcher) == 1 and self._batch_wake is not None:
+                    self._batch_wake.set()  # new deadline for the batch timer
+                return
+            journal = ArtifactJournal(current)  # copy-on-write undo log
+            try:
+                if stage.is_async:
+                    result = await stage.plugin.process(current)
+                else:
+                    result = await loop.run_in_executor(
+                        self._get_plugin_executor(), stage.plugin.process, current
+                    )
+            except Exception as exc:
+                logger.warning(f"Pipeline '{stage.name}' failed for {url}: {exc}")
+                if self.event_log is not None:
+                    self.event_log.pipeline_error(url, stage.name, str(exc))
+                journal.rollback()  # restore pre-failure state
+                continue
+            journal.commit()
+            if result is None:
+                if self.event_log is not None:
+                    self.event_log.pipeline_drop(url, stage.name)
+                return  # deliberately dropped by this stage
+            current = result
+        if self.retain_artifacts:
+            self.artifacts[url] = current
+
+    async def _process_batch(self, index: int, batch: List[Tuple[str, PageArtifact]]) -> None:
+        """Hand *batch* (``(url, artifact)`` pairs) to the ``process_batch`` of stage *index*.
+
+        Batches are cut without yielding to the event loop and then wait
+        for the stage's (FIFO) lock, so the batches of one stage are
+        processed one at a time in the order they were cut, and the
+        survivors continue through the later stages in arrival order.  If
+        ``process_batch`` raises, every artifact of the batch is rolled back
+        and passed on unchanged.
+        """
+        lock = self._batch_locks.setdefault(index, asyncio.Lock())
+        async with lock:
+            stage = self._pipeline_stages[index]
+            artifacts = [artifact for _, artifact in batch]
+            journals = [ArtifactJournal(artifact) for artifact in artifacts]
             try:
-                if inspect.iscoroutinefunction(pipeline.process):
-                    result = await pipeline.process(current)
+                if stage.batch_is_async:
+                    results = await stage.plugin.process_batch(artifacts)
                 else:
-                    result = pipeline.process(current)
+                    results = await asyncio.get_running_loop().run_in_executor(
+                        self._get_plugin_executor(), stage.plugin.process_batch, artifacts
+                    )
+                results = batch_results(stage, artifacts, results)
+            except Exception as exc:
+                logger.warning(f"Pipeline '{stage.name}' failed for a batch of {len(batch)}: {exc}")
+                for (url, _), journal in zip(batch, journals):
+                    if self.event_log is not None:
+                        self.event_log.pipeline_error(url, stage.name, str(exc))
+                    journal.rollback()
+                results = artifacts
+            else:
+                for journal in journals:
+                    journal.commit()
+            for (url, _), result in zip(batch, results):
                 if result is None:
                     if self.event_log is not None:
-                        self.event_log.pipeline_drop(artifact.url, pipeline_name)
-                current = result
+                        self.event_log.pipeline_drop(url, stage.name)
+                    continue
+                await self._run_stages(url, result, index + 1)
+
+    async def _flush_batches(self, due_only: bool = False) -> None:
+        """Process partly filled batches in stage order: all of them, or those past their deadline."""
+        now = time.monotonic()
+        for index, batcher in self._batchers.items():
+            if batcher and (not due_only or batcher.due(now)):
+                await self._process_batch(index, batcher.take())
+
+    async def _run_batch_timer(self) -> None:
+        """Process each partly filled batch once its oldest artifact has waited ``max_latency``."""
+        while self._batch_timer is not None:
+            deadline = next_deadline(self._batchers.values())
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            self._batch_wake.clear()
+            try:
+                await asyncio.wait_for(self._batch_wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self._flush_batches(due_only=True)
             except Exception as exc:
-                logger.warning(
-                    f"Pipeline '{pipeline_name}' failed for {artifact.url}: {exc}"
-                )
-                if self.event_log is not None:
-                    self.event_log.pipeline_error(artifact.url, pipeline_name, str(exc))
-                current = snapshot  # restore pre-failure state
-        if self.retain_artifacts and current is not None:
-            self.artifacts[artifact.url] = current
-        # else: artifact was deliberately dropped by a pipeline stage
+                logger.warning(f"Batch timer failed: {exc}")
+
+    async def _stop_batch_timer(self) -> None:
+        """Stop the batch timer, letting a batch it is processing finish."""
+        task, self._batch_timer = self._batch_timer, None
+        if task is None:
+            return
+        self._batch_wake.set()
+        await task
+        self._batch_wake = None
+
+    def _finish_page(self, url: str) -> None:
+        """Mark *url* as no longer in flight and queue it and its result for the next checkpoint."""
+        self._in_flight.pop(url, None)
+        if self._checkpointer is None:
+            return
+        self._checkpoint_visited.append(url)
+        record = self.results.get(url)
+        if record is not None:
+            self._checkpoint_pending[url] = record
+        self._checkpointer.page_done()
+
+    def _queued_items(self) -> List[Tuple[str, int]]:
+        """
+        Copy the queue's items in order, leaving the queue as it was.
+
+        Uses only the public queue API: the items are drained and put back,
+        then the extra unfinished-task count of the re-put items is
+        cancelled.  No ``await`` happens in between, so workers never see
+        the queue empty.
+        """
+        items = []
+        while True:
+            try:
+                items.append(self.queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        for item in items:
+            self.queue.put_nowait(item)
+        for _ in items:
+            self.queue.task_done()
+        return items
+
+    def _copy_state(self, all_results: bool = False) -> Tuple[List[Tuple[str, int]], Iterable[str], Dict[str, Any]]:
+        """
+        Copy the queue, visited URLs and results (call on the event loop).
+
+        URLs still being processed go back to the front of the queue and are
+        left out of the visited URLs, so a crawl resumed from the copy
+        fetches them again.  With *all_results* the whole visited set and
+        all results are returned; otherwise only the visited URLs and
+        results finished since the previous call, for incremental
+        checkpoints.
+        """
+        queue = list(self._in_flight.items()) + self._queued_items()
+        if all_results:
+            visited = self.visited_urls.difference(self._in_flight)
+            results = {url: record for url, record in self.results.items()
+                       if url not in self._in_flight}
+        else:
+            visited, self._checkpoint_visited = self._checkpoint_visited, []
+            results, self._checkpoint_pending = self._checkpoint_pending, {}
+        return queue, visited, results
+
+    def _checkpoint_snapshot(self) -> Tuple[List[Tuple[str, int]], Iterable[str], Dict[str, Any], Dict[str, Any]]:
+        """
+        State handed to the periodic checkpointer (runs on its thread).
+
+        A finished page's output may still sit in a batch or a pipeline's
+        buffer, so both are flushed after the copy and before the
+        checkpoint that records the page as visited is written.
+        """
+        async def copy():
+            state = self._copy_state()
+            await self._flush_pipelines()
+            return (*state, self._state_metadata())
+        return asyncio.run_coroutine_threadsafe(copy(), self._checkpoint_loop).result()
+
+    def _emit_result(self, url: str) -> None:
+        """Write the finished result record for *url* to the result sinks."""
+        if self.retain_results:
+            if not self.result_sinks:
+                return
+            record = self.results.get(url)
+        else:
+            record = self.results.pop(url, None)
+        if record is None:
+            return
+        for sink in self.result_sinks:
+            try:
+                sink.write(url, record)
+            except Exception as exc:
+                logger.warning(f"Result sink {type(sink).__name__} failed for {url}: {exc}")
+
+    async def _flush_pipelines(self) -> None:
+        """Process partly filled batches, then flush buffered pipeline stages."""
+        await self._flush_batches()
+        await self._flush_stages(self.pipelines)
+
+    async def _flush_outputs(self) -> None:
+        """Flush buffered pipeline stages, result sinks and the event log at crawl end."""
+        await self._flush_stages(list(self.pipelines) + self.result_sinks + [self.event_log])
+
+    async def _flush_stages(self, stages: List[Any]) -> None:
+        """Call ``flush()`` on each of *stages* that has one, logging failures."""
+        loop = asyncio.get_running_loop()
+        for stage in stages:
+            flush = getattr(stage, "flush", None)
+            if not callable(flush):
+                continue
+            try:
+                if inspect.iscoroutinefunction(flush):
+                    await flush()
+                else:
+                    executor = self._get_plugin_executor() if stage in self.pipelines else None
+                    await loop.run_in_executor(executor, flush)
+            except Exception as exc:
+                logger.warning(f"Could not flush {type(stage).__name__}: {exc}")
 
     def get_results(self):
         """Return the detailed crawl results (legacy dict format).
 
         .. deprecated::
             Use :meth:`get_artifacts` or pipeline-based output instead.
-            This dict duplicates data already present in :class:`PageArtifact`
-            and will be removed in a future release.
+            Each value is a :class:`~crawlit.models.ResultView`, a ``dict``
+            sharing headers, links, HTML and extractor output with the page's
+            :class:`PageArtifact`; this API will be removed in a future release.
         """
         import warnings
         warnings.warn(
@@ -1152,38 +1703,41 @@ class AsyncCrawler:
         """Check if crawling is paused."""
         return self._paused
     
-    async def save_state(self, filepath: str) -> None:
+    async def save_state(self, filepath: str, incremental: bool = False) -> None:
         """
         Save the current crawler state to a file (async version).
 
-        The save is atomic: state is serialised to a temporary file beside
-        `filepath` and then renamed into place so that a crash during the write
-        never leaves a partially-written state file.
+        Paths ending in ``.json`` get a JSON document; any other path gets a
+        binary checkpoint (see :mod:`crawlit.utils.checkpoint`).  Full saves
+        are atomic: the state is written to a temporary file beside
+        `filepath` and then renamed into place.
 
-        Queue contents are snapshotted by draining and refilling the queue.
-        This should only be called when workers are paused or stopped.
+        The state is copied on the event loop and written in an executor, so
+        this can be called while the crawl is running; pages still being
+        processed are saved as queued.
 
         Args:
             filepath: Path to save the state file
+            incremental: Append only what changed since the previous save to
+                the same checkpoint file instead of rewriting it
         """
-        import json as _json
-        import os as _os
-        import tempfile as _tempfile
-
-        # Drain the queue to a list, then put items back.
-        # This avoids accessing the private asyncio.Queue._queue attribute.
-        queue_list = []
-        while not self.queue.empty():
-            try:
-                item = self.queue.get_nowait()
-                queue_list.append(item)
-                self.queue.task_done()
-            except asyncio.QueueEmpty:
-                break
-        for item in queue_list:
-            self.queue.put_nowait(item)
-
-        metadata = {
+        queue_list, visited_urls, results = self._copy_state(all_results=True)
+        await asyncio.get_running_loop().run_in_executor(None, functools.partial(
+            QueueManager.save_state,
+            queue_list,
+            visited_urls,
+            results,
+            filepath,
+            self._state_metadata(),
+            writer=self._get_checkpoint_writer(filepath),
+            incremental=incremental
+        ))
+
+        logger.debug(f"State saved to {filepath} ({len(queue_list)} queued, "
+                     f"{len(visited_urls)} visited)")
+
+    def _state_metadata(self) -> Dict[str, Any]:
+        return {
             'start_url': self.start_url,
             'max_depth': self.max_depth,
             'internal_only': self.internal_only,
@@ -1191,30 +1745,13 @@ class AsyncCrawler:
             'max_queue_size': self.max_queue_size
         }
 
-        state = {
-            'queue': queue_list,
-            'visited_urls': list(self.visited_urls),
-            'results': self.results,
-            'metadata': metadata,
-            'saved_at': __import__('datetime').datetime.now().isoformat(),
-        }
-
-        # Write to a sibling temp file then rename for atomicity.
-        parent = _os.path.dirname(_os.path.abspath(filepath))
-        fd, tmp_path = _tempfile.mkstemp(dir=parent, suffix='.tmp')
-        try:
-            with _os.fdopen(fd, 'w', encoding='utf-8') as fh:
-                _json.dump(state, fh, indent=2, default=str)
-            _os.replace(tmp_path, filepath)
-        except Exception:
-            try:
-                _os.unlink(tmp_path)
-            except OSError:
-                pass
-            raise
-
-        logger.debug(f"State saved atomically to {filepath} ({len(queue_list)} queued, "
-                     f"{len(self.visited_urls)} visited)")
+    def _get_checkpoint_writer(self, filepath: str) -> CheckpointWriter:
+        """The checkpoint writer for *filepath*, kept so later saves can append deltas."""
+        if self._checkpointer is not None and self._checkpointer.writer.filepath == filepath:
+            return self._checkpointer.writer
+        if self._checkpoint_writer is None or self._checkpoint_writer.filepath != filepath:
+            self._checkpoint_writer = CheckpointWriter(filepath)
+        return self._checkpoint_writer
     
     async def load_state(self, filepath: str) -> None:
         """
@@ -1224,6 +1761,18 @@ class AsyncCrawler:
             filepath: Path to the state file
         """
         queue_deque, self.visited_urls, self.results, metadata = QueueManager.load_state(filepath)
+        # The next save starts a new snapshot rather than a delta of an older
+        # one, and the restored results go into the next checkpoint
+        self._checkpoint_writer = None
+        if self._checkpointer is not None:
+            self._checkpointer.writer.reset()
+        self._in_flight = {}
+        self._checkpoint_visited = list(self.visited_urls)
+        self._checkpoint_pending = dict(self.results)
+
+        # Results restored from the state belong in this run's streamed output too
+        for url in list(self.results):
+            self._emit_result(url)
         
         # Convert deque back to asyncio.Queue
         self.queue = asyncio.Queue()
@@ -1234,6 +1783,34 @@ class AsyncCrawler:
         if metadata:
             logger.info(f"Loaded state metadata: {metadata}")
     
+    async def resume_from(self, filepath: str) -> None:
+        """
+        Resume crawling from a saved state file (async version).
+
+        The state may be a JSON state file or a checkpoint; a checkpoint is
+        restored up to its last complete snapshot or delta.  Runs the crawl
+        (see :meth:`crawl`) until the restored queue is exhausted.
+
+        Args:
+            filepath: Path to the saved state file
+        """
+        if not CrawlResume.can_resume(filepath):
+            raise ValueError(f"Cannot resume from {filepath}: file not found or invalid")
+
+        resume_info = CrawlResume.get_resume_info(filepath)
+        logger.info(f"Resuming crawl from {filepath}")
+        logger.info(f"  - Saved at: {resume_info.get('saved_at')}")
+        logger.info(f"  - Queue size: {resume_info.get('queue_size')}")
+        logger.info(f"  - Visited URLs: {resume_info.get('visited_count')}")
+        logger.info(f"  - Results: {resume_info.get('results_count')}")
+
+        await self.load_state(filepath)
+        self._resumed, self._resumed_from = True, filepath
+        try:
+            await self.crawl()
+        finally:
+            self._resumed, self._resumed_from = False, None
+
     def get_queue_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the current queue.
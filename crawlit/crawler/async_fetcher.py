@@ -376,6 +376,10 @@ class ResponseLike:
         """
         return self._text
     
+    async def read(self):
+        """Async method to mimic aiohttp's response.read() method"""
+        return self.content
+
     # Python doesn't support having both a property and method with the same name
     # Instead, we'll use a different property name for synchronous access
     @property
@@ -10,9 +10,12 @@ import threading
 from collections import deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from typing import Dict, Set, List, Any, Optional, Tuple
+from typing import Dict, Iterable, Set, List, Any, Optional, Tuple
 from urllib.parse import urlparse, urljoin
 
+import requests
+from requests.structures import CaseInsensitiveDict
+
 from .fetcher import fetch_page
 from .parser import extract_links
 from .robots import RobotsHandler
@@ -32,7 +35,18 @@ from ..utils.progress import ProgressTracker
 from ..utils.url_filter import URLFilter
 from ..utils.session_manager import SessionManager
 from ..utils.queue_manager import QueueManager
-from ..utils.cache import PageCache, CrawlResume
+from ..utils.checkpoint import CheckpointWriter, PeriodicCheckpointer
+from .stages import (
+    DEFAULT_PIPELINE_BATCH_LATENCY_MS,
+    DEFAULT_PIPELINE_BATCH_SIZE,
+    MicroBatcher,
+    Stage,
+    batch_results,
+    classify_stages,
+    make_batchers,
+    next_deadline,
+)
+from ..utils.cache import PageCache, CrawlResume, OFFLINE_CACHE_MISS
 from ..utils.storage import StorageManager
 from ..utils.sitemap import SitemapParser, get_sitemaps_from_robots
 from ..utils.rate_limiter import RateLimiter
@@ -40,8 +54,10 @@ from ..utils.deduplication import ContentDeduplicator
 from ..utils.budget_tracker import BudgetTracker
 from ..models.page_artifact import (
     PageArtifact, HTTPInfo, ContentInfo, CrawlMeta, DownloadRecord,
-    CrawlJob, CrawlError, ArtifactSource,
+    CrawlJob, CrawlError, ArtifactSource, intern_headers,
 )
+from ..models.journal import ArtifactJournal, journaled
+from ..models.result_view import CONTENT_RESULT_KEYS, ResultView
 
 logger = logging.getLogger(__name__)
 
@@ -115,12 +131,26 @@ class Crawler:
         fetcher: Optional[Any] = None,
         # --- Incremental crawling ---
         incremental: Optional[Any] = None,
+        # --- Pre-fetch deduplication ---
+        prefetch_deduplicator: Optional[Any] = None,
+        # --- Offline replay ---
+        offline: bool = False,
         # --- Crawl job metadata ---
         run_id: Optional[str] = None,
         # --- Operational event log ---
         event_log: Optional[Any] = None,
         # --- Memory management ---
         retain_artifacts: bool = True,
+        retain_results: bool = True,
+        # --- Streaming result output ---
+        result_sinks: Optional[List[Any]] = None,
+        # --- Periodic checkpointing ---
+        checkpoint_path: Optional[str] = None,
+        checkpoint_interval: Optional[float] = 60.0,
+        checkpoint_every_pages: Optional[int] = None,
+        # --- Batched pipelines ---
+        pipeline_batch_size: int = DEFAULT_PIPELINE_BATCH_SIZE,
+        pipeline_batch_latency_ms: Optional[float] = DEFAULT_PIPELINE_BATCH_LATENCY_MS,
     ) -> None:
         """Initialize the crawler with given parameters.
         
@@ -172,6 +202,7 @@ class Crawler:
         # Queue management
         self.max_queue_size: Optional[int] = max_queue_size
         self._paused: bool = False
+        self._checkpoint_writer: Optional[CheckpointWriter] = None  # reused by save_state()
         
         # Threading support
         self.max_workers: Optional[int] = max_workers if max_workers and max_workers > 0 else 1
@@ -379,6 +410,53 @@ class Crawler:
         self.retain_artifacts: bool = retain_artifacts
         self.artifacts: Dict[str, PageArtifact] = {}
 
+        # Result sinks (crawlit.output.ResultSink): each URL's legacy result
+        # record is written to every sink as soon as the URL is processed.
+        # With retain_results=False the record is then dropped from
+        # self.results, so a crawl streaming its output to a sink runs in
+        # constant memory.
+        self.result_sinks: List[Any] = list(result_sinks or [])
+        self.retain_results: bool = retain_results
+
+        # Periodic checkpointing (crawlit.utils.checkpoint): while the crawl
+        # runs, a background thread writes the queue, visited set and
+        # finished results to checkpoint_path every checkpoint_interval
+        # seconds and/or checkpoint_every_pages pages.  URLs being processed
+        # are tracked in _in_flight so that a checkpoint re-queues them
+        # instead of recording them as visited.
+        self.checkpoint_path: Optional[str] = checkpoint_path
+        self._checkpoint_lock: threading.Lock = threading.Lock()
+        self._in_flight: Dict[str, int] = {}
+        self._checkpoint_pending: Dict[str, Any] = {}
+        self._checkpoint_visited: List[str] = []
+        # Set by resume_from(): crawl() continues the restored queue instead
+        # of seeding a new crawl
+        self._resumed = False
+        self._resumed_from: Optional[str] = None
+        self._checkpointer: Optional[PeriodicCheckpointer] = None
+        if checkpoint_path:
+            self._checkpointer = PeriodicCheckpointer(
+                CheckpointWriter(checkpoint_path),
+                self._checkpoint_snapshot,
+                interval=checkpoint_interval,
+                every_pages=checkpoint_every_pages,
+            )
+
+        # Batched pipelines (crawlit.crawler.stages): artifacts for a stage
+        # with process_batch() are buffered and handed over
+        # pipeline_batch_size at a time, or fewer once the oldest has waited
+        # pipeline_batch_latency_ms (the _batch_timer thread), unless the
+        # stage sets its own batch_size / max_latency_ms.  Each stage's lock
+        # is held while its batch is processed, which keeps batches and the
+        # artifacts leaving them in arrival order.
+        self.pipeline_batch_size: int = pipeline_batch_size
+        self.pipeline_batch_latency_ms: Optional[float] = pipeline_batch_latency_ms
+        self._pipeline_stages: List[Stage] = []
+        self._batchers: Dict[int, MicroBatcher] = {}
+        self._batch_locks: Dict[int, threading.Lock] = {}
+        self._batch_timer: Optional[threading.Thread] = None
+        self._batch_wake: threading.Event = threading.Event()
+
         # Discovery metadata: populated before enqueuing, consumed during processing
         self._discovered_from: Dict[str, str] = {}
         self._discovery_method: Dict[str, str] = {}
@@ -407,6 +485,23 @@ class Crawler:
         if self.incremental:
             logger.info("Incremental crawling enabled")
 
+        # --- Pre-fetch deduplication (skip likely duplicates before fetching) ---
+        self.prefetch_deduplicator: Optional[Any] = prefetch_deduplicator
+        if self.prefetch_deduplicator is not None and self.prefetch_deduplicator.enabled:
+            logger.info("Pre-fetch deduplication enabled")
+
+        # --- Offline replay (every page is served from page_cache) ---
+        self.offline: bool = offline
+        if self.offline:
+            if self.page_cache is None:
+                raise ValueError("offline=True requires a page_cache to replay from")
+            # Nothing may touch the network in replay mode
+            self.respect_robots = False
+            self.robots_handler = None
+            self.use_sitemap = False
+            self.sitemap_parser = None
+            logger.info("Offline replay enabled: pages are served from the page cache only")
+
         # --- Crawl job / run metadata ---
         self.job = CrawlJob(
             run_id=run_id or __import__("uuid").uuid4().hex,
@@ -425,6 +520,24 @@ class Crawler:
             logger.info(f"Registered extractors: {[e.name for e in self.extractors]}")
         if self.pipelines:
             logger.info(f"Registered pipelines: {[type(p).__name__ for p in self.pipelines]}")
+        self._register_plugins()
+
+    def _register_plugins(self) -> None:
+        """Classify the pipelines (per-artifact or batched) once per crawl."""
+        stages = classify_stages(
+            self.pipelines, "process",
+            batch_size=self.pipeline_batch_size,
+            max_latency_ms=self.pipeline_batch_latency_ms,
+        )
+        for stage in stages:
+            if stage.batch_size and stage.batch_is_async:
+                raise TypeError(
+                    f"Pipeline '{stage.name}' has an async process_batch() and cannot be used "
+                    "with the synchronous Crawler.  Use AsyncCrawler or implement BatchPipeline instead."
+                )
+        self._pipeline_stages = stages
+        self._batchers = make_batchers(stages)
+        self._batch_locks = {index: threading.Lock() for index in self._batchers}
 
     def _apply_config(self, config: Any) -> None:
         """Apply CrawlerConfig fields to override current instance settings."""
@@ -461,9 +574,13 @@ class Crawler:
                 self.pipelines.append(JSONLWriter(out.jsonl_path))
                 logger.info(f"Auto-registered JSONLWriter → {out.jsonl_path}")
             if getattr(out, "write_blobs", False) and getattr(out, "blobs_dir", None):
-                from ..pipelines.blob_store import BlobStore
-                self.pipelines.append(BlobStore(out.blobs_dir))
-                logger.info(f"Auto-registered BlobStore → {out.blobs_dir}")
+                if getattr(out, "packed_blobs", False):
+                    from ..pipelines.packed_blob_store import PackedBlobStore
+                    self.pipelines.append(PackedBlobStore(out.blobs_dir))
+                else:
+                    from ..pipelines.blob_store import BlobStore
+                    self.pipelines.append(BlobStore(out.blobs_dir))
+                logger.info(f"Auto-registered {type(self.pipelines[-1]).__name__} → {out.blobs_dir}")
             if getattr(out, "write_edges", False) and getattr(out, "edges_path", None):
                 from ..pipelines.edges_writer import EdgesWriter
                 self.pipelines.append(EdgesWriter(out.edges_path))
@@ -560,14 +677,22 @@ class Crawler:
     def crawl(self) -> None:
         """Start the crawling process"""
         self.job.started_at = datetime.now(timezone.utc)
+        self._register_plugins()
 
-        # Emit CRAWL_START event
+        # Emit CRAWL_START event (CRAWL_RESUME when continuing a saved crawl)
         if self.event_log is not None:
-            self.event_log.crawl_start(
-                seed_urls=self.job.seed_urls,
-                max_depth=self.max_depth,
-                run_id=self.job.run_id,
-            )
+            if self._resumed:
+                self.event_log.crawl_resume(
+                    source=self._resumed_from,
+                    visited=len(self.visited_urls),
+                    run_id=self.job.run_id,
+                )
+            else:
+                self.event_log.crawl_start(
+                    seed_urls=self.job.seed_urls,
+                    max_depth=self.max_depth,
+                    run_id=self.job.run_id,
+                )
 
         # Start progress tracker if provided
         if self.progress_tracker:
@@ -576,18 +701,38 @@ class Crawler:
         # Get session from session manager
         session = self.session_manager.get_sync_session()
         
-        # Discover and parse sitemaps if enabled
-        if self.use_sitemap and self.sitemap_parser:
-            self._discover_sitemaps(session)
-        
-        # Add the starting URL to the queue with depth 0
-        self.queue.append((self.start_url, 0))
-        
-        # Use threading if max_workers > 1
-        if self.max_workers > 1:
-            self._crawl_with_threading(session)
-        else:
-            self._crawl_single_threaded(session)
+        # A resumed crawl's seeds and sitemap URLs are already in the
+        # restored queue or visited set
+        if not self._resumed:
+            # Discover and parse sitemaps if enabled
+            if self.use_sitemap and self.sitemap_parser:
+                self._discover_sitemaps(session)
+
+            # Add the starting URL to the queue with depth 0
+            self.queue.append((self.start_url, 0))
+
+        if self._checkpointer is not None:
+            self._checkpointer.start()
+        if any(batcher.max_latency is not None for batcher in self._batchers.values()):
+            self._batch_timer = threading.Thread(
+                target=self._run_batch_timer, name="crawlit-batcher", daemon=True
+            )
+            self._batch_timer.start()
+        try:
+            # Use threading if max_workers > 1
+            if self.max_workers > 1:
+                self._crawl_with_threading(session)
+            else:
+                self._crawl_single_threaded(session)
+        finally:
+            self._stop_batch_timer()
+            try:
+                # Batched pages are processed, also when the crawl is interrupted
+                self._flush_batches()
+            finally:
+                if self._checkpointer is not None:
+                    # Final checkpoint, also when the crawl is interrupted
+                    self._checkpointer.stop()
         
         # Report skipped external URLs at the end
         if self.skipped_external_urls and self.internal_only:
@@ -611,10 +756,19 @@ class Crawler:
         if self.progress_tracker:
             self.progress_tracker.finish()
 
+        # Persist canonical hints / learned URL rules for the next run
+        if self.prefetch_deduplicator is not None and self.prefetch_deduplicator.state_path:
+            try:
+                self.prefetch_deduplicator.save()
+            except Exception as e:
+                logger.warning(f"Could not save pre-fetch dedup state: {e}")
+
         # Emit CRAWL_END event
         if self.event_log is not None:
             self.event_log.crawl_end(pages_crawled=len(self.visited_urls))
 
+        self._flush_outputs()
+
     def _crawl_single_threaded(self, session) -> None:
         """Single-threaded crawling (original implementation)"""
         while self.queue:
@@ -629,21 +783,23 @@ class Crawler:
                     logger.warning(f"Stopping crawl: {reason}")
                     break
             
-            current_url, depth = self.queue.popleft()
+            with self._checkpoint_lock:
+                current_url, depth = self.queue.popleft()
 
-            # Skip if we've already visited this URL or exceeded max depth
-            if current_url in self.visited_urls:
-                continue
-            if depth > self.max_depth:
-                continue
+                # Skip if we've already visited this URL or exceeded max depth
+                if current_url in self.visited_urls:
+                    continue
+                if depth > self.max_depth:
+                    continue
 
-            # Mark as visited here (before processing) so that any links
-            # added to the queue during processing cannot re-enqueue this URL.
-            self.visited_urls.add(current_url)
+                # Mark as visited here (before processing) so that any links
+                # added to the queue during processing cannot re-enqueue this URL.
+                self.visited_urls.add(current_url)
+                self._in_flight[current_url] = depth
 
             # Rate limiting is handled in _process_url
             # Process the URL
-            self._process_url(current_url, depth, session)
+            self._process_and_emit(current_url, depth, session)
     
     def _crawl_with_threading(self, session) -> None:
         """Multi-threaded crawling using ThreadPoolExecutor"""
@@ -665,28 +821,32 @@ class Crawler:
                 
                 # Submit new tasks from queue
                 while len(futures) < self.max_workers:
-                    with self._queue_lock:
-                        if not self.queue:
-                            break
-                        current_url, depth = self.queue.popleft()
-
-                    # Check depth limit before acquiring the visited lock
-                    if depth > self.max_depth:
-                        continue
-
-                    # Atomically check-and-mark as visited before submitting.
-                    # This prevents the race where two loop iterations dequeue
-                    # the same URL, both pass the "in visited_urls" check, and
-                    # both submit a worker — resulting in a double-fetch.
-                    with self._visited_lock:
-                        if current_url in self.visited_urls:
+                    # The checkpoint lock keeps a URL from being in neither
+                    # the queue nor the in-flight set while a checkpoint is taken
+                    with self._checkpoint_lock:
+                        with self._queue_lock:
+                            if not self.queue:
+                                break
+                            current_url, depth = self.queue.popleft()
+
+                        # Check depth limit before acquiring the visited lock
+                        if depth > self.max_depth:
                             continue
-                        # Mark as visited now, before the worker starts, so no
-                        # other iteration can submit the same URL concurrently.
-                        self.visited_urls.add(current_url)
+
+                        # Atomically check-and-mark as visited before submitting.
+                        # This prevents the race where two loop iterations dequeue
+                        # the same URL, both pass the "in visited_urls" check, and
+                        # both submit a worker — resulting in a double-fetch.
+                        with self._visited_lock:
+                            if current_url in self.visited_urls:
+                                continue
+                            # Mark as visited now, before the worker starts, so no
+                            # other iteration can submit the same URL concurrently.
+                            self.visited_urls.add(current_url)
+                        self._in_flight[current_url] = depth
 
                     # Submit task to thread pool
-                    future = executor.submit(self._process_url, current_url, depth, session)
+                    future = executor.submit(self._process_and_emit, current_url, depth, session)
                     futures[future] = (current_url, depth)
                 
                 # Process completed tasks
@@ -749,8 +909,9 @@ class Crawler:
         )
         _site = urlparse(url).netloc or None
 
-        # Build the PageArtifact early so extractors/pipelines always receive one
-        artifact = PageArtifact(
+        # Build the PageArtifact early so extractors/pipelines always receive one.
+        # Journaled containers let pipeline stages roll back without copying them.
+        artifact = journaled(PageArtifact(
             url=url,
             fetched_at=datetime.now(timezone.utc),
             source=ArtifactSource(type=_source_type, site=_site),
@@ -760,7 +921,7 @@ class Crawler:
                 discovery_method=discovery_method,
                 run_id=self.job.run_id,
             ),
-        )
+        ))
 
         # --- Incremental: get conditional headers (If-None-Match / If-Modified-Since) ---
         incremental_headers: Dict[str, str] = {}
@@ -770,69 +931,90 @@ class Crawler:
             except Exception as _e:
                 logger.debug(f"Incremental header lookup failed for {url}: {_e}")
 
-        # Initialize result data for this URL (thread-safe)
+        # Initialize the legacy result view for this URL (thread-safe); data
+        # that lives on the artifact is bound to it rather than copied
+        record = ResultView(
+            artifact,
+            depth=depth,
+            status=None,
+            headers=None,
+            links=[],
+            content_type=None,
+            error=None,
+            success=False,
+        )
         with self._results_lock:
-            self.results[url] = {
-                'depth': depth,
-                'status': None,
-                'headers': None,
-                'links': [],
-                'content_type': None,
-                'error': None,
-                'success': False
-            }
+            self.results[url] = record
         
         # Check cache first
         cached_data = None
+        cache_validators: Dict[str, str] = {}
+        request_headers = getattr(session, 'headers', None)
         if self.page_cache:
-            cached_data = self.page_cache.get(url)
+            cached_data = self.page_cache.get(url, request_headers=request_headers, allow_stale=self.offline)
         
         if cached_data:
             # Use cached data
             logger.debug(f"Using cached data for {url}")
-            status_code = cached_data.get('status_code', 200)
-            headers = cached_data.get('headers', {})
-            response_data = cached_data.get('response_data', {})
-            content = cached_data.get('content')
-            
-            success = status_code == 200
-            
-            # Case-insensitive content-type lookup for cached headers
-            cached_content_type = next((v for k, v in headers.items() if k.lower() == 'content-type'), '')
-            
+            self._serve_cached_data(url, depth, cached_data)
+            return
+
+        if self.offline:
+            logger.info(f"Not in cache, skipped (offline replay): {url}")
+            artifact.add_error(CrawlError.fetch(OFFLINE_CACHE_MISS))
             with self._results_lock:
-                self.results[url]['status'] = status_code
-                self.results[url]['success'] = success
-                self.results[url]['headers'] = headers
-                self.results[url]['content_type'] = cached_content_type
-
-            # Process cached content similar to fresh fetch
-            if success and content and cached_content_type.split(';')[0].strip().lower() == 'text/html':
-                # Process cached HTML content
-                self._process_cached_content(url, depth, content, headers)
+                record['error'] = OFFLINE_CACHE_MISS
+                if self.retain_artifacts:
+                    self.artifacts[url] = artifact
+            if self.progress_tracker:
+                self.progress_tracker.record_url(url, False, links_found=0, depth=depth)
             return
+
+        # --- HTTP cache: revalidate a stale entry with a conditional request ---
+        if self.page_cache and self.page_cache.http_semantics:
+            cache_validators = self.page_cache.get_conditional_headers(url, request_headers=request_headers)
+            if cache_validators:
+                # The cache's validators describe content we can actually serve on 304
+                incremental_headers = {**incremental_headers, **cache_validators}
         
+        # --- Pre-fetch dedup: skip likely duplicates before downloading them ---
+        if self.prefetch_deduplicator is not None and self._skip_prefetch_duplicate(url, depth, session):
+            return
+
         # Fetch the page using our fetcher with session (capture wall-clock time)
         _t0 = time.perf_counter()
-        success, response_or_error, status_code = fetch_page(
-            url,
-            self.user_agent,
-            self.max_retries,
-            self.timeout,
-            session=session,
-            use_js_rendering=self.use_js_rendering,
-            js_renderer=None,  # Create new renderer per request to avoid threading issues
-            wait_for_selector=self.js_wait_for_selector,
-            wait_for_timeout=self.js_wait_for_timeout,
-            proxy=self.proxy,
-            proxy_manager=self.proxy_manager,
-            extra_headers=incremental_headers if incremental_headers else None,
-            on_retry=(
-                self.event_log.fetch_retry if self.event_log is not None else None
-            ),
-        )
+        if self.fetcher is not None:
+            success, response_or_error, status_code = self._fetch_with_plugin(url, incremental_headers)
+        else:
+            success, response_or_error, status_code = fetch_page(
+                url,
+                self.user_agent,
+                self.max_retries,
+                self.timeout,
+                session=session,
+                use_js_rendering=self.use_js_rendering,
+                js_renderer=None,  # Create new renderer per request to avoid threading issues
+                wait_for_selector=self.js_wait_for_selector,
+                wait_for_timeout=self.js_wait_for_timeout,
+                proxy=self.proxy,
+                proxy_manager=self.proxy_manager,
+                extra_headers=incremental_headers if incremental_headers else None,
+                on_retry=(
+                    self.event_log.fetch_retry if self.event_log is not None else None
+                ),
+            )
         _elapsed_ms = (time.perf_counter() - _t0) * 1000
 
+        # --- HTTP cache: 304 for a stale entry turns it back into a hit ---
+        if status_code == 304 and cache_validators:
+            cached_data = self.page_cache.revalidate(url)
+            if cached_data is not None:
+                logger.debug(f"304 Not Modified for {url} — serving revalidated cache entry")
+                if self.event_log is not None:
+                    self.event_log.incremental_hit(url)
+                self._serve_cached_data(url, depth, cached_data)
+                return
+
         # --- Incremental: handle 304 Not Modified ---
         if status_code == 304:
             logger.debug(f"304 Not Modified for {url} — skipping reprocessing")
@@ -841,7 +1023,7 @@ class Crawler:
             if self.event_log is not None:
                 self.event_log.incremental_hit(url)
             with self._results_lock:
-                self.results[url]['status'] = 304
+                record['status'] = 304
                 if self.retain_artifacts:
                     self.artifacts[url] = artifact
             if self.incremental:
@@ -853,20 +1035,17 @@ class Crawler:
         
         # Update results (thread-safe)
         with self._results_lock:
-            self.results[url]['status'] = status_code
-            self.results[url]['success'] = success
+            record['status'] = status_code
+            record['success'] = success
         
         if success:
             response = response_or_error
             
-            # Store response headers (use CaseInsensitiveDict for content_type lookup)
-            headers = dict(response.headers)
+            # Response headers, copied once and shared by the artifact and the
+            # result view (use CaseInsensitiveDict for content_type lookup)
+            headers = intern_headers(response.headers)
             content_type = response.headers.get('Content-Type', '')
             
-            with self._results_lock:
-                self.results[url]['headers'] = headers
-                self.results[url]['content_type'] = content_type
-            
             # Record bytes downloaded for budget tracking
             if self.budget_tracker:
                 # Try to get content length from header, otherwise estimate from content
@@ -909,6 +1088,9 @@ class Crawler:
                 elapsed_ms=round(_elapsed_ms, 2),
                 response_bytes=_response_bytes,
             )
+            with self._results_lock:
+                record.bind('headers')
+                record['content_type'] = content_type
 
             # Cache will be updated after HTML content is processed
 
@@ -923,63 +1105,65 @@ class Crawler:
                     html_content = response.text
 
                     # Check for duplicate content
-                    if self.content_deduplicator.enabled:
-                        if self.content_deduplicator.is_duplicate(html_content, url):
-                            logger.info(f"Skipping duplicate content at {url}")
-                            duplicate_urls = self.content_deduplicator.get_duplicate_urls(url)
-                            if self.event_log is not None:
-                                import hashlib as _hl
-                                _h = _hl.sha256(html_content.encode("utf-8", errors="replace")).hexdigest()[:16]
-                                self.event_log.dedupe_hit(url, content_hash=_h)
-                            with self._results_lock:
-                                self.results[url]['duplicate'] = True
-                                if duplicate_urls:
-                                    self.results[url]['duplicate_of'] = list(duplicate_urls)
-
-                            # Still record progress but mark as duplicate
-                            if self.progress_tracker:
-                                self.progress_tracker.record_url(
-                                    url,
-                                    True,
-                                    links_found=0,
-                                    depth=depth,
-                                    metadata={'duplicate': True}
-                                )
-                            return  # Skip processing duplicate content
-
-                    # Store HTML content using storage manager
-                    stored_html = self.storage_manager.store_html(url, html_content)
-                    if stored_html is not None:
+                    is_duplicate = (self.content_deduplicator.enabled
+                                    and self.content_deduplicator.is_duplicate(html_content, url))
+
+                    if self.prefetch_deduplicator is not None:
+                        # Audit skips with the same (normalised) hash the URL rules were learned from
+                        self.prefetch_deduplicator.record_fetch(
+                            url, headers, html_content,
+                            content_hash=self.content_deduplicator.get_content_hash(url),
+                        )
+
+                    if is_duplicate:
+                        logger.info(f"Skipping duplicate content at {url}")
+                        duplicate_urls = self.content_deduplicator.get_duplicate_urls(url)
+                        if self.prefetch_deduplicator is not None and duplicate_urls:
+                            self.prefetch_deduplicator.record_duplicate(url, duplicate_urls)
+                        if self.event_log is not None:
+                            import hashlib as _hl
+                            _h = _hl.sha256(html_content.encode("utf-8", errors="replace")).hexdigest()[:16]
+                            self.event_log.dedupe_hit(url, content_hash=_h)
                         with self._results_lock:
-                            self.results[url]['html_content'] = stored_html
+                            record['duplicate'] = True
+                            if duplicate_urls:
+                                record['duplicate_of'] = list(duplicate_urls)
+
+                        # Still record progress but mark as duplicate
+                        if self.progress_tracker:
+                            self.progress_tracker.record_url(
+                                url,
+                                True,
+                                links_found=0,
+                                depth=depth,
+                                metadata={'duplicate': True}
+                            )
+                        return  # Skip processing duplicate content
 
                     # Populate artifact content
                     artifact.content = ContentInfo(raw_html=html_content)
 
+                    # Store HTML content using storage manager; in-memory
+                    # storage shares the artifact's string
+                    stored_html = self.storage_manager.store_html(url, html_content)
+                    if stored_html is not None:
+                        with self._results_lock:
+                            if stored_html is html_content:
+                                record.bind('html_content')
+                            else:
+                                record['html_content'] = stored_html
+
                     # Use ContentExtractor to extract all page metadata if enabled
                     if self.content_extraction_enabled and self.content_extractor:
                         content_data = self.content_extractor.extract_content(html_content, url, response)
 
-                        # Merge content extractor results with page results
-                        with self._results_lock:
-                            self.results[url].update({
-                                'title': content_data.get('title'),
-                                'meta_description': content_data.get('meta_description'),
-                                'meta_keywords': content_data.get('meta_keywords'),
-                                'canonical_url': content_data.get('canonical_url'),
-                                'language': content_data.get('language'),
-                                'headings': content_data.get('headings'),
-                                'images_with_context': content_data.get('images_with_context'),
-                                'page_type': content_data.get('page_type'),
-                                'last_modified': content_data.get('last_modified')
-                            })
-                        # Mirror into artifact
-                        for key in ('title', 'meta_description', 'meta_keywords',
-                                    'canonical_url', 'language', 'headings',
-                                    'images_with_context', 'page_type', 'last_modified'):
+                        # Store in the artifact; the result view shares the values
+                        for key in CONTENT_RESULT_KEYS:
                             val = content_data.get(key)
                             if val is not None:
                                 artifact.extracted[key] = val
+                        with self._results_lock:
+                            record.bind(*CONTENT_RESULT_KEYS)
                         logger.debug(f"Extracted metadata for {url}")
 
                     # Extract links from HTML content
@@ -989,36 +1173,34 @@ class Crawler:
                     # Extract images from the page if extraction is enabled
                     if self.image_extraction_enabled:
                         images = self.image_extractor.extract_images(html_content)
-                        with self._results_lock:
-                            self.results[url]['images'] = images
                         artifact.extracted['images'] = images
+                        with self._results_lock:
+                            record.bind('images')
                         logger.debug(f"Extracted {len(images)} images from {url}")
 
                     # Extract keywords from the page if extraction is enabled
                     if self.keyword_extraction_enabled:
                         keywords_data = self.keyword_extractor.extract_keywords(html_content, include_scores=True)
                         keyphrases = self.keyword_extractor.extract_keyphrases(html_content)
-                        with self._results_lock:
-                            self.results[url]['keywords'] = keywords_data['keywords']
-                            self.results[url]['keyword_scores'] = keywords_data['scores']
-                            self.results[url]['keyphrases'] = keyphrases
                         artifact.extracted['keywords'] = keywords_data['keywords']
                         artifact.extracted['keyword_scores'] = keywords_data['scores']
                         artifact.extracted['keyphrases'] = keyphrases
+                        with self._results_lock:
+                            record.bind('keywords', 'keyword_scores', 'keyphrases')
                         logger.debug(f"Extracted {len(keywords_data['keywords'])} keywords and {len(keyphrases)} keyphrases from {url}")
 
                     # Extract tables from the page if extraction is enabled
                     if self.table_extraction_enabled:
                         try:
                             tables = extract_tables(html_content, min_rows=1, min_columns=1)
-                            with self._results_lock:
-                                self.results[url]['tables'] = tables
                             artifact.extracted['tables'] = tables
+                            with self._results_lock:
+                                record.bind('tables')
                             logger.debug(f"Extracted {len(tables)} tables from {url}")
                         except Exception as e:
                             logger.error(f"Error extracting tables from {url}: {e}")
                             with self._results_lock:
-                                self.results[url]['tables'] = []
+                                record['tables'] = []
 
                     # Run plugin extractors on the HTML
                     for extractor in self.extractors:
@@ -1036,10 +1218,11 @@ class Crawler:
                     if self.page_cache:
                         self.page_cache.set(
                             url,
-                            self.results[url],
+                            record.copy(),
                             status_code,
                             headers,
-                            html_content
+                            html_content,
+                            request_headers=request_headers
                         )
 
                 elif content_type_base == 'application/pdf' and self.enable_pdf_extraction:
@@ -1050,9 +1233,9 @@ class Crawler:
                             pdf_bytes = response.content
                             pdf_extractor = PDFExtractor()
                             pdf_result = pdf_extractor.extract_from_bytes(pdf_bytes)
-                            with self._results_lock:
-                                self.results[url]['pdf_data'] = pdf_result
                             artifact.extracted['pdf'] = pdf_result
+                            with self._results_lock:
+                                record.bind('pdf_data')
                             artifact.content = ContentInfo(
                                 raw_html=pdf_bytes.decode('latin-1', errors='replace'),
                                 size_bytes=len(pdf_bytes),
@@ -1073,16 +1256,16 @@ class Crawler:
                     logger.debug(f"Skipping content extraction for non-HTML content type: {content_type} at {url}")
 
                 # Store the links in the results (even if empty for non-HTML content)
-                artifact.links = links
+                artifact.links.extend(links)
                 with self._results_lock:
-                    self.results[url]['links'] = links
+                    record.bind('links')
 
                 # Record progress for successful URL
                 if self.progress_tracker:
                     with self._results_lock:
-                        images_count = len(self.results[url].get('images', []))
-                        keywords_count = len(self.results[url].get('keywords', []))
-                        tables_count = len(self.results[url].get('tables', []))
+                        images_count = len(record.get('images', []))
+                        keywords_count = len(record.get('keywords', []))
+                        tables_count = len(record.get('tables', []))
                     self.progress_tracker.record_url(
                         url,
                         True,
@@ -1108,8 +1291,11 @@ class Crawler:
                     except Exception as _e:
                         logger.debug(f"Incremental record failed for {url}: {_e}")
 
-                # Run pipeline stages on the completed artifact
+                # Run pipeline stages on the completed artifact, then share
+                # any container a stage replaced with the result view
                 self._run_pipelines(artifact)
+                with self._results_lock:
+                    record.rebind()
 
                 # Add new links to the queue (thread-safe)
                 for link in links:
@@ -1127,7 +1313,7 @@ class Crawler:
                 logger.error(f"Error processing {url}: {e}")
                 artifact.add_error(CrawlError(code="UNKNOWN", message=str(e), source="engine"))
                 with self._results_lock:
-                    self.results[url]['error'] = str(e)
+                    record['error'] = str(e)
                 # Record progress for failed URL
                 if self.progress_tracker:
                     self.progress_tracker.record_url(
@@ -1144,7 +1330,7 @@ class Crawler:
             if self.event_log is not None:
                 self.event_log.fetch_error(url, err_msg, status_code=status_code)
             with self._results_lock:
-                self.results[url]['error'] = err_msg
+                record['error'] = err_msg
             # Record progress for failed URL
             if self.progress_tracker:
                 self.progress_tracker.record_url(
@@ -1155,10 +1341,54 @@ class Crawler:
                 )
 
         # Store artifact (always, even on failure, so callers have a record)
-        if self.retain_artifacts:
-            with self._results_lock:
+        with self._results_lock:
+            if self.retain_artifacts:
                 self.artifacts[url] = artifact
+            else:
+                record.detach()  # let the artifact (and its HTML) be freed
     
+    def _skip_prefetch_duplicate(self, url: str, depth: int, session) -> bool:
+        """Consult the pre-fetch deduplicator; mark and report *url* if it is skipped."""
+        dedup = self.prefetch_deduplicator
+        if not dedup.enabled:
+            return False
+
+        duplicate_of = dedup.check_url(url)
+        if duplicate_of is None and dedup.head_requests:
+            proxies = None
+            if self.proxy_manager:
+                current_proxy = self.proxy_manager.get_next_proxy()
+                if current_proxy:
+                    proxies = current_proxy.get_dict()
+            elif self.proxy:
+                proxies = {'http': self.proxy, 'https': self.proxy} if isinstance(self.proxy, str) else self.proxy
+            try:
+                head = session.head(url, timeout=self.timeout, allow_redirects=True, proxies=proxies)
+                if head.status_code == 200:
+                    duplicate_of = dedup.check_headers(url, dict(head.headers))
+            except Exception as e:
+                logger.debug(f"HEAD request failed for {url}: {e}")
+
+        if duplicate_of is None:
+            return False
+
+        logger.info(f"Skipping likely duplicate {url} (of {duplicate_of}) before fetching")
+        with self._results_lock:
+            self.results[url]['duplicate'] = True
+            self.results[url]['duplicate_of'] = [duplicate_of]
+            self.results[url]['prefetch_skipped'] = True
+        if self.event_log is not None:
+            self.event_log.dedupe_hit(url)
+        if self.progress_tracker:
+            self.progress_tracker.record_url(
+                url,
+                True,
+                links_found=0,
+                depth=depth,
+                metadata={'duplicate': True}
+            )
+        return True
+
     def _should_crawl(self, url: str) -> bool:
         """Determine if a URL should be crawled based on settings"""
         # Check if URL is already visited
@@ -1204,8 +1434,9 @@ class Crawler:
     def _run_pipelines(self, artifact: PageArtifact) -> None:
         """Run all registered pipeline stages on *artifact* (thread-safe).
 
-        Each stage receives a :meth:`~PageArtifact.copy` of the current artifact
-        so that a failing stage cannot corrupt the state seen by later stages.
+        Each stage runs under an :class:`~crawlit.models.journal.ArtifactJournal`
+        so that a failing stage is rolled back and cannot corrupt the state seen
+        by later stages; containers are only copied when a stage mutates them.
 
         Pipeline contract
         ----------------
@@ -1213,39 +1444,213 @@ class Crawler:
         * Return ``None`` to *drop* the artifact — it will not be stored in
           ``self.artifacts`` and will not reach subsequent pipeline stages.
           Use this for filtering (e.g. robots.txt post-check, relevance gating).
+
+        At a batch-capable stage the artifact is buffered; it continues
+        through the remaining stages when its batch is processed (see
+        :meth:`_process_batch`).
         """
-        current: Optional[PageArtifact] = artifact
-        for pipeline in self.pipelines:
-            if current is None:
-                break
-            pipeline_name = type(pipeline).__name__
-            snapshot = current.copy()  # snapshot before each stage
+        self._run_stages(artifact.url, artifact, 0)
+
+    def _run_stages(self, url: str, current: PageArtifact, start: int) -> None:
+        """Run pipeline stages ``start..`` on *current*, the artifact of *url*."""
+        for index in range(start, len(self._pipeline_stages)):
+            stage = self._pipeline_stages[index]
+            if stage.batch_size:
+                batcher = self._batchers[index]
+                with self._batch_locks[index]:
+                    batch = batcher.add((url, current))
+                    if batch:
+                        self._process_batch(index, batch)
+                    started = len(batcher) == 1
+                if started:
+                    self._batch_wake.set()  # new deadline for the batch timer
+                return
+            journal = ArtifactJournal(current)  # copy-on-write undo log
             try:
-                result = pipeline.process(current)
-                if result is None:
-                    if self.event_log is not None:
-                        self.event_log.pipeline_drop(artifact.url, pipeline_name)
-                current = result
+                result = stage.plugin.process(current)
             except Exception as exc:
-                logger.warning(
-                    f"Pipeline '{pipeline_name}' failed for {artifact.url}: {exc}"
-                )
+                logger.warning(f"Pipeline '{stage.name}' failed for {url}: {exc}")
                 if self.event_log is not None:
-                    self.event_log.pipeline_error(artifact.url, pipeline_name, str(exc))
-                current = snapshot  # restore pre-failure state
+                    self.event_log.pipeline_error(url, stage.name, str(exc))
+                journal.rollback()  # restore pre-failure state
+                continue
+            journal.commit()
+            if result is None:
+                if self.event_log is not None:
+                    self.event_log.pipeline_drop(url, stage.name)
+                return  # deliberately dropped by this stage
+            current = result
         if self.retain_artifacts:
             with self._results_lock:
-                if current is not None:
-                    self.artifacts[artifact.url] = current
-                # else: artifact was deliberately dropped by a pipeline stage
+                self.artifacts[url] = current
+
+    def _process_batch(self, index: int, batch: List[Tuple[str, PageArtifact]]) -> None:
+        """Hand *batch* (``(url, artifact)`` pairs) to the ``process_batch`` of stage *index*.
+
+        The caller holds the stage's lock, so the batches of one stage are
+        processed one at a time in the order they were cut, and the
+        survivors continue through the later stages in arrival order.  If
+        ``process_batch`` raises, every artifact of the batch is rolled back
+        and passed on unchanged.
+        """
+        stage = self._pipeline_stages[index]
+        artifacts = [artifact for _, artifact in batch]
+        journals = [ArtifactJournal(artifact) for artifact in artifacts]
+        try:
+            results = batch_results(stage, artifacts, stage.plugin.process_batch(artifacts))
+        except Exception as exc:
+            logger.warning(f"Pipeline '{stage.name}' failed for a batch of {len(batch)}: {exc}")
+            for (url, _), journal in zip(batch, journals):
+                if self.event_log is not None:
+                    self.event_log.pipeline_error(url, stage.name, str(exc))
+                journal.rollback()
+            results = artifacts
+        else:
+            for journal in journals:
+                journal.commit()
+        for (url, _), result in zip(batch, results):
+            if result is None:
+                if self.event_log is not None:
+                    self.event_log.pipeline_drop(url, stage.name)
+                continue
+            self._run_stages(url, result, index + 1)
+
+    def _flush_batches(self, due_only: bool = False) -> None:
+        """Process partly filled batches in stage order: all of them, or those past their deadline."""
+        now = time.monotonic()
+        for index, batcher in self._batchers.items():
+            with self._batch_locks[index]:
+                if batcher and (not due_only or batcher.due(now)):
+                    self._process_batch(index, batcher.take())
+
+    def _run_batch_timer(self) -> None:
+        """Process each partly filled batch once its oldest artifact has waited ``max_latency``."""
+        while self._batch_timer is not None:
+            deadline = next_deadline(self._batchers.values())
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            self._batch_wake.wait(timeout)
+            self._batch_wake.clear()
+            try:
+                self._flush_batches(due_only=True)
+            except Exception as exc:
+                logger.warning(f"Batch timer failed: {exc}")
+
+    def _stop_batch_timer(self) -> None:
+        """Stop the batch timer thread, letting a batch it is processing finish."""
+        thread, self._batch_timer = self._batch_timer, None
+        if thread is None:
+            return
+        self._batch_wake.set()
+        thread.join()
+
+    def _process_and_emit(self, url: str, depth: int, session) -> None:
+        """Process *url*, then hand its result record to the result sinks."""
+        # Not on KeyboardInterrupt: the page stays in flight, so the final
+        # checkpoint queues it again instead of recording it as visited.
+        try:
+            self._process_url(url, depth, session)
+        except Exception:
+            self._finish_page(url)
+            self._emit_result(url)
+            raise
+        self._finish_page(url)
+        self._emit_result(url)
+
+    def _finish_page(self, url: str) -> None:
+        """Mark *url* as no longer in flight and queue it and its result for the next checkpoint."""
+        with self._checkpoint_lock:
+            self._in_flight.pop(url, None)
+            if self._checkpointer is None:
+                return
+            self._checkpoint_visited.append(url)
+            with self._results_lock:
+                record = self.results.get(url)
+            if record is not None:
+                self._checkpoint_pending[url] = record
+        self._checkpointer.page_done()
+
+    def _copy_state(self, all_results: bool = False) -> Tuple[List[Tuple[str, int]], Iterable[str], Dict[str, Any]]:
+        """
+        Copy the queue, visited URLs and results consistently while workers run.
+
+        URLs still being processed go back to the front of the queue and are
+        left out of the visited URLs, so a crawl resumed from the copy
+        fetches them again.  With *all_results* the whole visited set and
+        all results are returned; otherwise only the visited URLs and
+        results finished since the previous call, for incremental
+        checkpoints.
+        """
+        with self._checkpoint_lock:
+            with self._queue_lock:
+                queue = list(self._in_flight.items()) + list(self.queue)
+            if all_results:
+                with self._visited_lock:
+                    visited = self.visited_urls.difference(self._in_flight)
+                with self._results_lock:
+                    results = {url: record for url, record in self.results.items()
+                               if url not in self._in_flight}
+            else:
+                visited, self._checkpoint_visited = self._checkpoint_visited, []
+                results, self._checkpoint_pending = self._checkpoint_pending, {}
+        return queue, visited, results
+
+    def _checkpoint_snapshot(self) -> Tuple[List[Tuple[str, int]], Iterable[str], Dict[str, Any], Dict[str, Any]]:
+        """
+        State handed to the periodic checkpointer (runs on its thread).
+
+        A finished page's output may still sit in a batch or a pipeline's
+        buffer, so both are flushed after the copy and before the
+        checkpoint that records the page as visited is written.
+        """
+        state = self._copy_state()
+        self._flush_pipelines()
+        return (*state, self._state_metadata())
+
+    def _emit_result(self, url: str) -> None:
+        """Write the finished result record for *url* to the result sinks."""
+        if self.retain_results and not self.result_sinks:
+            return
+        with self._results_lock:
+            if self.retain_results:
+                record = self.results.get(url)
+            else:
+                record = self.results.pop(url, None)
+        if record is None:
+            return
+        for sink in self.result_sinks:
+            try:
+                sink.write(url, record)
+            except Exception as exc:
+                logger.warning(f"Result sink {type(sink).__name__} failed for {url}: {exc}")
+
+    def _flush_pipelines(self) -> None:
+        """Process partly filled batches, then flush buffered pipeline stages."""
+        self._flush_batches()
+        self._flush_stages(self.pipelines)
+
+    def _flush_outputs(self) -> None:
+        """Flush buffered pipeline stages, result sinks and the event log at crawl end."""
+        self._flush_stages(list(self.pipelines) + self.result_sinks + [self.event_log])
+
+    def _flush_stages(self, stages: List[Any]) -> None:
+        """Call ``flush()`` on each of *stages* that has one, logging failures."""
+        for stage in stages:
+            flush = getattr(stage, "flush", None)
+            if not callable(flush):
+                continue
+            try:
+                flush()
+            except Exception as exc:
+                logger.warning(f"Could not flush {type(stage).__name__}: {exc}")
 
     def get_results(self) -> Dict[str, Dict[str, Any]]:
         """Return the detailed crawl results (legacy dict format).
 
         .. deprecated::
             Use :meth:`get_artifacts` or pipeline-based output instead.
-            This dict duplicates data already present in :class:`PageArtifact`
-            and will be removed in a future release.
+            Each value is a :class:`~crawlit.models.ResultView`, a ``dict``
+            sharing headers, links, HTML and extractor output with the page's
+            :class:`PageArtifact`; this API will be removed in a future release.
         """
         import warnings
         warnings.warn(
@@ -1349,27 +1754,47 @@ class Crawler:
         """Check if crawling is paused."""
         return self._paused
     
-    def save_state(self, filepath: str) -> None:
-        """
-        Save the current crawler state to a file.
-        
-        Args:
-            filepath: Path to save the state file
-        """
-        metadata = {
+    def _state_metadata(self) -> Dict[str, Any]:
+        return {
             'start_url': self.start_url,
             'max_depth': self.max_depth,
             'internal_only': self.internal_only,
             'respect_robots': self.respect_robots,
             'max_queue_size': self.max_queue_size
         }
+
+    def save_state(self, filepath: str, incremental: bool = False) -> None:
+        """
+        Save the current crawler state to a file.
+
+        Paths ending in ``.json`` get a JSON document; any other path gets a
+        binary checkpoint (see :mod:`crawlit.utils.checkpoint`).  Safe to
+        call while the crawl is running: pages still being processed are
+        saved as queued.
+        
+        Args:
+            filepath: Path to save the state file
+            incremental: Append only what changed since the previous save to
+                the same checkpoint file instead of rewriting it
+        """
+        queue, visited_urls, results = self._copy_state(all_results=True)
         QueueManager.save_state(
-            self.queue,
-            self.visited_urls,
-            self.results,
+            queue,
+            visited_urls,
+            results,
             filepath,
-            metadata
+            self._state_metadata(),
+            writer=self._get_checkpoint_writer(filepath),
+            incremental=incremental
         )
+
+    def _get_checkpoint_writer(self, filepath: str) -> CheckpointWriter:
+        """The checkpoint writer for *filepath*, kept so later saves can append deltas."""
+        if self._checkpointer is not None and self._checkpointer.writer.filepath == filepath:
+            return self._checkpointer.writer
+        if self._checkpoint_writer is None or self._checkpoint_writer.filepath != filepath:
+            self._checkpoint_writer = CheckpointWriter(filepath)
+        return self._checkpoint_writer
     
     def load_state(self, filepath: str) -> None:
         """
@@ -1379,6 +1804,18 @@ class Crawler:
             filepath: Path to the state file
         """
         self.queue, self.visited_urls, self.results, metadata = QueueManager.load_state(filepath)
+        # The next save starts a new snapshot rather than a delta of an older
+        # one, and the restored results go into the next checkpoint
+        self._checkpoint_writer = None
+        if self._checkpointer is not None:
+            self._checkpointer.writer.reset()
+        self._in_flight = {}
+        self._checkpoint_visited = list(self.visited_urls)
+        self._checkpoint_pending = dict(self.results)
+
+        # Results restored from the state belong in this run's streamed output too
+        for url in list(self.results):
+            self._emit_result(url)
         
         # Optionally restore metadata
         if metadata:
@@ -1393,6 +1830,54 @@ class Crawler:
         """
         return QueueManager.get_queue_stats(self.queue)
     
+    def _fetch_with_plugin(self, url: str, headers: Dict[str, str]) -> Tuple[bool, Any, Optional[int]]:
+        """
+        Fetch *url* through the injected :class:`~crawlit.interfaces.Fetcher`.
+
+        Returns the same ``(success, response_or_error, status_code)`` triple as
+        :func:`fetch_page`, with a :class:`requests.Response` built from the
+        :class:`~crawlit.interfaces.FetchResult`.
+        """
+        result = self.fetcher.fetch(url, headers=headers or None)
+        if result.not_modified:
+            return False, result.error or "304 Not Modified", 304
+        if not result.success:
+            return False, result.error or f"HTTP Error: {result.status_code}", result.status_code
+        response = requests.Response()
+        response.url = result.url or url
+        response.status_code = result.status_code or 200
+        response.headers = CaseInsensitiveDict(result.headers or {})
+        if result.content_type and 'Content-Type' not in response.headers:
+            response.headers['Content-Type'] = result.content_type
+        if result.text is not None:
+            response._content = result.text.encode('utf-8')
+            response.encoding = 'utf-8'
+        else:
+            response._content = result.raw_bytes or b''
+        return True, response, response.status_code
+
+    def _serve_cached_data(self, url: str, depth: int, cached_data: Dict[str, Any]) -> None:
+        """Fill the results for *url* from a page cache entry instead of fetching it."""
+        status_code = cached_data.get('status_code', 200)
+        headers = cached_data.get('headers', {})
+        content = cached_data.get('content')
+        
+        success = status_code == 200
+        
+        # Case-insensitive content-type lookup for cached headers
+        cached_content_type = next((v for k, v in headers.items() if k.lower() == 'content-type'), '')
+        
+        with self._results_lock:
+            self.results[url]['status'] = status_code
+            self.results[url]['success'] = success
+            self.results[url]['headers'] = headers
+            self.results[url]['content_type'] = cached_content_type
+
+        # Process cached content similar to fresh fetch
+        if success and content and cached_content_type.split(';')[0].strip().lower() == 'text/html':
+            # Process cached HTML content
+            self._process_cached_content(url, depth, content, headers)
+
     def _process_cached_content(self, url: str, depth: int, content: str, headers: Dict[str, Any]) -> None:
         """Process cached HTML content (similar to fresh fetch processing)"""
         try:
@@ -1496,6 +1981,10 @@ class Crawler:
     def resume_from(self, filepath: str) -> None:
         """
         Resume crawling from a saved state file.
+
+        The state may be a JSON state file or a checkpoint; a checkpoint is
+        restored up to its last complete snapshot or delta.  Runs the crawl
+        (see :meth:`crawl`) until the restored queue is exhausted.
         
         Args:
             filepath: Path to the saved state file
@@ -1514,8 +2003,8 @@ class Crawler:
         self.load_state(filepath)
         
         # Continue crawling
-        session = self.session_manager.get_sync_session()
-        if self.max_workers > 1:
-            self._crawl_with_threading(session)
-        else:
-            self._crawl_single_threaded(session)
\ No newline at end of file
+        self._resumed, self._resumed_from = True, filepath
+        try:
+            self.crawl()
+        finally:
+            self._resumed, self._resumed_from = False, None
\ No newline at end of file
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+stages.py - Plugin stages classified once, at registration.
+
+The engines used to ask ``inspect.iscoroutinefunction`` about every
+extractor and pipeline on every page.  :func:`classify_stages` answers the
+questions that decide how a plugin is called — sync or async, per-artifact
+or batched — once per crawl and keeps the answers in a :class:`Stage`::
+
+    stages = classify_stages(self.pipelines, "process", batch_size=100)
+    for stage in stages:
+        if stage.is_async:
+            result = await stage.plugin.process(artifact)
+
+A pipeline is *batch-capable* when it has a ``process_batch(artifacts)``
+method (see :class:`~crawlit.interfaces.BatchPipeline`).  The engine
+buffers artifacts for it in a :class:`MicroBatcher` and calls
+``process_batch`` once ``batch_size`` artifacts have arrived or the oldest
+has waited ``max_latency_ms``; the stage's own ``batch_size`` /
+``max_latency_ms`` attributes win over the engine defaults.
+``process_batch`` returns a list with one entry per artifact — the artifact
+to pass on or ``None`` to drop it — or ``None`` to pass all of them on
+unchanged (see :func:`batch_results`).
+"""
+
+import inspect
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+#: Artifacts buffered per batch-capable pipeline when neither the stage nor
+#: the engine sets a batch size.
+DEFAULT_PIPELINE_BATCH_SIZE = 100
+
+#: Longest time (ms) an artifact waits in a partly filled batch by default.
+DEFAULT_PIPELINE_BATCH_LATENCY_MS = 1000.0
+
+
+class Stage:
+    """
+    One extractor or pipeline and how to call it.
+
+    Attributes
+    ----------
+    plugin : Any
+        The registered extractor or pipeline.
+    name : str
+        ``plugin.name`` for extractors, the class name for pipelines.
+    is_async : bool
+        The per-item method (``extract`` / ``process``) is a coroutine function.
+    batch_size : int
+        ``0`` for per-item stages, else the number of artifacts buffered
+        before ``process_batch`` is called.
+    batch_is_async : bool
+        ``process_batch`` is a coroutine function.
+    max_latency : float | None
+        Seconds before a partly filled batch is processed anyway (``None``:
+        only when full or at crawl end).
+    """
+
+    __slots__ = ("plugin", "name", "is_async", "batch_size", "batch_is_async", "max_latency")
+
+    def __init__(self, plugin: Any, name: str, is_async: bool,
+                 batch_size: int = 0, batch_is_async: bool = False,
+                 max_latency: Optional[float] = None):
+        self.plugin = plugin
+        self.name = name
+        self.is_async = is_async
+        self.batch_size = batch_size
+        self.batch_is_async = batch_is_async
+        self.max_latency = max_latency
+
+    def __repr__(self) -> str:
+        mode = "async" if self.is_async else "sync"
+        if self.batch_size:
+            mode += f", batch={self.batch_size}"
+        return f"Stage({self.name}, {mode})"
+
+
+def _number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def classify_stage(plugin: Any, method: str, batch_size: Optional[int] = None,
+                   max_latency_ms: Optional[float] = None) -> Stage:
+    """
+    Build the :class:`Stage` for *plugin*, whose per-item method is *method*.
+
+    *batch_size* and *max_latency_ms* are the engine defaults for
+    batch-capable pipelines; a *batch_size* of ``None`` means the plugin is
+    never batched (extractors).  A latency of ``None`` or ``0`` turns the
+    time trigger off.
+    """
+    name = getattr(plugin, "name", None) if method == "extract" else None
+    stage = Stage(
+        plugin,
+        name or type(plugin).__name__,
+        inspect.iscoroutinefunction(getattr(plugin, method, None)),
+    )
+    process_batch = getattr(plugin, "process_batch", None)
+    if batch_size is not None and callable(process_batch):
+        size = getattr(plugin, "batch_size", None)
+        if not isinstance(size, int) or isinstance(size, bool):
+            size = batch_size
+        if size < 1:
+            raise ValueError(f"{stage.name}: batch_size must be >= 1, got {size}")
+        latency = getattr(plugin, "max_latency_ms", None)
+        if not _number(latency):
+            latency = max_latency_ms
+        stage.batch_size = size
+        stage.batch_is_async = inspect.iscoroutinefunction(process_batch)
+        stage.max_latency = latency / 1000.0 if latency and latency > 0 else None
+    return stage
+
+
+def classify_stages(plugins: Iterable[Any], method: str, batch_size: Optional[int] = None,
+                    max_latency_ms: Optional[float] = None) -> List[Stage]:
+    """Classify each of *plugins* with :func:`classify_stage`, keeping their order."""
+    return [classify_stage(plugin, method, batch_size, max_latency_ms) for plugin in plugins]
+
+
+def batch_results(stage: Stage, artifacts: List[Any], results: Any) -> List[Any]:
+    """
+    Check what ``process_batch`` returned for *artifacts* and return one
+    entry per artifact (``None`` becomes *artifacts* itself).
+
+    Raises :class:`ValueError` if the number of results does not match.
+    """
+    if results is None:
+        return artifacts
+    results = list(results)
+    if len(results) != len(artifacts):
+        raise ValueError(
+            f"{stage.name}.process_batch returned {len(results)} results "
+            f"for {len(artifacts)} artifacts"
+        )
+    return results
+
+
+class MicroBatcher:
+    """
+    Buffer of one batch-capable stage.
+
+    :meth:`add` cuts a batch once ``batch_size`` items are buffered;
+    :meth:`due` reports when the oldest item has waited ``max_latency``
+    seconds, after which the engine processes the partial batch
+    (:meth:`take`).  Items come out in the order they were added.  Not
+    thread-safe: the engines guard each batcher with the stage's lock.
+    """
+
+    __slots__ = ("batch_size", "max_latency", "deadline", "_items")
+
+    def __init__(self, batch_size: int, max_latency: Optional[float] = None):
+        self.batch_size = batch_size
+        self.max_latency = max_latency
+        self.deadline: Optional[float] = None
+        self._items: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, item: Any) -> Optional[List[Any]]:
+        """Buffer *item*; return the full batch when this fills it."""
+        if not self._items and self.max_latency is not None:
+            self.deadline = time.monotonic() + self.max_latency
+        self._items.append(item)
+        if len(self._items) >= self.batch_size:
+            return self.take()
+        return None
+
+    def due(self, now: Optional[float] = None) -> bool:
+        """``True`` when buffered items have waited ``max_latency`` seconds."""
+        if self.deadline is None:
+            return False
+        return (time.monotonic() if now is None else now) >= self.deadline
+
+    def take(self) -> List[Any]:
+        """Remove and return everything buffered, oldest first."""
+        items, self._items = self._items, []
+        self.deadline = None
+        return items
+
+
+def make_batchers(stages: List[Stage]) -> Dict[int, MicroBatcher]:
+    """Return ``{index: MicroBatcher}`` for the batch-capable entries of *stages*."""
+    return {
+        index: MicroBatcher(stage.batch_size, stage.max_latency)
+        for index, stage in enumerate(stages)
+        if stage.batch_size
+    }
+
+
+def next_deadline(batchers: Iterable[MicroBatcher]) -> Optional[float]:
+    """Earliest ``deadline`` of *batchers* holding items, or ``None``."""
+    deadlines = [b.deadline for b in batchers if b.deadline is not None]
+    return min(deadlines) if deadlines else None
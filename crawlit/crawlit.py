@@ -29,7 +29,8 @@ logger = logging.getLogger(__name__)
 # Import the crawler components
 from crawlit.crawler.engine import Crawler
 from crawlit.crawler.async_engine import AsyncCrawler
-from crawlit.output.formatters import save_results, generate_summary_report
+from crawlit.output.formatters import save_results, open_sink, SummarySink
+from crawlit.utils.queue_manager import QueueManager
 
 def parse_args():
     """Parse command line arguments"""
@@ -39,8 +40,8 @@ def parse_args():
     )
     parser.add_argument("--url", "-u", required=True, help="Target website URL")
     parser.add_argument("--depth", "-d", type=int, default=3, help="Maximum crawl depth")
-    parser.add_argument("--output-format", "-f", default="json", choices=["json", "csv", "txt", "html"], 
-                        help="Output format (json, csv, txt, html)")
+    parser.add_argument("--output-format", "-f", default="json", choices=["json", "jsonl", "csv", "txt", "html"], 
+                        help="Output format (json, jsonl, csv, txt, html)")
     parser.add_argument("--output", "-O", default="crawl_results.json", help="File to save results")
     parser.add_argument("--pretty-json", "-p", action="store_true", default=False,
                         help="Enable pretty-print JSON with indentation")
@@ -173,8 +174,21 @@ def parse_args():
                         help="Cache time-to-live in seconds (default: 3600)")
     parser.add_argument("--enable-disk-cache", action="store_true", default=False,
                         help="Enable disk-based caching (persists across runs)")
+    parser.add_argument("--cache-max-memory-mb", type=float, default=64,
+                        help="Memory budget for the in-memory page cache in MB (default: 64)")
+    parser.add_argument("--cache-http-semantics", action="store_true", default=False,
+                        help="Honour Cache-Control/Expires/Vary and revalidate stale cache entries")
+    parser.add_argument("--offline", action="store_true", default=False,
+                        help="Replay a previous crawl from the disk cache without any network access")
+    parser.add_argument("--low-memory", action="store_true", default=False,
+                        help="Stream results to the output file without keeping pages in memory")
     parser.add_argument("--save-state", default=None,
-                        help="Save crawl state to file for later resumption")
+                        help="Save crawl state to file for later resumption (checkpointed "
+                             "periodically during the crawl unless the name ends in .json)")
+    parser.add_argument("--checkpoint-interval", type=float, default=60,
+                        help="Seconds between --save-state checkpoints (default: 60, 0 to disable)")
+    parser.add_argument("--checkpoint-pages", type=int, default=None,
+                        help="Also checkpoint --save-state every N crawled pages")
     parser.add_argument("--resume-from", default=None,
                         help="Resume crawl from previously saved state file")
     
@@ -185,6 +199,10 @@ def parse_args():
                         help="Minimum content length for deduplication (default: 100)")
     parser.add_argument("--dedup-normalize", action="store_true", default=True,
                         help="Normalize content before deduplication")
+    parser.add_argument("--dedup-near-duplicates", action="store_true", default=False,
+                        help="Also skip near-duplicate pages (SimHash similarity)")
+    parser.add_argument("--dedup-similarity", type=float, default=0.95,
+                        help="Similarity threshold for near-duplicate detection (default: 0.95)")
     
     # URL filtering options
     parser.add_argument("--allowed-pattern", action="append", default=None,
@@ -239,6 +257,7 @@ def main():
     if args.verbose:
         logger.setLevel(logging.DEBUG)
     
+    result_sinks = []
     try:
         # Record start time for duration calculation
         start_time = datetime.datetime.now()
@@ -303,16 +322,20 @@ def main():
         
         # Setup page cache if enabled
         page_cache = None
-        if args.use_cache or args.enable_disk_cache:
+        if args.use_cache or args.enable_disk_cache or args.offline:
             logger.info("Setting up page cache...")
             from crawlit.utils.cache import PageCache
             
+            # Offline replay reads whatever a previous run left on disk, however old
+            enable_disk_cache = args.enable_disk_cache or args.offline
             page_cache = PageCache(
-                ttl=args.cache_ttl,
-                enable_disk_cache=args.enable_disk_cache,
-                cache_dir=args.cache_dir if args.enable_disk_cache else None
+                ttl=None if args.offline else args.cache_ttl,
+                enable_disk_cache=enable_disk_cache,
+                cache_dir=args.cache_dir if enable_disk_cache else None,
+                max_memory_bytes=int(args.cache_max_memory_mb * 1024 * 1024),
+                http_semantics=args.cache_http_semantics
             )
-            logger.info(f"Cache enabled: TTL={args.cache_ttl}s, disk={args.enable_disk_cache}")
+            logger.info(f"Cache enabled: TTL={page_cache.ttl}s, disk={enable_disk_cache}")
         
         # Setup content deduplicator if enabled
         content_deduplicator = None
@@ -323,9 +346,14 @@ def main():
             content_deduplicator = ContentDeduplicator(
                 enabled=True,
                 min_content_length=args.dedup_min_length,
-                normalize_content=args.dedup_normalize
+                normalize_content=args.dedup_normalize,
+                near_duplicates=args.dedup_near_duplicates,
+                similarity_threshold=args.dedup_similarity
+            )
+            logger.info(
+                f"Deduplication enabled: min_length={args.dedup_min_length}, normalize={args.dedup_normalize}, "
+                f"near_duplicates={args.dedup_near_duplicates}"
             )
-            logger.info(f"Deduplication enabled: min_length={args.dedup_min_length}, normalize={args.dedup_normalize}")
         
         # Setup URL filter if patterns specified
         url_filter = None
@@ -418,6 +446,44 @@ def main():
                 logger.warning(f"Cannot resume from {args.resume_from}, starting fresh crawl")
                 args.resume_from = None
         
+        # A binary --save-state file is checkpointed by the engine while the
+        # crawl runs (and once more when it ends); .json files are written
+        # once, after the crawl
+        checkpoint_path = None
+        checkpoint_interval = args.checkpoint_interval if args.checkpoint_interval > 0 else None
+        if (args.save_state and QueueManager.state_format(args.save_state) == "checkpoint"
+                and (checkpoint_interval or args.checkpoint_pages)):
+            checkpoint_path = args.save_state
+
+        # Stream results to the output file as pages are crawled.  Image
+        # extraction annotates the results after the crawl, so it keeps the
+        # end-of-crawl export.
+        output_sink = None
+        if not args.extract_images:
+            output_sink = open_sink(args.output_format, args.output, args.pretty_json)
+            result_sinks.append(output_sink)
+        summary_sink = SummarySink()
+        result_sinks.append(summary_sink)
+
+        # --low-memory drops each page's artifact and result record once it
+        # has been written, unless a post-crawl step still needs them
+        retain_results = True
+        if args.low_memory:
+            needs_results = [flag for flag, enabled in (
+                ("--extract-tables", args.extract_tables),
+                ("--extract-images", args.extract_images),
+                ("--extract-keywords", args.extract_keywords),
+                ("--extract-content", args.extract_content or args.extract_headings
+                 or args.extract_metadata or args.extract_images_context),
+                ("--database", args.database),
+                ("--save-state", args.save_state and not checkpoint_path),
+            ) if enabled]
+            if needs_results:
+                logger.warning(f"--low-memory: keeping results in memory for {', '.join(needs_results)}")
+            else:
+                retain_results = False
+                logger.info("Low-memory mode: results are streamed and not kept in memory")
+
         # Determine whether to use async crawling
         if getattr(args, 'async', False):
             logger.info("Using asynchronous crawling mode")
@@ -449,6 +515,7 @@ def main():
                     session_manager=session_manager,
                     url_filter=url_filter,
                     page_cache=page_cache,
+                    offline=args.offline,
                     storage_manager=storage_manager,
                     store_html_content=not args.no_store_html,
                     content_deduplicator=content_deduplicator,
@@ -460,11 +527,29 @@ def main():
                     sitemap_urls=args.sitemap_url,
                     same_path_only=args.same_path_only,
                     max_queue_size=args.max_queue_size,
-                    incremental=incremental_crawler
+                    incremental=incremental_crawler,
+                    retain_artifacts=not args.low_memory,
+                    retain_results=retain_results,
+                    result_sinks=result_sinks,
+                    checkpoint_path=checkpoint_path,
+                    checkpoint_interval=checkpoint_interval,
+                    checkpoint_every_pages=args.checkpoint_pages
                 )
 
+                # Resume from saved state if specified, otherwise start fresh
+                resumed = False
+                if args.resume_from:
+                    try:
+                        loop.run_until_complete(crawler.resume_from(args.resume_from))
+                        resumed = True
+                        logger.info(f"Successfully resumed from {args.resume_from}")
+                    except Exception as e:
+                        logger.error(f"Failed to resume: {e}")
+                        logger.info("Starting fresh crawl instead")
+
                 # Run the crawler in the current event loop
-                loop.run_until_complete(crawler.crawl())
+                if not resumed:
+                    loop.run_until_complete(crawler.crawl())
                 
                 # Handle async post-processing inside the loop context
                 async def async_post_process():
@@ -472,10 +557,12 @@ def main():
                     
                     # Get results
                     results = crawler.get_results()
-                    logger.info(f"Crawl complete. Visited {len(results)} URLs.")
+                    logger.info(f"Crawl complete. Visited {summary_sink.count} URLs.")
                     
                     # Save state if requested
-                    if args.save_state:
+                    if checkpoint_path:
+                        logger.info(f"Crawl state checkpointed to {checkpoint_path}")
+                    elif args.save_state:
                         try:
                             await crawler.save_state(args.save_state)
                             logger.info(f"Crawl state saved to {args.save_state}")
@@ -524,6 +611,7 @@ def main():
                 session_manager=session_manager,
                 url_filter=url_filter,
                 page_cache=page_cache,
+                offline=args.offline,
                 storage_manager=storage_manager,
                 store_html_content=not args.no_store_html,
                 content_deduplicator=content_deduplicator,
@@ -536,27 +624,38 @@ def main():
                 same_path_only=args.same_path_only,
                 max_queue_size=args.max_queue_size,
                 max_workers=args.max_workers,
-                incremental=incremental_crawler
+                incremental=incremental_crawler,
+                retain_artifacts=not args.low_memory,
+                retain_results=retain_results,
+                result_sinks=result_sinks,
+                checkpoint_path=checkpoint_path,
+                checkpoint_interval=checkpoint_interval,
+                checkpoint_every_pages=args.checkpoint_pages
             )
             
-            # Resume from saved state if specified
+            # Resume from saved state if specified (resume_from runs the crawl)
+            resumed = False
             if args.resume_from:
                 try:
                     crawler.resume_from(args.resume_from)
+                    resumed = True
                     logger.info(f"Successfully resumed from {args.resume_from}")
                 except Exception as e:
                     logger.error(f"Failed to resume: {e}")
                     logger.info("Starting fresh crawl instead")
             
             # Start crawling
-            crawler.crawl()
+            if not resumed:
+                crawler.crawl()
             
             # Handle sync post-processing
             results = crawler.get_results()
-            logger.info(f"Crawl complete. Visited {len(results)} URLs.")
+            logger.info(f"Crawl complete. Visited {summary_sink.count} URLs.")
             
             # Save state if requested (sync version)
-            if args.save_state:
+            if checkpoint_path:
+                logger.info(f"Crawl state checkpointed to {checkpoint_path}")
+            elif args.save_state:
                 try:
                     crawler.save_state(args.save_state)
                     logger.info(f"Crawl state saved to {args.save_state}")
@@ -741,7 +840,11 @@ def main():
                 logger.warning("Continuing with file output only...")
         
         # Save results to file in the specified format
-        output_path = save_results(results, args.output_format, args.output, args.pretty_json)
+        if output_sink is not None:
+            output_sink.close()
+            output_path = output_sink.output_file
+        else:
+            output_path = save_results(results, args.output_format, args.output, args.pretty_json)
         logger.info(f"Results saved to {output_path}")
         
         # Handle comprehensive content extraction if enabled
@@ -923,13 +1026,17 @@ def main():
         
         # Show summary if requested
         if args.summary:
-            print("\n" + generate_summary_report(results))
+            print("\n" + summary_sink.report())
         
     except KeyboardInterrupt:
         logger.info("Crawl interrupted by user.")
     except Exception as e:
         logger.error(f"An error occurred: {e}")
         return 1
+    finally:
+        # Finish whatever was streamed, including on interrupt or error
+        for sink in result_sinks:
+            sink.close()
         
     return 0
 
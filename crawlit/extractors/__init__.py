@@ -9,7 +9,10 @@ from .keyword_extractor import KeywordExtractor
 from .content_extractor import ContentExtractor
 from .forms import FormExtractor, Form, FormField, extract_forms
 from .structured_data import StructuredDataExtractor, StructuredData, extract_structured_data
-from .language import LanguageDetector, LanguageDetection, detect_language
+from .language import (
+    LanguageDetector, LanguageDetection, TrigramLanguageModel,
+    detect_language, detect_languages, get_language_model,
+)
 from .pdf_extractor import PDFExtractor, extract_pdf_text, is_pdf_available
 from .js_embedded_data import JSEmbeddedDataExtractor, extract_js_embedded_data
 
@@ -43,7 +46,10 @@ __all__ = [
     # Language Detection (NEW)
     'LanguageDetector',
     'LanguageDetection',
+    'TrigramLanguageModel',
     'detect_language',
+    'detect_languages',
+    'get_language_model',
     
     # PDF Extraction (NEW)
     'PDFExtractor',
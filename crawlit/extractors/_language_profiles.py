@@ -0,0 +1,1268 @@
+"""
+Precomputed character-trigram profiles for :mod:`crawlit.extractors.language`.
+
+Each profile is the language's 1000 most frequent lower-cased character
+trigrams, most frequent first, concatenated into a single string (every
+trigram is exactly three characters, spaces marking word boundaries).  The
+rankings were derived from the Wikipedia n-gram frequency tables published
+with the langdetect project (Apache License 2.0), keeping only trigrams
+made of spaces and letters of the language's own script: the tables pick
+up Latin trigrams from the English names and citations in non-Latin
+articles, and punctuation, digits and stray Han characters besides.
+
+Chinese and Japanese are not listed: those tables fold their characters
+into a few representatives, so they are identified by script instead.
+Vietnamese is not listed either; being Latin-script, it falls below the
+model's coverage floor and is left unclassified.
+"""
+
+TRIGRAM_PROFILES = {
+    "ar": (
+        " الية  فيفي الم منمن ات الأ والى والها العالترة ان ين  علالي"
+        "ام  باالحهو انيالب أوالقنة هي علىلة السباليا الجون الشال الا"
+        "عة الإدة اء الدير  هو عا للما نية إلالفكان هيمة ني الكريةالن"
+        "تي عامالريد لي إلىأو  ما بندين كاقة  وتدي  ول وهول ار  عنلتي"
+        "الوبر بن قع الل معري مدي مد أن محياتينةاد بيةكة لية بي تق وم"
+        "ماللم اري ويربيمانرب بة  مويل  و لعادم ورييم ادي مربي  مسولا"
+        "ميةنهاالصور الخ لالماعد عب له لعرلياالهاً عن مي ديةالثانتفة "
+        "وم بينالذلمسلك قدمأول بعهم رياالطسي استنطقولياب  هذلمتلاممنط"
+        "لايعاليه  بلنيا عببانغربمع لمنلديملكطقةلا بعد برائيلأوموا يق"
+        "يونسم محاتقعمل لأر أب حي أحكرة يو حولاتلهاعرب ناعلي اسايةيس "
+        "ود دى لذيمد  مقيرة سنقد لعب قدينيارة متكل راتمساكون وق وأسية"
+        "سة  مجمارالغعملوب لأمسيا كر حاحافريكحة نوبته اسملمي تعوهوبل "
+        "شمابارونينت مرك كممريلمعلد  عم سييو يكيدولحمديث براذي مقا مص"
+        "ريقلمملقرلموحد  فر سالشرذا لدوجنوافظ لمامينسيبد  عد بوسنة وك"
+        " كلأن  تو أك دوبلديزيجة ليدركةوفيلإنركزليوتابمصرنه  قر إح وب"
+        "صر هر وهيولديناتهابري تحلالشرق أمأمر أيمثلتحدلسللانظة عبد ان"
+        "اسيلاس يع شر نوحدةنادإحد جا ديحدىعلممبركز فظةلمحقريلمدولة تم"
+        "لمرحاللاعسلابيرأحدتم ليمساح إسغيريمييهاضمنرى حيث قايق ائروان"
+        "ترا سولقدكي اع ديدهذامستيان بممحم أسبلغعمالبروي وما كوكية ضم"
+        " يتوسيذه عددسبامتحيخ  وس لهقاطرق  بهقي دد بع  م نانرانلكةتار"
+        "ادةلعل روهذهدار وع قبلغ لإسستخلسيليهلجنمملنا لثالفرارايراوية"
+        "وسطصل رف رين تنكم را ذلكابع إنتخداس  تاايااطع ألمر ماتيليياس"
+        "لله لييت لتاوكادورلحرليزلقاطة رنسفيهاق  وفرس اة وس دنييب يطا"
+        "فرنناتجامقيةكن  خلباتشار داخدم ميوبياحةمعاومنعيةالزرئي بدائل"
+        "يينسكاتيناعبامعردنيديكمايف  لكبهاتوننجل جنأرداضيالةثانبه ئيس"
+        "عتبقبلابا تسسان تتتبرلح مينودي تباج لأس ملشكلارسعود جمراقوقد"
+        "وض لسالملجليريخ إي ينديم نسلادلومبنااعي ترلحاشركلمصلسويقعنوا"
+        "لعمورةلكرطريلمجصريمنذثل  سلسط طعةعراطول شمئية لونذ  يسسابلغر"
+        "خلاولىرض واتبا لشموع وناانو تشإنج شافريزيةسورحوضإسبيقيأنه عر"
+        "لوليلارهامجملدرانهمنهلبحدا منامهاند  وحايريز جد  غرطاللجزلف "
+        "زة مياوراسينصالمترروسلبييع باسرت دراكات سكمرامه لناعرففيلويت"
+        "ره قارلباعاصنديافةيستحواكبر أراناثر راءاتهمنتعادلندلكونيولفي"
+        "شر بحرغة هورسميبعةاز  كييضادر لس يومنساعينلبلديا تأأبواف درج"
+        "عات لتموعوا تر علارك للموميميل فاروندن بلايماوعةلأنمعةيلةقلي"
+        "جمويقارج واححياعشراربمعركريقيا جوزيراتيمليلشيكتاتلفقدي خامسل"
+        "اعةارك يللاقكتولكنلترداد طررواألمناءتكورجةموسلرووف مير وج أف"
+        "شريلبنصة حديلب وار بحبعضتى يريوبامجللوارقيسيمستاتصامايحادروب"
+        "ماعكلي ثم بط حراصمإسل مثتب عي هد تحت جزلينيسيكثر سبلجميدةبول"
+        "سعوقاللغةلاحعندطبيستو بتولو كتلمقتحابو  أصلعدنوعللغلون ممياض"
+        "وروالآابياح نتامى وادكبيلكتلفارن وائسلسواسئي راسلطا ابيلعأيض"
+        " ريتجاابق أع يح هايارطانوبرحكمثم  درحت  يمبيالصاأورونساحداما"
+        "ربعافيتبعخليلأللتونينيكو لأتميتور تلطينقل لكيلكاعلوقاميكالطب"
+        "تركروفثير مكلريكالوق توفده حتىتانتمايتيرابتقلظيمحيةيعتلوسدائ"
+        "مون بأرائفيةرد  أخحركيسملجاعديأكبيروضي نونكوم أهفلسبطوامةاوي"
+        " ورأخرخاصكارعبا غيويلهنداك مدرإنتحريثلادريللاجارعض تبل حسركي"
+        "لدا مخوتومبا عشلتحاقيجزيماءلحي مشلحدصمةجمعأحم تكعدةاه ياب را"
+        "رومدانلتعتالراضنظيلقوكتبرايشخصكويلتق بشجلس نيطور فلشيخحربباب"
+        "تنظوطنتعدراميبيدامتشاقرندمالخاريد مؤ حتاملدرس كبجمافترسلممام"
+        "ارتبيلختلصورأكثلق لت  لعتفا أققرايش لمشنتيفر دونللعدهامت ابن"
+        "فاعئل  لصإيط تصشهرلراسطييمةلفنمادلاثوت ثة بيعرع  ون نظست لسط"
+    ),
+    "cs": (
+        " jeje ní  poch  v  a na  pr na seho ce terou  ne ro stickpro"
+        "ýchse ostem  přké kteky skéstaéhoně  kt ob ve do by kobylím "
+        "ka la  vy z ký ova zaku skýcí stiích jané nskdní ma sp čelov"
+        "souednrovstreníová leká  soistný  pany vníle ckéod  odpřejed"
+        "to ko nímná  meti ícípododnovépolsto mo tekéh kaznaranvé  ná"
+        "ie nosastředovýentnic záckýako reve  sv výtelnebebomi vá en "
+        "ta echelepravan taspo liticujechověttroým slody kovém st ro "
+        "esklníicetí rodmenate slvánjícnovovibo  ně krtrajakroz jikon"
+        " s oleatičesci yl  mě zeerýkýcletíhova  hoskoerikouání aněst"
+        "nícálntnísky chra ze ravlo jí nejoceměsvenstetorástros devýc"
+        "eckaninýcvatší  inladverolirocrý vod miskunourok dr sk trpří"
+        "hodoloel skárictovokutřeklazemeré aldu inado  todnotavlavlen"
+        "mu ameek aloují fiester  hrčnítaklicledlas osnu ré enstinty "
+        "čenes acedob cekolerážen plzenal on padčásus ojerníezi baví "
+        "drupřiníhhra o ern votu  brval sanačno velruhcháionenýajístá"
+        "jsový ečnovo boototvíale jsru denedestvali ditskinylskli uží"
+        "níkrá achstu larat znadnektly mezda ylaichde vintecnik noero"
+        "ry ří ověat enoori vznamoveházeverskckástílinpou dastřoznřen"
+        "ouž foin charáldovmerčas čilitedivou k nceii  ozres frloutar"
+        "ite siceneralemanýkraant artiv lo bematlog orhlakémhovtě ovn"
+        "or  am čálikjenžívenáehože ak andposlat raika vlpojstnavnlož"
+        "aké co i elk peinorad téejíodusob kltannciáze hl buancato au"
+        "za an ropjehnéhangsvězi omokýmlan věči prvkupzí jšídněvy ad "
+        "ožeforenametnámnemlu  sygrail enérávskaji jejormeliracblidin"
+        "nýmtalpráec mecha ménromvě tří hehu leč řeutookroblři turins"
+        " okán fravitodooslparupi půpinet enekomoučtemněkanarajanéum "
+        "ogi hatátochroteterojží ckyků lisemiaraystáro rudle asápalád"
+        "oroincby ngl dvějšporramkosemírvnáleacítvoingcelsevznánte ži"
+        "dě soviália kráohoýmiperonsázíariaroněm vizápmarvsknějslanti"
+        "povodeetrzniokoiliněnalamí aviicirchuskansináobeísttolším ni"
+        "počritík  zplekětšadaitamanjméaktivnave třozeis  thminlesrie"
+        "it názpisdí kemežíroběmenstodlrazanočelorabornad žeovsěnírou"
+        "amiauttéžnacéž remdělers úzcíctomonoba áchev adituppatpo tat"
+        "ůvoejvma asine témižnnotvořust bináritiblaanáinuonijinnispla"
+        "si avahorder kubraté trironhemineiloačeúzeouzideervenc tvome"
+        "acichetů nesnapvojmá obyorglos kmdvoglikat říčno grnaldalárn"
+        "vys opdemona u etislermafilkreelnobnívatonlivejnkarrusublrak"
+        "nta vařesardřídadevéhstěorestéiniriskdyreptruogrckoousoruopr"
+        "bníesent gen gentotenng  sumořzovtoudeltikrů nat mízalarthy "
+        " kdřecnálikyedoetodatnerosomov huzákgan vášícatapubnitov ont"
+        "ortbývořeštětkaře ed ktičovpoz býačnoti scmaldi vu ležic uni"
+        "osajskíváapohráchnylolidihoharvolžnídnáobrcovodi jm všbecvaj"
+        "pův tukláývamnočersu zejmskdlolé eznávaamoobíornsysvlaobc ti"
+        "motaž  ažtekdskazemís zvberrgamicčinůsoam avoejintrbě jovvoz"
+        " smvně křlnědnežiterepůsvlávál zktheik ikodostvaopetrátlipop"
+        "prenco umbalivoenioneezeane mujemazyzsktšívýmved těoboozd čl"
+        "intřadátkuchánavarher čaoluvýz dnudedstar net urživepujmeilm"
+        "tioitofic zdpohřskálo máatřotekuljazsluzacnů potebnvznploěle"
+        "áváaduoběcesre vid síasnčujrveychjevykleta tybil cajižismahr"
+        "itumocni pandissahbřeivagicermesnnémive cíulthudpomlkozevobi"
+    ),
+    "da": (
+        "er en et  de i  er en ogog denderde fornde af foaf terand me"
+        "lle soereinged ligsk detre om steor  st tike ne lertilsomger"
+        "lanske beng  etindes endil  frar te  haansnskge  inelliskion"
+        "medngeels ko på dapå verdelestigend generiedefrastale dt  ma"
+        " bl veat enson danan ra ernmenret vammestiatiistst  prggeund"
+        " limerill elers la sael vartiokomtte resen udentnerse lev si"
+        "ordninlsestr no ka sk anrnens renommig  føser atangive hered"
+        "provedrin grbletenoventekan seberev eli ba opkke fi omman br"
+        "harnor vikenidendtnneone hoold spmunenegt iggnet alienal mmu"
+        "lderikstolinmarorgtet am mikerndsgnearttor motal tr un syfte"
+        "eteavnorm byrerrantisrstholska na hvpertatspiagekrialeis nes"
+        "betem nstrg samris arhanfødngsinsnalortresødt pain ikapilrt "
+        "rdevenogn rodesrkeamearkmetateammrie podrerignennishav faune"
+        "sogant kiregors ty fllen tertetidrd by minve hedtraherførade"
+        "værvetedsorerreirklemskr pegel geus allkonele le tarskår egn"
+        "veslt dlinsebelratkal thlliine krben keigt digetøstørsdstald"
+        "ære bomel cark så borletik iti toparsidfileveum gn lesvisnt "
+        "ssekreld temkabbesjerennbansydtegpri vænelvor gaaliyskndrrun"
+        "rme cobruaveted mugantreannnavergtanikktrugrurup orogstys sl"
+        "tikodealtsighvoilm ovbyglla nelskabetivlitattmesrs me onsamt"
+        "theekteltts orippelagsanturådefre ofiftsonds sinettvn omeerr"
+        "iertrimodanigsåssiplatliiteenharelstmt ertie  biøreerayggege"
+        "sis lovinkelft eskas lad årarioli raledseldisankktiona kltør"
+        "skieftruggivtin rilieunivan kølogasteksanenat kugrarovolo ja"
+        " jood inandb ruegi ef hiessefo sø øskilisehe rn cerndilm tro"
+        "rådhovøbe svidlvneia ardollstlydeassndlblikøbtigti skorge hu"
+        "agtengrtistøembddehel chtesrelnke feintlkegesvidiliør boligh"
+        "polag telto lis plralglerodsatbyeemmusimusrmasikerdængnmatni"
+        "aktståudeungmattiflægdigetsdleogiini guna orbad udgole ju do"
+        "gteketanmmildbyntrdboystronmbeitaeta måadikt ritcenkuntræfin"
+        "ropslayenkrarogchaemerevhusremschdskpe kor surefsit buklaopr"
+        "ustiloianncekololknhaalbraflomtadikeræskirsiotagtarrberlidag"
+        "odu cefat isuppup dinenigræblaktece rgaarasprramlivgreesioft"
+        "ervækktiterftonanapormrårdiuge ikgårsventarom hjvilietnedit "
+        "dtiamierurnaoniomrrækejerumlasur val høghevstntiomppenam fle"
+        "rsoongskuka arb voyeriellatmpeontær  auldtrænbinrkserbid of "
+        "lgeuroorftekrivdvida orkpredteisskniialægtroschenieejdhen lu"
+        "erlsbygiosesireck tårradud  såhøjærkogrca frismeænddieuserol"
+        "unaildks reiriaun bretabovsta misrvefolrtsjorreaspelub pidse"
+        "os lå jdeedich elvbejffeeissetsty næpanlodueremivirbrihisure"
+        "fodab hviomagis lådgisbenemsleudsespældlekalrll ichlikmidock"
+        "dveibevelællidsdsbldsbegodbiv gstbasosthjelreædeetiancrseoge"
+        "rsindoornlteeinatuoffdspdompræampård adåneop udvtyrarsri vik"
+        "sa kiniklyre niamluktrlault sæsæthaltydkstaseduckleucekluata"
+        " wialsigs ekegr læermrfandkdatuarørrngl scspooviyttadsfun dr"
+        "vejedlnniatorm eseebridtetykulmål fu nu jenivunkbedanubiljen"
+        "ksebjeerhuddciagnivigmstnverekro  wala lbuoursvijemelaulidla"
+        "ødefikløbmalayeasirueaftsniæstonddemomkdriarlls alaricdniitu"
+        "iktussrakgi barematlerønbrorebdkrrocjælrhuunslutnktgørgieurg"
+        "achbumni nda kmth lavlmeedropsnomrimiddomiyllkatruslilty nit"
+    ),
+    "de": (
+        "er en  dederscheinin  eicheistnd ie  inst  unichund is diisc"
+        "dieinech es on  bende auhensteter voungne  gedentenandng gen"
+        "ver stte vonstaim ber imdeshe reiherde  si daentersit  ve mi"
+        "us auseitlanlicion alindem  zuntechtas mitngener we errenach"
+        " scnis ma anmenereernrt et rdeeic wadas sechaeisest re hatsc"
+        "an nenar ienigeiererteutis lleell wierieme lalie natioatichi"
+        "ensaufendsseuchls ger grum demsenle wargesel alsteilerrtedeu"
+        "rie prsiewei kant  likan he baann frmeiodezeiingutstellen me"
+        "ort amge artuntheittetra enallhrerananichngem füei beibenstr"
+        "ielitealtene spngsechht re  sotadeiltunhafproametliaft jaadt"
+        "hne biergurdaliaucfürür  korn liseteangur merahrrunse nstass"
+        "rchman noseielerstuf leichlwurinswer lebezrd  wurg hauchsgeb"
+        " odal esekreedeegeiedtisdt risft ord po colt  saerbspiateale"
+        "serltepielin teesseberinrscsis brtanantregmalnalat erabesika"
+        " neelt or ariegezesicam stinettheerltor chnieini pafor buiti"
+        "wirfraburagegelnacmarvornesselgt noril mmeriknneilins hanchr"
+        "nntenazu ckechwparerr absin hoor egitz  zwittanz thurgtaldet"
+        "rgenatonaweshteerwnschaljahsprric umehetemird moeruiss ni fa"
+        " kruss esescerkratintwieübeperfersgebiskertst tr rotigfenzen"
+        "sitturrectrigra duhr amipolwalerdrts kussiammiesoliatt zeeng"
+        "itzoneariligenb übautnzelitonstetostchugli sündiinainzkomll "
+        "nanobebuntesnamik  usgehiserk utesüdkenrre klustabe festlhri"
+        " ranz nseekt kirs zursstehrltuunilunhemdismbeia rit fimetive"
+        "musrbeurcme ochemass erf viilletzommhieori hiembhisegttikorm"
+        "welnn ohnegriketonig restredelna bauffernehesaat rubanrauson"
+        "taarerwishörrli cagruhweerhom  flnti gaideppenunehöarets kon"
+        " juarknemdor drecknglron boral fock durollzummingieanslatenn"
+        "rif permaitaoloanaondmatlasnigpriebiracietrünllihmeenkeziels"
+        "etreurtroildtinkt ktilagiebstoändgegermganau rheankgiofilsam"
+        "oni muhlezieaupockstuenzeniündmil douptfrehlahinrwainnardtie"
+        "hatrkeovi tantrbarastilmbielogbraldedlitatke gisächdrendsört"
+        "ld eimhunty esirovettomeiffgretehwohtiv fu lofinsetllsuseick"
+        "dunöstsanneuitsrnavinkeimonediiangroragntagribalainarairkühr"
+        "hoc toroptzeuerontbillesadetätorg jo glgun rizereigntsbliflu"
+        "ra twanicntomisorf jerlatzttarrtindkehthsefridkreliounorefte"
+        "plaof lusfühlgevomathbreuarzweahllosusiorseid obkirrze ihahn"
+        "falrhaile pfialharrwerbaupp etircromporwicndu wopenängwen eh"
+        "hrtinwriarz rsice seealb ofntlkrisbeff elditäpanowichopranla"
+        "erzadios ösislagewnzözösed kteriglegzwiunkut ogiklape sikuto"
+        "oma gigleiftretaueituugewa  tizt la asirf lauultroßaktgrümun"
+        "holelalm rgaigtomphn thotlerupogenwofamehmekaarbücktrurmeatu"
+        "rafta usgviecouihrelbsowhststä suzirewekelnehurofelka digrtr"
+        "etwrodatzndokleramnbeae htsftssatbrinhailoee gtentwag elnbek"
+        "veneiblltisida ystlbefas lu elln  aslla osradeorhnunit goorn"
+        "eizizioffancßenebraldusarse pihliheuimmntygefährureane köße "
+        "ey arlnkelemrm belndlnheosenktolgogrlchtt enfttuutznbasionch"
+        "ovekraoss kmanuze th fußbinad icama dareroulioduni sorktobet"
+        " rhala blzunudeenhbe  plio hnimt ginrsprumhilotemaieminbugar"
+        " phßbaeiekatfahruslomdin syfollscbefußburzhl örd kerfaiumtwi"
+        "ngabacve ms narndaletli preremaumtitufgcomdamrgiät lstkun va"
+    ),
+    "el": (
+        " τοου αι  κα τηης του σττο καιας ος της απην την ποία  με εί"
+        "ων ίναείνναιτικικήστηαπόπό ται ο ια που η  πρικόαν ός τα ής "
+        "στονα  ανετακή  διμε ίαςτη τανον ες  παού νικυς ουςκό τονών "
+        "σε  συις ει  επτωνση μα ίου πετεροπο σεκατπεριστως εριματνομ"
+        "ικά τωκά  έν ήτήταέναές ρα  γιικοπολατο αραντ ταστιπαριο προ"
+        "διακε τιςηκε ελοι αναντακήςστα ή  οιμέναστθηκημαλογρικαποελλ"
+        " γεισμλληαρχρισ οπ μακού αυ υπποίμετγιαολο μιερο νασυνλικ μέ"
+        "ληνατα κοτά αυτοντναςρουαραρο κόςντισηςρος εκ θε αγολι χρριο"
+        "γρα βαβρίειασίατροουρεί νο ατι βρ σύ ενμικ νοτοςρίοποι μοεπι"
+        " τρουν τιαλλ δεόνοσημνη σειονομουμούρατνία ασχειποτ δηλη ατά"
+        "ίο ηνινουστήτελστειακουσ ωςμερομασκεμιαότε πλανι αλστργεν μπ"
+        "τρανωσρίσδικ οροικκαλρίαφοριοςγίαδημεραομάρειραφνειβασπόλλεί"
+        "οτετριτήςιουμαντητζετκώνμεν πόσα είτδα ελε κυπανησηότημο εία"
+        "ομοορίένοσμόύς τασοίοίσκασι ισ σηλο νος κάριαικώ έχκαν κόυν "
+        "γαλασίιώνλοςειςπρωίταούνρά ούςκέςλλοάδαροσερίλλάρωτνηςίζερον"
+        "οδοσικλουλιτιας χαημοήματορδιογνωογρικακετάλλλία ευακτικέ όν"
+        "νων κρεθνουλσμοωστήθη ομυτι δήρακιά δήμεπίμό τηρνησέχεογίείο"
+        "ήμοορεφέρυπο σκ βονός γνρη ασηανίραςοριόρορησμεγγιοανοητααγω"
+        "υργδιάπρώ ον αθέρεάς τή τημερμκου ακπρόυσιιλιταςνισαιρ αιίων"
+        "ρετρείμία όπούσκρα αμραγαλασφατείυτοησιόμεστόιτιειρτολνατωση"
+        "τε αγγχωρμόςινοίεςσσαητιοία εξτό ευρόλη όρργαοχήταλύτεμοςπισ"
+        " ουαφέιαν μυανάαίαρχαειδόποσυγρούνεςαρίεντεννοινινόδοσ λεγρά"
+        " λαποδκοικαθ κύλειιδιωριρίζχώρντοαλύκειτούρματισακόλούντρρώτ"
+        "ησε σχσιλριν έλτίαοκρμπορασημιμυθίστχή σκομονδρο χωανεπίσάστ"
+        "όταλευλάδ πάμιοσμαανόενοιούότιτοιραμιμοτώνεκττόςοσφκτηονιαίο"
+        " λονότάφο τεεν μβρθολωνιπορογιύστιταεπα κιημε ιδάτοριόδρασαν"
+        "ρι υστ σα βι χώτι ρεςγεραριομιυναέραγουκονλα ράφνήθυθογγλ μί"
+        "μη διεντίπωςώς ωμαλιά νόσιμφαιετρκαρ εθγάλγωνιότυτότεςητήπαλ"
+        "δαςαλιένηαράσμέκινεμβχου ηλνούθεσαμετιν άλτηκ μά γαεγά ερμέρ"
+        " κεαλολλιανδάτωετάτέρκα χίατιαατρερημμαγικχαρατηικρίνοίσηίνε"
+        "λά ίδαεωρειοσιαάζεευτντεοργλίοπο συμμεσγμαργονή όπωαρτνόμλαν"
+        "στάφή χαίκότννη δυλόγιοχοτιτιονδρμάτώναονίαϊκίοςκείετιωνίηνα"
+        "αιννό ρωνναφλιοταξπήρρόντέλέντατίένείνηλλατομουααφοξη ροπύν "
+        "ράτακαχρηρχίφωνοί αλίκράιό σιουγκέρο ολλαμλωνενιείχνε μαίτές"
+        "ληςακομώνυρίγαν ότμοπέα  φιόμοανήωναιριπληπικεργνιαντ ύντίκο"
+        "δεκοράτοκυμπνηττήρδίαγοςηρο δύωτεώραηλεημένώνταγδεςλιαθνι πι"
+        "υνο φοσουγούκυροσττησλεμ φυόλοκρι γρνετ εικληλύτυτήδουάνενημ"
+        "μάζμάδγωγεγαπειφοςιασθείνανάλοθλητήμκηςδο δοςαιώκη άντ ιοχαν"
+        "ροεγένερ έαςδώνίκηονό τέσο ινήενόατέέργύριριλαμμμασαγκέλεέλλ"
+        "ερεουδννή μημαρροφάρι γλτοπγονχείοειάνωήναησίίς ξε γόςίδιντά"
+        "πριισσύσεοιονακλή ενώισηήσεκωνώμαρώνόλεμέσαδιπονελοένωονανοι"
+        "ζονωτιύο ιάςυαριχεηρίυντκευόρερχινυμωρίνήςβουσύνλασβολχριδύο"
+        "ολειαμασκεωνόνιούρόσμαίρίτεατεκοπχοςμορογοκος κλυσακόσοιχιορ"
+        "ιμέάνοάδοθετπλοκτι θέέτη γκχημειτάρχθερολλρίωφικφόρκολχε κρο"
+        "δυταγοτατβάνζειήκεπιοκίνορφικιρομγή φαίώνυνιοοραργόώτηιατακρ"
+        "ογέταμτεύουμξύ αθλεπτνολ έκχετφιλπλαάσηαμβομέέκτ δοικη ντεκε"
+        "υσηοίκτοίληθκίαθέσαφιλητρχερανμπιγο έτρπαιιωτεσητογσχεδενινε"
+        " έδόν οφοινηιεθόσοτάσνήκαρολαιεκακόμικειράατόλισυγγθήνιερευσ"
+        "τρί τζλονιοδάμεχρορωπεχνώνεμόν εμαξύπραίχεαθήυλοολόαίνωγήνθρ"
+        "ύουμέτ σοχρόολητεχιδώκλοτίοοιεώτοθεωίωςταθαγμφανυμονασολήούμ"
+    ),
+    "en": (
+        " ththehe  in ofof in  aned nd andis on  a er  isan ionas  co"
+        "es ingng al tioent waor  to foatiterst ate re maforto was pr"
+        "th  sttedre ly  sent ist on de caby en at  itry ty  assta be"
+        "ce  by frne icait allts le com paers arch ame sopro wh wi ch"
+        "verestive no al he ba boianlanconic herber di fi orstrounte "
+        "ric mouni haromrs eri unia  la poonsnalnceresineom manmenns "
+        "artish mell trastern  liortse  local naitypariti si temeries"
+        "ecttorme can hiarefro at neernonave tatalige ithar  suite s "
+        "pernteastderintticereown brove weus  mi spnat leout roranral"
+        "ndeaineractish hisrateascharin entinwitlisundcatillsed tr gr"
+        "essmberitreaay mar peplathaeleear hoser sh sc woornembrt  pl"
+        "llede  fa raonearyld  gewn linariichtrilithatturincrd  saant"
+        " muighnitompormsonaniagepreboridelatnorreddisanccouciastiunt"
+        "asseveaseinaardminust aminduth auencrenwortes buialroueatrth"
+        "usentieseleasioordsin viss ourchi achicey el et  cetivrieong"
+        "cen daorissilia crlespriacteenil haruresou riellicireegendin"
+        "ct anaomeoligranes clthintamonshiiresheds ommrchrisnowwarwhi"
+        "oreriastoocatalghtous gaam corictalsitawho fegerntrllydennew"
+        "desspetarten jaangcesnglbliengsitoll eaew ut ontmilopetoncol"
+        "ecoho recinilic jutanlocndick ls  uspornismatrel puny um cie"
+        "larrmadiaicelayna dedendrk nam cihinventisacemedcheniaulaner"
+        "orkpolctohan goad amithoost taknoans jorstothermnic duschfic"
+        "oloade eladiararac kncarervnin dobrienengevelinsirsrtiusipec"
+        "kin apducondubltemchopanlliuriir troginathfoulonarctteimeeci"
+        "werue llahaswesedi exertuararlfirenslecrnaso  cunts tironrme"
+        "nedrigbasanyachtreosemungh ovinstgreemeesiegibalsic ruseaht "
+        "lsosenugh biol ailropisiee etevinhormestitmusblera micms ili"
+        "plerepaleilyhediviow log kiradbanpenhou adcitienvissseitsfer"
+        "pubrgeaus va aflasougup hooorarovoolea famrrehilur ledevivil"
+        "rsinnescoablheatleaveumbeadelaposio telgan phackigntaiockhip"
+        "oryta eancs ampcteetincislanovhammalrivod nsisidicsarkclucre"
+        "oma veualncheldutethrilerodayempibraid  flda be onireglowla "
+        "wrifremet ediatsho pi sylacocintoissorgookke raiannalandahen"
+        "ultbutntyssoarromieceetwnivitu opattoduatutimhesitttwordesia"
+        "ootramapptia drfilrioakeway wridampaelogro huorlbroks odeick"
+        "eliip  guimabetarshigweeutiigierrnotwinairheiot lerrldcipato"
+        "aneditoldvidboucurvedfterm udi kaabotbauraogrsesoteepturnnad"
+        "heltowholealllouncanuhirsan yomemgioteandsca twegueceremiisl"
+        " ai abilmtie twpulpopsigeiructrrilevurroweculvesgesisemmusis"
+        "palspaifiettcriie mos bllifeamlegoffoupmpearmuneae cedeferoc"
+        "udendommecketryoberteipa qualtorsargsocffirilwherlyem nclngs"
+        "mpliedrvedierolsecoodaftlenliealbvictudopulbutlypicpealagdon"
+        "retpe rofrgaierenirnirvilm shags netaroketmordurreffranuabum"
+        "russmarnelt hroludrdsnniwo tabptesporidavihumribadarseautcla"
+        "amaero yequeeinmpooadrtsystletebriscotbrcerotgy dy ctuntuely"
+        "atarosok havdiovememardios agugleglaechetheacmaioleasoild gi"
+        "onops ennucema finrapsetizeppecle evsubgli emieltchuguthubel"
+        "nioyearoavalremrtylopfesiamop ankstscasnlyquaergededicuchbee"
+        "apapet ottilnmeeryfiestuena irtrunshhem ocjanetaburfoorimetr"
+        "selnthlorsurffeagayer jeerlngudelossco olurlieigdevegemouila"
+    ),
+    "es": (
+        " dede es  lael la  en esen os  co un elent y as na ón do ue "
+        "nteiónte conal ado pounato ia or  ca sera  lodelqueaciest re"
+        "un ica prda cióantcom qu paon losstata parist supor ma di al"
+        "mense no re adacia a io  innciro ranca idadadres fu peiennto"
+        "co laserater siproicoperespionartstrmo traidoad fue noeroici"
+        "canbreinaan onaciontaancar itoer andalidos baaratorenentrlo "
+        "uni saale fr memunlesdesita haía eciamestecieritticsa deneri"
+        " sorteariomorio tetridisnes ar tranoesatamtadencmar anlla mu"
+        "oneman miria culiatalilifratroma  cicesmbrint o  moananalcid"
+        "su incniclanstirta grreg orurantitan naegioritenpre jutesnda"
+        "ortndoner viormlac facarertspaillncecalrmamerañoradforpriont"
+        "pañ tale treomuficpecaminac choviitugrane genideociizaialcas"
+        "tosrecnde le acgiótuamilierdorricerrgo  liralonoianinoersbla"
+        "cadsperenendnidmindepedioblonsrasder pu rosto do ve tonomus "
+        "astundarrlicorerossitquidicson ceepaaniulalleensuertivesiie "
+        "ora foescés ingcipturombtinectso ctois rin fi auerniosama va"
+        "norrti cr tielemadpobtónracña sanrearonmbivernos hiserchaact"
+        "iemembtarenauallaroca feambelaomprovellcenás culatirie piime"
+        "miepo  bool ndimonoloccitasnocuen exuadlidfamallmásondtiepla"
+        " asereata pludaalmvinberrimenontó gecorrra máinidaschicosues"
+        "colsiddioabace eta brnasnaddiaedeañalmegue gaza zadareemp gu"
+        "emainectuposoma hecuamedvo  hoargsicferlizmpocuearcrigtemoni"
+        "ropecealarrelloostniaatecriercva ratatocamsióardadeiudolapue"
+        "acein nstlenbar ra luga ordcerivaiasrdeisiil liseseindnisén "
+        "habríaagoimanecsentilrro amuelven duble añivijo ae ñolegoea "
+        "rnavalivoguaiénimisigbrinarió garán unopolducez igiblibanloc"
+        "iveismciu dalecermnsinsebraodo ja clño sislemrisabiustrriamp"
+        "vilrca tholiomiobrur ucibiévisiguayoscrrid occrescoiletidlat"
+        "lampiorgeladegunt altunt llsmorme ap behe vidgan gotelmaseni"
+        "rettacmplpalreplonlogir rgarsoipilitoncthesurloritelingosha "
+        "bitabregarto neasimitsusstáfunngl joipaifichovierocecoevi bi"
+        " ab edultireosampeimouansaledarod nusarmicramsianatomeeloorg"
+        "junmisum  emítirmi isénemayasabolgunroleo var obniotonctieso"
+        "nzaevaesdadisdegéncheba urourieli agealfinangrabiestánmesain"
+        "rel nidurolírupnovorrrciimpapaarootaeteebruegey celdonichogr"
+        "rilsioechdiriscautosi géequablsin huutong emeubinuedíapeliri"
+        "matoduetrrertitrquñosanzatrext ru adyo ulislaollzo ncobajerv"
+        "uloanelioajegruxicmosoleans ottigotrstuho emiudisegtá ocetod"
+        "tudponipoupocinilairahisadr imovemetigltruribhasatucacbieajo"
+        "herya eptmpaánisobncucearsibasaselítutihilín  burgouedacarce"
+        "scuiornivinsexi atgineadromupeefelevugasadsesuev ofosetioglo"
+        "rot tuifoplebroredemálerrarltabicnguve usigadvelemoja diepa "
+        "ecu eropiscarempen stua osoounlegaísodeiticlumprtabotocapcat"
+        "nizerísupavend iadspoabeícuclaeinguierdoteáti ridifdaetim km"
+        "ptiorosepdivarlllirnogíaay tecns etongerdoaríedomacfreigneti"
+        "ornériabonimalorsehacinfeñauaruidopedriharrefck igalés ubuit"
+        "umeje asousartudanii uiesocsosme eassolobiilorneviauchet pac"
+        "ndroctejoncaltitbolucpitid agulbupinrageñoamoóniubrneaís  us"
+        "úblgléutaeccuguuctmaligeoesnantisbumavi itublgioisp eudindou"
+        "iburd morurgnenhinsasapioluibeyorneoididemsaipanletarqpul ál"
+    ),
+    "fi": (
+        "en on in  onan ta istja sa ssa jasta jonenineise kaaissenaan"
+        "la lla taittall selaika  kuala vana li estain sullieenttaett"
+        "elllisiinstevuoksi matä  sa si alsi  kotaa vuolinnaiss muass"
+        " olaa ttivalia eliän okasti kiillti ustisiat ast petellinoit"
+        "maaerisä misden lajok ke tu yhoisle tetperessintlletaikansin"
+        " tosuoimilä toikai pa rantaienuontiionnstässältaikkvat elkun"
+        "kuukseus tenuomavasesrinstuse äänansminva uvastottäomaajamen"
+        " pieiskaualientllä hainaun  tettuitauluman viikaunn po he lu"
+        "ama me jurjajoi ninin liiteollaltet ide enteeseennesuutalome"
+        "ukstarlansisyht käaluensarisiikkatu tteijaosama malkirrankoi"
+        "lmaaiksiapaluttkaaostantesianakinlkaoimulktieri imeaittääut "
+        "tinsitaninimtertanmerilatamai äytlueteinkiann leitsntiianmi "
+        "attohjtioailaal veoinnkatunuot miliikuvritoriumi punsa soki "
+        "risosskilnnirusatiaks jäiikkasuutnsiosinetivakkisaa mytsejul"
+        "uodiityksilmuusarj tinteetekaltav eskäyaatjanarkyhdkonnisvan"
+        "elmoleovaionpuneltto ingirjoniäis noiä aupitäsimalksijerulev"
+        "ntotus th etottuulapa asuolsanimmmet aiää kesudekkoskutilunt"
+        " lätonvoijaiuriupumatennnan ossarpääelejärhti neielelä päuun"
+        "ityaleonketarikee sekjonkieisukenhtymesutaodemyötajalb roinn"
+        " ylpaiyttlas anokuituluvesktisuu eksttyeeluur moietlokukasel"
+        "lmivarvenvasokolburiahtebumikodes arpelusielotuuyössaläinlaa"
+        "noiotailieinjensvaautnutialer rkoeitis asidelami häenees hin"
+        " sthdetorsetakulloenikä  erinistyngievavaatyeeur lovaileerje"
+        "ko aloämämmäluoös enäilu ov inlenataaraikeoneskiheijal rusil"
+        "iastukaaromitävttommi prneeukuueeiirvisinoerkjeskoloonmusima"
+        "ppa väkokärjmä emassiikuvelakeleiertnä  itpoh täpuolajeilske"
+        "ututri kykerrkktheusshenne ltähalmit reandhänajiginnal hitys"
+        "karliaausmarhelartpantämelunaienkivimuumie voskaäjäuramäiink"
+        "rki riisäjosverkaplitokslukappankjotsukhdyviiunkeetulaniamas"
+        "irisemsikty ojeloias uismukhe uosrakdysrjonnoni äväällparlut"
+        "luskitonaakamonvälnasitodis il deolaeesälityyiskullärialmläh"
+        "ysv ykraamaiehtaterenukkilovinlauikistöntysiokusenaio it jä "
+        "usktasiks syuniekäpiisakyläololijyliuseetroteuudmuoisaopiano"
+        "seira  nammaät akiuorkutotiasetoliratiaetuoiderevä tekkoskul"
+        "eroltisasyteemmläiunguvunellme ohemiön asumpiojaelatuoos tyi"
+        " amoht tynitturkorlunumahjakelys keiaajaakuteoikkistoktutdin"
+        "rilpiskäs hopit kryt avimilnesmäähittulitijaaakkkyllu diotsi"
+        "pinhjoiaahanluuetäersihituiäsinsänssnii aurasaskasauinaulsko"
+        " n arvuoknaatkaetoaaiasvrei comeljohnnuppioa ontolmksatapiso"
+        "eikjakeraseuunaoulal ahdodoratyleoiljaskakopesai säharue oto"
+        "ngltehehiaamoukammjel brrtahta ustyntikamekeesoijälirkaavntt"
+        "evyääkimolomjatiosnytralntuilteidyvä fijougialogkattumedeerä"
+        "rooerrareilp baatovieviranuneikiate takadiystkehonsäär näpol"
+        "olu diyn toshdilpaurooppalvrkelosnossamogi eievitkikeakoomia"
+        "latnd ua aasron isvätaivdosioiahtprokotku kuikkulänokirsing "
+        "ivävittatosklkotoaympmänteomutyistykkkeeimrraei  cabriinslmä"
+        "danaukies omruoorttraihesieässkouuvirosforultye yeelludetaih"
+        "rvinskidaaturesänertoimuoi tojinälonutktyökeuopaorkmuinonuli"
+        " ednusarupiautolkusoniveumbrveanestrhumäheijälesruuntänäj op"
+        " belivooprtiunutomlemkohkiiähttäjkomlääatklkiktihjetiösäliis"
+    ),
+    "fr": (
+        " dede es le  le un lane est esla st nt on re et entionen  co"
+        " en etun  à ns uneque pa l parur ue tio dudeste llelesdu is "
+        "ansant d  pratimenraniqu au dadanse eurer  maée ie  pocomais"
+        " soce  queme fr déourme ienconillart sufra moain réist no ch"
+        "it  seellin té ommirear au tre cail ont si insonres an étrs "
+        "alenceineonsiseali saqui renteandort ilus ancsitnnets  di ou"
+        "proonnierançux  néitunçaui  viçai fosterie ceérial né terrti"
+        "ou cha tr al batra peerschean  arintétalisteusurlan libresse"
+        " grtaimunrteairge ntr rotem plaitpouita famarman looisrt ère"
+        "lieicatanmmutuéssiuesstrondricallverégiuniaritiqureris dorat"
+        "itinismmeitérégautnomcti miut el iteessgiolit ormontesrou av"
+        " findeiveangagecie telemnalenn a dépembgraouv meuéeforhe ori"
+        "ectmbrtatnéeassursstiépa thauxnd nespe  hatalgneissrenrd rit"
+        "natuve amenstie jo apomp elsioéra bronanti bo totriluserrés "
+        "oirani crroniliinsateousactcounieieuordnciporuisernmiléesmat"
+        "perral jurésencapp nantapreeauignmai acincrempluntstroinisan"
+        "posormavetit beprélai hostaétéièr stchiminoloec ve turprieux"
+        " jasouendvilerttenmérgueraisai raannndaicioliamias uteiséett"
+        "donat ble jecolinaces muttedécrrecanardnoroupialjouloginguit"
+        "morupe gatonndiir cal ex éclonsersé  piesputiroirmetinvenara"
+        "om rincaicarsesagncri veeu  clès emitousenuelide geditcenout"
+        "llapolnselatriganacteciaroptivblinai scleuusicorbaserm vanst"
+        "mesovidisind asrecdieusshanberésivinnnampogrovecisiaceisarma"
+        "omatheaméédième neréaculherls  spfoncaticernagenrneti ppeng "
+        " ci fuarcharénéfamnan onocipla pu tatorstoiviniqvieséerchonc"
+        "ublllissaticll rovempfil hioue guvis phlincrédenletédéavafic"
+        " riquabou s ulesem bieinogirèsvalué éseécociponioitichvelbal"
+        "si vannnéianatssieriqhamampustpuiuse mérapmiefainsiécrud soc"
+        "ielra tififi euastgieia adièceigiulaarevoidretoiphifuttérum "
+        "rta fepagongvaieloemauranglailomb gésigpubder ocsinivaginndr"
+        "enapelala itarrlortiléaloledér atsa os ultromtisctussofinorg"
+        "uilrge luervabl goora séaus vo hesathauuctsorreleptisojuiliq"
+        "jeugesoulhisvrideubelrivretercrodsudilennuqu ntonvioneinégén"
+        "pteomiipadé cetodeenrreplecngeseutuemplonovolimeré eilpen bu"
+        "palponnivdiahomna lacmisrocnelollspèloictouripècrac élictmer"
+        "riaio oduurnradey ogrnguathpér oforsorelicsqu aderinemmpilas"
+        " imvemndéprèmusammcergancinthéarsutreanattoluoin fécédai ies"
+        "rsiachae briix ostumeérogalétiplentéeprys if impéciuernnipas"
+        "ducor imarsogla aincospaovetrutésppanitrridésademetseinérpeu"
+        " ruurgiatabivreaphosebarurosepnonameuinatr évsporeuomenicatu"
+        " syréénu aysidéhumarléléophréeueulerhincleramptick nchta eus"
+        "da uanch uligerièmraverautonereco tirilrniama fléquarodivcla"
+        "thorgaliailmrcesmemagdifceloppneubananeiffepuosiotaléenreipe"
+        "sidismllophoida blry éreudempaelilopécé uthie iségaechtuderg"
+        "iétéceootévodirosssuibit édatahilhonligrotrrajeateldroocttar"
+        "depaviocaadasiqinonaupeslm anodairioémito nuelé naréleragicu"
+        "etimédbutaqutbafes éputéférimiockalbnadfoihabalomblnotiroié "
+        "ro duirdiam atorselenêmerositrotbvesapoargic otovitsérdiomiè"
+        "tecthuot éveeléhes égni umbno iguctrexpdatlbube uvrds ffiase"
+        "armoi noima oyavidlagsci drfoo c rofèneaurréc agsel éq hubum"
+    ),
+    "he": (
+        "ים ות ית  של המשל  הייה  הוון וא הוא בי בא או האעל נה  במין "
+        " עלני יותור וני השרה יא ום את רת היא מו בשלה ייםנית הרדי  הע"
+        "ריםנים משאל  בעאו לי בר נת  אתליתורי וה הת נורותבריאי  אימה "
+        "רי נות הב הח לא מיגליינוהיהידי אלירו הק הנ ברקה  ב  הס שנראש"
+        "ספר להדה  הפ בתיר  ומאנגוליישר למשראנגלראל פריו  ממ וב יששר "
+        "רית שמומישנייני יד שיביושנת קוליםתה ול בה  מא מס בסהמו שה אח"
+        "אה  שב הג יובשנפריפר תו אליבין הכ מתונהבית ה ולומי יל  בנאות"
+        "אור רוולד כללת שם וב באוווייקה ארתר ודירביאחרבותבאנ מד מעמים"
+        "ייתחבר בה אנוד מניהם נול לי פותי מת פה ניישה  מח מהמרי פינו "
+        "ריק הציבומן מותמונגם  אממדיהמשוס ילווי  חובים סובי אשרונואשו"
+        "וע ידומקו שואר לד עוליהועה שונפוררך  ההלותופיטור בדותרילי הל"
+        " בוחד ינה ואברוהוד מל מק כיפול מר בפיסטמו רב טי  לשעם קבולו "
+        "דינלם קר כה ימיוגיבעימוזכל חת רט דים אשבור ול תועותזה וביפי "
+        "ותיאמרוארלוג הדלאומערימודותמשפ לפ גם חיבנייונעברפרודורריה ני"
+        "צה יטיבת  בלהראשי מית רבלא יד  סימבר ספנוערוב ג כולניהשחק לו"
+        "הייייהוסיערבקולהיועד קור עוהשניכו וי בכ חבעת בו ורגקאיאינבוצ"
+        "וף  קרקיםולםיפויוןיקאוברוק  בק אב מברץ וג ורהכת פת צותורתעיר"
+        "רומהעויוויוםיש ישיעליעי שלי מנממוקת  מכבינדת חלקרו האיסרטדרו"
+        " בחכותטריניולל  עםויוטה מורטיםהברבנודולחר תית קיאחדפרס לעדם "
+        "מושולהוך  בג דויריצורשיםוש האוזיקוח יקרפני יהטרוחה  בצשת שנו"
+        "ילה לבשירסדרורוירהריי שםליו וע גררוסרופ בבותוהמא כוריטוסטמינ"
+        " דיריומיו מצ זהיק שלוגדוחייערכגרמוזימודקופקרימספשמוומובן מאי"
+        "זורטיתמלחכונופר גו זואופבעלצא  ראיתונוסרמניב מסואיםיצונטיהן "
+        "מר סטייתהאירוצרתיי הט כמליהרוןפותאן מטר מפחשב מטמדעכללבאי חל"
+        "סופישוהמירד קראסטושורתקוכן ועדברתליטיקואוממשמעיםיס תחושיממאו"
+        " אדקי עיקאולהבימיימועשוןגיה ונרטירצובישרפתייןובלוה בל  לרנוי"
+        " עיקנילאחכדומשותן רס מרכבליליי קבער  וכעתי לחומר לתרגובאררונ"
+        "זרחהרוגורקלירק המתצרפיך שב קייולנואימילהשילבו עדוכנושלגל סטר"
+        " שחנשיופוקרויזיקומדיוהחלציוהעי ל שהוממשצפומנויינמשלמש  לכיבר"
+        "איתאם  הזשותבע מכושנהופה דרסט רבוסוגלקישפחדו חותמאהרדיאזומחו"
+        "ארצשובוונ כדטובלך תור לקחוקנובבמאוייהקוובהודושמשרכז ושגה כתב"
+        "לחמאונרושרסידיתאבילוובספפילטר  מג לסיביסי דועאניקטווץ תוכ צי"
+        "מידפונכניבתויאוביבאלבארי שאאפרשבוברה ור תחדעיאוקבירמשחתיוהפו"
+        "חריהפר פע סרהארוצאאוסבולובמחרוזו  עבמאלהמקוסקסורשיתלמיבדרצת "
+        "קודלק  שפחק במרפתיהספומהיימיולמשתדע אשייסוכי להקאש ארץייריצי"
+        " כ דמורניהליוקרהמדודה יידר כיוטיקסיתציהשייתם  יצמזריטלפן הגד"
+        "לפיצר לילמשנ רי כארוםחילמצאריאמעואדםפוןמוסאייווהומנשמארכיגון"
+        "וז החווגוחומיחסלנופיםמנהדרךצרי תקבייכבי יחשבימצוסה יטוהיססת "
+        "טת נסי ופפיר טויור תרטינארגהשוסיידרתמוקהמחובווללבודפרד אפהאל"
+        "ועלדרההאמפייוקטוהיקן  נחמלכיחיעבוהמללומ ערחיםבדילמו מ מתוהינ"
+        "רוקכנס הםרכתטייותהמוצ נפ ו בתחכליידהראיעצמבעוהנועילהסוחוז גי"
+        "רא הרבתנו נקלטיירתספי מזילתרח רואתיקהמצלוסושיקו כיםחידרחביע "
+        "הווהשל נמנקר לנועיאלוניס שכאיטרם  אזבמשלפנינגתב אוג תי קלטיב"
+        "מבוקידמפררכברגלוציטוןנג מד תיםינתופתוצה שעקובוהולכלדריחוםורס"
+        "זיה כתנד לטונמצימפהממוצת וחגן שמיימההמסשפטיאלשריהתקרג מצע גב"
+        "גת זער תלהכואך  אספקירליונחלימבסיכמואיש פלסיוורטמחליט ניבהתפ"
+        "וזעיעיאחתכלוקרבהדושלההמרמיןרפונאיוקיפעולבי בט בןרגיסיםפחתאמצ"
+        "סקיבמק לצצבארילורק עצהוקבילמטירשתושב ירנחשהמעהירסיטגוסהעברכו"
+        " נשחי ודרגאו צרגריפיתיטתבלובמבהתנלנדינטנון טיחלוביעועהרחיהחי"
+        "ייששהינדיניקפעיצירשאיבחיחמתשתיהמכובעתפק שרתחיויזברסואליטהבער"
+    ),
+    "hu": (
+        " a  sz azen az an egyés ak  eg ésszebangy  meek tt  köes agy"
+        " maszteleben taet közala csába elletai  alely vaszá ha be ne"
+        "ik  te renaklt art lerenalá kiendészereségmelterzer fezettar"
+        "ettcsamegal us  amtalos neklenoszrtoja ok is el ta  nént sza"
+        " ketozlakti ia on ályeteánysalra ent milegnyeék intamezó ott"
+        "eze nyrosat án ól ébeer  álozómag fore bb eriforgyeáltládnem"
+        "állároarakorjellye kogyaána laül  anztávagság fa katet voolt"
+        " is je baás rszényae tásorsly tálák rül ké paasz váülehat ho"
+        " veeszág mánvolllaormmintel osba zen vifelég ul én latlékfél"
+        " réádjrésszldjávezndjkerellszineverü naidazágdjésszyelatioly"
+        "lyány  töszomervaltéselvte em ato heyarsz  ezfajatábe  inét "
+        "éléetigyiontvársi omálleeg  erltarásoválovnag de máeveez  ol"
+        "daezaténeikaorojábrt  jánévéseatasa meszloől tesver moranada"
+        "hozát illtártotrme gyse ni széri  poar  somadangtó ve belelő"
+        "ziktekyánekeváklamjáryikmásdiknálásándenyaerttenlisténúakzak"
+        "válemeamisoretéló elshelévelemki dardalmettékna or atóalmgat"
+        "kaizéshetégebóledeaj enevel esiáblsőár  roanyrakiszberttelap"
+        "mi zámjébkeloz alonyoetőöttkattörin nteakúeseandntéyetlyaest"
+        " orlomalkusz boresztevetlanyi ifotorgi árainarin prredárákúa"
+        "iráözöját stelüma ső venasstikketsokit cso arzonakoyestinla "
+        " saig ezélülinddetásoozatatzsévénlessenst lásléskezörö peli "
+        "kép fias istsíthezhaska iairánhalparrikszóortom kusnyiolilma"
+        "marste liikuosaeltlálkulze zásév püloritanétettaszíde ebb bi"
+        "rtéértözsmbevilersonagetmazkonemzarosábromengponyekásaerécím"
+        "ntitosrmaján évégikosrállko císerum le embporelmpersznalitő "
+        " friláegelaszel diösshar seot roz raménzár méthe léémekét tr"
+        "rmálhakaléséatt tu féálirepmendelmatlágaritra főövesoníteony"
+        "tudedi cafogtemkörélegysültgyoogytól coermzi evéantideáhond "
+        "takfej hátoktlenokző ció érei zötviduga totongaling emaniger"
+        "lek dé mű dadomngeolakül táerv utásimze ga véazotán buriadsz"
+        "rteye all auyanfolyakkénancelérta muakiászhanlia tikisden ös"
+        "ionenynosesskészigéheda kedlepcseossol oráismérenciöld akkön"
+        "tveinepítékelő mezmáröbbanadó agasbaobbhogtséke udobalábbpol"
+        "ga  adadádi eliélyszö jane mű smeolózt etlgazgolgbaonistatri"
+        "ágb sppes id josseutanyvákibőlratencepüng töbkiáopobor piört"
+        "ennndsépeönytákegérvedonrisznáfratéralótredélzemgyéje éntném"
+        "lte geeméltozüllag éltbeogadásultszk hinetetb írvon doge oka"
+        "prova áriadintoigengoajnró désselártlvevekágokapabbronza ann"
+        "etűciatomilill vesodi lokozjéhtolensfalrekiusvis igítáya mok"
+        "van kütjaszü páasáamoapatusolgözéyugármkravánjáhítoezőábótjá"
+        "regítéásbodalalordegnvégrégáciiniadóulaájakarllóió adorifets"
+        "ülékbaelkeraárs grálhál gyü ilházralavagényveíródezrokerngen"
+        "ombmérzínfölseklmitű nyuyséágirólonoinonaleztözilinladcsi no"
+        "rögmairadsodmonritrodokogörátéoldarksebniazottőlrébyensárgál"
+        "aleós ztétroeurateégéitaamajesalbramirobajpatyszkot átzorerz"
+        "llirsaeniretaluél  chbbiálakolmosetrrolssénullosapokenorazab"
+        "ozigesók vaslógercrjessaíműerjülöép ök agoarclítlétajdmbatéz"
+        "roretk göműviketil br thigalkebi dermél épüttainag isejnoeml"
+        "őszektztagonosáyezlcsptelányütrtj térábázakesrsesak irszuyéb"
+        "ile kmzollöncs nnaztrtszzéptaggialősuraetvoksozáézentalyngra"
+    ),
+    "id": (
+        "an angah ng  diala da seadalah medal peyankan yadi  ad keata"
+        "danara tetan be in baia terberngaengri at seb kaari pa saama"
+        "si menranperakaganera dera ya da daral  manyaingta asaasiai "
+        "ni elameram  koak sa upaebueri tamannggpenlamahaikaar siais "
+        "ntainibuatu uk ind suau en ungesima erupad prten laun banatu"
+        "alipater uahden atlan tias antbagntundoanaayaik onematprones"
+        "pakiandonawaandin tautahertrup jaga hanotaesa anaga unmemngk"
+        "taritatukembrikentetailaenasatkatsalatena bahebaecaeh  naole"
+        "ur pankarsankotahuilindagaikecka aanunton lehhasnan olnsiapa"
+        "erbendnalulatakdiaselmasus abuhunistut  haerl sitasrtaoragka"
+        "discamsarserintratlikggabarinsanyisiionkabersgi  bimbaunair "
+        "kalgarti utaovipem buani ju raadi munamartbupimades puvingun"
+        "rovainlatatirahrmawa inaepatem reriniri wiemiuralet alrleuni"
+        "timrislayuannjaemeki erm le po jetra nebeles tinmilndistragi"
+        " fidireka mielula ebekelrasdiknakuatstanisisail tam geukaeor"
+        "rtili emaikimpaajatikgiaegaempyahum pul caerkntebatlauimuhar"
+        "laimurituonaraksin arern hineglisparuruor erd dubenusi tu st"
+        "linmarkerrbastimbe ia kuenjel nia wasepkenidaseosamusampukom"
+        "amplimbuteneereukuong lihirradamedapsis mouarenyabawilialtri"
+        "ugastetel asndusek utdibgerrkaruske wanria orejaenisik gaua "
+        "rnailmsuk lukonngsgalbesolafilih jadlassemjar coit ike isngi"
+        "litditgahsuaolocarsunlia amsioduket isenasntikep noahiap pa "
+        "nnyja anj bo akrgade nge kijugmelrenemuenuturpunmbuelearuanc"
+        "luakastorjawjanambmunompder toaktrkeresareku yakdiplurulieti"
+        "uh eli pitalarkolidakmi  roiraerjritksiiteuasndelm  rukitgen"
+        "ngubunminsenlogmusudaibu trast soasujakakumaledardadigannkem"
+        " thlak husejumaetebal gudunbinustrsirsehinaluketepend itiim "
+        "maipolulune nerenc itergiguad ralesedininyakisah lopaspaledi"
+        "ggirtedidem pinputsettheggrncianuiasrambukgguronwaruduok agu"
+        "taiaerodevergamsaarjauha ag chumbibaup ewato makidibiagriogi"
+        " gr apebidilmpirbencaapiduaepulu ul pi ansigauju ibek lebsum"
+        "ideoritusakssiltiosesrapnghestpaiab gsarditidoma brontrunrek"
+        "ono abaleru ruttuasithe rajosiamienssurerpautgrano ton cioni"
+        "retelopelatoonsbihtiakebnjuerhol rostroyaifor donahskare if "
+        "sasle impmuldaerabmpokapjen spkairildahlomte dimnikutr foine"
+        "ardme ekstunntonyeekolenlesprebadtifdudusuktoktu ceudichaomi"
+        "ormargsecbuhausegijerihaektraicisotopesropipajalipeibetisore"
+        "ubursatkalumlarbu  horombilhamjepumuginkolovereagelacarodlon"
+        "tilnt ikuarnnarmpetekkunnomairaitcanekimetblilekrlamumivedas"
+        "ggofiksusdekpurorgondedubebpri kmoselukrtulemgotnineronus um"
+        "gusaatwakademahamununbol yuodurhalalakhublrd rumwalbasmbiui "
+        "ruakinomeunu joekunatutegatnyinitunylawii iunha askaryilljaa"
+        "id  autolbai yoyarmudsiukutce  hebawegedatkedruhmukaputaputi"
+        "imiktiiduro lkaaikomunetoko shkumkua fehalortburundjuallakur"
+        "ubapub riyatualmnyopeuriio do os ei itohidwahsidtatgasdaysif"
+        "ty ghaankof  klutumadst hi pusumpobehaticaryanurvislapklabum"
+        "tum frnkapokrbinceime ofjuk goisunsttulogrlihll sutanemesjun"
+        "innhadry watwasey se opurarpop iiifiupuabikuk achkarimtiggu "
+        "kammiaslaksarejhaairetab krom iwaetuokamisdratokecimonmikcil"
+        "sonmuaea ultrioporlunkulbullagbitrk ismkesmu ukiesurieellntr"
+    ),
+    "it": (
+        " di dela to di delell un cone llael  è  inentle ion neta un "
+        "nelre atoia one late no  dana  pr e il  al ilti ntein conica"
+        "comzio ca siperitaantaleallmenhe ca chese stara ll  stio nti"
+        " materparttoett chda  se regio pe pa suer li eseataartal ist"
+        "unaranon tralo  a azisi tanni alierico ntoglianc antatattpro"
+        " sontaatilledalratprero ticari tr tetorera riico no po mome "
+        "tà oriri inaoni froreesseststranortioloresmunonosti lebitma "
+        " l omuregfraricandcia pi quso onacessitareitu fiincde abiei "
+        " meome vitalpriontchiuneliaimeitoegiipa faiantua scste cicol"
+        "ittassicienessi abdo  sattinceinttroondria esuattritteereten"
+        " orver bainemanuninci gr arcatggianiingcarolanatnalzzaame li"
+        "ttasa va ntrtimost giersità lolic roero fossoie  miinideisse"
+        "soncenndolloretrisscoidesto veizz i mo monuradislinficcanrit"
+        "inoolice citlitrteagggrapo sciann spottizivenrioza ilian qua"
+        "dipseraraanamin dondirimmar fufortreatecorrinort ra naquepol"
+        "iensen o ive geastrieialrovimaenzndandetiv haesiapprenedi as"
+        "ecoend edua matspermaompireiornomnitcalutodenes omaedeimodia"
+        "ope putit ceiglerterrtursioilezatmerordivaicholtgenoporoned "
+        "posraloveeleormrtocipoviernacctinnzablinicemi ecnianch vasan"
+        "asc brreansilesdervinitiea laniceeglalt it amdicssavol crpor"
+        " feve clibblromubbtemmagtarnor auci  mumetpalppo ap duoraner"
+        "pubcceue  thensardmporso atermdes cunniiviualdionissicuttiat"
+        "liofinispgia beonssul toanzlatiù ropindierum llitesdatovatel"
+        "piùsem lucricopziavis bosoliscuppui ennletifi erill adetaoss"
+        "feresccamtongo umeppa vorigrazis cosiginnersivo  tipetisiami"
+        "bilsecaneccovaltol taseglizad theamplargnaite ismpiivoagnodo"
+        "eccemeominsegnouitrod imlogriznesfilosirna gaecicaszo rd rra"
+        "ciettuginltaollen sislassiaradnd rtadincuinonbreatuarcsuoalb"
+        "divlmesim elha rasst ogifu autsin d avanarscrusiilm cldirrdi"
+        "emangomiaalmvan glng ai sceimp rudegtutetrmi basramempnenerc"
+        "etiidilburecavent orgcinlisuesornbumrcaisscha enberdotnzicio"
+        "ltrloromoocaccinimogrponasimigoleoscenounoiamociudiias guegn"
+        "oprruptiolm ioculloroenieatutiimitagalapaguro avrmialchiarbi"
+        "hi occarresaotottrviarriuziembroiros bimicguerocnclammnosfon"
+        "spoureircmbrenaniztiladirrettàfamgruietnnoocesuaganultfasraf"
+        "piarivleg acorbnazinscapervsu uo us racrnocirevaquiisoguaeo "
+        "apoangoidpiongu svor satragnnaotascautaevi gomusustnglbraies"
+        "truaroote opuelvilamaet banlen nuagiuntset tultiambtudga nei"
+        "agolazmpamedainrchgi sivliesidavogleecleguar odidizspanotge "
+        "teanzommielaorsoluafitazeliremvithieeuruccccagolmmaaglncocer"
+        "sorega uaorrecesigcrecidpopungroggniiarnolmbiadobrineg etpi "
+        "milcelezick aceidauarschmpestuavidifpatngevieicc usilaigngre"
+        "mitltogonmorgiupicrotlterapcrolonrgadueul tamadrtisupedoncch"
+        "moleveasausatecusspa mesuanadeealrrovarrcidanze vateggiutira"
+        "nivoncmisvi oi azzditclaffipitvidsuprcopecatrgui agridrelpen"
+        "zondetinfurihermoduenrarsocas etetieggeonfommgernio ofhanloc"
+        "tavetàmasosaosoarlnetemommermernisieadatedognezzmplneaduresp"
+        "amoharifeogo otlevlerrt agairiocoonnrnegetuermprlacacitasnag"
+        "ibi ocise kmril utnovseddovredrolciuarslavnanbatdopof veldre"
+        "oduvessotur ndrcisrifans joey alotipnutnumsilpprsaliempliaff"
+    ),
+    "ko": (
+        "이다  년 으로 에서  는  월 하는  은  일  있다있다 한다 하여  대한하고 었다 으며 국의 있는  있는"
+        "대한민한민국이며 또는  또는적으로 이 되었다 위치였다  및 부터  한국 미국 의  사용적인  수  일본하였다"
+        " 설립민국  제 되어  주  에 까지  하나로는  그  프로 년에에는  세계 이름하기  인구 한다 서울 한 "
+        "했다  이다하며 라는 기도 위치한 말한말한다 문화년에  지역서는 되는  있으쪽으로 위해 명 이나  국가치한 "
+        "으로는있으며이자 립된 된다  목적 현재위해 대한 라고 인이다로서  도시 그리 기준구는  중  조선설립된에서는"
+        " 것이주의  프랑인구는지만  하는주로  사람목적으 연구들이  등 미국  사무민국의 사이 가장 개발특별시 국제"
+        "울특별서울특 주로가장 프랑스 지방관의  을 이는 일본 스의 적은  정치것을 에게  일부다른 공화국기준  사회"
+        " 영국리아 단법인별시  의해 시대 다른 게임 행정위한  대  따라 독일 경기 중국지는 법인이부에 하게  를 "
+        "으나 이라고 개  번째 구성 위한세계 아의  면적일에  에서 이라 소관 시작의해 실은  것을등의 도는 소관의"
+        "사무실 의미 일에 일반 가  현 무실은들의 어진  가지 경우는데  교육 때 면서 면적은 사단다는 등을 개의 "
+        "같은 기의  이후 주도 포함 중심 만들 등의위치하미국의 같은 세기사단법 알려따라  컴퓨 사건 통해대의 들을 "
+        "고도  발전시아 었으며번째  기술년부터 년부회는  세  여러 등을 두 컴퓨터하다  위하 되었 영화현재 통해 "
+        "국에서 대학거나 라고도 활동 개의 이용 소속 역사위하여것으로프로그 함께대학교이라는사용하함께  가리 것으학교 "
+        "그리스되고  으로광역시되었으이고 관한 관으로기에  로  정보리고 기를 하나이 언어 이루혹은  혹은 관한여러 "
+        "리를 상의 이었다하였으시스템소프트이란 리는  때문문에  기원하지  당시였으며치하고 시리성을 자가  선수것이다"
+        "이후 시리즈하나로 운영상을  관련많은 역시 본의  처음러시아 전쟁 와  경제 러시 음악 정부 제작니아  존재"
+        "에도 도의 시로  차  로마자의  대표일본의이에  전투 종교 수도년까지가운데 년까 약 나이다해서  제국다고 "
+        " 가운 있었전에 만들어로써 간의 때문에로부터사용되들은  공화나로  과학 중앙 독립 큰 체육관 시스랜드 로그램"
+        "어로  아이 나타 방송호는 자이다그의 문화체관광부일반적 라고화체육 모든 유럽 이탈 작품으로서육관광모든 시대 "
+        " 기여 국민중국  발생 과  인터 오스그리고탈리아광부 인의 남도 회의 이탈리자는 운데 위원회 인도 관리이를 "
+        "요한  시  데이 생산 전 화를  많은 최초 분야대통령사이에위를 력을 스트  정도원전  발매 대회도록 시의 "
+        "아시아 대통국제 키는 시에 기원전세기 가이다지고  대전 리그당시  형태도시로교의 정한 지를 동을  속하사를 "
+        " 이란 기록르는  이상자를 구의  주의는다 기관으이루어인민공민공화퓨터 동쪽으 제도 고대랑스 도로 서비스 아니"
+        "스를 려져  제공 부르 출신 다양사상 으로써드의 리스 알려져주도는 축구 년대부의 기관이학의  라는명의 등이 "
+        "기는 서의  더 장을  동쪽 마이 북쪽자로 오스트학에서름은 것이 신의 일의  용어 남쪽화국  등이 경상 영어"
+        " 사상 후 관이다 그의조선 대에 그는  만든일부터 이며지의 았다  방법경기도 구  명칭이름은 운동 서쪽 기업"
+        " 불리 문제 국립 이전 소프 아들 유명 나라있고 었고 용하는이의 리에  이론 관계 지원했던 었던 이라 서쪽으"
+        " 등장 전자정치인대로 시대의지역 북도  등에디오  대해 수행로마  선거리의  기관다가 데이터리그  명이 고려"
+        "반적으 않는 작곡행정  있고 서비 그는만든  총 도를  떨어사의 이션 무를 사가 학자 것은  대부 할  현대"
+        "계를 상으로 태어전을  지정군의  타이지로  자유 첫 속하는이기도고대 정을  회사원을  민족트웨어프트웨학자이"
+        "인으로 전문졌다  지구계의  중요 올림 자동보다 영국  일어 산업 월에대부분지역에 수학또한 어난  중화 조직"
+        "어이다 또한 영향 하고 환경지방 게임  각 원으로자동차장하는 연합 하였 공동리카  해당스가 장은  만 독일 "
+        " 소설다양한 남부양한  전통 아시 발표한국의제를  부산 가능 기능함으로른다  표준 있어하면서 된다이름이 스페"
+        "올림픽 라이 과정 들어아프리 단체 인간 구조로운  자신 상태 특정역을 동안  연결일까지문화재 기반 개최 새로"
+        " 불교 방식한국 축구  주요프리카 성  개념연구 수의 리아의했으며 말이 사업월에  발견 물리 하여킨다 물의 "
+        "가의 관은  일까 주에 참가 연방기독교나는 선의 름을  시간 보통 데 공무원나의  내용 야구영국의식을  표현"
+        "어를 학기술지에 주와 란드 가지고체를 주주의 일종어의  쓰이 이를화의  분류 바이라의 사는  중에 설치과학기"
+        "가지 하거나심으로원의  동안 황제 보호독일의 부분하면  자연드는  모두 항공 기독 곳에초의 스페인민주주 법률"
+        "문화 였고  어떤수를  하며주는 경우 플레이어떤  다이개발 아메리 우승 초기 자치 정의중심으업을  여성 전기"
+        "린다  재위 속한처음 인터넷국가 업의  상호로도  전라 인물 즉  북부서도  이르용하여가리킨스는 이트  다음"
+        " 왕국전쟁  섬 부를  농림리킨다 특히사람들이스 특히 작은  도모사람이대해 서로  명의 가진 민주가리키내는 "
+        "국과 역에 어서 향을  되어 작은원은  소비 브라 종류주에  특별백과사성된  결정유럽  애니 일컫과사전물을 "
+        " 번  란  윈도명은  필요영화 스트리용되는사용자말이다곳에 되었고우스 치한다었으나인구  진행 대상수가 권을 "
+        "니메이 호  주와메이션로의  걸쳐애니메이름을 높이 번지기로 주요 대학 체의 일컫는 기타트의 정도  문자국이 "
+        " 앨범산식품나라 최초의제의  기자스와  우주 통합새로운제국의역의 마이크 작가 급  충청속도로 그룹기가  부른"
+        " 참여하였고랑스의속의 없는 명이 식으로대백과의미한 주장동에  된  대구 원래모두 네트워구를 도시  월드협회는"
+        "미한다진다  되는름으로 하다 말하 감독과의 재의 식품부어는  스타비아  프리화국의 북서재위  조사 많이 이어"
+        "많이 이크로 소재장으로국에  공식 드라 개인 불린 회원용을  차지 왕조 현상위에  역할구에 웨어  만화어져 "
+        " 이들가로 가된 발전에발한  유래 내에 중부떨어진 최고시아의등에  정책호에 남쪽으 대백 아프 아르제로  네트"
+        " 철도구성되학적 이름으성의 보통 사건이 국내 지도디지털 행위 구역 전체되며 대를 인이 성하는음으로아버지 디지"
+    ),
+    "nl": (
+        "en  dede eenan  in va eeet van heis in  ishet ener  geentte "
+        "se ooreme beschie derersuitaatandndeel  maaanstente teingsta"
+        "eelit men stond di uiver voanslannt meeden waternse mend aar"
+        "or laats  opat genpladeegemerdtenijkrs ats we pltelest reas "
+        "maachtng lt  veerionelijrd  alordedees nervoorenakton chekt "
+        "art coiscraneer doeredienge onssewonberweraakensnwordeij was"
+        "op taadisisthe endinwparameeltstrregal ronegi pr na frtie to"
+        "merio le ati arijnar metelest  la nerijken grns jk  da wondi"
+        "chartegiofraus dooarille zianttemls erlriceldper paelilenpro"
+        "ichge ne  hotrire issgel no ka ameve aarikalinds bi lirt  ha"
+        "chibesch  po saof ikaien spege ofepa hinaajn ht alsstugeb ro"
+        "igeekeinduurierelsrlavenortitskaa moam  ooworangarr ja bosen"
+        " mi leion caachot  brillneddep baraagererkrliië  duke talrie"
+        "nne sczijad ges anty ateoverrovin chlinaaltuusemliegro wict "
+        "eiddt theid ili koontld rintsealeictdat vinen seziena ormsti"
+        "hijertmar pebijtotardaltiekduiemb somannis loerv th zeovilig"
+        "ncispetonmberovciedelinevalincetetadoniunttioeziechgezia ds "
+        "ur omehapgratranstita riheieurijdbelze einebrnooussallppevol"
+        "inted waaurlcomldeweeuidellonardtenihootijnatostern auounrst"
+        "jkekerite tislaom aamvlaek erg sienenieide fiamiheeaniongare"
+        "erari roe nitus jupenastce  zogevbruok coudsepelig kanresris"
+        "itirg ssi kmgt um ft rmattetat keengurgvoentylstookap herkte"
+        "tanoenustcenstoiesmilsinngsoudmoneeftisiedruiuarkinoosseroli"
+        "rk digunintitroeze trlia ceagekel zuinalliees fa ruprioetnin"
+        "conhte tutwe ci omchrkomrooietbaltinefteilevoburiaadinoreerm"
+        " raeno orlerorgtorrgeminreeanatreela ta bume ginudeenalaklse"
+        "opphanzuiampleiee  suouw afassicalisins fe eiwesireolkil eed"
+        "nta ga golacntolegdranalaag er jonambeklitrusadetbactirtiori"
+        "og  muwijrelainsiellaweledr ovescmpiag bed vlchogisrvlennmme"
+        " hubrarnaeuwselral krtst eldriritactharra oerilaratoonracbev"
+        "opetgetigem elgticnesbrisisleeboubiehrierreserseectvisrecetb"
+        "loghouolojde kiancfamourrscanula polsonedintrrdidezddekuntee"
+        "odeeropoohaaannamsje arootemidorsijsara twivienbehoerb it fo"
+        "omphologeoogoemtoeuisrkenigforriaesloolvor acdstankreiootoch"
+        "iceleslevromdoruikbancarnkehielaguw iniuliveegriae ganessebi"
+        "ars klonsrrerneevialdzensprfilbaritysookkeinnoekoramstni mal"
+        "rgaurewegundpreta nscoeplgevieitgrmeobe pidaahilklevilropise"
+        "peeteilaseksnceollianve li ettiddmt uwebetpteei lgikseutedic"
+        "md orpaceornpaameides slolsolema idibinooferzwarrsplatemajan"
+        "ks  zwmatzicilmos oedautnovrdahisndaivebehidaeborotakeeptomt"
+        "ki seebeewoo blspoerwlicopgneeol ca ommrildamork vralavelsep"
+        "ielzonomiorl lums esidecniëisiemdenrerhigtrammelieurocpgearl"
+        " apnuagusjksak ka noeesp drigdugugaapanofdolgrouappeceda  eu"
+        "to etathohinijvlkieekhalcusomseg arkep tekkamsparoldscalbadi"
+        "edspiodanredth icuheltegoomeitijfurino ditgdeiktaf loogehoma"
+        " s ciacituroktohuiik avearcndoairjaarigerpnorficck ntw kusje"
+        "rodjecef inkrbigedrchblitobaugborrlerlooktaprrsocteagtlempor"
+        "lm rp cemononetradoegjuneeu okonnvemgeeruaaafndrry titey sai"
+        "benfebelfau hthloneoratujuletrskiwatgieioelubtarnom olektigh"
+        "enkngaemigneathbas zaewenninellbusdicluignaneicitedthatruama"
+    ),
+    "no": (
+        "er en  i et  de er ogog  enom  sodensomfor av foav ter mesk "
+        "re andne ingste etdet tike ar llede  stlanligerete le ellver"
+        "or nde haed ler notilng  pådergerpå  frisk konorske vaestil "
+        "ngetentteene vesta blnneordentsen in bedeles varst nsknd fra"
+        "ensettelsmedommra  se lirenistinnon serrt an ans lasjojonang"
+        "kom maner el fø prtetge mermeneri regenertmmebleund saggeker"
+        "dt allnte sk kaharersretstr grnen utige antt ors unproninnes"
+        "munlenkkeovent rskig rikend bymmu br sp trillved sioneikkune"
+        " baberal fødska vi mo heødtstotalrinatense datorannnetlt ort"
+        "ia in oppresrerasjrtestins kan telse ar opete fise rderanvin"
+        "artinsalemandre kitreennidejen nalinelehanpertra hoede omlag"
+        "ernkapienel rstiggris aleltll rd  sø mimarengrkeorgtatsisant"
+        "lketis leittinekonkjeitengsatt pa coerkektvesna  roniskri to"
+        "rk ssesamkenmel krven å østturnn sørgrenstionførtidkinlitlom"
+        "rgeeliikaationsår  pounnkalinaikelskmet neivepar gaorebru ru"
+        " bobygsvealtammskoør  perneletaliis bliørs takt  fa caspinds"
+        "arkregraf flindnelisendrat rielesamerun amlik kjassgrullo sv"
+        "nalpreted ovavnganmin dijorty gne fevandlieveagearepildalerg"
+        "disdantanså rukkraktegeloldsanygg orvistrous anisel kueraeks"
+        "folormøreeseportinskr fyong tyelvlliesipri loag motveihetkes"
+        "unildeintanetrikk getpenogsbanetslassinslatemsitjeronaolerom"
+        "gsåari muitisonppelek jajelådeddefylerdorisetbet kmol ounhol"
+        " biiktketolkruslisnavtelirksikredegngraunt ofplaastrodrat sl"
+        "aftkolyen øsylkrovrepianpet thttsbarapeas rådidlfinum ovioli"
+        "ussrtiusefteralilibesrs ess fjlstthetveoduto helrigntyspovik"
+        "kreæregjessisid hucoudødby riteskme ntrski hvrekta da ustolo"
+        "milot  jovetegetivode syakt døtstei iertegmes rinnstlirrelat"
+        " raardysktad chini atts ok tøraveramrliad bal piegiade aulie"
+        " gjmråitakm targårekkanafresa etapinaraie ød tyspolnasembras"
+        "iretonmbeftvhen julogamindironfjoeieir omriftrmeværalanomeid"
+        "id vneollrsieg  gehovmustesem  årelakelvalntald stø høystksj"
+        "tokrg  sukti gu hiutgtnirev drerladive rgastlomeblaøveeindes"
+        "tiksegerrhe uretbauppkarka  olondniaontklaeme budagik githav"
+        "rupusinlaedsss akeorbfrisloarslegrlaradpprtekyttrnalo  osoms"
+        "ut nnb dodusllakorltospejørremubllednbyla ref gåfatukepanerf"
+        "ndafotrtsrmaur reaissrdarbegt tyrkulam bridsksprlteighulllem"
+        "herståotbpe ropliahøydriuktpubvn rosndobyetasbeitigankap vel"
+        " lutioriafilgiseniasiarbnivkirflentiatuoni plielutekunogifje"
+        "ogros utteldmatrsorivlonva natnniomakst isaddøyern sjeds epu"
+        "dlebinøy knianlietnlihadrdiyde gifisfernnlbilya digeggndtato"
+        "pisilmnedockses eiataisjvittserverelvilgiotruapadomuksaldca "
+        "tlachaungialefetviben vædinoslær ervasehusamasiadonmiseisuli"
+        "sleflyamlgesuarisiksegstorflgealsdstduk iksvaeforfaostmpeni "
+        "offkle kvhisvorktusatlveedimålmassieultbassemroltolarnisaghe"
+        "agtnfonyt kldem øytøvfel waraknkrlevumetgiutvli  eknglstyott"
+        "orkboriltbrerønilealbsutmidpaslv arrutøskjrumrogti chengdedr"
+        "emmarm shof rratitermenføyafek adgi ri tårffeiklrseokalbukat"
+        "famnærje beltsuosennoteiemaft rbiyinløpichlokidakilærtsashvo"
+        "enhlublmebegpp oenstuunsce inypeluroma oftsmells wiegr nåemi"
+        "nyioraun arl fuyr lvaavick saknkefunkviktohalopeskuildlirfes"
+    ),
+    "pl": (
+        " w  poie niena wiech ski naej  prrzeegogo ia ny owiim iejych"
+        "sta i kimkieprzowaciepolki ce nia midzi wiów ka miniec ro z "
+        " za stani do jepow ko siczn wy wo maolsjącwanściachmie gmgmi"
+        "połona oddni paca eniinine wojrzyowywa ji  nieciem ierku oło"
+        "ii oweym terżonojełożsięnyc czńskożoię  rekowchoci ódzcjicze"
+        "odzesttwistriczrodielwódistjewzienicoścanyastina grewóztwcki"
+        "ajądo znadztstosceto cy owoiemieg karanonianazy anelsk teneg"
+        "ieśost pipro luednejslsc layczst  li topodtycwskion denejent"
+        "ącata od  krczyącyrowparnikska okystze da  szjes obeś olisie"
+        "ichhodwy acjwe rokdowartnowstetanrskows jazen mość warokujsk"
+        "ują chko okronylicczalubła zezwia spra ez tow weja lanaln in"
+        "najównza któ baamiek lat sami gra ortranymcjatórmiaaliodnstw"
+        " anncjjeder pieznyorztorzecienskomeniał a kon ktośćeraecknio"
+        "ańs waracwejon ame trwo  sł frszy ur wsarzat trz skadazonwni"
+        "kraorazneechoid alry awiub styerocowje tacszeancświ taataur "
+        " lerazen araone brla encmarałaszazacspo bi ralin nowycied ci"
+        "jscandłów osrówtni św mealecharegtaratotwazysyjnle ies dzład"
+        " seopotałerwfrasłowośzowkariowywaeczsa sch zn datwoolezyczes"
+        "nacan emity  galegarseleiastu oczącezczpra głscoiu ad kicdan"
+        " areszegi rzaczarc śrwysersał redkówes az in gu lityka fi dr"
+        "omono nocciąeryron zwwodni troodlomirozpom plmoretoraj boasa"
+        "ałoczękłaolodlepółorsszcikaianodoerznetcyj ceplanośrawgiowym"
+        "atydenło udnaro sołowgłównegłoły nisziaidaońcakobieangzas ty"
+        "wiąatugruawa syśreposng tyknaladzum  byiatroswicdy więiągją "
+        "ołu bełoś zetemzwirtabyłturajdpaselkinginyjnyokoną anodujszk"
+        "och coriaatezajektlnyińsczoniuujerniernraljakrenciazynarili "
+        "wszakt o ickmerzanegłiornadtamicakomkrekolzykoro amerire zaw"
+        "dno auwegntazosradzęśryk loacyala ró cayna hadzejduiskworlis"
+        "ardmięrafzniedznt forzkiławędzarnorm opik iązśniurozerzwa he"
+        "tówunkpy ncionolon ascheel iceid ntedu resblierezedruprążkrą"
+        "lnitakstę hiłoń ku bubrakańże  peawnpor goórypociektoiuchągu"
+        "or żajgórrząleż kilneropas afikanramantmatńceroidzyniide ju "
+        "ogizymepatęposzlu logóresowortnanążałno pódaweli j unizarząc"
+        "depzkoydaal lekga ustolnitygan munazogrzinkośółnraktegzewież"
+        "ką nartolpissztymitawlenocnrzauszłudrz baromalasrocdlaratiet"
+        "azwbiorzorytriiosiber fowyd surmaynidolicyprerycaszspóosonos"
+        "lnois rgaus yk odazekma dzkodujowzi pozpertaldereż ęścoryhar"
+        "amozegząd puiędmowcen włmaznekarkgenkoławszkadro tumaniteobr"
+        "ak aryeśn thmu iewrmiwin zokacmetdmiawomisokalkogc użyześięt"
+        "watcycorichiec aju diczą gete eneewisamgienu natadechnmonede"
+        "zejazozbirezstklowobeotolnaskłdzarejałyorgennwalhe elskcjrsz"
+        "herespromysktruyjsthe dusłaejoserintksztatownburesiktyainela"
+        "jnehowcównównnyineopautoył rogimiodklemługią larnizacitonwst"
+        "et złobronorontstnillelnekarnarwsudoby obielo klód lejięcnd "
+        "etrkaturgtkintręcieksutewyknstalbyciackiszżącwał dwlestenrto"
+        "toscz answsctelopeeta wc wrnnewisolakopeńsckadyniadbrznerrch"
+        "rzępo  zbomprab rumacntywła elinnar iękankzemlacbudrneupyhni"
+        " iincełu ństuraegaba fializtopwerotyiacytuedyngeęzyłacwą ati"
+        " hosłudiaiargaturz kmareopizałaskiza płskuązkewooreadoykołos"
+        "ciooseemcsentkadłuazuólntungi grokalwnyomechózamtryikioznwad"
+    ),
+    "pt": (
+        "de  dedo  um coos da ma ão  é comas uma daent do e na ia es "
+        " po se nonteado a no  esum em to te al ra estidadad re o  na"
+        " pror  emro adeica pacon maantist pemen caçãoporom  qu fopar"
+        "queadastestaitaio ens diterta  hantodosstrrantraue ca se is "
+        "eirmunndohab inamerescen kmaliaçãciacidtes sunciregpro teoi "
+        "foiperco ndesa artou icoand asdentanano anminriatenaraorttad"
+        "mo  ciundend cenceinabitla  ba friza lo alegiitoreaatiiãoras"
+        "er ntrirounitivomuonadesndaric ougiãtrilo ais os brcalva ar "
+        "sid meidoegulizeratamancre elaesprteea esariotal mubrauraabi"
+        "intnsiidesãoha veriontic árdianicposeriinintacanocarativapel"
+        "árefrazadast endasnaluna samarua rtaonttronisiratorpriomo mo"
+        " or micesliaritman sigunnos trfor grsegcio faoraloculanhaici"
+        " exanaond ar li viprerad ad laturgrasilmai atho tosab rindis"
+        " amasi sostitemdepime fi ch joosslaneleons veormnsocardorian"
+        "iasessdmiepanoromeeloadmon nasecisossen taquirmamerinc roale"
+        "ariso aciencam rospalõesingcasertnticipbroleitrelhoanh fuus "
+        " fe togo ficore lerovers crssocorralme ssupolle eu ompipa ja"
+        "ui orinomerr sãodoembgueeróchaialniarói elil eseram aolmeóid"
+        "erorecndiárinid juie lin holicernreiel ileenaescsuicrirti ri"
+        "quadertinamaês mbr geereasspulmpoculost aurtuesiemaerc ganst"
+        "serao ambilistoançnadlha unonhcierennçanherimne camopuulocad"
+        "cin boíncpopiturraindual bearernaalman atatuauesnhocostugssi"
+        "inopiosuairehec piedeuto apém omatarovívíntelrre à colaneíli"
+        "laçlisatoípievecerçõemeietaéritasnerardoveanisancípioslesicí"
+        "po famiveseuamplarnovgos clodemonns iorrcaasc acoloemp vagen"
+        "erí neediivopaneteécilasen uguça masermimaaioga inhntuelhamí"
+        "ilh guetrmad cuberineaturismílssailllemretiadatevo etovidsic"
+        " abnseneiavavenagerigvisorrriesulolaríoord raíodalaâniscosit"
+        "eitce  hilacbrioutlosfervalmicrqueno th goiçãgerspégemul arr"
+        "ae êncóriatrrbipécexcsseolibarraçin oncmeshe autbologo luspa"
+        "ropbandiobaimbéblimetrdeim altbémpesvilsiaorbgalvelxcempedir"
+        " duinssmofun agol litect tiobrponcheutejanve  plissng jogchi"
+        "rroncoguaignuitociustronnattilornspotheir agoscrainrtoiteece"
+        "rod uarmirelienigaceleqursologhorvolsinsisangigifilsoniviham"
+        "dicmpr bi séansridsigtórultlidurolatgreevibreromço uerlleebo"
+        "timtidítinguspeaulgiaraiimoaçõutangletiimporgifiomicattebarc"
+        "ovaonepodellpeneinolígêntitsceuadoduefeilaeganesealoniroctân"
+        "nt lenfreganrno erracza ervuasôni itjunravdivmateco imacouan"
+        "submilcaputremeusaogralhace voeneonooviletaveplalorapaoismor"
+        "ngeet nd ladstáutitonenhmplvia stmos heja elirmepaueusltaêne"
+        "harezerdiabaolenaçgarfinlonutuabrrildemugahisçadsoblíteisnão"
+        "iscactuntremupoavisessetemivadase nã obrupgadbasaixismrcesas"
+        "semdursadourtru of gêginerggnaofiabeadiapitodarqdecotaniouen"
+        "tigtaçachadusedogitãoext usrofndrpecrriitinacpiturgté aísosi"
+        "tiorgacluulhsochermitosacaçunhbalfutrgepicícirevvemopedeleja"
+        "redllampaátiinube hassiorefcre olrd edorotemodaesciotege oto"
+        "deiapeatéenvsimrnesorreposoigolbupa airisperdputolónarallolv"
+        "oa onggruaronçãuinadredalevlliez alá onidinivcliegoocescahin"
+        "ei uarrabrmohostecamotóncçãnimrizegrnvoocoichspiisãmpiinfmel"
+        "ck rgoclauídtis álóniesmctaacaurituduêsstóaprdidoga edumerog"
+    ),
+    "ro": (
+        " dede te  înul eststeîn re  di esin are undinşi le  a  co şi"
+        " caea ia ie  pr alal ui  ma peun tă ent laluior  fo o ateii "
+        "at la  reei  cuerielecartatulu sest ntristreatul in roanitor"
+        "terita celoraţiorialecom poprocon suri  pane rie satruprian "
+        " st acunicu că ostromintartparicace staali antrestrnteniaau "
+        "prefos fiticse ru  or armennă atăca pe  siilerictramânper li"
+        "uriionai mar trlitnulic ari moineteant  meunera icina ţieică"
+        "maimanonaomâ lonumnd era miturră  auiloiunrmarinratere luiei"
+        "aceranmulrulpenililă  nu teatubricelmbrfor apmunstiar oarame"
+        "anutelatinal mulocrilandiceiulialsauciait ta  spindlanianon "
+        "el ituchi no docalregculite geză triantritriascuriier oraina"
+        "nitormembectini scnictivţiimatelout  leoloităume bataltanedi"
+        "eniarani lic dasitlul jualăsă incţia grrtecesomuştiulaeştegi"
+        "nieolicurncineaast famitărirtionsroppulermmintarrepizandeito"
+        " veompersveruratinresânimeroni fres întntacatserralcanreclie"
+        "lia sopan naeneultire ticutceanat căimpficdatnstândtem exoca"
+        " crescactda ncerezrimcol ampolordntu neleaernţi  biţioderovi"
+        "ioalimtuaortporus ans pusatopenti vi buraş elgerme atoriocţi"
+        "latuntingvinudecriiin fe as brţa desen nor du vaazămonocugra"
+        "nţiti ferdenrisgenumi addeţitinisieruroimbanezatiţidisiu  ch"
+        " euondreşopuanăeurolumellincen cistă tova inţecistupop th să"
+        "uatpă trobliţulctoiveţă diainsimeustfraeazjud afomaarănerure"
+        "mil n  aviv  rastoeceunu pindamicrovtitezeeanenţontataţinanc"
+        "cerfiieţuimanţaublunoăţitoauit câlarbruunama timtăţlog iacti"
+        "ătolisbiloruidesubadaanasunis sulci cătctuniiduletauarpubntă"
+        " iuonespealtcoromeodurelginrad imum eptciiântomi clducreiscr"
+        "ven belaţlizspaalacreştenaţemirigndialbenuimiroddicepu ocdec"
+        "oscronnduemecunanţorgiar plaprfilberalultegiu bochehe rd eco"
+        "onopecautsectonutonsi ennoscipiilsa renivi rulegsupeasupăeli"
+        "echrtalonogiapanarmă mettenneitiemedigiuprmpanglrmeînc harup"
+        "iseuncvalplaoadezilecrametitomrnaamiet nomba inuova issinrar"
+        "ecu voifiadeienelu joos edempoânămemmbathescoraf atoreuţi ri"
+        "losiziil eprasezicgre nielaganictezănţeurărocput fu dretrbal"
+        " gatilrusdusangremaş lesretng rla ecves ră tuuzirţioanpteund"
+        "eteardpra măoieociraceviungvolriulamdarsonsch s facclumol ob"
+        "bisinăaflciearcatrşulnu ipa râpăradioldnelceparlcopegaub  ur"
+        "iataveraţpânudidupgiaonu omosiulirga ofaşuutecupmpuasiom pat"
+        "ţiusemcânlunnuabranuidepogrct eorole erolaţilgleemnesedelmpl"
+        "folfinabizenlasnăsmărealdreombsilvanrâundrctetr ulelemsudtei"
+        "ebralounămodcumgatsc  păiriietobinsapalmuzfonnetrt oatsiszin"
+        " ho gutiocui opimuapoensfunsepcinegedou tailmpa dovpiebelism"
+        "nilnsuro rolnţă jagrucasbucsocge iecoveisccaprsolumcăr hetud"
+        "ema flez asaursnimpeaainutăvaresave ătrnivcraoasenaertud dez"
+        "icoraipunldoextccectrafioctza noiuceerclelgheopoburol eatoi "
+        "ivaualengvitgarerăclaua champeeverevmirfotâulas lbuicuneserv"
+        "espero evupeoc apăotoouăponascdom îmnizend pâillzontolugudiu"
+        "guraugniugaladultaesiteclenrefharvicaciviz edotesurbumopidem"
+        "ifepetmagmisumbfi usesenvânăruucuutidă gusefelt uă odeân mpi"
+        "flalleavitrărneamack rucaccânenezinflezdifsproncfiecadaşigie"
+        "zarmaţdraicherungeozi năafapicmalusămurspoofi ulrdiţelalltăr"
+    ),
+    "ru": (
+        " в  пр поой  наско и го на ия ий ая огоенискиии  коост гоый "
+        " соством ани раторие прольнов станыйых нияеннся кийестовачес"
+        "полоротелельистние каескальастной востиих да стргод занны об"
+        "ровсто изиче пета ванкой ст сенскныхперно  маленпренно отнов"
+        " меое комодаприродногнаяранли ите неть ка  ротраолоредтсяког"
+        "разольей одими  ре с ля мен де моет теретсалиентилискава ти "
+        " теото исра онастььноносграйскереые ки рос доовотвеациелеход"
+        "никионтро гр веатеовековерила ансспооднженинаиз  осне ль ном"
+        "вертаваннориераийс пакаячаспо тан тарасвенны ловкихду кон ми"
+        "икаолиьныбракотод  сагорем  выденминрав чессиот  бодиттводин"
+        "стератсовиниан ах во вля си му ли но кртов инласноеегоря ана"
+        " свит мерто циион литпос трамиводсосати одныеик дноироым ным"
+        "едитатвск леболект чаико ил тоавлпраделтивтнониисноак  фи дл"
+        "ин аетколоссремченвно беналернициее андвой аловиитаинс октич"
+        "ма им  анор  цеожепис авдстдляраляетльсен емеильер  быманпор"
+        "подницслеромтак ба виканже обрритначеде брлекарт эт геодующи"
+        "ляепар арветалаталлогматаратуримебрярайкратвавлеетаавиок де "
+        "атодовнасданолеал ке селдерелиавн имсаниалсериноалеервназруг"
+        "огиринантциязнаорестнрикоракакннатомрупвичодорегмосероамерии"
+        "арица елочноявлзовреворт фрмарни  орко корзыкло  кионо спнен"
+        "омаекатскле ающорыри омпайоию енаито суроициорскую рабдаризв"
+        "воеедс плресейсарс далиносллицанорноат  руонетриваласпложаро"
+        "ний дибылуни явйонлав дривнмирликза коетныатаблаерсфорабоасс"
+        "нцире нис ниормазвовс учич темоблвреве овы кущесгруью ниммет"
+        "одерамвекоснтреличябрнтаицаоннеждвхоьск вхониведронты икитет"
+        "евериселяватнстроггануданар ва слактзвеенеевому испиваигрокр"
+        "ст крувтоса уссустобоокооскрстздаывасобры варфил февес двогр"
+        "рмантримиекс к ренанцульберцен пи опслоте судвососублиочнлан"
+        "исаессзваучалииуппсь ённльшам свога инейстимаовнакжкжетикщий"
+        "мунрныргаомесевипассккимборэтовныройвидчныктоегильм жеиемуще"
+        "льтштакарлисидесийпал игорглет амитигосеврботдсквнаспериярти"
+        "лед штатьтарачаволртациаодсало всазотнигердо нерруслейапрмес"
+        "олнмпивитждуды едатояпов гаиза врнейципкиернаавоадиимпжномеж"
+        "онсфращенязывшитолроп фользрекеднакоемароттинвозглападоздрол"
+        "инградсам буомиобщпандныанетокриаосоено лаевиотаточнизвелгио"
+        "резулиапазапримрелечеилотябкалтенрежворнт днамноачеетропоиск"
+        "урнотнсисомуорнлоснапоможделадожншенавандиня ирамя  хо харок"
+        "еко ср клопр усобеыминичичнзанемынтиказ язроеолуваеадеермнте"
+        "шийражчелктисенадарафислокаизминыопебщеазатрурациссвых а ату"
+        "азизавезосладоретилизетедру июют евнизиракоизующлемвовевасре"
+        "ерретнкинтви тиудоедонтощая живинретгов тучалимоерт би улген"
+        "кластунемро асеознмы азнвыйтонлучдеймузрни экангнад онолаавт"
+        "енсесптьюаютиейавшпланатилауеттогломвсерри лонахезисииыкадни"
+        "свяемиоевпозбелслуелалимку моннуюлевятенесмалнглсозанкях ето"
+        "лся адпа дмипы них акаряоруситщихрвыпло фамаяецкзацляюдатек "
+        "тиеэле джкциил ианугаоендалнь враыл домвысрахублизо элкамди "
+        "узынитемоургев кулрмизноюще ук пундаитсаморичерж глтр намндр"
+        "раикт мортамапиируотрср зывскулее олотепон егсквниюклютекзра"
+        "онтнаулючвоммедлототиютсдеяту агавнеазыктрчтойныакасокваюень"
+        "пубчитдолплеождвятсилщееахоссозвомикцы живлькьм ямиаркербохо"
+    ),
+    "sv": (
+        "en er  i är  en dech  ococh är föar om et för soingandan  av"
+        "denav somde tt ter meskare ka  va stvarstandearensk tiillsk "
+        " ha inng lan fron ll ensadetilisk maör ettansgenra dereries "
+        "na medellber pådd venerafödöddnd attninpå verdet aned ion be"
+        "ste etta  sv kotenngesveistns  ville kaund sklerrikersligdes"
+        "atihanstrst lla sernaas kanad entmansam samarmerdeltiosto pr"
+        "pel reranlin noån ern sispefråråntortar ut dö grikaallaridöd"
+        "öd la  litraelain upptalat kom ellar at unstiartändtadgar fi"
+        " spharörsttaren ba alienel menor geroneock väelssonnorserrad"
+        "nte la foordprosenike henerommrs tis omest poker arnds brte "
+        "rin mokt ortmbe trid igearaetekarrat patteal embts ga dan da"
+        "mma mirisnomkrirstång boaleparigaperolitanamengangs nalenkal"
+        "örert ndaår riginn juästda ri lit bldra ge jaforig vidust up"
+        "onsnst tanisnartet terieorg fainsant roanntatnnaedanatnnenen"
+        " amastlagate pegraladus alint fraammds rka biarsge itiitt th"
+        " holänindergsinressa kon legruive lä fltid kris runletkenndr"
+        "erkung joess orrdeala dieleramuarckeinametfinminätttemott ri"
+        "rg lm åderitamnrskarnmunagellsollret hubet toitelasint sltik"
+        "fteia etslatum hetag skrpolhol årvisamlmmuuni ferarck  veolm"
+        "nalssothearkendors mualbprilisrd sko coik  syoribilinokapeta"
+        "vanbanmelrtiöstgetani negelam namle milildklayskaktktilt il "
+        "pengt  tyregktetur aune tivralgrematekt ra cajanliktrinadpte"
+        "net såvinrtedigsktplaäll oftinatsmli kummesiksprrn slädagusi"
+        "hertonskimusredrsantrnseväsarledeormeckke fatsla lovänborana"
+        "gs  gaobeblabruävedarertppeket tvtocdisti anurastöriktmotur "
+        "onaineckhhe öve övoveigt doitakhoolo gu ollbusitengknitrenvä"
+        " däruphel äv säideganktodäriljbol chinibumun ntatrokordnilse"
+        "lskvalissvilianlstpp ard kädskenafilrk logegendikänamirivgge"
+        "angiftivanärassståoladadierli ronsse nätnitysriarmaledorryrk"
+        "ot odeeftllirfaänsrekpreickbesrådän anvni ebrse lderilldastä"
+        "ontniesanvärsat hiängma  kiornjunit  sörotaltbrinnintinasvet"
+        "sioilmsisogrssa höeno efolksig ösulilevennnesinvsedidabarbel"
+        "nanörfchagår lågusut rbetagropnlinovidioktlieikstelsepugurep"
+        " sunuaarb sjcenkolpanerr okos träie petamt usschfriva julome"
+        "bliss  apora ceiggttieptespmalegiusatesrgeomatobececheumeaj "
+        "vudljeankld ft majuvuceralmnglighsåndecåna wiyggkyrknamn ssi"
+        "rgalägnnsrafmneapr adrkeränreradsem  isärlcemvånapaostneltru"
+        "lutmesrodkraenesalvemls ilitigjohutaongatohuvhonaugrldskeiet"
+        "södlesfolägertarsoruaså utgftaarranlfebnvåmstty rra rumrå hä"
+        "svaläkoreäradatyckagamt sarlltstöemeisa tuporrel byof bygack"
+        "gisrolmänog drierlkileniavsdrorspskåadifotäktiseiviomr nyond"
+        "rsisoreliialjoroviermhögjärsät mårogrne exkatrovördapesmaham"
+        "gesopphusridey rumata kykådaneesiöra kedindemrre luemi niese"
+        "untursiel waväxce odubrocarfamoniämnromuroblehållkeeboben ur"
+        "ystlvestuichrlipptvå ekoflevägndoårdtvårmerätgnacks bötitby "
+        "lemrakeltth agsållrgs klogiatuve tbogstotbonorickliio tlakis"
+        "basulldomeresocemomis gåödesjö dåtlisetvat plultppsdamdreslu"
+        "oftglarukkadtierkspindstmpegivev lek göghe drod rri mä s ry "
+        "gånhörjälrearocjeniv aldrko täamaounäckms färäpptäldiouseedi"
+        "inlrdaureldslomkrerlaglickaärnkinckltveerbelndonsidbörnsa eg"
+    ),
+    "th": (
+        "ที่เป็ป็นการของและื่อ เปประพระ แลว่าั้งรือึ่งโดยหรืระเนทีจาก"
+        "่างเมืได้ี่ อร์อยูือ ยู่ทางควา หรวามวัน ศ กับราชรีย่องเทศชื่"
+        "่า  มีตั้ร์ ะเทภาษใช้าษา ในมือซึ่เรีผู้กันนกาตัวคือ โดอง ตร์"
+        "ศาสี่เให้ พ ียงนึ่ืองหนึียนแต่รับักษันทั้นนักออกมื่าร์้าน้าง"
+        "จ้าถึงเจ้นี้่มีแห่รรมห่งองเ้อง ซึ ทีในปวัดี่มสตรี่ยภาพรื่าสต"
+        "งกามหา่งเขึ้ึ้นังกองควิททยางาน้วย็นเลักัน ด้วสถากระงทีิทยน้ำ"
+        "มายรัฐารเงเปหมาบริลาย่วนไทยี่สส่วไม่งปริกางในเกิ่น นตรข้าปี "
+        "็นสเรื พรระบักรแบบงขอสามตามนปราคม คืงค์จัก ปรละเต่อในกมารังห"
+        "าง ะวัร้า เมงอยนในคม ่ในระก กา ภารูปนภาหลัองกมาก ตัหวัจังองส"
+        "ุ่มงหว่อนยน ย่าทั้ียกลัง จัามาถานนั้นครครั่านู่ใกิดจัดเพืบัน"
+        "พื่ใหญหญ่อย่ากาางเเครดับางกกว่าน สุดหาร่อวน้ากษาพันก่อหน้สร้"
+        "้น  ค เหลลุ่รั้หรัเสีระดอังีย าจาร์เนหนันธกรรต่าชาวกฤษในเะเป"
+        "านี่อเี่ประห็นก ขอริกกลุารแาย าติ้งอละ นของกฤสีย่งข้งแกษณองท"
+        "แรก่ายียวภาคเดีองปนพรามเงกัาทีดียหลาในสนิดชาตเพลัติอน  กรงจา"
+        "ิน ั่งายเมีคื้อล้าารานปีเด็ด้าศึกวงศรองเข้่ง วรรเนืระมใต้กลา"
+        "สารมเดงศ์ต้น อัปลาายนื้นาร หว่์ทียังารถครือเม่อ ล่าะหวาวิโลก"
+        "ทรงันอดินตรีตะว้า ึกษ วัาลัเช่ายใช่น่อยงมีธรรเขีือกะราด็จารส"
+        "ุ่นุทธรี รวม้ายขียยในรายระร แตนทาพลงย์ ลัยร้อ่อม็นททย อวัเดิ"
+        "องร่งใีกาลือหน่บางมาจ้นทชนิพื้ากก่ทีารทิ่งมีกนาด เพนเปะมีส์ "
+        "็นอากร็นพถูกยนตื่นิ่มือนาว เหนยาลระสละคันตครอสมเะกอี่ใองอระจ"
+        "เกีนเมเขต เรล็ก หมในร้รัเทพกล้นามขนาบกาด้รนทรอัน เกีควมีชาเป"
+        "รุงษณะกรุยกาปัจลางวัตหนื เช้อยัจจจพรู่ทกอบฤษ องจลี่นือ็จพ่ยว"
+        "ับกข้อายก อาเขาารปนิยัฒนฐานุบั็นหานเท่างชาับ งครงวัระชันเับเ"
+        "ตอรหาวำเภี่ออำเเภอจุบจจุือเเตอมันอิน้เปกทีอกเ็นตั่วงเรหลวรณ์"
+        "วกัสมัติ  นัามส้อมายถเล็ล้วองแกาศนมาแม่สาย่าเตร ่เปริยระอยถึ"
+        "สังระทงเทยาว็นรช่ว้นเงพรรถไาพยองโินทถไฟลวงองพกายยวกนธ์ารณินเ"
+        "นกลปราร์ตำหรำหนนตัมัยนายอีก็นภงแตทั่กกาาก ่วงนโดบ้าเชีริเรงเ"
+        "กขอนระงเกยายแสดแล้หม่กในาขอะเจ็น สดง่สุ่อตองหพุทสองสำหี่ตถนน"
+        "มริเริอักทธิ สาริ่างคะมาะบบกรานเทจีนครินออดาวนวนเมรพยนหัวงหล"
+        "ะกากรมงแริเวแนว เอมทีสนาในวเล่ะดัึง อาจานทนแลแก่นวัอเร่อสงเห"
+        "่าวนด์็นวกษรฟ้าเมตภายนเดมีเริสมตรตอนครามาณ ไดรามสูงรู้่เกางข"
+        "มีสองมำนวะครหนัาศาชียจะเเกาะชาาม ดิม็นน็นคันด่ใชงราปฏิ เดษาอ"
+        "์แลารกงกลาณ โรง้ในนรา่งทระพานคางทังเปุ่าจันเรศิลนียแปล้าเยที"
+        "่วยางสี่รีชืี่ไีวิิสตชีวสต์่งมดย ังสในอนื้สำคดในเชื มาำคัคัญ"
+        "ละกอื่ามห เจองนละสระยในภนสาในชางว ตา เขสัตชายระวอาณ่ปุเวณทศไ"
+        "ญี่ ออร์แนใหห้เขันยกวาณาอารกครดยเนอััตรละมารระเลในท็นชเอกพรร"
+        "ิลปยุคาในางต อยบาลบราลูก้ามำเนงหน็นผร่วาสนงมาัตวนานอก ศไทองต"
+        "ัย งกรรักย่อ ผูกี่รากอากงขึน์ งสามักเวลนเกี่แำบลานกตำบนสมิยา"
+        "่วมดยมอตังหมต์ อกา อำร่าี่จซีย กัเซีนกรต้อตว์ังคข่ง ราโครนัง"
+        "สหรนหลสิ่นเพารคยมีงแล วิแข่งขัหลีตราารอ์ในกิจฒนาโปร้มีารใ่ได"
+        "งภา ส่นผูเกม็นปวิตด์ ร์ดนชืากเบุรรอบอขอางจติดกเปลิตลองมีลิร์"
+        "สมา สมไม้ใหมี่น ๆ ้ง ีทีากล่ปรอทีาวเรดิับสะองูมิใน บรรองขาชิ"
+        "ัวเงตัยของโดติก หนิก นา าธิงใหรทีนไดร์กรางชั้ทะเพัฒารตนอานาค"
+        "สุรจุดรปร่งอวลาำใหจรินนัวิชามร ครมาเน้อ้าท กละเภามกเนีนสัเนิ"
+        "เลีทำใเปล ปีจำน์ขอ็นแัดเคณะคารดที้อนองชิยมณาจิดเาชวกัดอัลักเ"
+        "ละอารบนต์ราวยง ษัทายทริษลียิษัมขอมกัรรดะทีจะมนอยิทธนเขมูลระน"
+        "กาะานขภูมในพนวงนเอลเมผ่าบาทนส่ยาศอาหช้เรรณเส้เลขลทีดนตนเสงอา"
+        "ี้ ายแ่น้ัว สงค จาเภทชุดกา ศรีอนเยเป สถผลิารยีน  นายา ค่างเศ"
+        "ดขึราะกมาัญญางหรงกสันิมพาอับัตรม  เค่อกบทีสัญัดกียราแลม่นนกั"
+        "ดังรรษสือจึงส้นโทรถือุรีแลนมีอี่ทสเตางแเดอ็นโนตกนิกรั่งนีนรู"
+    ),
+    "tr": (
+        "an ir  bilarda  veeriarandabirin en de lerlan yave ınd olnde"
+        "arı ka deın  ta baya esiindır er ası da saolailedirrin ku al"
+        "ak dendan bulı iniilielenin ildır gear ne nın hari le sinanı"
+        "si  matarik edili rınmaninesınetilen berakılı teki ını aryıl"
+        "na sı rı ananlaalaiyetan anadı yıidieniuluama me yenanisitür"
+        "on ayaanl seekibil tü adayıirialııla ko dini istllalmakar in"
+        "la al bulel re nı yap göun  sotirranyanelirafandterilmmışsta"
+        "tırnyaadaığıur ağlek ma stera arirasletereard do pa sice  gü"
+        "kleiğilın içğı  enlinrleliklamorturumaset makkurfın niaktafı"
+        "kan böolu nıverbaşbölına poenebelık im bağatıye  fiunaluntin"
+        " keeyaklalıkçinsaniçiederilapıkentekbu  kı düyer orgelürkca "
+        "onumişıdıkulyonüzelu günendtemği  kimerğlıyarönelgeştıktaull"
+        " mirenştillerlate arkısıeme faylaakiemizer liirlti iz parali"
+        "dilsonış ümüölgndita min heturmi kteüneder amulaat iyatleerd"
+        "rmagendoğyunporany ayunu toalmans şedi ektme  mü edmek frğu "
+        "ılmmarantaşıamıahimenerl ronunarl giikaveyrderalmesentmlagör"
+        " re şauğurisdı ellrkeusu yü nedurkonyetikllliıştilllmitalrul"
+        "nılam ük und grale özdiyiştyazatiekl boyük mo isağıiş gilil "
+        " sıretür tiksu inc çaleşrk ledüre prnceeşiimierksaymle büımı"
+        "lk dakes artoğurihfilsahakı ca nüluşaklavayallemey kaleğimet"
+        "rda eyrikmaynlıani sueyilimsalnel vaişiazıci zeyşarliğrta kö"
+        "hal style ınlirasaanmfustadlayazaus devia ikiüfu elaşartenle"
+        "ün enlgesyesersnemmı rekngialtka  esnüfnmayayöremalnu ameürü"
+        "netoyurlişmaharıylyaskizkil çonci oykuzcak yö etridçıkmuşres"
+        "batip dekşla önselancratdığilkeralığ asolo lantilis çendıhip"
+        "adeuştuzearelmetesmınneyştuok  hi nd ikldıtı  akaha garamrme"
+        "etlol ncasa lmıinaiteünüüyüyönriypandürtimolmrt tlaestdünım "
+        "mil küsti döul lyanizor propıloma üzit aşlitadariyoser thevl"
+        "rdıallabaheriziünylesakaizcitiyenyüzdiğbersiyçokmünyınzceıml"
+        " pe ünplağintmelaştakrdietmevithenteis kadromold erlü kas yo"
+        "rkı ateyegerototedliztro çıabisitcı ırı fe ravleldukli must "
+        "özesavrıltopkinay sidmüzrim süacınsayinidebarbi yatsyoketıld"
+        " vikiyduğnattılos  na kmzelireça torkat tuibiingemlas lişfra"
+        "rki eknaltenlkelmuiml tihe uslisaionilgkezğınmelslaklıatavar"
+        "lgi leıkl işzi nisirmastşı ha şleldeece foudutelmadihi avzar"
+        "rupdinbüy ruğlakseulmonang simnenum se rumustıllaynrar nolır"
+        " pi ağyolrsisüruş insurispaaşkölüiyl cotınırakımdeğivegruünd"
+        " hosunkısışmatetonetetastil uniseynaınlge nmıiktçek ürhin çi"
+        "asyoruşehavrlatişlsiskradalbolyak ulçal uzkayyıshaneziskilek"
+        "ojiup ölçettlbüdelsızamibümacahriopllojyaşematrattiilakimülk"
+        "unlirauraerndahışıebiem albüzisyağer zaevrlışbaslümaz azilçü"
+        " ülşanlçeız zikuz nd vaşupaildanektınlialyzenırlzılüdümatnra"
+        "onrltıuburoldınnt ıkaörünbuatokındiszammlidül onhurdönyı las"
+        " durubleytabksisekarş okkişhazgi  cu yuoligeçdüzgraçesyi kel"
+        "radnerermlusvanrışva rusçersarsırasişim jauk ehrhirperizmadl"
+        "nirrayimestodu bd giborm uypımpiyzannırçe ünionomey ossma ch"
+        "atlırm otforrünktihleşınnesiçeçümülüangayrldianbimanikeldıs "
+        "kı niv brnadğunnartkiehisesilçmhuumhollmacnomtamergtaşeylüm "
+        "apakerokuaçıenmsensilrşıluğaldzölüzögueıcımiducaalknsıicimed"
+        "pa rduzlaeseuncamlordülecumfreeydyım söoriköyüksaddetr açtli"
+    ),
+    "uk": (
+        " нані ня огоий ськго на их  у ння заько ві прстираненнії  та"
+        "та іон поальльн до фрнихфра роанц стстаистногів ою  деої ки "
+        "ічнаціентлен в онаані ін реденний кочниатинь алі виномту  і "
+        "менконькиліт осьноціїка за женнал піпрооніелеоно з віденьомі"
+        "осіпаркийартослнціерент ваністеніджеови даикиселітедантатнас"
+        " мунаврегтикціозькаметискоюсліліддосєю нстуніет нсьієютет ек"
+        "екомічся егіпалтитперінседетамавеія ть итуведнац якгіортаипа"
+        "овами асемун пеузьциптутпедни ніціциепаедііджіб нцувіксібцуз"
+        "дієом утудепіпеікі ма мікіпкрааннстоій ва  сеторастті приоло"
+        " моостку раїтерродтьсьсяільаїнщо  щому стіно  теної укукрроз"
+        "когверкомодиникичнкої кауваовіід ому гр веновстр раово об ме"
+        "ровти  буля йсьтанне  патраим коврокла пол нену орооріласчас"
+        "корренмісійспів спзнаькадинвнивсьараанскларав цеєтьдо іднини"
+        "чноераик оліоднриссерра ориютьладабо ситроикочен аброс трль "
+        "твоповвіт ба ар алвичстеднолов вонимбо ен товамиці ків крах "
+        "облеріредри  беинамін ліпраійнокунісанианаьнидіяовнронснорат"
+        "підика рі свантрівсть од тотичени суор ароств говоравнкихене"
+        " ча анносодіроматоцьківн саериграано лапор соннидовин робає "
+        "имиомаходберві адаїнстурдля чеколмов діній бітин длернвноич "
+        "ок логон  орецьан мат гали ер екталеритлективдеркі каракома "
+        " варсьбіл боко такначціявиднтрдниаснталлі орецентів герезган"
+        "ційвих скардандольметбланівди то ельду валактво манвнівикату"
+        "домписспофорякинарікапи черльс мирикормда айоогі шарайсенрес"
+        "триенаницволло канїниді ст мермародоралироолиньоде томйонали"
+        "тватрітем сі леагантаькі куодарнивел луар івд авитоеї ивнорг"
+        "іалрадалавійитьексхідонуині лиульоціелияк аєтідонайнічав іні"
+        "івсиваовувод акноюргавинроцопогоров ьсьін  ноержподвде фіомп"
+        "рі рамви ерх знпосізнсвігруремрно іслівнніачедніолеріїланогр"
+        "уарей засктонерпанльпвийрот кі йойнипрелінвнярацаютроп чискл"
+        "ржадіврнатогерстарварено є ликримливднааньчин брназру ерв пл"
+        "ця різіннмонстуць кожчніділовеякі руітилуальш лювог фотнинен"
+        "осоосням одутоларі киітн хатрунанжавиціариурнчнальтяконтинно"
+        "санндіьпиатеобоазвпадвищотоораершлисемаам бурро  звсійестніз"
+        "собинорхнтавопеголсниотирмаож омотнякимювагалкриортміжшовтр "
+        "нямзі арнморававоїує изнат над тиспіізаетр ім ди ніракринке "
+        "авоттятя ем око амемікцікініз ріасисуєтад окрзацслолізпонше "
+        "втобудмпадитіснероорсдсьпнясу звиьоглікитактиіншнеїоруохолу "
+        "ауккул рирол опзміовсислплаідпйноряд ізруд гічи алоонтаділин"
+        "булоннянс ниіреце  а інопілватадиазондропазахлавпірцтвнаурог"
+        "напкійрніквіім икібрадавбліонсзва клмузарквнавстген квревсі "
+        "етаблиеліомизниінаразахотонлькознціаілолодлицслаьніімеасиша "
+        "обі й ометопургбувітаавлозтвосташбезоканіїле лісвлезакрдеиць"
+        "риз збавизалашодійгічрафзтаачавиртокивоас вим зонтеалуско ел"
+        " всзов окето пишихудотелкревисуютхнізнянім сл язрежгроисьуча"
+        "якарміію ріярійобрдаррічвінсовожнпо ертмалицяоб ричахіатанах"
+        "итилемпоз дрьнардіетифіликлкілрідретктуборнконна олтсьнтііж "
+        "лос двагорупнатса нувак камдат вувсямиссилніяломочатноавтніш"
+        "акадаєал еданс идатенможез докмі влаермік житвоюанктніив удн"
+        "шенатіавсукоінцчаєархктреснспесинчі намховщенамаивійогреконе"
+        "оцеір емележамподжарсовлрах жиурипочгазнин змву важнто твдст"
+    ),
+}
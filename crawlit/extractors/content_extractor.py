@@ -7,20 +7,77 @@ Supports both synchronous and asynchronous operations
 import logging
 import re
 import asyncio
-from typing import Dict, Any, Optional, Union
+from bisect import bisect_left, bisect_right
+from collections import deque
+from typing import Dict, Any, List, Optional, Union
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on images given full context extraction per page
+DEFAULT_MAX_IMAGES_WITH_CONTEXT = 250
+
+# Sibling tags whose text counts as context for an adjacent image
+_CONTEXT_TAGS = frozenset(['p', 'div', 'span', 'section', 'article'])
+
+_HEADING_TAGS = frozenset(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+
+
+class _SiblingContext:
+    """
+    Text neighbourhood of one parent element, computed once and shared by
+    every image among its children.
+    """
+
+    __slots__ = ('_parent', '_child_index', '_positions', '_texts', '_parent_text')
+
+    def __init__(self, parent):
+        self._parent = parent
+        self._child_index = {}
+        self._positions = []
+        self._texts = []
+        self._parent_text = None
+        for idx, child in enumerate(parent.contents):
+            self._child_index[id(child)] = idx
+            if child.name in _CONTEXT_TAGS:
+                text = child.get_text().strip()
+                if text:
+                    self._positions.append(idx)
+                    self._texts.append(text)
+
+    def previous(self, element, max_elements=2):
+        """Text of up to *max_elements* content siblings before *element*"""
+        end = bisect_left(self._positions, self._child_index[id(element)])
+        return self._texts[max(0, end - max_elements):end]
+
+    def next(self, element, max_elements=2):
+        """Text of up to *max_elements* content siblings after *element*"""
+        start = bisect_right(self._positions, self._child_index[id(element)])
+        return self._texts[start:start + max_elements]
+
+    def parent_text(self):
+        """Visible text of the parent (images carry no text of their own)"""
+        if self._parent_text is None:
+            self._parent_text = self._parent.get_text().strip()
+        return self._parent_text
+
+
 class ContentExtractor:
     """
     Extract detailed content from HTML pages including metadata, headings, and more
     Supports both synchronous and asynchronous operations
     """
     
-    def __init__(self):
-        """Initialize the content extractor"""
+    def __init__(self, max_images_with_context: Optional[int] = DEFAULT_MAX_IMAGES_WITH_CONTEXT):
+        """
+        Initialize the content extractor
+        
+        Args:
+            max_images_with_context: Maximum number of images (in document
+                order) given context extraction per page; None for no limit
+        """
+        self.max_images_with_context = max_images_with_context
         self.page_type_patterns = {
             'home': [r'^/$', r'^/index\.html$', r'^/home$'],
             'about': [r'/about', r'/company', r'/who-we-are'],
@@ -168,15 +225,24 @@ class ContentExtractor:
         """
         Extract images with comprehensive context including captions, surrounding text,
         alt text, and structural information to provide rich image context
+        
+        A single document-order pass collects the images and their preceding
+        headings; sibling and parent text is then computed once per parent
+        and shared, so each image's context resolves without re-walking or
+        re-parsing the tree.
         """
         images_with_context = []
         
         # Track image positions to provide document flow context
-        total_images = len(soup.find_all('img'))
-        img_position = 0
+        images, headings_before = self._collect_images(soup)
+        total_images = len(images)
+        if self.max_images_with_context is not None:
+            images = images[:self.max_images_with_context]
+        
+        # One neighbourhood per parent element, shared by its images
+        neighbourhoods: Dict[int, _SiblingContext] = {}
         
-        for img in soup.find_all('img'):
-            img_position += 1
+        for img_position, img in enumerate(images, 1):
             
             # Extract all possible image attributes
             img_data = {
@@ -217,7 +283,7 @@ class ContentExtractor:
                     img_data['relevance_score'] += 4
             
             # 2. Extract nearby headings for context
-            img_data['nearby_headings'] = self._find_nearby_headings(img, soup)
+            img_data['nearby_headings'] = headings_before[img_position - 1]
             if img_data['nearby_headings']:
                 img_data['relevance_score'] += len(img_data['nearby_headings'])
             
@@ -226,20 +292,23 @@ class ContentExtractor:
             
             # 4. Find surrounding context (nearby text elements)
             context_elements = []
+            parent = img.parent
+            neighbourhood = neighbourhoods.get(id(parent))
+            if neighbourhood is None:
+                neighbourhood = neighbourhoods[id(parent)] = _SiblingContext(parent)
             
             # 4.1. Look for previous siblings that might provide context
-            prev_elements = self._get_previous_content_elements(img, max_elements=2)
-            context_elements.extend(prev_elements)
+            context_elements.extend(neighbourhood.previous(img, max_elements=2))
             
             # 4.2. Look for parent's text if it's relevant
-            parent_context = self._extract_parent_context(img)
-            if parent_context:
-                context_elements.append(parent_context)
-                img_data['relevance_score'] += 2  # Direct parent context is valuable
+            if parent.name not in ['a', 'body', 'html']:
+                parent_context = neighbourhood.parent_text()
+                if parent_context:
+                    context_elements.append(parent_context)
+                    img_data['relevance_score'] += 2  # Direct parent context is valuable
             
             # 4.3. Look for next siblings that might provide context
-            next_elements = self._get_next_content_elements(img, max_elements=2)
-            context_elements.extend(next_elements)
+            context_elements.extend(neighbourhood.next(img, max_elements=2))
             
             # 5. If no context was found but we have alt text, that becomes the primary context
             if not context_elements and img_data['alt']:
@@ -287,33 +356,32 @@ class ContentExtractor:
             parent = parent.parent
         return None
         
-    def _find_nearby_headings(self, img, soup):
-        """Find headings that might be related to the image"""
-        headings = []
-        
-        # Look for headings that precede the image (up to 2)
-        current = img
-        distance = 0
+    def _collect_images(self, soup):
+        """
+        Walk the document once, returning its images in document order and,
+        for each, up to two headings among the three elements preceding it
+        """
+        images = []
+        headings_before: List[List[Dict[str, Any]]] = []
         max_heading_distance = 3  # Max number of elements to look back
+        recent = deque(maxlen=max_heading_distance)
         
-        while current and distance < max_heading_distance:
-            current = current.previous_element
-            if current and current.name and current.name.startswith('h') and len(current.name) == 2:
-                # It's a heading element (h1-h6)
-                try:
-                    level = int(current.name[1])
-                    if 1 <= level <= 6:  # Valid heading level
+        for element in soup.descendants:
+            if element.name == 'img':
+                headings = []
+                for previous in reversed(recent):
+                    if previous.name in _HEADING_TAGS:
                         headings.append({
-                            'level': level, 
-                            'text': current.get_text().strip()
+                            'level': int(previous.name[1]),
+                            'text': previous.get_text().strip()
                         })
                         if len(headings) >= 2:  # Maximum 2 previous headings
                             break
-                except ValueError:
-                    pass  # Not a valid heading level
-            distance += 1
-            
-        return headings
+                images.append(element)
+                headings_before.append(headings)
+            recent.append(element)
+        
+        return images, headings_before
         
     def _extract_related_links(self, img):
         """Extract links related to the image"""
@@ -350,51 +418,6 @@ class ContentExtractor:
             
         return related_links
         
-    def _get_previous_content_elements(self, element, max_elements=2):
-        """Get meaningful text from previous elements"""
-        content_elements = []
-        prev_element = element.previous_sibling
-        
-        while prev_element and len(content_elements) < max_elements:
-            if prev_element.name in ['p', 'div', 'span', 'section', 'article']:
-                text = prev_element.get_text().strip()
-                if text:
-                    content_elements.insert(0, text)  # Insert at beginning to maintain order
-            prev_element = prev_element.previous_sibling
-            
-        return content_elements
-        
-    def _get_next_content_elements(self, element, max_elements=2):
-        """Get meaningful text from next elements"""
-        content_elements = []
-        next_element = element.next_sibling
-        
-        while next_element and len(content_elements) < max_elements:
-            if next_element.name in ['p', 'div', 'span', 'section', 'article']:
-                text = next_element.get_text().strip()
-                if text:
-                    content_elements.append(text)
-            next_element = next_element.next_sibling
-            
-        return content_elements
-        
-    def _extract_parent_context(self, img):
-        """Extract context from the parent element if relevant"""
-        if not img.parent or img.parent.name in ['a', 'body', 'html']:
-            return None
-            
-        # Get all text from parent except the image itself
-        parent_elements = [elem for elem in img.parent.contents if elem != img]
-        parent_text = ''.join(str(elem) for elem in parent_elements)
-        
-        # Clean the text using BeautifulSoup
-        if parent_text.strip():
-            soup_parent = BeautifulSoup(parent_text, 'html.parser')
-            clean_parent_text = soup_parent.get_text().strip()
-            return clean_parent_text
-            
-        return None
-    
     def _determine_page_type(self, url):
         """Determine page type based on URL pattern matching"""
         parsed_url = urlparse(url)
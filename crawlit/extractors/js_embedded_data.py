@@ -16,6 +16,11 @@ to embed server-side state in HTML responses:
 Extracted payloads are stored under ``artifact.extracted["js_embedded_data"]``
 as a dict keyed by pattern / element-id name.
 
+Script blocks are located with compiled string searches rather than a DOM
+parse, and assignment values are decoded in place with
+``json.JSONDecoder.raw_decode`` so large inline state never goes through a
+backtracking regex.  Scans are bounded by per-page size and time budgets.
+
 Usage
 -----
     from crawlit.extractors.js_embedded_data import JSEmbeddedDataExtractor
@@ -25,17 +30,18 @@ Usage
 import json
 import logging
 import re
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 from ..interfaces import Extractor
 from ..models.page_artifact import PageArtifact
 
 try:
-    from bs4 import BeautifulSoup
+    import orjson
 
-    _BS4_AVAILABLE = True
+    _ORJSON_AVAILABLE = True
 except ImportError:
-    _BS4_AVAILABLE = False
+    _ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -43,55 +49,38 @@ logger = logging.getLogger(__name__)
 # Pattern registry
 # ---------------------------------------------------------------------------
 
-# (name, compiled regex) – patterns applied to each <script> block text
-_WINDOW_PATTERNS: List[tuple] = [
-    (
-        "__NEXT_DATA__",
-        re.compile(
-            r"window\.__NEXT_DATA__\s*=\s*(\{.+?\})\s*;?\s*$",
-            re.DOTALL | re.MULTILINE,
-        ),
-    ),
-    (
-        "__APOLLO_STATE__",
-        re.compile(
-            r"window\.__APOLLO_STATE__\s*=\s*(\{.+?\})\s*;?\s*$",
-            re.DOTALL | re.MULTILINE,
-        ),
-    ),
-    (
-        "__REDUX_STATE__",
-        re.compile(
-            r"window\.__REDUX_STATE__\s*=\s*(\{.+?\})\s*;?\s*$",
-            re.DOTALL | re.MULTILINE,
-        ),
-    ),
-    (
-        "__INITIAL_STATE__",
-        re.compile(
-            r"window\.__INITIAL_STATE__\s*=\s*(\{.+?\})\s*;?\s*$",
-            re.DOTALL | re.MULTILINE,
-        ),
-    ),
-    (
-        "__DATA__",
-        re.compile(
-            r"window\.__DATA__\s*=\s*(\{.+?\})\s*;?\s*$",
-            re.DOTALL | re.MULTILINE,
-        ),
-    ),
-    (
-        "__NUXT__",
-        re.compile(
-            r"__NUXT__\s*=\s*(\{.+?\})\s*;?\s*$",
-            re.DOTALL | re.MULTILINE,
-        ),
-    ),
-]
+# Framework globals assigned as ``window.<name> = {...}``
+_WINDOW_NAMES = (
+    "__NEXT_DATA__",
+    "__APOLLO_STATE__",
+    "__REDUX_STATE__",
+    "__INITIAL_STATE__",
+    "__DATA__",
+)
+
+# Globals that may be assigned with any (or no) owner prefix
+_BARE_NAMES = ("__NUXT__",)
+
+# One alternation for every known assignment; the value itself is decoded by
+# ``json.JSONDecoder.raw_decode`` so no regex ever spans the payload.
+_ASSIGNMENT_RE = re.compile(
+    r"(?:window\.(?P<window>%s)|(?P<bare>%s))\s*=\s*(?=\{)"
+    % ("|".join(map(re.escape, _WINDOW_NAMES)), "|".join(map(re.escape, _BARE_NAMES)))
+)
+
+# Opening <script> tags and HTML comments (scripts inside comments are inert)
+_SCRIPT_OR_COMMENT_RE = re.compile(r"<!--|<script\b([^>]*)>", re.IGNORECASE)
+_SCRIPT_END_RE = re.compile(r"</script\s*>", re.IGNORECASE)
+_ATTR_RE = re.compile(
+    r"""([^\s"'=<>/]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+)))?"""
+)
+
+_JSON_DECODER = json.JSONDecoder()
 
 # Guard against pathological inputs
 _MAX_HTML_CHARS = 2_000_000   # 2 MB – truncate before parsing
-_MAX_SCRIPT_CHARS = 500_000   # per script block
+_MAX_SCRIPT_CHARS = 500_000   # per script block; larger blocks are skipped
+_MAX_TIME_MS = 250.0          # per-page time budget
 
 
 # ---------------------------------------------------------------------------
@@ -102,12 +91,82 @@ _MAX_SCRIPT_CHARS = 500_000   # per script block
 def _try_parse_json(text: str) -> Optional[Any]:
     """Attempt to parse *text* as JSON; return ``None`` on failure."""
     try:
+        if _ORJSON_AVAILABLE:
+            return orjson.loads(text.strip())
         return json.loads(text.strip())
-    except (json.JSONDecodeError, ValueError):
+    except ValueError:
         return None
 
 
-def extract_js_embedded_data(html_content: str) -> Dict[str, Any]:
+def _parse_assignment_value(text: str, start: int) -> Optional[Any]:
+    """Decode the JSON object that begins at ``text[start]``.
+
+    ``raw_decode`` walks the brackets in C and stops at the end of the value,
+    so trailing JavaScript after the object is ignored.
+    """
+    try:
+        value, _end = _JSON_DECODER.raw_decode(text, start)
+    except ValueError:
+        return None
+    return value
+
+
+def _parse_attrs(attr_text: str) -> Dict[str, str]:
+    """Parse the attribute portion of an opening tag (lower-cased names)."""
+    attrs: Dict[str, str] = {}
+    for m in _ATTR_RE.finditer(attr_text):
+        name = m.group(1).lower()
+        if name in attrs:
+            continue
+        value = m.group(2)
+        if value is None:
+            value = m.group(3)
+        if value is None:
+            value = m.group(4) or ""
+        attrs[name] = value
+    return attrs
+
+
+def _iter_scripts(html: str) -> Iterator[Tuple[Dict[str, str], int, int]]:
+    """Yield ``(attrs, body_start, body_end)`` for each ``<script>`` element.
+
+    Located with compiled searches over the raw string rather than a DOM
+    parse.  Unterminated scripts and scripts inside comments are skipped.
+    """
+    pos = 0
+    while True:
+        m = _SCRIPT_OR_COMMENT_RE.search(html, pos)
+        if m is None:
+            return
+        if m.group(0) == "<!--":
+            end = html.find("-->", m.end())
+            if end == -1:
+                return
+            pos = end + 3
+            continue
+        end_match = _SCRIPT_END_RE.search(html, m.end())
+        if end_match is None:
+            return
+        yield _parse_attrs(m.group(1)), m.end(), end_match.start()
+        pos = end_match.end()
+
+
+def _unique_key(results: Dict[str, Any], base_key: str) -> str:
+    """Avoid overwriting earlier blocks that share a key."""
+    final_key = base_key
+    suffix = 1
+    while final_key in results:
+        final_key = f"{base_key}_{suffix}"
+        suffix += 1
+    return final_key
+
+
+def extract_js_embedded_data(
+    html_content: str,
+    max_html_chars: int = _MAX_HTML_CHARS,
+    max_script_chars: int = _MAX_SCRIPT_CHARS,
+    max_time_ms: Optional[float] = _MAX_TIME_MS,
+) -> Dict[str, Any]:
     """
     Extract script-embedded JSON data from *html_content*.
 
@@ -115,6 +174,14 @@ def extract_js_embedded_data(html_content: str) -> Dict[str, Any]:
     ----------
     html_content : str
         Raw HTML of the page.
+    max_html_chars : int
+        Only the first *max_html_chars* characters of the page are scanned.
+    max_script_chars : int
+        Script blocks longer than this are skipped without being decoded.
+    max_time_ms : float, optional
+        Per-page time budget.  Once exceeded, the remaining script blocks are
+        left unscanned and whatever was found so far is returned.  ``None``
+        disables the budget.
 
     Returns
     -------
@@ -127,57 +194,47 @@ def extract_js_embedded_data(html_content: str) -> Dict[str, Any]:
     if not html_content:
         return results
 
-    truncated = html_content[:_MAX_HTML_CHARS]
-    script_texts: List[str] = []
-
-    if _BS4_AVAILABLE:
-        try:
-            soup = BeautifulSoup(truncated, "html.parser")
-            for tag in soup.find_all("script"):
-                stype = (tag.get("type") or "").lower()
-                text = tag.string or ""
-                if not text:
-                    continue
-
-                # Inline JSON blocks (<script type="application/json"> etc.)
-                if "application/json" in stype or "application/ld+json" in stype:
-                    parsed = _try_parse_json(text)
-                    if parsed is not None:
-                        # Use id/class as key when available
-                        key = tag.get("id") or tag.get("class") or "json_block"
-                        if isinstance(key, list):
-                            key = "_".join(str(k) for k in key)
-                        # Avoid overwriting earlier blocks with same key
-                        base_key = str(key)
-                        final_key = base_key
-                        suffix = 1
-                        while final_key in results:
-                            final_key = f"{base_key}_{suffix}"
-                            suffix += 1
-                        results[final_key] = parsed
-                else:
-                    script_texts.append(text[:_MAX_SCRIPT_CHARS])
-        except Exception as exc:
-            logger.debug(f"BeautifulSoup error in js_embedded_data: {exc}")
-    else:
-        # Fallback: crude regex to pull script block bodies
-        for m in re.finditer(
-            r"<script[^>]*>(.*?)</script>",
-            truncated,
-            re.DOTALL | re.IGNORECASE,
-        ):
-            script_texts.append(m.group(1)[:_MAX_SCRIPT_CHARS])
-
-    # Apply window-variable patterns to each script block
-    for script_text in script_texts:
-        for name, pattern in _WINDOW_PATTERNS:
-            if name in results:
+    truncated = html_content[:max_html_chars]
+    deadline = (
+        time.perf_counter() + max_time_ms / 1000.0 if max_time_ms is not None else None
+    )
+    # Window assignments never displace an id/class-keyed JSON block, so they
+    # are merged in after the scan.
+    assignments: Dict[str, Any] = {}
+
+    for attrs, start, end in _iter_scripts(truncated):
+        if deadline is not None and time.perf_counter() >= deadline:
+            logger.debug("js_embedded_data time budget exhausted; stopping scan")
+            break
+        if end - start > max_script_chars:
+            logger.debug(f"Skipping {end - start}-char script block (limit {max_script_chars})")
+            continue
+
+        text = truncated[start:end]
+        if not text:
+            continue
+
+        # Inline JSON blocks (<script type="application/json"> etc.)
+        stype = attrs.get("type", "").lower()
+        if "application/json" in stype or "application/ld+json" in stype:
+            parsed = _try_parse_json(text)
+            if parsed is not None:
+                # Use id/class as key when available
+                key = attrs.get("id") or "_".join(attrs.get("class", "").split()) or "json_block"
+                results[_unique_key(results, key)] = parsed
+            continue
+
+        # Window-variable assignments
+        for m in _ASSIGNMENT_RE.finditer(text):
+            name = m.group("window") or m.group("bare")
+            if name in assignments:
                 continue
-            m = pattern.search(script_text)
-            if m:
-                parsed = _try_parse_json(m.group(1))
-                if parsed is not None:
-                    results[name] = parsed
+            parsed = _parse_assignment_value(text, m.end())
+            if parsed is not None:
+                assignments[name] = parsed
+
+    for name, parsed in assignments.items():
+        results.setdefault(name, parsed)
 
     return results
 
@@ -197,15 +254,32 @@ class JSEmbeddedDataExtractor(Extractor):
         crawler = Crawler("https://nextjs-app.example.com", extractors=[extractor])
 
     Results are stored under ``artifact.extracted["js_embedded_data"]``.
+    The size and time budgets are passed through to
+    :func:`extract_js_embedded_data`.
     """
 
+    def __init__(
+        self,
+        max_html_chars: int = _MAX_HTML_CHARS,
+        max_script_chars: int = _MAX_SCRIPT_CHARS,
+        max_time_ms: Optional[float] = _MAX_TIME_MS,
+    ):
+        self.max_html_chars = max_html_chars
+        self.max_script_chars = max_script_chars
+        self.max_time_ms = max_time_ms
+
     @property
     def name(self) -> str:
         return "js_embedded_data"
 
     def extract(self, html_content: str, artifact: PageArtifact) -> Dict[str, Any]:
         try:
-            return extract_js_embedded_data(html_content)
+            return extract_js_embedded_data(
+                html_content,
+                max_html_chars=self.max_html_chars,
+                max_script_chars=self.max_script_chars,
+                max_time_ms=self.max_time_ms,
+            )
         except Exception as exc:
             logger.warning(f"JSEmbeddedDataExtractor failed for {artifact.url}: {exc}")
             artifact.errors.append(f"js_embedded_data extraction failed: {exc}")
@@ -3,17 +3,315 @@
 language.py - Advanced language detection
 
 Detects page language using multiple methods beyond just HTML lang attribute.
+Content is classified with a character-trigram model built once at import
+from the profiles in :mod:`crawlit.extractors._language_profiles`, scored on
+a bounded sample of the page text.  :func:`detect_languages` reads each page
+with a single :class:`html.parser.HTMLParser` pass instead of building a
+BeautifulSoup tree, and scores all the pages' samples together.
 """
 
+import math
 import re
 import logging
-from typing import Dict, List, Optional, Tuple
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 from collections import Counter
 from bs4 import BeautifulSoup
 
+from ._language_profiles import TRIGRAM_PROFILES
+
 logger = logging.getLogger(__name__)
 
+# Characters scanned per document by the trigram model
+DEFAULT_MAX_SAMPLE_CHARS = 2000
+
+
+class TrigramLanguageModel:
+    """
+    Character-trigram language classifier.
+
+    Each profile is a ranked list of trigrams; a trigram at rank ``r`` in a
+    profile of ``n`` entries carries weight ``log(n / (r + 1))``.  A text's
+    score for a language is the weighted sum of its trigram counts, computed
+    through a single inverted index so each trigram is looked up once no
+    matter how many languages are loaded.  :meth:`scores_batch` pools the
+    counts of many texts first, so a trigram shared by a whole batch is
+    looked up once for all of them.
+
+    Scripts used by a single supported language (kana, Han, Hangul, Thai) are
+    recognised directly before the trigram scoring runs.  Text whose
+    trigrams mostly miss even the best language's profile (an unprofiled
+    language such as Vietnamese, or gibberish) is left unclassified.
+    """
+
+    # (language, pattern) checked in order against the sample; the first
+    # script covering at least ``SCRIPT_THRESHOLD`` of the letters wins
+    SCRIPT_PATTERNS = (
+        ('ja', re.compile(r'[\u3040-\u30FF]')),  # Hiragana, Katakana
+        ('ko', re.compile(r'[\uAC00-\uD7AF\u1100-\u11FF]')),  # Hangul
+        ('zh', re.compile(r'[\u4E00-\u9FFF]')),  # CJK Unified Ideographs
+        ('th', re.compile(r'[\u0E00-\u0E7F]')),  # Thai
+    )
+    SCRIPT_THRESHOLD = 0.1
+
+    # Shortest normalised sample worth scoring
+    MIN_SAMPLE_CHARS = 20
+
+    # Share of a long sample's trigrams that must appear in the winning
+    # profile.  Profiled languages cover 0.5-0.75 of their own text;
+    # Vietnamese and keyboard gibberish stay around 0.1 against any profile.
+    MIN_COVERAGE = 0.4
+    # A sample of n trigrams may fall COVERAGE_SPREAD / sqrt(n) short of
+    # MIN_COVERAGE (one standard error at 50% coverage), since a single
+    # sentence of a profiled language scatters more around its usual
+    # coverage than a page does
+    COVERAGE_SPREAD = 0.5
+
+    _NON_LETTER_RE = re.compile(r'[\W\d_]+')
+
+    def __init__(self, profiles: Dict[str, str], max_sample_chars: int = DEFAULT_MAX_SAMPLE_CHARS):
+        """
+        Build the model.
+
+        Args:
+            profiles: Mapping of language code to its ranked trigrams,
+                concatenated into one string (three characters per trigram)
+            max_sample_chars: Maximum number of characters scored per text
+        """
+        self.max_sample_chars = max_sample_chars
+        self.languages: List[str] = sorted(profiles)
+        index: Dict[str, List[Tuple[int, float]]] = {}
+        for lang_idx, lang in enumerate(self.languages):
+            ranked = profiles[lang]
+            size = len(ranked) // 3
+            for rank in range(size):
+                trigram = ranked[rank * 3:rank * 3 + 3]
+                index.setdefault(trigram, []).append((lang_idx, math.log(size / (rank + 1))))
+        self._index: Dict[str, Tuple[Tuple[int, float], ...]] = {
+            trigram: tuple(entries) for trigram, entries in index.items()
+        }
+
+    def sample(self, text: str) -> str:
+        """Return the normalised, length-bounded sample that gets scored."""
+        # Normalising can only shrink runs of non-letters, so a raw slice a
+        # few times the budget always yields enough characters.
+        raw = text[:self.max_sample_chars * 4]
+        normalised = self._NON_LETTER_RE.sub(' ', raw.lower()).strip()
+        return normalised[:self.max_sample_chars]
+
+    def min_coverage(self, trigrams: int) -> float:
+        """Share of a sample's *trigrams* the winning profile must cover."""
+        return self.MIN_COVERAGE - self.COVERAGE_SPREAD / math.sqrt(trigrams)
+
+    def scores(self, text: str) -> List[Tuple[str, float]]:
+        """
+        Score *text* against every language.
+
+        Returns:
+            ``(language, share)`` pairs sorted best first, where the shares
+            sum to 1.0; empty if the sample is too short to judge or the
+            best language covers less than :meth:`min_coverage` of its
+            trigrams
+        """
+        return self.scores_batch([text])[0]
+
+    def scores_batch(self, texts: Iterable[str]) -> List[List[Tuple[str, float]]]:
+        """
+        Score many texts in one pass; results keep input order.
+
+        The trigram counts of every sample are pooled first, then each
+        distinct trigram is looked up once and its weights added to every
+        sample that contains it.
+        """
+        results: List[List[Tuple[str, float]]] = []
+        sizes: List[int] = []
+        # trigram -> [(row, count), ...] over every sample in the batch
+        pooled: Dict[str, List[Tuple[int, int]]] = {}
+        for text in texts:
+            row = len(results)
+            results.append([])
+            sizes.append(0)
+            sample = self.sample(text)
+            if len(sample) < self.MIN_SAMPLE_CHARS:
+                continue
+            script_lang = self._script_language(sample)
+            if script_lang is not None:
+                results[row] = [(script_lang, 1.0)]
+                continue
+            padded = f' {sample} '
+            sizes[row] = len(padded) - 2
+            for trigram, count in Counter(padded[i:i + 3] for i in range(sizes[row])).items():
+                pooled.setdefault(trigram, []).append((row, count))
+
+        width = len(self.languages)
+        totals = [[0.0] * width if size else None for size in sizes]
+        hits = [[0] * width if size else None for size in sizes]
+        index = self._index
+        for trigram, occurrences in pooled.items():
+            entries = index.get(trigram)
+            if not entries:
+                continue
+            for row, count in occurrences:
+                row_totals = totals[row]
+                row_hits = hits[row]
+                for lang_idx, weight in entries:
+                    row_totals[lang_idx] += weight * count
+                    row_hits[lang_idx] += count
+
+        for row, size in enumerate(sizes):
+            if size:
+                results[row] = self._rank(totals[row], hits[row], size)
+        return results
+
+    def _script_language(self, sample: str) -> Optional[str]:
+        """Return the language whose script dominates *sample*, if any."""
+        letters = len(sample) - sample.count(' ')
+        for lang, pattern in self.SCRIPT_PATTERNS:
+            if letters and len(pattern.findall(sample)) / letters >= self.SCRIPT_THRESHOLD:
+                return lang
+        return None
+
+    def _rank(self, totals: List[float], hits: List[int], trigrams: int) -> List[Tuple[str, float]]:
+        """Turn one sample's per-language totals into ranked shares."""
+        grand_total = sum(totals)
+        if grand_total <= 0:
+            return []
+        best_idx = max(range(len(totals)), key=totals.__getitem__)
+        if hits[best_idx] < self.min_coverage(trigrams) * trigrams:
+            return []
+        ranked = sorted(zip(self.languages, totals), key=lambda x: x[1], reverse=True)
+        return [(lang, total / grand_total) for lang, total in ranked if total > 0]
+
+    def classify(self, text: str) -> Optional[Tuple[str, float]]:
+        """
+        Classify *text*.
+
+        Returns:
+            ``(language, confidence)`` or ``None`` if the text is too short
+            or matches no profiled language.
+            Confidence is the winner's lead over the runner-up relative to
+            the winner's score, so 1.0 means no other language matched.
+        """
+        return self._verdict(self.scores(text))
+
+    def classify_batch(self, texts: Iterable[str]) -> List[Optional[Tuple[str, float]]]:
+        """Classify many texts in one :meth:`scores_batch` pass; results keep input order."""
+        return [self._verdict(ranked) for ranked in self.scores_batch(texts)]
+
+    @staticmethod
+    def _verdict(ranked: List[Tuple[str, float]]) -> Optional[Tuple[str, float]]:
+        """Reduce ranked shares to ``(language, confidence)``."""
+        if not ranked:
+            return None
+        best_lang, best = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        return best_lang, (best - runner_up) / best
+
+
+# Built once per process; every detector shares it
+_DEFAULT_MODEL = TrigramLanguageModel(TRIGRAM_PROFILES)
+
+
+def get_language_model() -> TrigramLanguageModel:
+    """Return the shared trigram model loaded at import."""
+    return _DEFAULT_MODEL
+
+
+class _PageText(HTMLParser):
+    """
+    Single-pass reader for what language detection needs from a page.
+
+    Collects the ``<html lang>`` value, the title, the visible text and,
+    in :attr:`meta`, the ``content`` of the first Content-Language,
+    ``name="language"`` and ``name="description"`` meta tags (``None`` if
+    that tag has no ``content``), without building a tree.
+    """
+
+    _HIDDEN_TAGS = frozenset(('script', 'style', 'noscript'))
+    _CONTENT_LANGUAGE_RE = re.compile(r'content-language', re.I)
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.html_lang: Optional[str] = None
+        self.meta: Dict[str, Optional[str]] = {}
+        self.title: Optional[str] = None
+        self._chunks: List[str] = []
+        self._title_chunks: Optional[List[str]] = None
+        self._hidden = 0
+        self._seen_html = False
+
+    @classmethod
+    def read(cls, html_content: str) -> "_PageText":
+        page = cls()
+        page.feed(html_content)
+        page.close()
+        return page
+
+    @property
+    def text(self) -> str:
+        return ''.join(self._chunks)
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag in self._HIDDEN_TAGS:
+            self._hidden += 1
+        elif tag == 'html':
+            if not self._seen_html:
+                self._seen_html = True
+                self.html_lang = self._attr(attrs, 'lang')
+        elif tag == 'meta':
+            self._read_meta(attrs)
+        elif tag == 'title' and self.title is None and self._title_chunks is None:
+            self._title_chunks = []
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == 'meta':
+            self._read_meta(attrs)
+        elif tag == 'html' and not self._seen_html:
+            self._seen_html = True
+            self.html_lang = self._attr(attrs, 'lang')
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self._HIDDEN_TAGS:
+            if self._hidden:
+                self._hidden -= 1
+        elif tag == 'title' and self._title_chunks is not None:
+            self.title = ''.join(self._title_chunks).strip()
+            self._title_chunks = None
+
+    def handle_data(self, data: str) -> None:
+        if self._hidden:
+            return
+        self._chunks.append(data)
+        if self._title_chunks is not None:
+            self._title_chunks.append(data)
+
+    def close(self) -> None:
+        super().close()
+        if self._title_chunks is not None:
+            self.title = ''.join(self._title_chunks).strip()
+            self._title_chunks = None
+
+    def _read_meta(self, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        content = self._attr(attrs, 'content')
+        http_equiv = self._attr(attrs, 'http-equiv')
+        if http_equiv is not None and self._CONTENT_LANGUAGE_RE.search(http_equiv):
+            self.meta.setdefault('content-language', content)
+        name = self._attr(attrs, 'name')
+        if name in ('language', 'description'):
+            self.meta.setdefault(name, content)
+
+    @staticmethod
+    def _attr(attrs: List[Tuple[str, Optional[str]]], name: str) -> Optional[str]:
+        for key, value in attrs:
+            if key == name:
+                return value or ''
+        return None
+
+
+# Marks a detector whose content has not been scored yet
+_NOT_SCORED: Any = object()
+
 
 @dataclass
 class LanguageDetection:
@@ -34,10 +332,9 @@ class LanguageDetector:
     Detection methods:
     1. HTML lang attribute
     2. Meta tags (Content-Language, http-equiv)
-    3. Text content analysis (character frequency)
-    4. Common words detection
-    5. URL patterns
-    6. Title and meta description
+    3. Text content analysis (character-trigram model)
+    4. URL patterns
+    5. Title and meta description
     """
     
     # Common words in different languages (top 20 most frequent words)
@@ -86,18 +383,34 @@ class LanguageDetector:
         'ru': re.compile(r'[\u0400-\u04FF]'),  # Cyrillic
     }
     
-    def __init__(self, html_content: str, url: str = ""):
+    def __init__(self, html_content: str, url: str = "",
+                 model: Optional[TrigramLanguageModel] = None):
         """
         Initialize language detector.
         
         Args:
             html_content: HTML content to analyze
             url: URL of the page (for URL-based detection)
+            model: Trigram model for content analysis (defaults to the
+                shared model loaded at import)
         """
         self.html_content = html_content
         self.url = url
-        self.soup = BeautifulSoup(html_content, 'html.parser')
+        self.model = model or _DEFAULT_MODEL
         self.detection_methods: Dict[str, str] = {}
+        self._page = _PageText.read(html_content)
+        self._soup: Optional[BeautifulSoup] = None
+        self._visible_text: Optional[str] = None
+        # (language, confidence) from the trigram model, filled in ahead of
+        # detect() by detect_languages()
+        self._content_result: Optional[Tuple[str, float]] = _NOT_SCORED
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        """BeautifulSoup tree of the page, parsed on first access (detection does not need it)."""
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html_content, 'html.parser')
+        return self._soup
     
     def detect(self) -> LanguageDetection:
         """
@@ -121,18 +434,12 @@ class LanguageDetector:
         if url_lang:
             self.detection_methods['url'] = url_lang
         
-        # Method 4: Content analysis (character patterns)
-        char_lang = self._detect_from_character_patterns()
-        if char_lang:
-            self.detection_methods['characters'] = char_lang
+        # Method 4: Content analysis (character trigrams)
+        content_lang = self._detect_from_ngrams()
+        if content_lang:
+            self.detection_methods['ngrams'] = content_lang
         
-        # Method 5: Common words
-        word_langs = self._detect_from_common_words()
-        if word_langs:
-            top_word_lang = word_langs[0][0]
-            self.detection_methods['common_words'] = top_word_lang
-        
-        # Method 6: Title and meta description
+        # Method 5: Title and meta description
         meta_content_lang = self._detect_from_title_meta()
         if meta_content_lang:
             self.detection_methods['title_meta'] = meta_content_lang
@@ -147,7 +454,7 @@ class LanguageDetector:
             detection_methods=self.detection_methods,
             html_lang=html_lang,
             meta_lang=meta_lang,
-            content_lang=char_lang or (word_langs[0][0] if word_langs else None)
+            content_lang=content_lang
         )
         
         logger.info(f"Detected language: {primary_lang} (confidence: {confidence:.2f})")
@@ -156,9 +463,8 @@ class LanguageDetector:
     
     def _detect_from_html_lang(self) -> Optional[str]:
         """Detect from HTML lang attribute"""
-        html_tag = self.soup.find('html')
-        if html_tag and html_tag.has_attr('lang'):
-            lang = html_tag['lang'].lower()
+        if self._page.html_lang is not None:
+            lang = self._page.html_lang.lower()
             # Extract primary language code (e.g., 'en' from 'en-US')
             lang_code = lang.split('-')[0][:2]
             logger.debug(f"HTML lang attribute: {lang_code}")
@@ -168,17 +474,17 @@ class LanguageDetector:
     def _detect_from_meta_tags(self) -> Optional[str]:
         """Detect from meta tags"""
         # Check Content-Language meta tag
-        meta_lang = self.soup.find('meta', attrs={'http-equiv': re.compile(r'content-language', re.I)})
-        if meta_lang and meta_lang.has_attr('content'):
-            lang = meta_lang['content'].lower()
+        content = self._page.meta.get('content-language')
+        if content is not None:
+            lang = content.lower()
             lang_code = lang.split('-')[0].split(',')[0].strip()[:2]
             logger.debug(f"Meta Content-Language: {lang_code}")
             return lang_code
         
         # Check name="language" meta tag
-        meta_lang = self.soup.find('meta', attrs={'name': 'language'})
-        if meta_lang and meta_lang.has_attr('content'):
-            lang = meta_lang['content'].lower()
+        content = self._page.meta.get('language')
+        if content is not None:
+            lang = content.lower()
             lang_code = lang.split('-')[0][:2]
             logger.debug(f"Meta language: {lang_code}")
             return lang_code
@@ -211,66 +517,22 @@ class LanguageDetector:
         
         return None
     
-    def _detect_from_character_patterns(self) -> Optional[str]:
-        """Detect from character frequency patterns"""
-        # Get visible text
-        text = self._get_visible_text()
-        
-        if not text or len(text) < 50:
+    def _detect_from_ngrams(self) -> Optional[str]:
+        """Detect from a bounded sample of the visible text"""
+        result = self._content_result
+        if result is _NOT_SCORED:
+            result = self.model.classify(self._get_visible_text())
+        if result is None:
             return None
-        
-        # Check for language-specific characters
-        for lang, pattern in self.CHAR_PATTERNS.items():
-            matches = pattern.findall(text)
-            if matches:
-                ratio = len(matches) / len(text)
-                if ratio > 0.05:  # At least 5% of characters are language-specific
-                    logger.debug(f"Character pattern detected: {lang} (ratio: {ratio:.2%})")
-                    return lang
-        
-        return None
-    
-    def _detect_from_common_words(self) -> List[Tuple[str, float]]:
-        """Detect from common words frequency"""
-        text = self._get_visible_text().lower()
-        
-        if not text or len(text) < 100:
-            return []
-        
-        # Split into words
-        words = re.findall(r'\b\w+\b', text)
-        if len(words) < 20:
-            return []
-        
-        # Count matches for each language
-        lang_scores = {}
-        
-        for lang, common_words in self.COMMON_WORDS.items():
-            matches = sum(1 for word in words if word in common_words)
-            score = matches / len(words)
-            if score > 0.01:  # At least 1% match
-                lang_scores[lang] = score
-        
-        # Sort by score
-        sorted_langs = sorted(lang_scores.items(), key=lambda x: x[1], reverse=True)
-        
-        if sorted_langs:
-            logger.debug(f"Common words detected: {sorted_langs[0][0]} (score: {sorted_langs[0][1]:.2%})")
-        
-        return sorted_langs
+        lang, confidence = result
+        logger.debug(f"Trigram model detected: {lang} (confidence: {confidence:.2f})")
+        return lang
     
     def _detect_from_title_meta(self) -> Optional[str]:
         """Detect from title and meta description"""
         # Get title and meta description
-        title = ''
-        title_tag = self.soup.find('title')
-        if title_tag:
-            title = title_tag.get_text(strip=True)
-        
-        meta_desc = ''
-        meta_tag = self.soup.find('meta', attrs={'name': 'description'})
-        if meta_tag and meta_tag.has_attr('content'):
-            meta_desc = meta_tag['content']
+        title = self._page.title or ''
+        meta_desc = self._page.meta.get('description') or ''
         
         combined_text = (title + ' ' + meta_desc).lower()
         
@@ -304,17 +566,18 @@ class LanguageDetector:
     
     def _get_visible_text(self) -> str:
         """Extract visible text from HTML"""
-        # Remove script and style elements
-        for script in self.soup(['script', 'style', 'meta', 'noscript']):
-            script.decompose()
+        if self._visible_text is not None:
+            return self._visible_text
         
-        text = self.soup.get_text()
+        # Script, style and noscript contents are already left out
+        text = self._page.text
         
         # Clean up whitespace
         lines = (line.strip() for line in text.splitlines())
         chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
         text = ' '.join(chunk for chunk in chunks if chunk)
         
+        self._visible_text = text
         return text
     
     def _combine_detections(self) -> Tuple[str, float, List[Tuple[str, float]]]:
@@ -332,8 +595,7 @@ class LanguageDetector:
             'html_lang': 3.0,      # High weight - explicit declaration
             'meta_tags': 2.5,      # High weight - explicit declaration
             'url': 2.0,            # Medium-high weight - explicit in URL
-            'characters': 2.5,     # High weight - strong indicator
-            'common_words': 2.0,   # Medium-high weight - content-based
+            'ngrams': 3.0,         # High weight - content-based model
             'title_meta': 1.5      # Medium weight - important content
         }
         
@@ -419,5 +681,33 @@ def detect_language(html_content: str, url: str = "") -> LanguageDetection:
     return detector.detect()
 
 
-
-
+def detect_languages(
+    html_documents: Sequence[str],
+    urls: Optional[Sequence[str]] = None,
+) -> List[LanguageDetection]:
+    """
+    Detect the language of many pages at once.
+    
+    Each page is read in one :class:`html.parser.HTMLParser` pass (no
+    BeautifulSoup tree), and the text samples of all pages are scored
+    together with :meth:`TrigramLanguageModel.classify_batch`.
+    
+    Args:
+        html_documents: HTML content of each page
+        urls: URLs of the pages, aligned with *html_documents*
+        
+    Returns:
+        LanguageDetection objects in input order
+    """
+    if urls is None:
+        urls = [""] * len(html_documents)
+    elif len(urls) != len(html_documents):
+        raise ValueError("urls must be the same length as html_documents")
+    detectors = [
+        LanguageDetector(html, url, model=_DEFAULT_MODEL)
+        for html, url in zip(html_documents, urls)
+    ]
+    verdicts = _DEFAULT_MODEL.classify_batch(d._get_visible_text() for d in detectors)
+    for detector, verdict in zip(detectors, verdicts):
+        detector._content_result = verdict
+    return [detector.detect() for detector in detectors]
@@ -13,12 +13,64 @@ Extracts structured data from web pages including:
 import json
 import logging
 import re
+from html.parser import HTMLParser
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from bs4 import BeautifulSoup
 
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# JSON-LD blocks larger than this (in characters) are skipped
+DEFAULT_MAX_JSON_LD_SIZE = 1_000_000
+
+# Elements that never have children (mirrors BeautifulSoup's html.parser builder)
+_VOID_ELEMENTS = frozenset({
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen',
+    'link', 'menuitem', 'meta', 'param', 'source', 'track', 'wbr',
+    'basefont', 'bgsound', 'command', 'frame', 'image', 'isindex',
+    'nextid', 'spacer',
+})
+
+# Elements whose text is excluded from get_text()
+_NON_TEXT_ELEMENTS = frozenset({'script', 'style', 'template'})
+
+
+def _json_loads(text: str) -> Any:
+    """Decode JSON, using orjson when it is installed."""
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _add_json_ld(json_ld_data: List[Dict[str, Any]], data: Any) -> None:
+    """Append a decoded JSON-LD payload, flattening @graph and top-level arrays."""
+    # Handle @graph arrays (multiple items in one script)
+    if isinstance(data, dict) and '@graph' in data:
+        json_ld_data.extend(data['@graph'])
+    # Handle arrays of JSON-LD objects
+    elif isinstance(data, list):
+        json_ld_data.extend(data)
+    # Single JSON-LD object
+    else:
+        json_ld_data.append(data)
+
+
+def _add_property(item_data: Dict[str, Any], name: str, value: Any) -> None:
+    """Set *name* on an item, collecting repeated properties into a list."""
+    if name in item_data:
+        if not isinstance(item_data[name], list):
+            item_data[name] = [item_data[name]]
+        item_data[name].append(value)
+    else:
+        item_data[name] = value
+
 
 @dataclass
 class StructuredData:
@@ -31,6 +83,288 @@ class StructuredData:
     meta_tags: Dict[str, str] = field(default_factory=dict)
 
 
+class _Item:
+    """An open Microdata or RDFa item collected while streaming."""
+
+    __slots__ = ('head', 'props')
+
+    def __init__(self, head: Dict[str, Any]):
+        self.head = head
+        # [name, value] pairs in document order; text values are filled in
+        # when the property element closes
+        self.props: List[List[Any]] = []
+
+    def build(self) -> Dict[str, Any]:
+        item_data = dict(self.head)
+        for name, value in self.props:
+            _add_property(item_data, name, value)
+        return item_data
+
+
+class _Frame:
+    """Per-element state kept on the parser's open-element stack."""
+
+    __slots__ = ('tag', 'text', 'micro_item', 'micro_slot', 'rdfa_item',
+                 'rdfa_slot', 'has_vocab')
+
+    def __init__(self, tag: str):
+        self.tag = tag
+        self.text: Optional[List[str]] = None
+        self.micro_item: Optional[_Item] = None
+        self.micro_slot: Optional[List[Any]] = None
+        self.rdfa_item: Optional[_Item] = None
+        self.rdfa_slot: Optional[List[Any]] = None
+        self.has_vocab = False
+
+
+class _StructuredDataParser(HTMLParser):
+    """
+    Streaming collector for every structured-data format.
+
+    Runs directly on ``html.parser`` events, so no tree is built.  JSON-LD
+    script bodies, Open Graph / Twitter / standard meta tags, Microdata and
+    RDFa items are all gathered in one pass.  Element nesting follows the
+    same rules as BeautifulSoup's ``html.parser`` builder (void elements
+    never open, an end tag closes everything up to its matching start tag),
+    so results match the tree-based ``extract_*`` methods.
+    """
+
+    def __init__(self, max_json_ld_size: int = DEFAULT_MAX_JSON_LD_SIZE):
+        super().__init__(convert_charrefs=True)
+        self.max_json_ld_size = max_json_ld_size
+        self.data = StructuredData()
+
+        self._stack: List[_Frame] = []
+        self._micro_items: List[_Item] = []
+        self._rdfa_items: List[_Item] = []
+        self._vocabs: List[str] = []
+        # Open text collectors, innermost last
+        self._collectors: List[List[str]] = []
+        self._pending_text: List[str] = []
+        self._non_text_depth = 0
+
+        # Current <script type="application/ld+json"> body, if any
+        self._json_ld_chunks: Optional[List[str]] = None
+        self._json_ld_size = 0
+
+    # ------------------------------------------------------------------
+    # Text handling
+    # ------------------------------------------------------------------
+
+    def _flush_text(self) -> None:
+        if not self._pending_text:
+            return
+        text = ''.join(self._pending_text).strip()
+        self._pending_text = []
+        if text:
+            for collector in self._collectors:
+                collector.append(text)
+
+    def handle_data(self, data: str) -> None:
+        if self._json_ld_chunks is not None:
+            self._json_ld_size += len(data)
+            if self._json_ld_size <= self.max_json_ld_size:
+                self._json_ld_chunks.append(data)
+            return
+        if self._collectors and not self._non_text_depth:
+            self._pending_text.append(data)
+
+    def handle_comment(self, data: str) -> None:
+        self._flush_text()
+
+    # ------------------------------------------------------------------
+    # Element handling
+    # ------------------------------------------------------------------
+
+    def handle_starttag(self, tag: str, attrs: List[tuple]) -> None:
+        self._flush_text()
+        attr_map = {name: ('' if value is None else value) for name, value in attrs}
+
+        if tag == 'meta':
+            self._handle_meta(attr_map)
+        elif tag == 'script' and attr_map.get('type') == 'application/ld+json':
+            self._json_ld_chunks = []
+            self._json_ld_size = 0
+
+        frame = _Frame(tag)
+        self._open_microdata(frame, tag, attr_map)
+        self._open_rdfa(frame, tag, attr_map)
+
+        if tag in _VOID_ELEMENTS:
+            self._close_frame(frame)
+            return
+
+        if 'vocab' in attr_map:
+            self._vocabs.append(attr_map['vocab'])
+            frame.has_vocab = True
+        if frame.text is not None:
+            self._collectors.append(frame.text)
+        if tag in _NON_TEXT_ELEMENTS:
+            self._non_text_depth += 1
+        self._stack.append(frame)
+
+    def handle_startendtag(self, tag: str, attrs: List[tuple]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush_text()
+        if tag == 'script' and self._json_ld_chunks is not None:
+            self._finish_json_ld()
+
+        # Close everything up to the most recent matching start tag
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index].tag == tag:
+                self._pop_to(index)
+                return
+
+    def close(self) -> None:
+        super().close()
+        self._flush_text()
+        if self._json_ld_chunks is not None:
+            self._finish_json_ld()
+        # Unclosed elements are closed at end of document
+        self._pop_to(0)
+
+    def _pop_to(self, index: int) -> None:
+        while len(self._stack) > index:
+            frame = self._stack.pop()
+            if frame.text is not None:
+                self._collectors.pop()
+            if frame.has_vocab:
+                self._vocabs.pop()
+            if frame.tag in _NON_TEXT_ELEMENTS:
+                self._non_text_depth -= 1
+            self._close_frame(frame)
+
+    def _handle_meta(self, attr_map: Dict[str, str]) -> None:
+        content = attr_map.get('content', '')
+
+        property_name = attr_map.get('property')
+        if property_name is not None and property_name[:3].lower() == 'og:':
+            property_name = property_name.lower()
+            if content:
+                self.data.open_graph[property_name.replace('og:', '')] = content
+
+        name = attr_map.get('name')
+        if name is not None:
+            name = name.lower()
+            if name.startswith('twitter:'):
+                if content:
+                    self.data.twitter_cards[name.replace('twitter:', '')] = content
+            elif name and content and not name.startswith('og:'):
+                self.data.meta_tags[name] = content
+
+    def _finish_json_ld(self) -> None:
+        chunks = self._json_ld_chunks
+        size = self._json_ld_size
+        self._json_ld_chunks = None
+        if not chunks:
+            return
+        if size > self.max_json_ld_size:
+            logger.debug(
+                f"Skipping JSON-LD block of {size} chars "
+                f"(limit {self.max_json_ld_size})"
+            )
+            return
+        try:
+            _add_json_ld(self.data.json_ld, _json_loads(''.join(chunks)))
+        except ValueError as e:
+            logger.warning(f"Failed to parse JSON-LD: {e}")
+        except Exception as e:
+            logger.warning(f"Error extracting JSON-LD: {e}")
+
+    # ------------------------------------------------------------------
+    # Microdata / RDFa
+    # ------------------------------------------------------------------
+
+    def _open_microdata(self, frame: _Frame, tag: str, attr_map: Dict[str, str]) -> None:
+        owner = self._micro_items[-1] if self._micro_items else None
+        is_item = 'itemscope' in attr_map
+
+        if owner is not None and 'itemprop' in attr_map:
+            slot = [attr_map['itemprop'], None]
+            owner.props.append(slot)
+            if is_item:
+                pass  # filled with the nested item when it closes
+            elif tag == 'meta':
+                slot[1] = attr_map.get('content', '')
+            elif tag in ('link', 'a'):
+                slot[1] = attr_map.get('href', '')
+            elif tag in ('img', 'audio', 'video', 'source'):
+                slot[1] = attr_map.get('src', '')
+            elif tag == 'time' and 'datetime' in attr_map:
+                slot[1] = attr_map['datetime']
+            else:
+                frame.text = frame.text if frame.text is not None else []
+            frame.micro_slot = slot
+
+        if is_item:
+            head: Dict[str, Any] = {}
+            item_type = attr_map.get('itemtype', '')
+            if item_type:
+                head['@type'] = item_type.split('/')[-1]  # Get last part of URL
+                head['@context'] = '/'.join(item_type.split('/')[:-1])
+            frame.micro_item = _Item(head)
+            self._micro_items.append(frame.micro_item)
+
+    def _open_rdfa(self, frame: _Frame, tag: str, attr_map: Dict[str, str]) -> None:
+        owner = self._rdfa_items[-1] if self._rdfa_items else None
+        is_item = 'typeof' in attr_map
+
+        if owner is not None and 'property' in attr_map:
+            slot = [attr_map['property'], None]
+            owner.props.append(slot)
+            if is_item:
+                pass  # filled with the nested item when it closes
+            elif 'content' in attr_map:
+                slot[1] = attr_map['content']
+            elif 'resource' in attr_map:
+                slot[1] = attr_map['resource']
+            elif 'href' in attr_map:
+                slot[1] = attr_map['href']
+            elif 'src' in attr_map:
+                slot[1] = attr_map['src']
+            else:
+                frame.text = frame.text if frame.text is not None else []
+            frame.rdfa_slot = slot
+
+        if is_item:
+            head = {}
+            if attr_map['typeof']:
+                head['@type'] = attr_map['typeof']
+            if attr_map.get('vocab'):
+                head['@context'] = attr_map['vocab']
+            elif self._vocabs:
+                head['@context'] = self._vocabs[-1]
+            frame.rdfa_item = _Item(head)
+            self._rdfa_items.append(frame.rdfa_item)
+
+    def _close_frame(self, frame: _Frame) -> None:
+        text = ''.join(frame.text) if frame.text is not None else None
+
+        if frame.micro_item is not None:
+            self._micro_items.pop()
+            item_data = frame.micro_item.build()
+            if frame.micro_slot is not None:
+                frame.micro_slot[1] = item_data
+            elif not self._micro_items and item_data:
+                self.data.microdata.append(item_data)
+        elif frame.micro_slot is not None and frame.micro_slot[1] is None:
+            frame.micro_slot[1] = text or ''
+
+        if frame.rdfa_item is not None:
+            self._rdfa_items.pop()
+            item_data = frame.rdfa_item.build()
+            if frame.rdfa_slot is not None:
+                frame.rdfa_slot[1] = item_data
+            elif not self._rdfa_items and item_data:
+                self.data.rdfa.append(item_data)
+        elif frame.rdfa_slot is not None and frame.rdfa_slot[1] is None:
+            frame.rdfa_slot[1] = text or ''
+
+
 class StructuredDataExtractor:
     """
     Extracts structured data from HTML pages.
@@ -44,32 +378,47 @@ class StructuredDataExtractor:
     - Standard meta tags
     """
     
-    def __init__(self, html_content: str, url: str = ""):
+    def __init__(self, html_content: str, url: str = "",
+                 max_json_ld_size: int = DEFAULT_MAX_JSON_LD_SIZE):
         """
         Initialize structured data extractor.
         
         Args:
             html_content: HTML content to extract from
             url: URL of the page (for context)
+            max_json_ld_size: JSON-LD blocks longer than this many characters
+                              are skipped
         """
         self.html_content = html_content
         self.url = url
-        self.soup = BeautifulSoup(html_content, 'html.parser')
+        self.max_json_ld_size = max_json_ld_size
+        self._soup: Optional[BeautifulSoup] = None
         self.data = StructuredData()
     
+    @property
+    def soup(self) -> BeautifulSoup:
+        """Parsed document, built on first use by the per-format ``extract_*`` methods."""
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html_content, 'html.parser')
+        return self._soup
+    
     def extract_all(self) -> StructuredData:
         """
         Extract all structured data from the page.
         
+        All formats are collected in a single streaming pass over the HTML;
+        no parse tree is built.
+        
         Returns:
             StructuredData object with all extracted data
         """
-        self.data.json_ld = self.extract_json_ld()
-        self.data.microdata = self.extract_microdata()
-        self.data.rdfa = self.extract_rdfa()
-        self.data.open_graph = self.extract_open_graph()
-        self.data.twitter_cards = self.extract_twitter_cards()
-        self.data.meta_tags = self.extract_meta_tags()
+        parser = _StructuredDataParser(max_json_ld_size=self.max_json_ld_size)
+        try:
+            parser.feed(self.html_content or '')
+            parser.close()
+        except Exception as e:
+            logger.warning(f"Error streaming structured data from {self.url}: {e}")
+        self.data = parser.data
         
         total_items = (len(self.data.json_ld) + len(self.data.microdata) + 
                       len(self.data.rdfa) + bool(self.data.open_graph) + 
@@ -97,22 +446,20 @@ class StructuredDataExtractor:
         
         for script in scripts:
             if script.string:
+                if len(script.string) > self.max_json_ld_size:
+                    logger.debug(
+                        f"Skipping JSON-LD block of {len(script.string)} chars "
+                        f"(limit {self.max_json_ld_size})"
+                    )
+                    continue
                 try:
-                    data = json.loads(script.string)
-                    
-                    # Handle @graph arrays (multiple items in one script)
-                    if isinstance(data, dict) and '@graph' in data:
-                        json_ld_data.extend(data['@graph'])
-                    # Handle arrays of JSON-LD objects
-                    elif isinstance(data, list):
-                        json_ld_data.extend(data)
-                    # Single JSON-LD object
-                    else:
-                        json_ld_data.append(data)
+                    data = _json_loads(str(script.string))
+                    _add_json_ld(json_ld_data, data)
                     
-                    logger.debug(f"Extracted JSON-LD: {data.get('@type', 'Unknown')}")
+                    if isinstance(data, dict):
+                        logger.debug(f"Extracted JSON-LD: {data.get('@type', 'Unknown')}")
                 
-                except json.JSONDecodeError as e:
+                except ValueError as e:
                     logger.warning(f"Failed to parse JSON-LD: {e}")
                 except Exception as e:
                     logger.warning(f"Error extracting JSON-LD: {e}")
@@ -188,12 +535,7 @@ class StructuredDataExtractor:
                 prop_value = prop.get_text(strip=True)
             
             # Handle multiple properties with same name
-            if prop_name in item_data:
-                if not isinstance(item_data[prop_name], list):
-                    item_data[prop_name] = [item_data[prop_name]]
-                item_data[prop_name].append(prop_value)
-            else:
-                item_data[prop_name] = prop_value
+            _add_property(item_data, prop_name, prop_value)
         
         return item_data
     
@@ -272,12 +614,7 @@ class StructuredDataExtractor:
                 prop_value = self._extract_rdfa_item(prop)
             
             # Handle multiple properties
-            if prop_name in item_data:
-                if not isinstance(item_data[prop_name], list):
-                    item_data[prop_name] = [item_data[prop_name]]
-                item_data[prop_name].append(prop_value)
-            else:
-                item_data[prop_name] = prop_value
+            _add_property(item_data, prop_name, prop_value)
         
         return item_data
     
@@ -448,18 +785,20 @@ class StructuredDataExtractor:
         }
 
 
-def extract_structured_data(html_content: str, url: str = "") -> StructuredData:
+def extract_structured_data(html_content: str, url: str = "",
+                            max_json_ld_size: int = DEFAULT_MAX_JSON_LD_SIZE) -> StructuredData:
     """
     Convenience function to extract all structured data.
     
     Args:
         html_content: HTML content
         url: URL of the page
+        max_json_ld_size: JSON-LD blocks longer than this many characters are skipped
         
     Returns:
         StructuredData object
     """
-    extractor = StructuredDataExtractor(html_content, url)
+    extractor = StructuredDataExtractor(html_content, url, max_json_ld_size=max_json_ld_size)
     return extractor.extract_all()
 
 
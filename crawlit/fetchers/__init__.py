@@ -1,8 +1,11 @@
 """crawlit.fetchers - Built-in Fetcher implementations."""
 
 from .http_fetcher import DefaultFetcher, DefaultAsyncFetcher
+from .warc_fetcher import WARCFetcher, AsyncWARCFetcher
 
 __all__ = [
     "DefaultFetcher",
     "DefaultAsyncFetcher",
+    "WARCFetcher",
+    "AsyncWARCFetcher",
 ]
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+warc_fetcher.py - Replay archived WARC responses through the Fetcher interface.
+
+Point a crawler at WARC files written by :class:`~crawlit.pipelines.WARCWriter`
+(or any gzip-per-record / plain WARC) to re-run extraction over captured pages
+without touching the network::
+
+    from crawlit import Crawler
+    from crawlit.fetchers import WARCFetcher
+
+    crawler = Crawler(
+        "https://example.com",
+        fetcher=WARCFetcher("./warcs"),
+        respect_robots=False,
+    )
+    crawler.crawl()
+
+The URL index is loaded from ``index.cdxj`` when present; otherwise every WARC
+file is scanned once.  When a URL was captured several times the last capture
+wins.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from ..interfaces import AsyncFetcher, Fetcher, FetchResult
+from ..utils.warc import WARC_INDEX_NAME, iter_warc_records, read_warc_record
+
+logger = logging.getLogger(__name__)
+
+_WARC_SUFFIXES = (".warc", ".warc.gz")
+
+
+def _charset(content_type: str) -> str:
+    for param in content_type.split(";")[1:]:
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "charset":
+            return value.strip().strip("\"'") or "utf-8"
+    return "utf-8"
+
+
+class WARCFetcher(Fetcher):
+    """
+    Synchronous fetcher that serves responses from WARC archives.
+
+    Parameters
+    ----------
+    sources : str | Path | iterable of str | Path
+        WARC files and/or directories containing ``*.warc`` / ``*.warc.gz``.
+    use_index : bool
+        Load ``index.cdxj`` from source directories when available instead of
+        scanning the WARC files (default ``True``).
+    """
+
+    def __init__(
+        self,
+        sources: Union[str, Path, Iterable[Union[str, Path]]],
+        use_index: bool = True,
+    ):
+        if isinstance(sources, (str, Path)):
+            sources = [sources]
+        self._index: Dict[str, Tuple[Path, int, int]] = {}
+        files: List[Path] = []
+        for source in sources:
+            source = Path(source)
+            if source.is_dir():
+                index_path = source / WARC_INDEX_NAME
+                if use_index and index_path.exists():
+                    self._load_index(index_path)
+                    continue
+                files.extend(sorted(
+                    p for p in source.iterdir() if p.name.endswith(_WARC_SUFFIXES)
+                ))
+            else:
+                files.append(source)
+        for path in files:
+            self._scan(path)
+        logger.info(f"WARCFetcher indexed {len(self._index)} URLs")
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def _load_index(self, index_path: Path) -> None:
+        with index_path.open(encoding="utf-8") as f:
+            for line in f:
+                # "<url> <timestamp> <json>"; the JSON carries the exact URL
+                parts = line.rstrip("\n").split(" ", 2)
+                if len(parts) < 3:
+                    continue
+                try:
+                    entry = json.loads(parts[2])
+                    self._index[entry["url"]] = (
+                        index_path.parent / entry["filename"], int(entry["offset"]), int(entry["length"])
+                    )
+                except (ValueError, KeyError) as exc:
+                    logger.warning(f"Skipping malformed line in {index_path}: {exc}")
+
+    def _scan(self, path: Path) -> None:
+        try:
+            for offset, length, record in iter_warc_records(path):
+                if record.type == "response" and record.target_uri:
+                    self._index[record.target_uri] = (path, offset, length)
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Error scanning WARC file {path}: {exc}")
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._index
+
+    def urls(self) -> List[str]:
+        """All archived response URLs."""
+        return list(self._index)
+
+    # ------------------------------------------------------------------
+    # Fetcher interface
+    # ------------------------------------------------------------------
+
+    def fetch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> FetchResult:
+        location = self._index.get(url)
+        if location is None:
+            return FetchResult(success=False, url=url, status_code=0, error="Not in WARC archive")
+        path, offset, length = location
+        try:
+            status, resp_headers, body = read_warc_record(path, offset, length).http_response()
+        except Exception as exc:
+            logger.warning(f"WARCFetcher: failed to read {url} from {path}@{offset}: {exc}")
+            return FetchResult(success=False, url=url, status_code=0, error=str(exc))
+
+        content_type = next((v for k, v in resp_headers.items() if k.lower() == "content-type"), "")
+        if status != 200:
+            return FetchResult(
+                success=False,
+                url=url,
+                status_code=status,
+                headers=resp_headers,
+                content_type=content_type or None,
+                error=f"HTTP Error: {status}",
+            )
+
+        content_type_base = content_type.split(";")[0].strip().lower()
+        text: Optional[str] = None
+        if "text" in content_type_base or "html" in content_type_base or "json" in content_type_base:
+            try:
+                text = body.decode(_charset(content_type), errors="replace")
+            except LookupError:
+                text = body.decode("utf-8", errors="replace")
+        return FetchResult(
+            success=True,
+            url=url,
+            status_code=status,
+            headers=resp_headers,
+            content_type=content_type or None,
+            text=text,
+            raw_bytes=body,
+            elapsed_ms=0.0,
+            response_bytes=len(body),
+        )
+
+
+class AsyncWARCFetcher(AsyncFetcher):
+    """
+    Asynchronous variant of :class:`WARCFetcher`.
+
+    Disk reads run in the default executor so replay never blocks the event
+    loop.  Accepts the same arguments as :class:`WARCFetcher`, or an existing
+    instance via ``fetcher=``.
+    """
+
+    def __init__(self, sources=None, use_index: bool = True, fetcher: Optional[WARCFetcher] = None):
+        if fetcher is None and sources is None:
+            raise ValueError("AsyncWARCFetcher needs sources or a WARCFetcher")
+        self._fetcher = fetcher or WARCFetcher(sources, use_index=use_index)
+
+    def __len__(self) -> int:
+        return len(self._fetcher)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._fetcher
+
+    async def fetch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> FetchResult:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._fetcher.fetch, url, headers)
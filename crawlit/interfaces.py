@@ -7,6 +7,7 @@ Defines abstract base classes for:
   * Fetcher / AsyncFetcher   – pluggable HTTP fetch layer
   * Extractor / AsyncExtractor  – attach derived data to PageArtifact.extracted
   * Pipeline  / AsyncPipeline   – post-process, persist, or filter artifacts
+  * BatchPipeline / AsyncBatchPipeline – the same, a micro-batch at a time
 
 Inject plugins via the keyword arguments on ``Crawler`` / ``AsyncCrawler``::
 
@@ -269,3 +270,63 @@ class AsyncPipeline(ABC):
     @abstractmethod
     async def process(self, artifact: "PageArtifact") -> Optional["PageArtifact"]:
         """Process *artifact* asynchronously."""
+
+
+class BatchPipeline(Pipeline):
+    """
+    Pipeline stage that processes artifacts in micro-batches.
+
+    The engines buffer artifacts for the stage and call
+    :meth:`process_batch` once ``batch_size`` of them have arrived, or with
+    fewer once the oldest has waited ``max_latency_ms`` milliseconds, and
+    with whatever is left when ``crawl()`` ends.  Artifacts reach the stage
+    in the order they arrived, and those returned continue through the
+    remaining stages in that order.  Leaving ``batch_size`` /
+    ``max_latency_ms`` as ``None`` uses the crawler's
+    ``pipeline_batch_size`` / ``pipeline_batch_latency_ms``;
+    ``max_latency_ms = 0`` disables the time trigger.
+
+    Use it for sinks that pay a per-call cost (a lock, a write, a database
+    round-trip) which a batch amortises.  :meth:`process` is kept for
+    callers that hand over one artifact at a time.
+    """
+
+    batch_size: Optional[int] = None
+    max_latency_ms: Optional[float] = None
+
+    @abstractmethod
+    def process_batch(
+        self, artifacts: List["PageArtifact"]
+    ) -> Optional[List[Optional["PageArtifact"]]]:
+        """
+        Process *artifacts*.
+
+        Returns one entry per artifact — the (possibly modified) artifact,
+        or ``None`` to drop it — or ``None`` to pass every artifact on
+        unchanged, which is what sinks that only persist artifacts do.
+        """
+
+    def process(self, artifact: "PageArtifact") -> Optional["PageArtifact"]:
+        results = self.process_batch([artifact])
+        return artifact if results is None else results[0]
+
+
+class AsyncBatchPipeline(AsyncPipeline):
+    """
+    Asynchronous variant of :class:`BatchPipeline`.
+
+    Compatible with :class:`~crawlit.crawler.async_engine.AsyncCrawler` only.
+    """
+
+    batch_size: Optional[int] = None
+    max_latency_ms: Optional[float] = None
+
+    @abstractmethod
+    async def process_batch(
+        self, artifacts: List["PageArtifact"]
+    ) -> Optional[List[Optional["PageArtifact"]]]:
+        """Process *artifacts* asynchronously (same contract as :meth:`BatchPipeline.process_batch`)."""
+
+    async def process(self, artifact: "PageArtifact") -> Optional["PageArtifact"]:
+        results = await self.process_batch([artifact])
+        return artifact if results is None else results[0]
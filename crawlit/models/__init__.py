@@ -11,7 +11,12 @@ from .page_artifact import (
     DownloadRecord,
     CrawlMeta,
     ArtifactSource,
+    intern_headers,
+    SLOTTED,
 )
+from .serialization import ArtifactSerializer, artifact_to_dict
+from .journal import ArtifactJournal, journaled
+from .result_view import ResultView
 
 __all__ = [
     "SCHEMA_VERSION",
@@ -24,4 +29,11 @@ __all__ = [
     "DownloadRecord",
     "CrawlMeta",
     "ArtifactSource",
+    "intern_headers",
+    "SLOTTED",
+    "ArtifactSerializer",
+    "artifact_to_dict",
+    "ArtifactJournal",
+    "journaled",
+    "ResultView",
 ]
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+journal.py - Copy-on-write rollback for pipeline stages.
+
+The engines used to call :meth:`PageArtifact.copy` before every pipeline
+stage so a failing stage could be rolled back, copying ``links``,
+``extracted``, ``downloads`` and ``errors`` each time even though most stages
+never touch them.  :class:`ArtifactJournal` gives the same guarantees while
+copying only what a stage actually changes:
+
+* the artifact's top-level fields and the scalar fields of its sub-records
+  (``http``, ``content``, ``source``, ``crawl``) are captured by reference —
+  a handful of attribute reads;
+* ``links``, ``downloads``, ``errors`` and ``extracted`` are saved on the
+  *first* in-place mutation while a journal is open, provided they are
+  :class:`JournaledList` / :class:`JournaledDict` containers.  The engines
+  build their artifacts with :func:`journaled`; a journal never replaces a
+  container, since others (e.g. a ``get_results()`` record) may hold it,
+  and copies plain ``list`` / ``dict`` containers up front instead.
+
+::
+
+    artifact = journaled(PageArtifact(url=url))
+    journal = ArtifactJournal(artifact)
+    try:
+        result = stage.process(artifact)
+    except Exception:
+        journal.rollback()      # artifact is back to its pre-stage state
+    else:
+        journal.commit()
+
+As with :meth:`PageArtifact.copy`, rollback covers reassigned fields and
+in-place changes to the top-level containers; objects nested inside them
+(e.g. a list stored in ``extracted``) are not tracked.
+"""
+
+import dataclasses
+from typing import Any, Dict, List, Optional, Tuple
+
+from .page_artifact import ArtifactSource, ContentInfo, CrawlMeta, HTTPInfo, PageArtifact
+
+_ARTIFACT_FIELDS = tuple(f.name for f in dataclasses.fields(PageArtifact))
+_RECORD_FIELDS = {
+    cls: tuple(f.name for f in dataclasses.fields(cls))
+    for cls in (HTTPInfo, ContentInfo, ArtifactSource, CrawlMeta)
+}
+_RECORD_ATTRS = ("http", "content", "source", "crawl")
+_LIST_ATTRS = ("links", "downloads", "errors")
+
+
+def _mutator(base, name):
+    original = getattr(base, name)
+
+    def method(self, *args, **kwargs):
+        journal = self._journal
+        if journal is not None:
+            journal._save(self)
+        return original(self, *args, **kwargs)
+
+    method.__name__ = name
+    method.__doc__ = original.__doc__
+    return method
+
+
+class JournaledList(list):
+    """``list`` that reports its first mutation to an open :class:`ArtifactJournal`."""
+
+    __slots__ = ("_journal",)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._journal: Optional["ArtifactJournal"] = None
+
+    def __reduce_ex__(self, protocol):
+        return (list, (list(self),))
+
+
+class JournaledDict(dict):
+    """``dict`` that reports its first mutation to an open :class:`ArtifactJournal`."""
+
+    __slots__ = ("_journal",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._journal: Optional["ArtifactJournal"] = None
+
+    def __reduce_ex__(self, protocol):
+        return (dict, (dict(self),))
+
+
+for _name in ("append", "extend", "insert", "remove", "pop", "clear", "sort",
+              "reverse", "__setitem__", "__delitem__", "__iadd__", "__imul__"):
+    setattr(JournaledList, _name, _mutator(list, _name))
+for _name in ("__setitem__", "__delitem__", "pop", "popitem", "clear", "update",
+              "setdefault", "__ior__"):
+    if hasattr(dict, _name):
+        setattr(JournaledDict, _name, _mutator(dict, _name))
+del _name
+
+
+def journaled(artifact: PageArtifact) -> PageArtifact:
+    """
+    Give *artifact* journaled ``links``, ``downloads``, ``errors`` and
+    ``extracted`` containers, in place, and return it.
+
+    Call it when the artifact is built, before anything else holds its
+    containers: plain containers are copied into journaled ones.
+    """
+    for attr in _LIST_ATTRS:
+        value = getattr(artifact, attr)
+        if type(value) is list:
+            setattr(artifact, attr, JournaledList(value))
+    if type(artifact.extracted) is dict:
+        artifact.extracted = JournaledDict(artifact.extracted)
+    return artifact
+
+
+class ArtifactJournal:
+    """
+    Cheap undo log for one pipeline stage run on *artifact*.
+
+    Opening a journal is O(number of fields); the contents of journaled
+    containers are only copied when a stage mutates them in place, those of
+    plain containers when the journal is opened.  Call exactly one of
+    :meth:`commit` or :meth:`rollback`.
+    """
+
+    __slots__ = ("_artifact", "_fields", "_records", "_containers", "_saved", "_copied")
+
+    def __init__(self, artifact: PageArtifact):
+        self._artifact = artifact
+        records: List[Tuple[Any, Tuple[Any, ...]]] = []
+        for attr in _RECORD_ATTRS:
+            record = getattr(artifact, attr)
+            names = _RECORD_FIELDS.get(type(record))
+            if names is not None:
+                records.append((record, tuple(getattr(record, name) for name in names)))
+        self._records = records
+
+        containers: List[Any] = []
+        copied: List[Tuple[Any, Any]] = []
+        for value in [getattr(artifact, attr) for attr in _LIST_ATTRS] + [artifact.extracted]:
+            if isinstance(value, (JournaledList, JournaledDict)):
+                value._journal = self
+                containers.append(value)
+            elif type(value) is list:
+                copied.append((value, list(value)))
+            elif type(value) is dict:
+                copied.append((value, dict(value)))
+        self._containers = containers
+        self._copied = copied
+        self._saved: Dict[int, Tuple[Any, Any]] = {}
+        self._fields = tuple(getattr(artifact, name) for name in _ARTIFACT_FIELDS)
+
+    def _save(self, container) -> None:
+        key = id(container)
+        if key not in self._saved:
+            snapshot = dict(container) if isinstance(container, dict) else list(container)
+            self._saved[key] = (container, snapshot)
+
+    @property
+    def dirty(self) -> bool:
+        """Whether any container has been mutated in place."""
+        return bool(self._saved) or any(container != snapshot for container, snapshot in self._copied)
+
+    def _detach(self) -> None:
+        for container in self._containers:
+            if container._journal is self:
+                container._journal = None
+
+    def commit(self) -> None:
+        """Keep the stage's changes and stop tracking."""
+        self._detach()
+        self._saved.clear()
+        self._copied = []
+
+    def rollback(self) -> None:
+        """Restore the artifact to its state when the journal was opened."""
+        self._detach()
+        for container, snapshot in list(self._saved.values()) + self._copied:
+            if isinstance(container, dict):
+                dict.clear(container)
+                dict.update(container, snapshot)
+            else:
+                list.__setitem__(container, slice(None), snapshot)
+        self._saved.clear()
+        self._copied = []
+        for record, values in self._records:
+            for name, value in zip(_RECORD_FIELDS[type(record)], values):
+                setattr(record, name, value)
+        artifact = self._artifact
+        for name, value in zip(_ARTIFACT_FIELDS, self._fields):
+            setattr(artifact, name, value)
@@ -4,15 +4,54 @@ page_artifact.py - Stable, versioned crawl result model.
 
 Replaces ad-hoc result dicts with a consistent PageArtifact dataclass that
 every engine, extractor, and pipeline works with.
+
+Per-page records are slotted dataclasses (no per-instance ``__dict__``) on
+Python 3.10+; on 3.8/3.9 they fall back to regular dataclasses with the same
+fields and behaviour.  Low-cardinality strings repeated on every page
+(content types, source type/site, discovery method, run id, error codes) are
+interned on construction, and :func:`intern_headers` does the same for
+response header names.  :class:`PageArtifact` still accepts ad-hoc
+attributes; their instance dict is only allocated when one is set.
 """
 
 import dataclasses
+import sys
 import uuid
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
 SCHEMA_VERSION = "1"
 
+#: ``True`` when the per-page records below use ``__slots__``.
+SLOTTED = sys.version_info >= (3, 10)
+
+# Decorator for per-page records: one artifact and its sub-records are
+# created for every crawled page, so dropping __dict__ matters at scale.
+_record = dataclasses.dataclass(slots=True) if SLOTTED else dataclasses.dataclass
+
+
+class _AdHocAttributes:
+    # Keeps ad-hoc attributes (``artifact.my_flag = ...``) working on the
+    # slotted PageArtifact; the instance dict is only allocated when one is set.
+    __slots__ = ("__dict__",)
+
+
+def _intern(value: Any) -> Any:
+    """``sys.intern`` exact ``str`` values; anything else is returned as is."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def intern_headers(headers: Any) -> Dict[str, Any]:
+    """
+    Copy a headers mapping into a plain ``dict`` with interned header names.
+
+    Header names repeat on every response, so interning them lets all
+    retained pages share one string per name.  For multi-valued mappings
+    (e.g. aiohttp's ``CIMultiDictProxy``) the first value wins, as with
+    ``dict(headers)``.
+    """
+    return {sys.intern(str(name)): headers[name] for name in headers}
+
 # ---------------------------------------------------------------------------
 # Error classification
 # ---------------------------------------------------------------------------
@@ -31,7 +70,7 @@ ERROR_CODES = {
 }
 
 
-@dataclasses.dataclass
+@_record
 class CrawlError:
     """
     Structured error record attached to a :class:`PageArtifact`.
@@ -55,6 +94,10 @@ class CrawlError:
     source: Optional[str] = None
     http_status: Optional[int] = None
 
+    def __post_init__(self) -> None:
+        self.code = _intern(self.code)
+        self.source = _intern(self.source)
+
     def __str__(self) -> str:
         parts = [f"[{self.code}]"]
         if self.source:
@@ -135,7 +178,7 @@ class CrawlJob:
 # ---------------------------------------------------------------------------
 
 
-@dataclasses.dataclass
+@_record
 class HTTPInfo:
     """HTTP response metadata, including timing and transfer-size metrics."""
 
@@ -152,8 +195,11 @@ class HTTPInfo:
     # --- Size metrics (bytes) ---
     response_bytes: Optional[int] = None  # total bytes received over the wire
 
+    def __post_init__(self) -> None:
+        self.content_type = _intern(self.content_type)
 
-@dataclasses.dataclass
+
+@_record
 class ContentInfo:
     """Page content metadata and optional storage references."""
 
@@ -165,7 +211,7 @@ class ContentInfo:
     size_bytes: int = 0
 
 
-@dataclasses.dataclass
+@_record
 class DownloadRecord:
     """Record of a file downloaded during the crawl."""
 
@@ -177,8 +223,12 @@ class DownloadRecord:
     content_type: Optional[str] = None
     error: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        self.content_type = _intern(self.content_type)
+        self.parse_status = _intern(self.parse_status)
 
-@dataclasses.dataclass
+
+@_record
 class CrawlMeta:
     """Crawl graph / navigation context for a page."""
 
@@ -189,8 +239,12 @@ class CrawlMeta:
     # Inherited from engine's CrawlJob
     run_id: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        self.discovery_method = _intern(self.discovery_method)
+        self.run_id = _intern(self.run_id)
 
-@dataclasses.dataclass
+
+@_record
 class ArtifactSource:
     """
     Source provenance for a crawled artifact.
@@ -216,14 +270,18 @@ class ArtifactSource:
     type: str = "unknown"   # seed / sitemap / html_link / api / unknown
     site: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        self.type = _intern(self.type)
+        self.site = _intern(self.site)
+
 
 # ---------------------------------------------------------------------------
 # Top-level artifact
 # ---------------------------------------------------------------------------
 
 
-@dataclasses.dataclass
-class PageArtifact:
+@_record
+class PageArtifact(_AdHocAttributes):
     """
     A stable, versioned record of one crawled page.
 
@@ -352,26 +410,19 @@ class PageArtifact:
 
     def to_dict(self) -> Dict[str, Any]:
         """Return a JSON-serialisable dictionary."""
+        from .serialization import artifact_to_dict
+        return artifact_to_dict(self)
 
-        def _convert(obj: Any) -> Any:
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            if isinstance(obj, CrawlError):
-                d: Dict[str, Any] = {"code": obj.code, "message": obj.message}
-                if obj.source is not None:
-                    d["source"] = obj.source
-                if obj.http_status is not None:
-                    d["http_status"] = obj.http_status
-                return d
-            if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
-                return {k: _convert(v) for k, v in dataclasses.asdict(obj).items()}
-            if isinstance(obj, list):
-                return [_convert(i) for i in obj]
-            if isinstance(obj, dict):
-                return {k: _convert(v) for k, v in obj.items()}
-            return obj
-
-        return _convert(dataclasses.asdict(self))
+    def to_json(self, exclude=None, include=None) -> bytes:
+        """
+        Return the artifact as UTF-8 JSON bytes.
+
+        ``exclude`` / ``include`` take dotted field paths (e.g.
+        ``"content.raw_html"``); see
+        :class:`~crawlit.models.serialization.ArtifactSerializer`.
+        """
+        from .serialization import ArtifactSerializer
+        return ArtifactSerializer(exclude=exclude, include=include).dumps(self)
 
     # ------------------------------------------------------------------
     # Backward-compatibility bridge
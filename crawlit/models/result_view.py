@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+result_view.py - Legacy ``get_results()`` records sharing a PageArtifact's data.
+
+The engines used to fill a ``self.results[url]`` dict (``headers``,
+``links``, ``html_content``, extractor outputs…) alongside the
+:class:`PageArtifact` holding the same data, sometimes as a second copy.
+:class:`ResultView` is a ``dict`` whose keys with an artifact home are
+*bound*: they hold the artifact's own objects rather than copies, while the
+few legacy-only scalars (``depth``, ``status``, ``success``, ``error``, dedup
+flags) are ordinary entries::
+
+    record = ResultView(artifact, depth=0, status=None, headers=None, links=[])
+    artifact.http = HTTPInfo(status=200, headers=headers)
+    record.bind("headers")            # record["headers"] is artifact.http.headers
+
+Being a real ``dict``, a view passes ``isinstance(record, dict)``, goes
+straight into ``json.dump`` and pickles as a plain ``dict``.  Binding takes
+the artifact's value at that moment; the engines :meth:`~ResultView.rebind`
+after the pipelines ran, so values a pipeline replaced on the artifact are
+not kept twice.  Assigning a key replaces the value in the view only.
+"""
+
+from typing import Any, Callable, Dict, Tuple
+
+from .page_artifact import PageArtifact
+
+#: Legacy result keys filled from :class:`~crawlit.extractors.ContentExtractor`
+#: output (stored in ``artifact.extracted`` when not ``None``).
+CONTENT_RESULT_KEYS = (
+    "title", "meta_description", "meta_keywords", "canonical_url", "language",
+    "headings", "images_with_context", "page_type", "last_modified",
+)
+
+#: Keys read from somewhere other than ``artifact.extracted[key]``.
+_GETTERS: Dict[str, Callable[[PageArtifact], Any]] = {
+    "headers": lambda artifact: artifact.http.headers,
+    "links": lambda artifact: artifact.links,
+    "html_content": lambda artifact: artifact.content.raw_html,
+    "pdf_data": lambda artifact: artifact.extracted.get("pdf"),
+}
+
+
+class ResultView(dict):
+    """
+    Legacy result ``dict`` for one URL, sharing bound values with *artifact*.
+
+    Bound keys take ``artifact.http.headers``, ``artifact.links``,
+    ``artifact.content.raw_html``, ``artifact.extracted["pdf"]`` (for
+    ``pdf_data``) or ``artifact.extracted.get(key)`` by reference.
+    """
+
+    __slots__ = ("_artifact", "_bound")
+
+    def __init__(self, artifact: PageArtifact, **fields: Any):
+        super().__init__(fields)
+        self._artifact = artifact
+        self._bound: Tuple[str, ...] = ()
+
+    @property
+    def artifact(self) -> PageArtifact:
+        """The page's artifact (``None`` once :meth:`detach` was called)."""
+        return self._artifact
+
+    def bind(self, *keys: str) -> None:
+        """Set *keys* to the artifact's current values (shared, not copied)."""
+        if self._artifact is None:
+            raise ValueError("cannot bind keys on a detached ResultView")
+        for key in keys:
+            getter = _GETTERS.get(key)
+            self[key] = getter(self._artifact) if getter is not None else self._artifact.extracted.get(key)
+        self._bound += tuple(key for key in dict.fromkeys(keys) if key not in self._bound)
+
+    def rebind(self) -> None:
+        """
+        Bind every key bound so far again, picking up values replaced on the
+        artifact (and overwriting values assigned to those keys since).
+        """
+        if self._artifact is not None:
+            self.bind(*self._bound)
+
+    def detach(self) -> None:
+        """Drop the artifact reference; bound values stay in the view."""
+        self._artifact = None
+        self._bound = ()
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+serialization.py - Fast PageArtifact → JSON serialisation.
+
+:meth:`PageArtifact.to_dict` used to call :func:`dataclasses.asdict` (a deep
+copy of every container, including ``extracted``) and then walk the result a
+second time to convert datetimes.  The functions here build the artifact's
+dict in a single pass, and :class:`ArtifactSerializer` encodes straight to
+JSON bytes without copying ``links``, ``extracted`` or ``http.headers`` at
+all — values the JSON encoder cannot handle natively (datetimes, nested
+dataclasses, sets) are converted on demand by its ``default`` hook.
+
+The encoder is picked once at import: ``orjson`` when installed, then
+``msgspec``, then the standard library ``json`` module.  All three produce
+UTF-8 JSON with the same structure; only whitespace differs.
+
+Field projection
+----------------
+``exclude`` / ``include`` take dotted field paths::
+
+    ArtifactSerializer(exclude=["content.raw_html", "http.headers"])
+    ArtifactSerializer(include=["url", "http.status", "extracted.title"])
+
+``skip_blob_html=True`` drops ``content.raw_html`` only for artifacts whose
+``content.blob_path`` is set, i.e. when the HTML is already stored by a
+:class:`~crawlit.pipelines.BlobStore`.
+"""
+
+import dataclasses
+import json
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Optional
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+    _MSGSPEC_AVAILABLE = True
+except ImportError:
+    _MSGSPEC_AVAILABLE = False
+
+from .page_artifact import (
+    ArtifactSource,
+    ContentInfo,
+    CrawlError,
+    CrawlMeta,
+    DownloadRecord,
+    HTTPInfo,
+    PageArtifact,
+)
+
+#: Encoders usable as ``ArtifactSerializer(backend=...)``.
+BACKENDS = ("auto", "orjson", "msgspec", "json")
+
+_FIELDS = {
+    cls: tuple(f.name for f in dataclasses.fields(cls))
+    for cls in (HTTPInfo, ContentInfo, ArtifactSource, CrawlMeta, DownloadRecord, CrawlError)
+}
+
+
+def _record(obj: Any) -> Dict[str, Any]:
+    """Flat dict of a leaf dataclass's fields (values are not copied)."""
+    return {name: getattr(obj, name) for name in _FIELDS[type(obj)]}
+
+
+def _jsonable(obj: Any) -> Any:
+    """Copy *obj* into plain JSON-compatible containers (``to_dict`` semantics)."""
+    if isinstance(obj, dict):
+        return {k: _jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_jsonable(v) for v in obj]
+    if isinstance(obj, tuple) and type(obj) is tuple:
+        return tuple(_jsonable(v) for v in obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: _jsonable(getattr(obj, f.name)) for f in dataclasses.fields(obj)}
+    return obj
+
+
+def _default(obj: Any) -> Any:
+    """``default`` hook for encoders: convert what JSON cannot represent."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return _jsonable(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    # list/dict subclasses (e.g. journaled containers) for encoders that
+    # only accept the exact builtin types
+    if isinstance(obj, list):
+        return list(obj)
+    if isinstance(obj, dict):
+        return dict(obj)
+    return str(obj)
+
+
+def artifact_to_dict(artifact: PageArtifact, copy: bool = True) -> Dict[str, Any]:
+    """
+    Build the JSON-serialisable dict of *artifact* in a single pass.
+
+    With ``copy=True`` (what :meth:`PageArtifact.to_dict` uses) every
+    container is copied and datetimes are converted, so the result is fully
+    independent of the artifact.  With ``copy=False`` ``links``,
+    ``extracted`` and ``http.headers`` are shared with the artifact; use this
+    only for immediate encoding.
+    """
+    convert = _jsonable if copy else (lambda value: value)
+    fetched_at = artifact.fetched_at
+    http = _record(artifact.http)
+    http["headers"] = convert(http["headers"])
+    return {
+        "schema_version": artifact.schema_version,
+        "url": artifact.url,
+        "fetched_at": fetched_at.isoformat() if isinstance(fetched_at, datetime) else fetched_at,
+        "http": http,
+        "content": _record(artifact.content),
+        "source": _record(artifact.source),
+        "links": convert(artifact.links),
+        "extracted": convert(artifact.extracted),
+        "downloads": [_record(d) for d in artifact.downloads],
+        "errors": [_record(e) for e in artifact.errors],
+        "crawl": _record(artifact.crawl),
+    }
+
+
+def _parse_paths(paths: Optional[Iterable[str]]) -> Optional[Dict[str, Any]]:
+    """Turn dotted paths into a nested dict; ``True`` marks a selected leaf."""
+    if paths is None:
+        return None
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        node = tree
+        parts = path.split(".")
+        for part in parts[:-1]:
+            child = node.get(part)
+            if child is True:
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[parts[-1]] = True
+    return tree
+
+
+def _drop(data: Dict[str, Any], tree: Dict[str, Any]) -> Dict[str, Any]:
+    out = dict(data)
+    for key, sub in tree.items():
+        if key not in out:
+            continue
+        if sub is True:
+            del out[key]
+        elif isinstance(out[key], dict):
+            out[key] = _drop(out[key], sub)
+    return out
+
+
+def _keep(data: Dict[str, Any], tree: Dict[str, Any]) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    for key, sub in tree.items():
+        if key not in data:
+            continue
+        if sub is True:
+            out[key] = data[key]
+        elif isinstance(data[key], dict):
+            out[key] = _keep(data[key], sub)
+    return out
+
+
+class ArtifactSerializer:
+    """
+    Encode :class:`PageArtifact` objects to JSON bytes, with optional projection.
+
+    Parameters
+    ----------
+    exclude : iterable of str | None
+        Dotted field paths to omit (e.g. ``"content.raw_html"``).
+    include : iterable of str | None
+        Dotted field paths to keep; everything else is omitted.  Applied
+        before ``exclude``.
+    skip_blob_html : bool
+        Omit ``content.raw_html`` when ``content.blob_path`` is set.
+    backend : str
+        ``"auto"`` (default: orjson, then msgspec, then json), ``"orjson"``,
+        ``"msgspec"`` or ``"json"``.
+
+    Thread-safe; one instance can be shared by several pipelines.
+    """
+
+    def __init__(
+        self,
+        exclude: Optional[Iterable[str]] = None,
+        include: Optional[Iterable[str]] = None,
+        skip_blob_html: bool = False,
+        backend: str = "auto",
+    ):
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}, got {backend!r}")
+        if backend == "auto":
+            backend = "orjson" if _ORJSON_AVAILABLE else "msgspec" if _MSGSPEC_AVAILABLE else "json"
+        elif backend == "orjson" and not _ORJSON_AVAILABLE:
+            raise ImportError("orjson is not installed")
+        elif backend == "msgspec" and not _MSGSPEC_AVAILABLE:
+            raise ImportError("msgspec is not installed")
+        self.backend = backend
+        self._exclude = _parse_paths(exclude)
+        self._include = _parse_paths(include)
+        self._skip_blob_html = skip_blob_html
+
+        if backend == "orjson":
+            options = orjson.OPT_NON_STR_KEYS
+            self._encode = lambda data: orjson.dumps(data, default=_default, option=options)
+        elif backend == "msgspec":
+            self._encode = msgspec.json.Encoder(enc_hook=_default).encode
+        else:
+            encoder = json.JSONEncoder(ensure_ascii=False, default=_default)
+            self._encode = lambda data: encoder.encode(data).encode("utf-8")
+
+    def to_dict(self, artifact: PageArtifact) -> Dict[str, Any]:
+        """Projected dict of *artifact*; containers are shared, not copied."""
+        data = artifact_to_dict(artifact, copy=False)
+        if self._include is not None:
+            data = _keep(data, self._include)
+        if self._exclude:
+            data = _drop(data, self._exclude)
+        if self._skip_blob_html and artifact.content.blob_path and "content" in data:
+            content = dict(data["content"])
+            content.pop("raw_html", None)
+            data["content"] = content
+        return data
+
+    def dumps(self, artifact: PageArtifact) -> bytes:
+        """Encode *artifact* as UTF-8 JSON bytes (no trailing newline)."""
+        return self._encode(self.to_dict(artifact))
+
+    def __repr__(self) -> str:
+        return f"ArtifactSerializer(backend={self.backend!r})"
@@ -6,15 +6,35 @@ Output package containing formatters for crawl results
 from .formatters import (
     save_results,
     save_as_json,
+    save_as_jsonl,
     save_as_csv, 
     save_as_txt,
-    generate_summary_report
+    generate_summary_report,
+    open_sink,
+    ResultSink,
+    FileSink,
+    JSONSink,
+    JSONLSink,
+    CSVSink,
+    TXTSink,
+    HTMLSink,
+    SummarySink,
 )
 
 __all__ = [
     'save_results',
     'save_as_json',
+    'save_as_jsonl',
     'save_as_csv',
     'save_as_txt',
-    'generate_summary_report'
-]
\ No newline at end of file
+    'generate_summary_report',
+    'open_sink',
+    'ResultSink',
+    'FileSink',
+    'JSONSink',
+    'JSONLSink',
+    'CSVSink',
+    'TXTSink',
+    'HTMLSink',
+    'SummarySink',
+]
@@ -1,6 +1,19 @@
 #!/usr/bin/env python3
 """
 formatters.py - Output formatters for crawler results
+
+Every format is written by a :class:`ResultSink` that takes one result at a
+time, so a crawl can stream its output while it runs instead of keeping all
+results in memory for an end-of-crawl export::
+
+    with open_sink("jsonl", "results.jsonl") as sink:
+        for url, data in results.items():
+            sink.write(url, data)
+
+The ``save_as_*`` helpers and :func:`save_results` drive the same sinks over
+a complete results dict.  Totals that only become known at the end (URL and
+success counts in the JSON, TXT and HTML headers) are written as fixed-width
+placeholders and filled in by :meth:`ResultSink.close`.
 """
 
 import json
@@ -8,6 +21,10 @@ import csv
 import html as _html
 import os
 import datetime
+import shutil
+import tempfile
+import threading
+from abc import ABC, abstractmethod
 from pathlib import Path
 
 _BLOCKED_SCHEMES = ('javascript:', 'data:', 'vbscript:')
@@ -35,275 +52,361 @@ def create_output_file(output_path):
         os.makedirs(output_dir, exist_ok=True)
 
 
-def save_results(results, output_format=None, output_file=None, pretty_json=False, format_type=None, pretty=None):
-    """Save crawler results to specified file in the requested format.
-    
-    This function takes the crawler results and saves them to a file in the specified format.
-    It supports JSON, CSV, TXT, and HTML output formats.
-    
-    Args:
-        results (dict): Crawler results dictionary containing URL data.
-        output_format (str, optional): Format to save results in (json, csv, txt, html). 
-            If None, will use the file extension or default to JSON.
-        output_file (str, optional): Path to the output file. If None, prints to stdout.
-        pretty_json (bool, optional): Whether to format JSON with indentation. Defaults to False.
-        format_type (str, optional): Alternative name for output_format (for backward compatibility).
-        pretty (bool, optional): Alternative name for pretty_json (for backward compatibility).
-        
-    Returns:
-        bool: True if saving was successful, False otherwise.
-    
-    Raises:
-        ValueError: If an unsupported output format is specified.
-    pretty: Alternative name for pretty_json (for backward compatibility)
+def _now():
+    return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+# Width of the placeholders for totals patched in on close
+_COUNT_WIDTH = 12
+
+
+class ResultSink(ABC):
+    """Base class for incremental writers of crawl results.
+
+    Call :meth:`write` once per crawled URL (from any thread) and
+    :meth:`close` at the end; sinks are also context managers.  ``count``
+    and ``success_count`` track what has been written so far.
     """
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    # Handle parameter aliasing (support both format_type and output_format)
-    if format_type is not None and output_format is None:
-        output_format = format_type
-    
-    # Handle pretty parameter (tests use pretty instead of pretty_json)
-    if pretty is not None and pretty_json is False:
-        pretty_json = pretty
-    
-    # Default filename if not specified
-    if output_file is None:
-        # Tests expect 'crawl_results.json' as default
-        output_file = f"crawl_results.{output_format.lower()}"
-    
-    # Make sure the output directory exists
-    create_output_file(output_file)
-    
-    # Choose the appropriate formatter based on format
-    if output_format.lower() == "json":
-        save_as_json(results, output_file, timestamp, pretty_json)
-    elif output_format.lower() == "csv":
-        save_as_csv(results, output_file, timestamp)
-    elif output_format.lower() == "txt":
-        save_as_txt(results, output_file, timestamp)
-    elif output_format.lower() == "html":
-        save_as_html(results, output_file, timestamp)
-    else:
-        raise ValueError(f"Unsupported output format: {output_format}")
-    
-    # Return the path to the file that was created
-    return output_file
 
+    def __init__(self):
+        self.count = 0
+        self.success_count = 0
+        self.closed = False
+        self._lock = threading.Lock()
 
-def save_as_json(results, output_file, timestamp, pretty_json=False):
-    """Save crawler results in JSON format"""
-    # Create a clean copy of results without HTML content
-    clean_results = {}
-    for url, data in results.items():
-        # Create a copy of the data without html_content
-        clean_data = {k: v for k, v in data.items() if k != 'html_content'}
-        clean_results[url] = clean_data
-    
-    # Create output data structure with metadata and results
-    output_data = {
-        "metadata": {
-            "timestamp": timestamp,
-            "total_urls": len(results)
-        },
-        "urls": clean_results
-    }
-    
-    # Write to file with nice formatting
-    with open(output_file, 'w', encoding='utf-8') as f:
-        if pretty_json:
-            json.dump(output_data, f, indent=2, sort_keys=True)
+    def write(self, url, data):
+        """Write the result *data* (a dict-like record) for *url*."""
+        with self._lock:
+            if self.closed:
+                raise ValueError("I/O operation on closed sink")
+            self._write_entry(url, data)
+            self.count += 1
+            if data.get('success', False):
+                self.success_count += 1
+
+    def flush(self):
+        """Push buffered output to its destination."""
+
+    def close(self):
+        """Write the trailer (totals, footers) and release the sink. Idempotent."""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            self._finish()
+
+    @abstractmethod
+    def _write_entry(self, url, data):
+        """Write one result; called with the sink's lock held."""
+
+    def _finish(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class FileSink(ResultSink):
+    """A :class:`ResultSink` writing to *output_file* (parent directories are created)."""
+
+    newline = None
+
+    def __init__(self, output_file, timestamp=None):
+        super().__init__()
+        self.output_file = output_file
+        self.timestamp = timestamp or _now()
+        create_output_file(output_file)
+        self._file = open(output_file, 'w', encoding='utf-8', newline=self.newline)
+        self._write_header()
+
+    def _write_header(self):
+        pass
+
+    def _write_footer(self):
+        pass
+
+    def _placeholder(self):
+        """Reserve space for a total; returns the offset to pass to :meth:`_patch`."""
+        offset = self._file.tell()
+        self._file.write(" " * _COUNT_WIDTH)
+        return offset
+
+    def _patch(self, offset, value):
+        end = self._file.tell()
+        self._file.seek(offset)
+        self._file.write(f"{value:<{_COUNT_WIDTH}}")
+        self._file.seek(end)
+
+    def flush(self):
+        with self._lock:
+            if not self.closed:
+                self._file.flush()
+
+    def _finish(self):
+        try:
+            self._write_footer()
+        finally:
+            self._file.close()
+
+
+def _without_html(data):
+    return {k: v for k, v in data.items() if k != 'html_content'}
+
+
+class JSONSink(FileSink):
+    """Stream results as ``{"metadata": {...}, "urls": {url: result, ...}}``.
+
+    ``html_content`` is left out.  With ``pretty=True`` the output is
+    indented with sorted keys inside each result; URLs keep crawl order.
+    """
+
+    def __init__(self, output_file, timestamp=None, pretty=False):
+        self.pretty = pretty
+        super().__init__(output_file, timestamp)
+
+    def _write_header(self):
+        timestamp = json.dumps(self.timestamp)
+        if self.pretty:
+            self._file.write(f'{{\n  "metadata": {{\n    "timestamp": {timestamp},\n    "total_urls": ')
+            self._total = self._placeholder()
+            self._file.write('\n  },\n  "urls": {')
+        else:
+            self._file.write(f'{{"metadata": {{"timestamp": {timestamp}, "total_urls": ')
+            self._total = self._placeholder()
+            self._file.write('}, "urls": {')
+
+    def _write_entry(self, url, data):
+        clean_data = _without_html(data)
+        if self.pretty:
+            entry = json.dumps(clean_data, indent=2, sort_keys=True, default=str).replace('\n', '\n    ')
+            separator = ',\n    ' if self.count else '\n    '
         else:
-            json.dump(output_data, f)
+            entry = json.dumps(clean_data, default=str)
+            separator = ', ' if self.count else ''
+        self._file.write(f'{separator}{json.dumps(str(url))}: {entry}')
 
+    def _write_footer(self):
+        if self.pretty:
+            self._file.write('\n  }\n}' if self.count else '}\n}')
+        else:
+            self._file.write('}}')
+        self._patch(self._total, self.count)
 
-def save_as_csv(results, output_file, timestamp):
-    """Save crawler results in CSV format"""
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        
-        # Write header
-        writer.writerow(['URL', 'Status', 'Depth', 'Content Type', 'Links Found', 'Success', 'Error', 'Images Found', 'Keywords Found', 'Key Phrases Found', 'Tables Found'])
-        
-        # Write data rows
-        for url, data in results.items():
-            images_count = len(data.get('images', []))
-            keywords_count = len(data.get('keywords', []))
-            keyphrases_count = len(data.get('keyphrases', []))
-            tables_count = len(data.get('tables', []))
-            
-            writer.writerow([
-                url,
-                data.get('status', 'N/A'),
-                data.get('depth', 'N/A'),
-                data.get('content_type', 'N/A'),
-                len(data.get('links', [])),
-                data.get('success', False),
-                data.get('error', ''),
-                images_count,
-                keywords_count,
-                keyphrases_count,
-                tables_count
-            ])
-        
-        # Write detailed data for images, keywords, etc. after basic info
+
+class JSONLSink(FileSink):
+    """Stream results as JSON Lines: one ``{"url": ..., **result}`` object per line."""
+
+    def _write_entry(self, url, data):
+        record = {"url": url}
+        record.update((k, v) for k, v in data.items() if k not in ('html_content', 'url'))
+        self._file.write(json.dumps(record, default=str) + '\n')
+
+
+class CSVSink(FileSink):
+    """Stream one summary row per URL.
+
+    Per-URL detail sections (images, keywords, tables) are spooled to a
+    temporary file and appended after the summary rows on close.
+    """
+
+    newline = ''
+
+    def _write_header(self):
+        self._writer = csv.writer(self._file)
+        self._details = tempfile.TemporaryFile('w+', newline='', encoding='utf-8')
+        self._detail_writer = csv.writer(self._details)
+        self._writer.writerow(['URL', 'Status', 'Depth', 'Content Type', 'Links Found', 'Success', 'Error', 'Images Found', 'Keywords Found', 'Key Phrases Found', 'Tables Found'])
+
+    def _write_entry(self, url, data):
+        writer = self._writer
+        images_count = len(data.get('images', []))
+        keywords_count = len(data.get('keywords', []))
+        keyphrases_count = len(data.get('keyphrases', []))
+        tables_count = len(data.get('tables', []))
+
+        writer.writerow([
+            url,
+            data.get('status', 'N/A'),
+            data.get('depth', 'N/A'),
+            data.get('content_type', 'N/A'),
+            len(data.get('links', [])),
+            data.get('success', False),
+            data.get('error', ''),
+            images_count,
+            keywords_count,
+            keyphrases_count,
+            tables_count
+        ])
+
+        writer = self._detail_writer
+        # Images
+        if 'images' in data and data['images']:
+            writer.writerow([])
+            writer.writerow([f'# Images for {url}'])
+            writer.writerow(['Image Source', 'Alt Text', 'Width', 'Height', 'Class'])
+            for img in data['images']:
+                writer.writerow([
+                    img.get('src', 'N/A'),
+                    img.get('alt', 'N/A'),
+                    img.get('width', 'N/A'),
+                    img.get('height', 'N/A'),
+                    img.get('class', 'N/A')
+                ])
+
+        # Keywords
+        if 'keywords' in data and data['keywords']:
+            writer.writerow([])
+            writer.writerow([f'# Keywords for {url}'])
+            writer.writerow(['Keyword', 'Score'])
+
+            keywords = data['keywords']
+            keyword_scores = data.get('keyword_scores', {})
+
+            for keyword in keywords:
+                score = keyword_scores.get(keyword, 'N/A')
+                writer.writerow([keyword, score])
+
+        # Key Phrases
+        if 'keyphrases' in data and data['keyphrases']:
+            writer.writerow([])
+            writer.writerow([f'# Key Phrases for {url}'])
+            for phrase in data['keyphrases']:
+                writer.writerow([phrase])
+
+        # Tables (in a simplified format)
+        if 'tables' in data and data['tables']:
+            writer.writerow([])
+            writer.writerow([f'# Tables for {url}'])
+            for i, table in enumerate(data['tables']):
+                writer.writerow([f'Table {i+1}'])
+                for row in table:
+                    writer.writerow(row)
+                writer.writerow([])
+
+    def _write_footer(self):
+        writer = self._writer
         writer.writerow([])
         writer.writerow(['# DETAILED DATA'])
-        
-        for url, data in results.items():
-            # Images
-            if 'images' in data and data['images']:
-                writer.writerow([])
-                writer.writerow([f'# Images for {url}'])
-                writer.writerow(['Image Source', 'Alt Text', 'Width', 'Height', 'Class'])
-                for img in data['images']:
-                    writer.writerow([
-                        img.get('src', 'N/A'),
-                        img.get('alt', 'N/A'),
-                        img.get('width', 'N/A'),
-                        img.get('height', 'N/A'),
-                        img.get('class', 'N/A')
-                    ])
-            
-            # Keywords
-            if 'keywords' in data and data['keywords']:
-                writer.writerow([])
-                writer.writerow([f'# Keywords for {url}'])
-                writer.writerow(['Keyword', 'Score'])
-                
-                keywords = data['keywords']
-                keyword_scores = data.get('keyword_scores', {})
-                
-                for keyword in keywords:
-                    score = keyword_scores.get(keyword, 'N/A')
-                    writer.writerow([keyword, score])
-            
-            # Key Phrases
-            if 'keyphrases' in data and data['keyphrases']:
-                writer.writerow([])
-                writer.writerow([f'# Key Phrases for {url}'])
-                for phrase in data['keyphrases']:
-                    writer.writerow([phrase])
-            
-            # Tables (in a simplified format)
-            if 'tables' in data and data['tables']:
-                writer.writerow([])
-                writer.writerow([f'# Tables for {url}'])
-                for i, table in enumerate(data['tables']):
-                    writer.writerow([f'Table {i+1}'])
-                    for row in table:
-                        writer.writerow(row)
-                    writer.writerow([])
-        
+        self._file.flush()
+        self._details.seek(0)
+        shutil.copyfileobj(self._details, self._file)
+        self._details.close()
+
         # Write metadata at the end
         writer.writerow([])
-        writer.writerow(['# Generated at:', timestamp])
-        writer.writerow(['# Total URLs:', len(results)])
+        writer.writerow(['# Generated at:', self.timestamp])
+        writer.writerow(['# Total URLs:', self.count])
 
 
-def save_as_txt(results, output_file, timestamp):
-    """Save crawler results in plain text format"""
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(f"Crawl Results - Generated at {timestamp}\n")
-        f.write(f"Total URLs: {len(results)}\n")
-        f.write("=" * 80 + "\n\n")
-        
-        # Write one entry per URL
-        for url, data in results.items():
-            f.write(f"URL: {url}\n")
-            f.write(f"Status: {data.get('status', 'N/A')}\n")
-            f.write(f"Depth: {data.get('depth', 'N/A')}\n")
-            f.write(f"Content Type: {data.get('content_type', 'N/A')}\n")
-            f.write(f"Success: {data.get('success', False)}\n")
-            
-            # Show error if there was one
-            if data.get('error'):
-                f.write(f"Error: {data.get('error')}\n")
-            
-            # Show found links
-            links = data.get('links', [])
-            f.write(f"Links Found: {len(links)}\n")
-            
-            # Write the first few links if there are any
-            if links:
-                f.write("Sample Links:\n")
-                for link in links[:5]:  # Show at most 5 links
-                    f.write(f"  - {link}\n")
-                
-                if len(links) > 5:
-                    f.write(f"  - ... and {len(links) - 5} more\n")
-            
-            # Add images information
-            images = data.get('images', [])
-            f.write(f"Images Found: {len(images)}\n")
-            if images:
-                f.write("Sample Images:\n")
-                for img in images[:3]:  # Show at most 3 images
-                    src = img.get('src', 'No source')
-                    alt = img.get('alt', 'No alt text')
-                    f.write(f"  - {src} (Alt: {alt})\n")
-                
-                if len(images) > 3:
-                    f.write(f"  - ... and {len(images) - 3} more\n")
-            
-            # Add keywords information
-            keywords = data.get('keywords', [])
-            f.write(f"Keywords Found: {len(keywords)}\n")
-            if keywords:
-                f.write("Top Keywords:\n")
-                # Get top 5 keywords with scores if available
-                keyword_scores = data.get('keyword_scores', {})
-                if keyword_scores and len(keywords) > 0:
-                    sorted_keywords = sorted(keyword_scores.items(), key=lambda x: x[1], reverse=True)
-                    for keyword, score in sorted_keywords[:5]:
-                        f.write(f"  - {keyword} (Score: {score:.4f})\n")
-                else:
-                    for keyword in keywords[:5]:
-                        f.write(f"  - {keyword}\n")
-                
-                if len(keywords) > 5:
-                    f.write(f"  - ... and {len(keywords) - 5} more\n")
-            
-            # Add keyphrases
-            keyphrases = data.get('keyphrases', [])
-            f.write(f"Key Phrases Found: {len(keyphrases)}\n")
-            if keyphrases:
-                f.write("Sample Key Phrases:\n")
-                for phrase in keyphrases[:5]:  # Show at most 5 keyphrases
-                    f.write(f"  - {phrase}\n")
-                
-                if len(keyphrases) > 5:
-                    f.write(f"  - ... and {len(keyphrases) - 5} more\n")
-            
-            # Add tables information
-            tables = data.get('tables', [])
-            f.write(f"Tables Found: {len(tables)}\n")
-            if tables and len(tables) > 0:
-                f.write("Sample Table Structure:\n")
-                if len(tables) > 0 and len(tables[0]) > 0:
-                    sample_table = tables[0]
-                    max_rows = min(3, len(sample_table))
-                    for i in range(max_rows):
-                        row = sample_table[i]
-                        max_cols = min(3, len(row))
-                        f.write("  | " + " | ".join(str(cell) for cell in row[:max_cols]))
-                        if len(row) > 3:
-                            f.write(" | ... ")
-                        f.write(" |\n")
-                    
-                    if len(sample_table) > 3:
-                        f.write("  | ... |\n")
-                    
-                if len(tables) > 1:
-                    f.write(f"  ... and {len(tables) - 1} more tables\n")
-            
-            f.write("\n" + "-" * 40 + "\n\n")
+class TXTSink(FileSink):
+    """Stream results as a plain text report."""
 
+    def _write_header(self):
+        f = self._file
+        f.write(f"Crawl Results - Generated at {self.timestamp}\n")
+        f.write("Total URLs: ")
+        self._total = self._placeholder()
+        f.write("\n" + "=" * 80 + "\n\n")
 
-def save_as_html(results, output_file, timestamp):
-    """Save crawler results in HTML format"""
-    # Create HTML structure with a basic responsive design
-    html = f"""<!DOCTYPE html>
+    def _write_entry(self, url, data):
+        f = self._file
+        f.write(f"URL: {url}\n")
+        f.write(f"Status: {data.get('status', 'N/A')}\n")
+        f.write(f"Depth: {data.get('depth', 'N/A')}\n")
+        f.write(f"Content Type: {data.get('content_type', 'N/A')}\n")
+        f.write(f"Success: {data.get('success', False)}\n")
+
+        # Show error if there was one
+        if data.get('error'):
+            f.write(f"Error: {data.get('error')}\n")
+
+        # Show found links
+        links = data.get('links', [])
+        f.write(f"Links Found: {len(links)}\n")
+
+        # Write the first few links if there are any
+        if links:
+            f.write("Sample Links:\n")
+            for link in links[:5]:  # Show at most 5 links
+                f.write(f"  - {link}\n")
+
+            if len(links) > 5:
+                f.write(f"  - ... and {len(links) - 5} more\n")
+
+        # Add images information
+        images = data.get('images', [])
+        f.write(f"Images Found: {len(images)}\n")
+        if images:
+            f.write("Sample Images:\n")
+            for img in images[:3]:  # Show at most 3 images
+                src = img.get('src', 'No source')
+                alt = img.get('alt', 'No alt text')
+                f.write(f"  - {src} (Alt: {alt})\n")
+
+            if len(images) > 3:
+                f.write(f"  - ... and {len(images) - 3} more\n")
+
+        # Add keywords information
+        keywords = data.get('keywords', [])
+        f.write(f"Keywords Found: {len(keywords)}\n")
+        if keywords:
+            f.write("Top Keywords:\n")
+            # Get top 5 keywords with scores if available
+            keyword_scores = data.get('keyword_scores', {})
+            if keyword_scores and len(keywords) > 0:
+                sorted_keywords = sorted(keyword_scores.items(), key=lambda x: x[1], reverse=True)
+                for keyword, score in sorted_keywords[:5]:
+                    f.write(f"  - {keyword} (Score: {score:.4f})\n")
+            else:
+                for keyword in keywords[:5]:
+                    f.write(f"  - {keyword}\n")
+
+            if len(keywords) > 5:
+                f.write(f"  - ... and {len(keywords) - 5} more\n")
+
+        # Add keyphrases
+        keyphrases = data.get('keyphrases', [])
+        f.write(f"Key Phrases Found: {len(keyphrases)}\n")
+        if keyphrases:
+            f.write("Sample Key Phrases:\n")
+            for phrase in keyphrases[:5]:  # Show at most 5 keyphrases
+                f.write(f"  - {phrase}\n")
+
+            if len(keyphrases) > 5:
+                f.write(f"  - ... and {len(keyphrases) - 5} more\n")
+
+        # Add tables information
+        tables = data.get('tables', [])
+        f.write(f"Tables Found: {len(tables)}\n")
+        if tables and len(tables) > 0:
+            f.write("Sample Table Structure:\n")
+            if len(tables) > 0 and len(tables[0]) > 0:
+                sample_table = tables[0]
+                max_rows = min(3, len(sample_table))
+                for i in range(max_rows):
+                    row = sample_table[i]
+                    max_cols = min(3, len(row))
+                    f.write("  | " + " | ".join(str(cell) for cell in row[:max_cols]))
+                    if len(row) > 3:
+                        f.write(" | ... ")
+                    f.write(" |\n")
+
+                if len(sample_table) > 3:
+                    f.write("  | ... |\n")
+
+            if len(tables) > 1:
+                f.write(f"  ... and {len(tables) - 1} more tables\n")
+
+        f.write("\n" + "-" * 40 + "\n\n")
+
+    def _write_footer(self):
+        self._patch(self._total, self.count)
+
+
+_HTML_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -389,18 +492,39 @@ def save_as_html(results, output_file, timestamp):
             <p>Generated at: {timestamp}</p>
         </header>
         
-        <div class="summary">
-            <h2>Crawl Summary</h2>
-            <p>Total URLs: <strong>{len(results)}</strong></p>
-            <p>Successful requests: <strong>{sum(1 for data in results.values() if data.get('success', False))}</strong></p>
-            <p>Failed requests: <strong>{sum(1 for data in results.values() if not data.get('success', False))}</strong></p>
-        </div>
-        
-        <h2>Results by URL</h2>
 """
-    
-    # Add each URL as a card
-    for url, data in results.items():
+
+_HTML_FOOTER = """
+        <footer>
+            <p>Generated by Crawlit - A Modular, Ethical Python Web Crawler</p>
+        </footer>
+    </div>
+</body>
+</html>
+"""
+
+
+class HTMLSink(FileSink):
+    """Stream results as a standalone HTML page with one card per URL."""
+
+    def _write_header(self):
+        f = self._file
+        f.write(_HTML_HEAD.format(timestamp=self.timestamp))
+        f.write('        <div class="summary">\n            <h2>Crawl Summary</h2>\n            <p>Total URLs: <strong>')
+        self._total = self._placeholder()
+        f.write('</strong></p>\n            <p>Successful requests: <strong>')
+        self._successful = self._placeholder()
+        f.write('</strong></p>\n            <p>Failed requests: <strong>')
+        self._failed = self._placeholder()
+        f.write('</strong></p>\n        </div>\n        \n        <h2>Results by URL</h2>\n')
+
+    def _write_entry(self, url, data):
+        self._file.write(self._render_card(url, data))
+
+    @staticmethod
+    def _render_card(url, data):
+        """Render the result card for one URL."""
+        out = []
         status = data.get('status', 'N/A')
         success = data.get('success', False)
         depth = data.get('depth', 'N/A')
@@ -410,7 +534,7 @@ def save_as_html(results, output_file, timestamp):
 
         status_class = "status-success" if success else "status-error"
 
-        html += f"""
+        out.append(f"""
         <div class="url-card">
             <h3>{_html.escape(str(url))}</h3>
             <div class="details">
@@ -427,40 +551,40 @@ def save_as_html(results, output_file, timestamp):
                     <strong>Success:</strong> {_html.escape(str(success))}
                 </div>
             </div>
-"""
+""")
 
         # Add error if there is one
         if error:
-            html += f"""
+            out.append(f"""
             <div class="detail-item">
                 <strong>Error:</strong> <span class="status-error">{_html.escape(str(error))}</span>
             </div>
-"""
+""")
 
         # Add links if there are any
         if links:
-            html += f"""
+            out.append(f"""
             <div>
                 <strong>Links Found:</strong> {len(links)}
                 <div class="links-list">
                     <ul>
-"""
+""")
             # Show all links in HTML
             for link in links:
                 safe_link_href = _safe_href(link)
                 escaped_link = _html.escape(str(link))
-                html += f'                        <li><a href="{safe_link_href}" target="_blank">{escaped_link}</a></li>\n'
+                out.append(f'                        <li><a href="{safe_link_href}" target="_blank">{escaped_link}</a></li>\n')
 
-            html += """
+            out.append("""
                     </ul>
                 </div>
             </div>
-"""
+""")
 
         # Add images if there are any
         images = data.get('images', [])
         if images:
-            html += f"""
+            out.append(f"""
             <div>
                 <strong>Images Found:</strong> {len(images)}
                 <div class="links-list">
@@ -470,7 +594,7 @@ def save_as_html(results, output_file, timestamp):
                             <th style="border: 1px solid #ddd; padding: 8px; text-align: left;">Alt Text</th>
                             <th style="border: 1px solid #ddd; padding: 8px; text-align: left;">Dimensions</th>
                         </tr>
-"""
+""")
             for img in images:
                 src = img.get('src', 'No source')
                 alt = img.get('alt', 'No alt text')
@@ -483,25 +607,25 @@ def save_as_html(results, output_file, timestamp):
                 escaped_dim = _html.escape(str(dimensions))
                 escaped_basename = _html.escape(str(src).split('/')[-1])
 
-                html += f"""
+                out.append(f"""
                         <tr>
                             <td style="border: 1px solid #ddd; padding: 8px;"><a href="{safe_src_href}" target="_blank">{escaped_basename}</a></td>
                             <td style="border: 1px solid #ddd; padding: 8px;">{escaped_alt}</td>
                             <td style="border: 1px solid #ddd; padding: 8px;">{escaped_dim}</td>
                         </tr>
-"""
+""")
 
-            html += """
+            out.append("""
                     </table>
                 </div>
             </div>
-"""
+""")
 
         # Add keywords if there are any
         keywords = data.get('keywords', [])
         keyword_scores = data.get('keyword_scores', {})
         if keywords:
-            html += f"""
+            out.append(f"""
             <div>
                 <strong>Keywords Found:</strong> {len(keywords)}
                 <div class="links-list">
@@ -510,117 +634,238 @@ def save_as_html(results, output_file, timestamp):
                             <th style="border: 1px solid #ddd; padding: 8px; text-align: left;">Keyword</th>
                             <th style="border: 1px solid #ddd; padding: 8px; text-align: left;">Score</th>
                         </tr>
-"""
+""")
             for keyword in keywords:
                 score = keyword_scores.get(keyword, 'N/A')
-                html += f"""
+                out.append(f"""
                         <tr>
                             <td style="border: 1px solid #ddd; padding: 8px;">{_html.escape(str(keyword))}</td>
                             <td style="border: 1px solid #ddd; padding: 8px;">{_html.escape(str(score))}</td>
                         </tr>
-"""
+""")
 
-            html += """
+            out.append("""
                     </table>
                 </div>
             </div>
-"""
+""")
 
         # Add key phrases if there are any
         keyphrases = data.get('keyphrases', [])
         if keyphrases:
-            html += f"""
+            out.append(f"""
             <div>
                 <strong>Key Phrases Found:</strong> {len(keyphrases)}
                 <div class="links-list">
                     <ul>
-"""
+""")
             for phrase in keyphrases:
-                html += f'                        <li>{_html.escape(str(phrase))}</li>\n'
+                out.append(f'                        <li>{_html.escape(str(phrase))}</li>\n')
 
-            html += """
+            out.append("""
                     </ul>
                 </div>
             </div>
-"""
+""")
 
         # Add tables if there are any
         tables = data.get('tables', [])
         if tables:
-            html += f"""
+            out.append(f"""
             <div>
                 <strong>Tables Found:</strong> {len(tables)}
                 <div class="links-list">
-"""
+""")
             for i, table in enumerate(tables):
-                html += f"""
+                out.append(f"""
                     <h4>Table {i+1}</h4>
                     <table style="width:100%; border-collapse: collapse;">
-"""
+""")
                 for row in table:
-                    html += """
+                    out.append("""
                         <tr>
-"""
+""")
                     for cell in row:
-                        html += f"""
+                        out.append(f"""
                             <td style="border: 1px solid #ddd; padding: 8px;">{_html.escape(str(cell))}</td>
-"""
-                    html += """
+""")
+                    out.append("""
                         </tr>
-"""
-                html += """
+""")
+                out.append("""
                     </table>
                     <br>
-"""
+""")
 
-            html += """
+            out.append("""
                 </div>
             </div>
-"""
+""")
         
-        html += """
+        out.append("""
         </div>
-"""
-    
-    # Close HTML structure
-    html += """
-        <footer>
-            <p>Generated by Crawlit - A Modular, Ethical Python Web Crawler</p>
-        </footer>
-    </div>
-</body>
-</html>
-"""
-    
-    # Write HTML to file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html)
+""")
+        return "".join(out)
 
 
-def generate_summary_report(results):
-    """Generate a pretty CLI summary of crawl results"""
-    success_count = sum(1 for data in results.values() if data.get('success', False))
-    failed_count = len(results) - success_count
-    link_count = sum(len(data.get('links', [])) for data in results.values())
-    
-    depths = {}
-    for data in results.values():
+    def _write_footer(self):
+        self._file.write(_HTML_FOOTER)
+        self._patch(self._total, self.count)
+        self._patch(self._successful, self.success_count)
+        self._patch(self._failed, self.count - self.success_count)
+
+
+class SummarySink(ResultSink):
+    """Accumulate the counters behind :func:`generate_summary_report`.
+
+    Keeps only totals, so it can run alongside a file sink on crawls whose
+    results are not retained.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.link_count = 0
+        self.depths = {}
+
+    def _write_entry(self, url, data):
+        self.link_count += len(data.get('links', []))
         depth = data.get('depth', 0)
-        depths[depth] = depths.get(depth, 0) + 1
+        self.depths[depth] = self.depths.get(depth, 0) + 1
+
+    def report(self):
+        """Return the summary text for everything written so far."""
+        summary = [
+            "Crawl Summary",
+            "=" * 40,
+            # Change wording to match test expectations
+            f"Total URLs crawled: {self.count}",
+            f"Successful requests: {self.success_count}",
+            f"Failed requests: {self.count - self.success_count}",
+            f"Total links discovered: {self.link_count}",
+            "",
+            "URLs by depth:",
+        ]
+
+        for depth in sorted(self.depths.keys()):
+            summary.append(f"  Depth {depth}: {self.depths[depth]} URLs")
+
+        return "\n" .join(summary)
+
+
+#: Output formats accepted by :func:`open_sink` and :func:`save_results`.
+SINKS = {
+    "json": JSONSink,
+    "jsonl": JSONLSink,
+    "csv": CSVSink,
+    "txt": TXTSink,
+    "html": HTMLSink,
+}
+
+
+def open_sink(output_format, output_file=None, pretty_json=False, timestamp=None):
+    """Open a streaming sink for *output_format* writing to *output_file*.
+
+    Args:
+        output_format (str): One of json, jsonl, csv, txt, html.
+        output_file (str, optional): Defaults to ``crawl_results.<format>``.
+        pretty_json (bool, optional): Indent JSON output.
+        timestamp (str, optional): Generation time shown in the output; defaults to now.
+
+    Returns:
+        FileSink: The open sink; call ``close()`` when the crawl is done.
+
+    Raises:
+        ValueError: If an unsupported output format is specified.
+    """
+    sink_class = SINKS.get(str(output_format).lower())
+    if sink_class is None:
+        raise ValueError(f"Unsupported output format: {output_format}")
+    if output_file is None:
+        output_file = f"crawl_results.{output_format.lower()}"
+    if sink_class is JSONSink:
+        return JSONSink(output_file, timestamp, pretty=pretty_json)
+    return sink_class(output_file, timestamp)
+
+
+def _write_all(sink, results):
+    with sink:
+        for url, data in results.items():
+            sink.write(url, data)
+
+
+def save_results(results, output_format=None, output_file=None, pretty_json=False, format_type=None, pretty=None):
+    """Save crawler results to specified file in the requested format.
+    
+    This function takes the crawler results and saves them to a file in the specified format.
+    It supports JSON, JSONL, CSV, TXT, and HTML output formats.
+    
+    Args:
+        results (dict): Crawler results dictionary containing URL data.
+        output_format (str, optional): Format to save results in (json, jsonl, csv, txt, html). 
+            If None, will use the file extension or default to JSON.
+        output_file (str, optional): Path to the output file. If None, prints to stdout.
+        pretty_json (bool, optional): Whether to format JSON with indentation. Defaults to False.
+        format_type (str, optional): Alternative name for output_format (for backward compatibility).
+        pretty (bool, optional): Alternative name for pretty_json (for backward compatibility).
+        
+    Returns:
+        bool: True if saving was successful, False otherwise.
     
-    summary = [
-        "Crawl Summary",
-        "=" * 40,
-        # Change wording to match test expectations
-        f"Total URLs crawled: {len(results)}",
-        f"Successful requests: {success_count}",
-        f"Failed requests: {failed_count}",
-        f"Total links discovered: {link_count}",
-        "",
-        "URLs by depth:",
-    ]
+    Raises:
+        ValueError: If an unsupported output format is specified.
+    pretty: Alternative name for pretty_json (for backward compatibility)
+    """
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
-    for depth in sorted(depths.keys()):
-        summary.append(f"  Depth {depth}: {depths[depth]} URLs")
+    # Handle parameter aliasing (support both format_type and output_format)
+    if format_type is not None and output_format is None:
+        output_format = format_type
     
-    return "\n" .join(summary)
\ No newline at end of file
+    # Handle pretty parameter (tests use pretty instead of pretty_json)
+    if pretty is not None and pretty_json is False:
+        pretty_json = pretty
+    
+    # Default filename if not specified
+    if output_file is None:
+        # Tests expect 'crawl_results.json' as default
+        output_file = f"crawl_results.{output_format.lower()}"
+    
+    # Stream every result through the sink for the requested format
+    # (open_sink creates the output directory)
+    sink = open_sink(output_format, output_file, pretty_json=pretty_json, timestamp=timestamp)
+    _write_all(sink, results)
+    
+    # Return the path to the file that was created
+    return output_file
+
+
+def save_as_json(results, output_file, timestamp, pretty_json=False):
+    """Save crawler results in JSON format"""
+    _write_all(JSONSink(output_file, timestamp, pretty=pretty_json), results)
+
+
+def save_as_jsonl(results, output_file, timestamp=None):
+    """Save crawler results in JSON Lines format (one object per URL)"""
+    _write_all(JSONLSink(output_file, timestamp), results)
+
+
+def save_as_csv(results, output_file, timestamp):
+    """Save crawler results in CSV format"""
+    _write_all(CSVSink(output_file, timestamp), results)
+
+
+def save_as_txt(results, output_file, timestamp):
+    """Save crawler results in plain text format"""
+    _write_all(TXTSink(output_file, timestamp), results)
+
+
+def save_as_html(results, output_file, timestamp):
+    """Save crawler results in HTML format"""
+    _write_all(HTMLSink(output_file, timestamp), results)
+
+
+def generate_summary_report(results):
+    """Generate a pretty CLI summary of crawl results"""
+    sink = SummarySink()
+    _write_all(sink, results)
+    return sink.report()
@@ -2,12 +2,20 @@
 
 from .jsonl_writer import JSONLWriter
 from .blob_store import BlobStore
+from .packed_blob_store import PackedBlobStore, read_blob
 from .edges_writer import EdgesWriter
 from .artifact_store import ArtifactStore
+from .warc_writer import WARCWriter
+from .database_pipeline import DatabasePipeline, artifact_to_result
 
 __all__ = [
     "JSONLWriter",
     "BlobStore",
+    "PackedBlobStore",
+    "read_blob",
     "EdgesWriter",
     "ArtifactStore",
+    "WARCWriter",
+    "DatabasePipeline",
+    "artifact_to_result",
 ]
@@ -11,6 +11,7 @@ downstream consumer that reads crawlit output::
         blobs/
             html/<sha[:2]>/<sha>.html   — raw HTML blobs (content-addressed)
             pdf/<sha[:2]>/<sha>.pdf     — raw PDF blobs  (content-addressed)
+            (or segments/*.seg + index.bin with ``packed_blobs=True``)
         edges.jsonl       — site-graph navigation edges (from→to per line)
 
 The layout is fixed and documented so that downstream tools (Spark jobs,
@@ -41,7 +42,14 @@ from typing import Optional, Any
 
 from ..interfaces import Pipeline
 from ..models.page_artifact import PageArtifact, CrawlJob
+from ..models.serialization import ArtifactSerializer
+from ..utils.buffered_writer import (
+    DEFAULT_BUFFER_SIZE,
+    DEFAULT_FLUSH_INTERVAL,
+    BufferedLineWriter,
+)
 from .blob_store import BlobStore
+from .packed_blob_store import PackedBlobStore
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +71,21 @@ class ArtifactStore(Pipeline):
     write_edges : bool
         Append navigation edges to ``edges.jsonl``.
         Defaults to ``True``.
+    packed_blobs : bool
+        Store blobs in compressed segment files via
+        :class:`~crawlit.pipelines.PackedBlobStore` instead of one file per
+        hash.  Defaults to ``False``.
+    flush_interval : float
+        Seconds between group flushes of ``artifacts.jsonl``, ``edges.jsonl``
+        and ``events.jsonl`` (default 1.0); ``0`` flushes every line.
+    buffer_size : int
+        Pending bytes per file that trigger an early flush (default 1 MiB).
+    fsync : str
+        ``"never"`` (default), ``"flush"`` or ``"close"``.
+    serializer : ArtifactSerializer | None
+        Encoder for ``artifacts.jsonl`` lines (default: all fields).  Use
+        ``ArtifactSerializer(skip_blob_html=True)`` to keep raw HTML only in
+        ``blobs/``.
     """
 
     #: Relative path names (public contract — do not change without a version bump)
@@ -82,26 +105,36 @@ class ArtifactStore(Pipeline):
         write_edges: bool = True,
         write_events: bool = True,
         hash_store=None,
+        packed_blobs: bool = False,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        fsync: str = "never",
+        serializer: Optional[ArtifactSerializer] = None,
     ) -> None:
         self._root = Path(store_dir)
         self._root.mkdir(parents=True, exist_ok=True)
 
         self._write_blobs = write_blobs
         self._write_edges = write_edges
+        self._serializer = serializer or ArtifactSerializer()
         self._lock = threading.Lock()
 
         # Delegate blob writing to BlobStore (single implementation)
         self._blob_store: Optional[BlobStore] = None
         if write_blobs:
-            self._blob_store = BlobStore(
+            blob_store_cls = PackedBlobStore if packed_blobs else BlobStore
+            self._blob_store = blob_store_cls(
                 self._root / self.BLOBS_DIR, hash_store=hash_store
             )
 
-        self._artifacts_fh = (self._root / self.ARTIFACTS_LOG).open(
-            "a", encoding="utf-8"
+        writer_options = dict(
+            flush_interval=flush_interval, buffer_size=buffer_size, fsync=fsync
+        )
+        self._artifacts_fh = BufferedLineWriter(
+            self._root / self.ARTIFACTS_LOG, **writer_options
         )
         self._edges_fh = (
-            (self._root / self.EDGES_LOG).open("a", encoding="utf-8")
+            BufferedLineWriter(self._root / self.EDGES_LOG, **writer_options)
             if write_edges
             else None
         )
@@ -113,6 +146,7 @@ class ArtifactStore(Pipeline):
             self.event_log = CrawlEventLog(
                 path=self._root / self.EVENTS_LOG,
                 run_id=job.run_id if job else None,
+                **writer_options,
             )
 
         if job is not None:
@@ -170,10 +204,7 @@ class ArtifactStore(Pipeline):
     # ------------------------------------------------------------------
 
     def _append_artifact(self, artifact: PageArtifact) -> None:
-        line = json.dumps(artifact.to_dict(), ensure_ascii=False)
-        with self._lock:
-            self._artifacts_fh.write(line + "\n")
-            self._artifacts_fh.flush()
+        self._artifacts_fh.write(self._serializer.dumps(artifact))
 
     def _append_edge(self, artifact: PageArtifact) -> None:
         if not artifact.crawl.discovered_from:
@@ -187,22 +218,28 @@ class ArtifactStore(Pipeline):
             "source_type": artifact.source.type,
             "site": artifact.source.site,
         }
-        line = json.dumps(edge, ensure_ascii=False)
-        with self._lock:
-            self._edges_fh.write(line + "\n")
-            self._edges_fh.flush()
+        self._edges_fh.write(json.dumps(edge, ensure_ascii=False))
 
     # ------------------------------------------------------------------
     # Cleanup
     # ------------------------------------------------------------------
 
+    def flush(self) -> None:
+        """Write buffered artifact, edge and event lines to disk now."""
+        self._artifacts_fh.flush()
+        if self._edges_fh is not None:
+            self._edges_fh.flush()
+        if self.event_log is not None:
+            self.event_log.flush()
+
     def close(self) -> None:
         """Flush and close all open file handles."""
         with self._lock:
-            if self._artifacts_fh and not self._artifacts_fh.closed:
-                self._artifacts_fh.close()
-            if self._edges_fh and not self._edges_fh.closed:
+            self._artifacts_fh.close()
+            if self._edges_fh is not None:
                 self._edges_fh.close()
+        if isinstance(self._blob_store, PackedBlobStore):
+            self._blob_store.close()
         if self.event_log is not None:
             try:
                 self.event_log.close()
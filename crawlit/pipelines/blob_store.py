@@ -51,10 +51,13 @@ class BlobStore(Pipeline):
     def __init__(self, blobs_dir, hash_store=None):
         self._root = Path(blobs_dir)
         self._root.mkdir(parents=True, exist_ok=True)
-        (self._root / "html").mkdir(exist_ok=True)
-        (self._root / "pdf").mkdir(exist_ok=True)
         self._lock = threading.Lock()
         self._hash_store = hash_store  # Optional[ContentHashStore]
+        self._init_layout()
+
+    def _init_layout(self) -> None:
+        (self._root / "html").mkdir(exist_ok=True)
+        (self._root / "pdf").mkdir(exist_ok=True)
 
     # ------------------------------------------------------------------
     # Pipeline interface
@@ -84,37 +87,21 @@ class BlobStore(Pipeline):
             logger.warning(f"BlobStore write failed ({dest}): {exc}")
             return False
 
-    def _save_html(self, artifact: PageArtifact):
-        data = artifact.content.raw_html.encode("utf-8", errors="replace")
-        sha = self._sha256_bytes(data)
-
-        # Cross-run dedup: check persistent store first
-        if self._hash_store is not None:
-            existing_path = self._hash_store.get_blob_path(artifact.content.raw_html)
-            if existing_path:
-                artifact.content.blob_path = existing_path
-                artifact.content.blob_sha256 = sha
-                return
-
-        subdir = self._root / "html" / sha[:2]
+    def _put(self, kind: str, sha: str, data: bytes) -> str:
+        """Store *data* under *sha* and return its blob path."""
+        subdir = self._root / kind / sha[:2]
         with self._lock:
             subdir.mkdir(parents=True, exist_ok=True)
-        dest = subdir / f"{sha}.html"
+        dest = subdir / f"{sha}.{kind}"
         # Content-addressed: same hash guarantees same content, so
         # unconditional write is safe and avoids TOCTOU race.
         self._write_file(dest, data)
+        return str(dest)
 
-        artifact.content.blob_path = str(dest)
-        artifact.content.blob_sha256 = sha
-
-        if self._hash_store is not None:
-            self._hash_store.update_blob_path(sha, str(dest))
-
-    def _save_pdf(self, artifact: PageArtifact):
-        # raw_html stores the original bytes encoded as latin-1 for PDFs
-        data = artifact.content.raw_html.encode("latin-1", errors="replace")
+    def _save(self, artifact: PageArtifact, kind: str, data: bytes):
         sha = self._sha256_bytes(data)
 
+        # Cross-run dedup: check persistent store first
         if self._hash_store is not None:
             existing_path = self._hash_store.get_blob_path(artifact.content.raw_html)
             if existing_path:
@@ -122,16 +109,17 @@ class BlobStore(Pipeline):
                 artifact.content.blob_sha256 = sha
                 return
 
-        subdir = self._root / "pdf" / sha[:2]
-        with self._lock:
-            subdir.mkdir(parents=True, exist_ok=True)
-        dest = subdir / f"{sha}.pdf"
-        # Content-addressed: same hash guarantees same content, so
-        # unconditional write is safe and avoids TOCTOU race.
-        self._write_file(dest, data)
+        blob_path = self._put(kind, sha, data)
 
-        artifact.content.blob_path = str(dest)
+        artifact.content.blob_path = blob_path
         artifact.content.blob_sha256 = sha
 
         if self._hash_store is not None:
-            self._hash_store.update_blob_path(sha, str(dest))
+            self._hash_store.update_blob_path(sha, blob_path)
+
+    def _save_html(self, artifact: PageArtifact):
+        self._save(artifact, "html", artifact.content.raw_html.encode("utf-8", errors="replace"))
+
+    def _save_pdf(self, artifact: PageArtifact):
+        # raw_html stores the original bytes encoded as latin-1 for PDFs
+        self._save(artifact, "pdf", artifact.content.raw_html.encode("latin-1", errors="replace"))
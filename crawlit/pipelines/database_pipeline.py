@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+database_pipeline.py - Pipeline stage: stream artifacts into a database backend.
+
+Instead of calling ``DatabaseBackend.save_results`` once the crawl is over,
+:class:`DatabasePipeline` converts each artifact to the legacy result row
+and writes rows in batches of ``batch_size`` while the crawl runs::
+
+    db = get_database_backend("sqlite", database_path="crawl.db")
+    crawler = Crawler(url, pipelines=[DatabasePipeline(db, batch_size=200)],
+                      retain_artifacts=False)
+
+The crawl row is created with the first batch and its URL counts are
+updated after every batch.  Inside a crawl the pipeline receives
+micro-batches of artifacts (it is a
+:class:`~crawlit.interfaces.BatchPipeline`) and buffers each one under a
+single lock acquisition.  The crawler flushes the pipeline when the crawl
+ends; call :meth:`DatabasePipeline.close` when using it on its own.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..interfaces import BatchPipeline
+from ..models.page_artifact import PageArtifact
+from ..utils.database import DEFAULT_BATCH_SIZE, DatabaseBackend
+
+logger = logging.getLogger(__name__)
+
+# Error codes the engines record when a fetch itself failed (including a 304
+# with nothing cached to serve); any other error leaves the page successful
+_FETCH_FAILURE_CODES = frozenset({"FETCH_ERROR", "HTTP_ERROR", "INCREMENTAL"})
+
+
+def artifact_to_result(artifact: PageArtifact, include_html: bool = True) -> Dict[str, Any]:
+    """
+    Build the legacy result dict (as stored by ``save_results``) for *artifact*.
+
+    Extractor output in ``artifact.extracted`` is merged in under its own key,
+    so ``title``, ``images`` and ``keywords`` land in their columns and the
+    rest in the backend's ``metadata`` field.  ``success`` follows the
+    engines: any 2xx response, fresh or replayed from the cache, whose fetch
+    recorded no error; extractor and pipeline errors do not clear it.
+    """
+    status = artifact.http.status
+    result: Dict[str, Any] = dict(artifact.extracted)
+    result.update(
+        status=status,
+        success=(
+            status is not None and 200 <= status < 300
+            and not any(error.code in _FETCH_FAILURE_CODES for error in artifact.errors)
+        ),
+        depth=artifact.crawl.depth,
+        content_type=artifact.http.content_type,
+        links=list(artifact.links),
+    )
+    if include_html and artifact.content.raw_html is not None:
+        result["html_content"] = artifact.content.raw_html
+    if artifact.errors:
+        result["error"] = artifact.errors[0].message
+    return result
+
+
+class DatabasePipeline(BatchPipeline):
+    """
+    Insert each :class:`~crawlit.models.PageArtifact` into *backend* in batches.
+
+    Parameters
+    ----------
+    backend : DatabaseBackend
+        Any backend from :func:`~crawlit.utils.database.get_database_backend`.
+    metadata : dict | None
+        Crawl metadata (``start_url``, ``user_agent``, ``max_depth``…) for the
+        crawl row.
+    batch_size : int
+        Rows buffered before they are written (default 500).  This is
+        independent of the engine's micro-batches, whose size is set by the
+        crawler's ``pipeline_batch_size``.
+    include_html : bool
+        Store ``content.raw_html`` in the ``html_content`` column (default ``True``).
+
+    Thread-safe: rows are buffered under a lock and written by whichever
+    worker fills the batch.
+    """
+
+    def __init__(
+        self,
+        backend: DatabaseBackend,
+        metadata: Optional[Dict[str, Any]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        include_html: bool = True,
+    ):
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        self._backend = backend
+        self._metadata = metadata
+        self._batch_size = batch_size  # private: a public batch_size would size the engine batches
+        self._include_html = include_html
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, Dict[str, Any]]] = []
+        self._crawl_id = None
+        self.total_urls = 0
+        self.successful_urls = 0
+
+    @property
+    def crawl_id(self):
+        """Id of the crawl row, or ``None`` until the first batch is written."""
+        return self._crawl_id
+
+    def _write_pending(self) -> None:
+        # Caller holds self._lock
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        if self._crawl_id is None:
+            self._crawl_id = self._backend.begin_crawl(self._metadata)
+        self._backend.insert_results(self._crawl_id, batch)
+        self.total_urls += len(batch)
+        self.successful_urls += sum(1 for _, result in batch if result["success"])
+        self._backend.update_crawl_counts(self._crawl_id, self.total_urls, self.successful_urls)
+
+    def flush(self) -> None:
+        """Write buffered rows to the database now."""
+        with self._lock:
+            try:
+                self._write_pending()
+            except Exception as exc:
+                logger.warning(f"DatabasePipeline could not write batch (rows dropped): {exc}")
+
+    def close(self) -> None:
+        """Write remaining rows.  The backend connection is left open."""
+        self.flush()
+
+    # ------------------------------------------------------------------
+    # Pipeline interface
+    # ------------------------------------------------------------------
+
+    def process(self, artifact: PageArtifact) -> Optional[PageArtifact]:
+        self.process_batch([artifact])
+        return artifact
+
+    def process_batch(self, artifacts: List[PageArtifact]) -> None:
+        rows = []
+        for artifact in artifacts:
+            try:
+                rows.append((artifact.url, artifact_to_result(artifact, self._include_html)))
+            except Exception as exc:
+                logger.warning(f"DatabasePipeline failed for {artifact.url}: {exc}")
+        try:
+            with self._lock:
+                self._pending.extend(rows)
+                if len(self._pending) >= self._batch_size:
+                    self._write_pending()
+        except Exception as exc:
+            logger.warning(f"DatabasePipeline failed for a batch of {len(rows)}: {exc}")
+        return None
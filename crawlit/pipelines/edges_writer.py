@@ -9,21 +9,28 @@ Each line records a directed (from_url → to_url) edge::
 
 These edges can be used to reconstruct the site graph, analyse crawl coverage,
 or feed graph-analysis tools.
+
+Lines are buffered and group-flushed like :class:`JSONLWriter`.
 """
 
 import json
 import logging
 import threading
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
-from ..interfaces import Pipeline
+from ..interfaces import BatchPipeline
 from ..models.page_artifact import PageArtifact
+from ..utils.buffered_writer import (
+    DEFAULT_BUFFER_SIZE,
+    DEFAULT_FLUSH_INTERVAL,
+    BufferedLineWriter,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class EdgesWriter(Pipeline):
+class EdgesWriter(BatchPipeline):
     """
     Write ``(discovered_from → url)`` navigation edges to a JSONL file.
 
@@ -36,25 +43,45 @@ class EdgesWriter(Pipeline):
         Output file path.  Parent directories are created automatically.
     append : bool
         Open in append mode (default: ``True``).
+    flush_interval, buffer_size, fsync
+        Buffering options, see :class:`JSONLWriter`.
     """
 
-    def __init__(self, path, append: bool = True):
+    def __init__(
+        self,
+        path,
+        append: bool = True,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        fsync: str = "never",
+    ):
         self._path = Path(path)
         self._append = append
+        self._writer_options = dict(
+            flush_interval=flush_interval, buffer_size=buffer_size, fsync=fsync
+        )
         self._lock = threading.Lock()
-        self._fh = None
+        self._fh: Optional[BufferedLineWriter] = None
         self._open()
 
     def _open(self):
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        mode = "a" if self._append else "w"
-        self._fh = self._path.open(mode, encoding="utf-8", buffering=1)
+        self._fh = BufferedLineWriter(self._path, append=self._append, **self._writer_options)
+
+    def _handle(self) -> BufferedLineWriter:
+        with self._lock:
+            if self._fh is None:
+                self._open()
+            return self._fh
+
+    def flush(self):
+        fh = self._fh
+        if fh is not None:
+            fh.flush()
 
     def close(self):
         with self._lock:
             if self._fh is not None:
                 try:
-                    self._fh.flush()
                     self._fh.close()
                 finally:
                     self._fh = None
@@ -65,22 +92,36 @@ class EdgesWriter(Pipeline):
         except Exception:
             pass
 
-    def process(self, artifact: PageArtifact) -> Optional[PageArtifact]:
-        if not artifact.crawl.discovered_from:
-            return artifact
-
+    @staticmethod
+    def _edge_line(artifact: PageArtifact) -> str:
         edge = {
             "from_url": artifact.crawl.discovered_from,
             "to_url": artifact.url,
             "depth": artifact.crawl.depth,
             "method": artifact.crawl.discovery_method or "link",
         }
+        return json.dumps(edge, ensure_ascii=False)
+
+    def process(self, artifact: PageArtifact) -> Optional[PageArtifact]:
+        if not artifact.crawl.discovered_from:
+            return artifact
         try:
-            line = json.dumps(edge, ensure_ascii=False)
-            with self._lock:
-                if self._fh is None:
-                    self._open()
-                self._fh.write(line + "\n")
+            self._handle().write(self._edge_line(artifact))
         except Exception as exc:
             logger.warning(f"EdgesWriter failed for {artifact.url}: {exc}")
         return artifact
+
+    def process_batch(self, artifacts: List[PageArtifact]) -> None:
+        lines = []
+        for artifact in artifacts:
+            if not artifact.crawl.discovered_from:
+                continue
+            try:
+                lines.append(self._edge_line(artifact))
+            except Exception as exc:
+                logger.warning(f"EdgesWriter failed for {artifact.url}: {exc}")
+        try:
+            self._handle().write_many(lines)
+        except Exception as exc:
+            logger.warning(f"EdgesWriter failed for a batch of {len(lines)}: {exc}")
+        return None
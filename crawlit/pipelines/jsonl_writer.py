@@ -3,25 +3,37 @@
 jsonl_writer.py - Pipeline stage: write one artifact per line to a JSONL file.
 
 Each crawled page produces a single JSON line so the output can be streamed,
-processed with ``jq``, imported into BigQuery, etc.
+processed with ``jq``, imported into BigQuery, etc.  Lines are encoded by an
+:class:`~crawlit.models.ArtifactSerializer`; pass your own to project fields,
+e.g. ``ArtifactSerializer(skip_blob_html=True)`` after a ``BlobStore``.
 
-Thread-safe: a per-instance ``threading.Lock`` serialises concurrent writes
-when the synchronous engine runs with ``max_workers > 1``.
+Lines are handed to a :class:`~crawlit.utils.buffered_writer.BufferedLineWriter`
+and written in groups by a background thread (every ``flush_interval``
+seconds); ``close()`` and the end of a crawl flush everything.  Pass
+``flush_interval=0`` to write and flush each line immediately.
+
+The writer is a :class:`~crawlit.interfaces.BatchPipeline`: inside a crawl
+it receives micro-batches and queues each batch's lines in one call.
 """
 
-import json
 import logging
 import threading
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
-from ..interfaces import Pipeline
+from ..interfaces import BatchPipeline
 from ..models.page_artifact import PageArtifact
+from ..models.serialization import ArtifactSerializer
+from ..utils.buffered_writer import (
+    DEFAULT_BUFFER_SIZE,
+    DEFAULT_FLUSH_INTERVAL,
+    BufferedLineWriter,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class JSONLWriter(Pipeline):
+class JSONLWriter(BatchPipeline):
     """
     Write each :class:`~crawlit.models.PageArtifact` as a JSON line to *path*.
 
@@ -32,13 +44,33 @@ class JSONLWriter(Pipeline):
     append : bool
         If ``True`` (default) open in append mode so that resuming a crawl
         does not overwrite previous output.
+    flush_interval : float
+        Seconds between group flushes (default 1.0); ``0`` flushes every line.
+    buffer_size : int
+        Pending bytes that trigger an early flush (default 1 MiB).
+    fsync : str
+        ``"never"`` (default), ``"flush"`` or ``"close"``.
+    serializer : ArtifactSerializer | None
+        Encoder for each line (default: all fields, fastest available backend).
     """
 
-    def __init__(self, path, append: bool = True):
+    def __init__(
+        self,
+        path,
+        append: bool = True,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        fsync: str = "never",
+        serializer: Optional[ArtifactSerializer] = None,
+    ):
         self._path = Path(path)
+        self._serializer = serializer or ArtifactSerializer()
         self._append = append
+        self._writer_options = dict(
+            flush_interval=flush_interval, buffer_size=buffer_size, fsync=fsync
+        )
         self._lock = threading.Lock()
-        self._fh = None
+        self._fh: Optional[BufferedLineWriter] = None
         self._open()
 
     # ------------------------------------------------------------------
@@ -46,17 +78,26 @@ class JSONLWriter(Pipeline):
     # ------------------------------------------------------------------
 
     def _open(self):
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        mode = "a" if self._append else "w"
-        self._fh = self._path.open(mode, encoding="utf-8", buffering=1)
-        logger.debug(f"JSONLWriter opened {self._path} (mode={mode!r})")
+        self._fh = BufferedLineWriter(self._path, append=self._append, **self._writer_options)
+        logger.debug(f"JSONLWriter opened {self._path} (append={self._append})")
+
+    def _handle(self) -> BufferedLineWriter:
+        with self._lock:
+            if self._fh is None:
+                self._open()
+            return self._fh
+
+    def flush(self):
+        """Write buffered lines to disk now."""
+        fh = self._fh
+        if fh is not None:
+            fh.flush()
 
     def close(self):
         """Flush and close the underlying file handle."""
         with self._lock:
             if self._fh is not None:
                 try:
-                    self._fh.flush()
                     self._fh.close()
                 finally:
                     self._fh = None
@@ -73,11 +114,20 @@ class JSONLWriter(Pipeline):
 
     def process(self, artifact: PageArtifact) -> Optional[PageArtifact]:
         try:
-            line = json.dumps(artifact.to_dict(), ensure_ascii=False, default=str)
-            with self._lock:
-                if self._fh is None:
-                    self._open()
-                self._fh.write(line + "\n")
+            self._handle().write(self._serializer.dumps(artifact))
         except Exception as exc:
             logger.warning(f"JSONLWriter failed for {artifact.url}: {exc}")
         return artifact
+
+    def process_batch(self, artifacts: List[PageArtifact]) -> None:
+        lines = []
+        for artifact in artifacts:
+            try:
+                lines.append(self._serializer.dumps(artifact))
+            except Exception as exc:
+                logger.warning(f"JSONLWriter failed for {artifact.url}: {exc}")
+        try:
+            self._handle().write_many(lines)
+        except Exception as exc:
+            logger.warning(f"JSONLWriter failed for a batch of {len(lines)}: {exc}")
+        return None
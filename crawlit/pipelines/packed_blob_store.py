@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+packed_blob_store.py - Pipeline stage: content-addressed blobs packed into segments.
+
+A drop-in alternative to :class:`~crawlit.pipelines.BlobStore` for large
+crawls.  Instead of one file per hash, compressed blobs are appended to a
+small number of large segment files and located through an offset index::
+
+    <blobs_dir>/segments/blobs-00000.seg
+    <blobs_dir>/segments/blobs-00001.seg    # after rotation
+    <blobs_dir>/index.bin                   # sha256 -> segment, offset, length
+
+Every segment record is self-describing (magic, kind, codec, SHA-256 and
+payload length precede the payload), so ``index.bin`` can always be rebuilt
+from the segments; on open, records written after the last index entry (e.g.
+after a crash) are re-indexed automatically.
+
+``content.blob_path`` is set to a locator of the form
+``<segment path>#<offset>:<length>``; :func:`read_blob` resolves both these
+locators and the plain file paths written by :class:`BlobStore`.  Reads go
+through read-only memory maps of the segment files.
+
+Content-addressed semantics and the
+:class:`~crawlit.utils.content_hash_store.ContentHashStore` integration are
+identical to :class:`BlobStore`: a blob whose hash is already stored is never
+written twice.
+
+Thread-safe: a per-instance ``threading.Lock`` serialises appends and index
+updates.
+"""
+
+import logging
+import mmap
+import struct
+import zlib
+from pathlib import Path
+from typing import Dict, Iterator, NamedTuple, Optional, Tuple
+
+try:
+    import zstandard
+    _ZSTD_AVAILABLE = True
+except ImportError:
+    _ZSTD_AVAILABLE = False
+
+from .blob_store import BlobStore
+
+logger = logging.getLogger(__name__)
+
+_RECORD_MAGIC = b"CLB1"
+# magic, kind, codec, sha256 digest, payload length
+_RECORD_HEADER = struct.Struct(">4sBB32sI")
+# sha256 digest, segment number, payload offset, payload length, kind, codec
+_INDEX_ENTRY = struct.Struct(">32sIQIBB")
+
+_KINDS = {"html": 1, "pdf": 2}
+_KIND_NAMES = {code: name for name, code in _KINDS.items()}
+
+_CODEC_NONE = 0
+_CODEC_ZLIB = 1
+_CODEC_ZSTD = 2
+_CODECS = {None: _CODEC_NONE, "zlib": _CODEC_ZLIB, "zstd": _CODEC_ZSTD}
+
+_SEGMENT_DIR = "segments"
+_INDEX_NAME = "index.bin"
+
+
+class BlobLocation(NamedTuple):
+    """Position of one blob payload inside a segment file."""
+
+    segment: int
+    offset: int
+    length: int
+    kind: str
+    codec: int
+
+
+def _decompress(codec: int, payload: bytes) -> bytes:
+    if codec == _CODEC_NONE:
+        return payload
+    if codec == _CODEC_ZLIB:
+        return zlib.decompress(payload)
+    if codec == _CODEC_ZSTD:
+        if not _ZSTD_AVAILABLE:
+            raise RuntimeError("zstandard is required to read zstd-compressed blobs")
+        return zstandard.ZstdDecompressor().decompress(payload)
+    raise ValueError(f"Unknown blob codec {codec}")
+
+
+def _parse_locator(blob_path: str) -> Optional[Tuple[Path, int, int]]:
+    path, sep, position = blob_path.rpartition("#")
+    if not sep:
+        return None
+    offset, _, length = position.partition(":")
+    try:
+        return Path(path), int(offset), int(length)
+    except ValueError:
+        return None
+
+
+def read_blob(blob_path: str) -> bytes:
+    """
+    Return the (decompressed) bytes referenced by a ``content.blob_path``.
+
+    Accepts packed locators written by :class:`PackedBlobStore` as well as
+    plain file paths written by :class:`BlobStore`.
+    """
+    located = _parse_locator(blob_path)
+    if located is None:
+        return Path(blob_path).read_bytes()
+    path, offset, length = located
+    header_at = offset - _RECORD_HEADER.size
+    if header_at < 0:
+        raise ValueError(f"Invalid blob locator: {blob_path}")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        magic, _, codec, _, stored_length = _RECORD_HEADER.unpack_from(view, header_at)
+        if magic != _RECORD_MAGIC or stored_length != length:
+            raise ValueError(f"No blob record at {blob_path}")
+        return _decompress(codec, view[offset:offset + length])
+
+
+class PackedBlobStore(BlobStore):
+    """
+    Persist raw page content to compressed, append-only segment files.
+
+    Parameters
+    ----------
+    blobs_dir : str | Path
+        Root directory for segments and the index.  Created automatically.
+    hash_store : ContentHashStore | None
+        Optional persistent hash store for cross-run deduplication (see
+        :class:`BlobStore`).
+    max_segment_size : int
+        Start a new segment once the current one reaches this many bytes
+        (default 256 MiB).
+    compression : str | None
+        ``'zlib'`` (default), ``'zstd'`` (requires the ``zstandard``
+        package, falls back to zlib) or ``None``.  Blobs that do not shrink
+        (e.g. most PDFs) are stored uncompressed regardless.
+    compression_level : int
+        Compression level passed to the codec (default 6).
+    """
+
+    def __init__(
+        self,
+        blobs_dir,
+        hash_store=None,
+        max_segment_size: int = 256 * 1024 * 1024,
+        compression: Optional[str] = "zlib",
+        compression_level: int = 6,
+    ):
+        if compression not in _CODECS:
+            raise ValueError(f"compression must be 'zlib', 'zstd' or None, got {compression!r}")
+        if compression == "zstd" and not _ZSTD_AVAILABLE:
+            logger.warning("zstandard not installed; falling back to zlib blob compression")
+            compression = "zlib"
+        self._max_segment_size = max_segment_size
+        self._compression = compression
+        self._compression_level = compression_level
+        self._index: Dict[bytes, BlobLocation] = {}
+        self._maps: Dict[int, mmap.mmap] = {}
+        self._segment = 0
+        self._segment_fh = None
+        self._segment_size = 0
+        self._index_fh = None
+        super().__init__(blobs_dir, hash_store=hash_store)
+
+    # ------------------------------------------------------------------
+    # Layout / recovery
+    # ------------------------------------------------------------------
+
+    def _init_layout(self) -> None:
+        self._segment_dir = self._root / _SEGMENT_DIR
+        self._segment_dir.mkdir(exist_ok=True)
+        self._index_path = self._root / _INDEX_NAME
+
+        segments = sorted(
+            int(p.stem.rpartition("-")[2]) for p in self._segment_dir.glob("blobs-*.seg")
+        )
+        rebuild = bool(segments) and not self._index_path.exists()
+        if self._index_path.exists():
+            self._load_index()
+        self._index_fh = self._index_path.open("ab")
+        if rebuild:
+            logger.info(f"PackedBlobStore: rebuilding missing index for {self._root}")
+            for segment in segments:
+                self._recover_segment(segment, 0)
+        elif segments:
+            # Only the newest segment can hold records written after the last
+            # index entry; anything past that is re-indexed from the segment.
+            indexed_end = max(
+                (loc.offset + loc.length for loc in self._index.values()
+                 if loc.segment == segments[-1]),
+                default=0,
+            )
+            self._recover_segment(segments[-1], indexed_end)
+        self._index_fh.flush()
+
+        self._segment = segments[-1] if segments else 0
+        self._open_segment(self._segment)
+
+    def _load_index(self) -> None:
+        data = self._index_path.read_bytes()
+        usable = len(data) - len(data) % _INDEX_ENTRY.size
+        if usable != len(data):
+            logger.warning(f"PackedBlobStore: truncating partial entry in {self._index_path}")
+            with self._index_path.open("r+b") as fh:
+                fh.truncate(usable)
+        for digest, segment, offset, length, kind, codec in _INDEX_ENTRY.iter_unpack(data[:usable]):
+            self._index[digest] = BlobLocation(segment, offset, length, _KIND_NAMES.get(kind, "html"), codec)
+
+    def _iter_segment(self, segment: int, start: int) -> Iterator[Tuple[int, bytes, BlobLocation]]:
+        """Yield (record end, digest, location) for intact records from *start*."""
+        path = self._segment_path(segment)
+        size = path.stat().st_size
+        if size <= start:
+            return
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            pos = start
+            while pos + _RECORD_HEADER.size <= size:
+                magic, kind, codec, digest, length = _RECORD_HEADER.unpack_from(view, pos)
+                payload_at = pos + _RECORD_HEADER.size
+                if magic != _RECORD_MAGIC or payload_at + length > size:
+                    break
+                pos = payload_at + length
+                yield pos, digest, BlobLocation(segment, payload_at, length, _KIND_NAMES.get(kind, "html"), codec)
+
+    def _recover_segment(self, segment: int, start: int) -> None:
+        end = start
+        recovered = 0
+        for end, digest, location in self._iter_segment(segment, start):
+            if digest not in self._index:
+                self._index[digest] = location
+                self._write_index_entry(digest, location)
+                recovered += 1
+        path = self._segment_path(segment)
+        if path.stat().st_size > max(end, start):
+            logger.warning(f"PackedBlobStore: truncating incomplete record at {path}@{end}")
+            with path.open("r+b") as fh:
+                fh.truncate(max(end, start))
+        if recovered and start:
+            logger.info(f"PackedBlobStore: re-indexed {recovered} blob(s) from {path.name}")
+
+    def _segment_path(self, segment: int) -> Path:
+        return self._segment_dir / f"blobs-{segment:05d}.seg"
+
+    def _open_segment(self, segment: int) -> None:
+        if self._segment_fh is not None:
+            self._segment_fh.close()
+        self._segment = segment
+        self._segment_fh = self._segment_path(segment).open("ab")
+        self._segment_size = self._segment_fh.tell()
+
+    def _write_index_entry(self, digest: bytes, location: BlobLocation) -> None:
+        self._index_fh.write(_INDEX_ENTRY.pack(
+            digest, location.segment, location.offset, location.length,
+            _KINDS.get(location.kind, 1), location.codec,
+        ))
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _compress(self, data: bytes) -> Tuple[int, bytes]:
+        if self._compression == "zlib":
+            payload = zlib.compress(data, self._compression_level)
+        elif self._compression == "zstd":
+            payload = zstandard.ZstdCompressor(level=self._compression_level).compress(data)
+        else:
+            return _CODEC_NONE, data
+        if len(payload) >= len(data):
+            return _CODEC_NONE, data
+        return _CODECS[self._compression], payload
+
+    def _locator(self, location: BlobLocation) -> str:
+        return f"{self._segment_path(location.segment)}#{location.offset}:{location.length}"
+
+    def _put(self, kind: str, sha: str, data: bytes) -> str:
+        digest = bytes.fromhex(sha)
+        with self._lock:
+            location = self._index.get(digest)
+            if location is not None:
+                return self._locator(location)
+
+        # Compress outside the lock; a concurrent duplicate is resolved below
+        codec, payload = self._compress(data)
+        header = _RECORD_HEADER.pack(_RECORD_MAGIC, _KINDS[kind], codec, digest, len(payload))
+
+        with self._lock:
+            location = self._index.get(digest)
+            if location is not None:
+                return self._locator(location)
+            if self._segment_size and self._segment_size >= self._max_segment_size:
+                self._open_segment(self._segment + 1)
+            location = BlobLocation(
+                self._segment, self._segment_size + len(header), len(payload), kind, codec
+            )
+            try:
+                self._segment_fh.write(header)
+                self._segment_fh.write(payload)
+                self._segment_fh.flush()
+            except Exception as exc:
+                logger.warning(f"PackedBlobStore write failed ({self._segment_path(self._segment)}): {exc}")
+                self._segment_fh.seek(0, 2)
+                self._segment_fh.truncate(self._segment_size)
+                raise
+            self._segment_size += len(header) + len(payload)
+            self._write_index_entry(digest, location)
+            self._index_fh.flush()
+            self._index[digest] = location
+        return self._locator(location)
+
+    def _view(self, segment: int, end: int) -> mmap.mmap:
+        """Return a read-only map of *segment* covering at least *end* bytes."""
+        view = self._maps.get(segment)
+        if view is None or len(view) < end:
+            if view is not None:
+                view.close()
+            with self._segment_path(segment).open("rb") as f:
+                view = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[segment] = view
+        return view
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, sha: str) -> bool:
+        try:
+            return bytes.fromhex(sha) in self._index
+        except ValueError:
+            return False
+
+    def locate(self, sha: str) -> Optional[BlobLocation]:
+        """Return the :class:`BlobLocation` for the SHA-256 hex digest *sha*."""
+        try:
+            return self._index.get(bytes.fromhex(sha))
+        except ValueError:
+            return None
+
+    def get(self, sha: str) -> Optional[bytes]:
+        """Return the stored bytes for the SHA-256 hex digest *sha*, or ``None``."""
+        location = self.locate(sha)
+        if location is None:
+            return None
+        with self._lock:
+            view = self._view(location.segment, location.offset + location.length)
+            payload = view[location.offset:location.offset + location.length]
+        return _decompress(location.codec, payload)
+
+    def close(self) -> None:
+        """Flush and close the active segment, the index and all read maps."""
+        with self._lock:
+            for view in self._maps.values():
+                view.close()
+            self._maps.clear()
+            for attr in ("_segment_fh", "_index_fh"):
+                fh = getattr(self, attr, None)
+                if fh is not None:
+                    try:
+                        fh.flush()
+                        fh.close()
+                    finally:
+                        setattr(self, attr, None)
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
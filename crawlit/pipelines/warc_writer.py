@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+warc_writer.py - Pipeline stage: archive responses as WARC files.
+
+Every fetched page becomes a ``request``, a ``response`` and (optionally) a
+``metadata`` record, each compressed as its own gzip member::
+
+    <warc_dir>/crawlit-20240101120000-00000.warc.gz
+    <warc_dir>/crawlit-20240101120000-00001.warc.gz   # after rotation
+    <warc_dir>/index.cdxj
+
+Files are rotated once they reach ``max_file_size`` bytes.  ``index.cdxj``
+receives one line per response record (``<url> <timestamp> {json}`` with the
+file name, offset and length), which lets
+:class:`~crawlit.fetchers.WARCFetcher` replay an archive without scanning it.
+
+Bodies are archived as decoded by the crawler (``Content-Encoding`` and
+``Transfer-Encoding`` are removed and ``Content-Length`` is rewritten), so
+records are self-consistent but not byte-identical to the wire format.
+
+Thread-safe: a per-instance ``threading.Lock`` serialises concurrent writes
+when the synchronous engine runs with ``max_workers > 1``.
+"""
+
+import codecs
+import gzip
+import json
+import logging
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .. import __version__
+from ..interfaces import Pipeline
+from ..models.page_artifact import PageArtifact
+from ..models.serialization import ArtifactSerializer
+from ..utils.warc import (
+    WARC_INDEX_NAME,
+    build_http_request_block,
+    build_http_response_block,
+    build_warc_record,
+    warc_date,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _charset(content_type: str) -> Optional[str]:
+    for param in content_type.split(';')[1:]:
+        name, _, value = param.partition('=')
+        if name.strip().lower() == 'charset':
+            return value.strip().strip('"\'') or None
+    return None
+
+
+class WARCWriter(Pipeline):
+    """
+    Write each :class:`~crawlit.models.PageArtifact` to rotating WARC files.
+
+    Parameters
+    ----------
+    warc_dir : str | Path
+        Output directory.  Created automatically.
+    prefix : str
+        File name prefix (default ``"crawlit"``).
+    max_file_size : int
+        Rotate to a new file once the current one reaches this many bytes
+        (default 1 GiB).
+    write_request_records : bool
+        Also write a ``request`` record per page (default ``True``).
+    write_metadata_records : bool
+        Also write a ``metadata`` record with the artifact's crawl metadata,
+        links and extractor output as JSON (default ``True``).
+    request_headers : dict | None
+        Headers recorded in ``request`` records besides ``Host`` (e.g. the
+        crawler's ``User-Agent``).
+    compress_level : int
+        gzip compression level for each record (default 6).
+    """
+
+    def __init__(
+        self,
+        warc_dir,
+        prefix: str = "crawlit",
+        max_file_size: int = 1024 ** 3,
+        write_request_records: bool = True,
+        write_metadata_records: bool = True,
+        request_headers: Optional[Dict[str, str]] = None,
+        compress_level: int = 6,
+    ):
+        self._root = Path(warc_dir)
+        self._root.mkdir(parents=True, exist_ok=True)
+        self._prefix = prefix
+        self._max_file_size = max_file_size
+        self._write_requests = write_request_records
+        self._write_metadata = write_metadata_records
+        self._request_headers = dict(request_headers or {})
+        self._compress_level = compress_level
+        self._metadata_serializer = ArtifactSerializer(exclude=["content.raw_html"])
+        self._lock = threading.Lock()
+        self._session = datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')
+        self._serial = 0
+        self._fh = None
+        self._path: Optional[Path] = None
+        self._size = 0
+        self._index_fh = None
+        self.records_written = 0
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    @property
+    def current_path(self) -> Optional[Path]:
+        """Path of the WARC file currently being written (``None`` before the first record)."""
+        return self._path
+
+    def _open_next(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+        self._path = self._root / f"{self._prefix}-{self._session}-{self._serial:05d}.warc.gz"
+        self._serial += 1
+        self._fh = self._path.open("ab")
+        self._size = self._fh.tell()
+        if self._index_fh is None:
+            self._index_fh = (self._root / WARC_INDEX_NAME).open("a", encoding="utf-8")
+        info = (
+            f"software: crawlit/{__version__}\r\n"
+            "format: WARC File Format 1.1\r\n"
+        ).encode("utf-8")
+        _, record = build_warc_record(
+            "warcinfo", info, content_type="application/warc-fields",
+            extra_headers={"WARC-Filename": self._path.name},
+        )
+        self._append(record)
+        logger.debug(f"WARCWriter opened {self._path}")
+
+    def _append(self, record: bytes) -> Tuple[int, int]:
+        data = gzip.compress(record, compresslevel=self._compress_level)
+        offset = self._size
+        self._fh.write(data)
+        self._size += len(data)
+        return offset, len(data)
+
+    def _encode_body(self, artifact: PageArtifact, content_type: str) -> Tuple[bytes, str]:
+        raw = artifact.content.raw_html
+        if "application/pdf" in content_type.lower():
+            # raw_html stores the original bytes encoded as latin-1 for PDFs
+            return raw.encode("latin-1", errors="replace"), content_type
+        charset = _charset(content_type)
+        if charset:
+            try:
+                codecs.lookup(charset)
+                return raw.encode(charset), content_type
+            except (LookupError, UnicodeEncodeError):
+                pass
+        body = raw.encode("utf-8", errors="replace")
+        if charset:
+            content_type = content_type.split(';')[0].strip() + "; charset=utf-8"
+        return body, content_type
+
+    def _metadata_block(self, artifact: PageArtifact) -> bytes:
+        return self._metadata_serializer.dumps(artifact)
+
+    def close(self):
+        """Flush and close the current WARC file and the index."""
+        with self._lock:
+            for attr in ("_fh", "_index_fh"):
+                fh = getattr(self, attr)
+                if fh is not None:
+                    try:
+                        fh.flush()
+                        fh.close()
+                    finally:
+                        setattr(self, attr, None)
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    # ------------------------------------------------------------------
+    # Pipeline interface
+    # ------------------------------------------------------------------
+
+    def process(self, artifact: PageArtifact) -> Optional[PageArtifact]:
+        if not artifact.http.status or artifact.content.raw_html is None:
+            return artifact
+        try:
+            self._write(artifact)
+        except Exception as exc:
+            logger.warning(f"WARCWriter failed for {artifact.url}: {exc}")
+        return artifact
+
+    def _write(self, artifact: PageArtifact) -> None:
+        url = artifact.url
+        date = warc_date(artifact.fetched_at)
+        headers = dict(artifact.http.headers or {})
+        content_type = artifact.http.content_type or next(
+            (v for k, v in headers.items() if k.lower() == "content-type"), ""
+        )
+        body, stored_content_type = self._encode_body(artifact, content_type)
+        if stored_content_type != content_type:
+            headers = {k: v for k, v in headers.items() if k.lower() != "content-type"}
+            headers["Content-Type"] = stored_content_type
+        elif content_type and not any(k.lower() == "content-type" for k in headers):
+            headers["Content-Type"] = content_type
+
+        response_block = build_http_response_block(artifact.http.status, headers, body)
+        response_id, response_record = build_warc_record(
+            "response", response_block, target_uri=url,
+            content_type="application/http;msgtype=response", date=date,
+        )
+        records = [response_record]
+        if self._write_requests:
+            parts = urlsplit(url)
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+            request_block = build_http_request_block(
+                "GET", path, {"Host": parts.netloc, **self._request_headers}
+            )
+            records.append(build_warc_record(
+                "request", request_block, target_uri=url,
+                content_type="application/http;msgtype=request", date=date,
+                extra_headers={"WARC-Concurrent-To": response_id},
+            )[1])
+        if self._write_metadata:
+            records.append(build_warc_record(
+                "metadata", self._metadata_block(artifact), target_uri=url,
+                content_type="application/json", date=date,
+                extra_headers={"WARC-Concurrent-To": response_id},
+            )[1])
+
+        with self._lock:
+            if self._fh is None or self._size >= self._max_file_size:
+                self._open_next()
+            offset, length = self._append(records[0])
+            for record in records[1:]:
+                self._append(record)
+            self._fh.flush()
+            entry = {
+                "url": url,
+                "filename": self._path.name,
+                "offset": offset,
+                "length": length,
+                "status": artifact.http.status,
+                "mime": content_type.split(";")[0].strip() or None,
+            }
+            self._index_fh.write(
+                f"{url} {date.replace('-', '').replace(':', '').replace('T', '').rstrip('Z')} "
+                f"{json.dumps(entry, ensure_ascii=False)}\n"
+            )
+            self._index_fh.flush()
+            self.records_written += 1
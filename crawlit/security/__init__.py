@@ -3,7 +3,8 @@
 Security features for crawlit
 
 Provides CSRF token handling, security headers analysis, WAF detection,
-and honeypot detection for secure web crawling.
+honeypot detection, and a single-pass scanner combining them for secure
+web crawling.
 """
 
 from .csrf import (
@@ -34,6 +35,12 @@ from .captcha_detector import (
     detect_captcha
 )
 
+from .scanner import (
+    SecurityScanner,
+    SecurityScanResult,
+    scan_security
+)
+
 __all__ = [
     # CSRF handling
     'CSRFTokenExtractor',
@@ -57,5 +64,10 @@ __all__ = [
     'CaptchaDetector',
     'CaptchaType',
     'detect_captcha',
+    
+    # Single-pass scanning
+    'SecurityScanner',
+    'SecurityScanResult',
+    'scan_security',
 ]
 
@@ -7,7 +7,7 @@ Detects common CAPTCHA providers and challenges in web pages.
 
 import logging
 import re
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Set
 from enum import Enum
 from bs4 import BeautifulSoup
 
@@ -85,6 +85,23 @@ class CaptchaDetector:
         'access denied'
     ]
     
+    # Provider pattern groups, keyed by the name used in detection results
+    PROVIDER_PATTERNS = {
+        'recaptcha': RECAPTCHA_PATTERNS,
+        'hcaptcha': HCAPTCHA_PATTERNS,
+        'cloudflare': CLOUDFLARE_PATTERNS,
+        'funcaptcha': FUNCAPTCHA_PATTERNS,
+        'geetest': GEETEST_PATTERNS,
+    }
+    
+    # Literal markers that refine the provider into a specific CAPTCHA type
+    PROVIDER_MARKERS = [
+        'recaptcha/api.js',
+        'recaptcha/enterprise.js',
+        'grecaptcha.execute',
+        'cf-turnstile',
+    ]
+    
     def __init__(self, on_captcha_detected: Optional[Callable[[Dict[str, Any]], None]] = None):
         """
         Initialize the CAPTCHA detector.
@@ -112,16 +129,8 @@ class CaptchaDetector:
                 - indicators: List of specific indicators found
                 - url: The URL analyzed
         """
-        result = {
-            'detected': False,
-            'captcha_types': [],
-            'confidence': 0.0,
-            'indicators': [],
-            'url': url
-        }
-        
         if not html_content:
-            return result
+            return self._build_result(url, set(), set(), [], [], [])
         
         # Convert to lowercase for case-insensitive matching
         html_lower = html_content.lower()
@@ -133,15 +142,58 @@ class CaptchaDetector:
             logger.warning(f"Failed to parse HTML for CAPTCHA detection: {e}")
             soup = None
         
+        providers = {
+            provider for provider, patterns in self.PROVIDER_PATTERNS.items()
+            if self._check_patterns(html_lower, patterns)
+        }
+        markers = {marker for marker in self.PROVIDER_MARKERS if marker in html_lower}
+        keyword_matches = [
+            keyword for keyword in self.GENERIC_CAPTCHA_KEYWORDS if keyword in html_lower
+        ]
+        captcha_images = self._detect_captcha_images(soup) if soup else []
+        captcha_iframes = self._detect_captcha_iframes(soup) if soup else []
+        
+        result = self._build_result(
+            url, providers, markers, keyword_matches, captcha_images, captcha_iframes
+        )
+        self._record_detection(result)
+        return result
+    
+    @staticmethod
+    def _build_result(url: str, providers: Set[str], markers: Set[str],
+                      keyword_matches: List[str], captcha_images: List[str],
+                      captcha_iframes: List[str]) -> Dict[str, Any]:
+        """
+        Turn raw signals into a detection result dict.
+        
+        Args:
+            url: URL of the page
+            providers: Keys of PROVIDER_PATTERNS that matched the page
+            markers: Entries of PROVIDER_MARKERS present in the page
+            keyword_matches: Generic CAPTCHA keywords present, in keyword order
+            captcha_images: Sources of CAPTCHA-like images
+            captcha_iframes: Sources of CAPTCHA-like iframes
+            
+        Returns:
+            Dictionary with detection results (see :meth:`detect`)
+        """
+        result = {
+            'detected': False,
+            'captcha_types': [],
+            'confidence': 0.0,
+            'indicators': [],
+            'url': url
+        }
+        
         indicators = []
         captcha_types = set()
         
         # Check for reCAPTCHA
-        if self._check_patterns(html_lower, self.RECAPTCHA_PATTERNS):
-            if 'recaptcha/api.js' in html_lower or 'recaptcha/enterprise.js' in html_lower:
+        if 'recaptcha' in providers:
+            if 'recaptcha/api.js' in markers or 'recaptcha/enterprise.js' in markers:
                 captcha_types.add(CaptchaType.RECAPTCHA_V2)
                 indicators.append("reCAPTCHA v2 script detected")
-            elif 'grecaptcha.execute' in html_lower:
+            elif 'grecaptcha.execute' in markers:
                 captcha_types.add(CaptchaType.RECAPTCHA_V3)
                 indicators.append("reCAPTCHA v3 detected")
             else:
@@ -149,13 +201,13 @@ class CaptchaDetector:
                 indicators.append("reCAPTCHA detected")
         
         # Check for hCaptcha
-        if self._check_patterns(html_lower, self.HCAPTCHA_PATTERNS):
+        if 'hcaptcha' in providers:
             captcha_types.add(CaptchaType.HCAPTCHA)
             indicators.append("hCaptcha detected")
         
         # Check for Cloudflare
-        if self._check_patterns(html_lower, self.CLOUDFLARE_PATTERNS):
-            if 'cf-turnstile' in html_lower:
+        if 'cloudflare' in providers:
+            if 'cf-turnstile' in markers:
                 captcha_types.add(CaptchaType.CLOUDFLARE_TURNSTILE)
                 indicators.append("Cloudflare Turnstile detected")
             else:
@@ -163,38 +215,29 @@ class CaptchaDetector:
                 indicators.append("Cloudflare Challenge detected")
         
         # Check for FunCaptcha
-        if self._check_patterns(html_lower, self.FUNCAPTCHA_PATTERNS):
+        if 'funcaptcha' in providers:
             captcha_types.add(CaptchaType.FUNCAPTCHA)
             indicators.append("FunCaptcha detected")
         
         # Check for GeeTest
-        if self._check_patterns(html_lower, self.GEETEST_PATTERNS):
+        if 'geetest' in providers:
             captcha_types.add(CaptchaType.GEETEST)
             indicators.append("GeeTest CAPTCHA detected")
         
         # Check for CAPTCHA images
-        if soup:
-            captcha_images = self._detect_captcha_images(soup)
-            if captcha_images:
-                captcha_types.add(CaptchaType.SIMPLE_CAPTCHA)
-                indicators.append(f"CAPTCHA image(s) detected: {len(captcha_images)}")
+        if captcha_images:
+            captcha_types.add(CaptchaType.SIMPLE_CAPTCHA)
+            indicators.append(f"CAPTCHA image(s) detected: {len(captcha_images)}")
         
         # Check for generic CAPTCHA keywords
-        keyword_matches = []
-        for keyword in self.GENERIC_CAPTCHA_KEYWORDS:
-            if keyword in html_lower:
-                keyword_matches.append(keyword)
-        
         if keyword_matches:
             indicators.append(f"CAPTCHA keywords detected: {', '.join(keyword_matches[:3])}")
             if not captcha_types:
                 captcha_types.add(CaptchaType.CUSTOM_CAPTCHA)
         
         # Check for CAPTCHA iframes
-        if soup:
-            captcha_iframes = self._detect_captcha_iframes(soup)
-            if captcha_iframes:
-                indicators.append(f"CAPTCHA iframe(s) detected: {len(captcha_iframes)}")
+        if captcha_iframes:
+            indicators.append(f"CAPTCHA iframe(s) detected: {len(captcha_iframes)}")
         
         # Calculate confidence based on number of indicators
         if captcha_types:
@@ -204,19 +247,24 @@ class CaptchaDetector:
             
             # Higher confidence with more indicators
             result['confidence'] = min(1.0, len(indicators) * 0.25)
-            
-            logger.info(f"CAPTCHA detected on {url}: {result['captcha_types']}")
-            self._detection_count += 1
-            
-            # Trigger callback if provided
-            if self.on_captcha_detected:
-                try:
-                    self.on_captcha_detected(result)
-                except Exception as e:
-                    logger.error(f"Error in CAPTCHA callback: {e}")
         
         return result
     
+    def _record_detection(self, result: Dict[str, Any]) -> None:
+        """Count a positive detection and fire the callback, if any."""
+        if not result['detected']:
+            return
+        
+        logger.info(f"CAPTCHA detected on {result['url']}: {result['captcha_types']}")
+        self._detection_count += 1
+        
+        # Trigger callback if provided
+        if self.on_captcha_detected:
+            try:
+                self.on_captcha_detected(result)
+            except Exception as e:
+                logger.error(f"Error in CAPTCHA callback: {e}")
+    
     def _check_patterns(self, text: str, patterns: List[str]) -> bool:
         """
         Check if any pattern matches the text.
@@ -247,13 +295,7 @@ class CaptchaDetector:
         
         # Look for images with CAPTCHA-related attributes
         for img in soup.find_all('img'):
-            src = img.get('src', '').lower()
-            alt = img.get('alt', '').lower()
-            img_id = img.get('id', '').lower()
-            img_class = ' '.join(img.get('class', [])).lower()
-            
-            if any(keyword in src or keyword in alt or keyword in img_id or keyword in img_class 
-                   for keyword in ['captcha', 'challenge', 'verify']):
+            if self._is_captcha_image(img):
                 captcha_images.append(img.get('src', ''))
         
         return captcha_images
@@ -272,17 +314,33 @@ class CaptchaDetector:
         
         # Look for iframes with CAPTCHA-related attributes
         for iframe in soup.find_all('iframe'):
-            src = iframe.get('src', '').lower()
-            iframe_id = iframe.get('id', '').lower()
-            iframe_class = ' '.join(iframe.get('class', [])).lower()
-            title = iframe.get('title', '').lower()
-            
-            if any(keyword in src or keyword in iframe_id or keyword in iframe_class or keyword in title
-                   for keyword in ['captcha', 'recaptcha', 'hcaptcha', 'challenge', 'verify']):
+            if self._is_captcha_iframe(iframe):
                 captcha_iframes.append(iframe.get('src', ''))
         
         return captcha_iframes
     
+    @staticmethod
+    def _is_captcha_image(img) -> bool:
+        """Check whether an ``<img>`` tag looks like a CAPTCHA challenge image."""
+        src = img.get('src', '').lower()
+        alt = img.get('alt', '').lower()
+        img_id = img.get('id', '').lower()
+        img_class = ' '.join(img.get('class', [])).lower()
+        
+        return any(keyword in src or keyword in alt or keyword in img_id or keyword in img_class 
+                   for keyword in ['captcha', 'challenge', 'verify'])
+    
+    @staticmethod
+    def _is_captcha_iframe(iframe) -> bool:
+        """Check whether an ``<iframe>`` tag looks like an embedded CAPTCHA widget."""
+        src = iframe.get('src', '').lower()
+        iframe_id = iframe.get('id', '').lower()
+        iframe_class = ' '.join(iframe.get('class', [])).lower()
+        title = iframe.get('title', '').lower()
+        
+        return any(keyword in src or keyword in iframe_id or keyword in iframe_class or keyword in title
+                   for keyword in ['captcha', 'recaptcha', 'hcaptcha', 'challenge', 'verify'])
+    
     def get_detection_count(self) -> int:
         """
         Get the total number of CAPTCHAs detected.
@@ -29,6 +29,19 @@ def _load_csrf_patterns() -> dict:
 
 _CSRF_PATTERNS = _load_csrf_patterns()
 
+# (token name, compiled regex) pairs for inline JavaScript, loaded from csrf_patterns.json
+_JS_TOKEN_PATTERNS = [
+    (entry["name"], re.compile(entry["pattern"], re.IGNORECASE))
+    for entry in _CSRF_PATTERNS.get("javascript_patterns", [
+        {"name": "csrfToken", "pattern": r'csrfToken\s*[=:]\s*["\']([^"\']+)["\']'},
+        {"name": "csrf_token", "pattern": r'csrf_token\s*[=:]\s*["\']([^"\']+)["\']'},
+        {"name": "CSRF_TOKEN", "pattern": r'CSRF_TOKEN\s*[=:]\s*["\']([^"\']+)["\']'},
+        {"name": "_token", "pattern": r'_token\s*[=:]\s*["\']([^"\']+)["\']'},
+        {"name": "authenticity_token", "pattern": r'authenticity_token\s*[=:]\s*["\']([^"\']+)["\']'},
+        {"name": "xsrfToken", "pattern": r'xsrfToken\s*[=:]\s*["\']([^"\']+)["\']'},
+    ])
+]
+
 
 class CSRFTokenExtractor:
     """
@@ -130,25 +143,10 @@ class CSRFTokenExtractor:
             if not script.string:
                 continue
 
-            script_content = script.string
-
-            # Mapping of token names to their regex patterns (loaded from csrf_patterns.json)
-            patterns = [
-                (entry["name"], entry["pattern"])
-                for entry in _CSRF_PATTERNS.get("javascript_patterns", [
-                    {"name": "csrfToken", "pattern": r'csrfToken\s*[=:]\s*["\']([^"\']+)["\']'},
-                    {"name": "csrf_token", "pattern": r'csrf_token\s*[=:]\s*["\']([^"\']+)["\']'},
-                    {"name": "CSRF_TOKEN", "pattern": r'CSRF_TOKEN\s*[=:]\s*["\']([^"\']+)["\']'},
-                    {"name": "_token", "pattern": r'_token\s*[=:]\s*["\']([^"\']+)["\']'},
-                    {"name": "authenticity_token", "pattern": r'authenticity_token\s*[=:]\s*["\']([^"\']+)["\']'},
-                    {"name": "xsrfToken", "pattern": r'xsrfToken\s*[=:]\s*["\']([^"\']+)["\']'},
-                ])
-            ]
-
-            for token_name, pattern in patterns:
-                matches = re.findall(pattern, script_content, re.IGNORECASE)
-                if matches:
-                    self.tokens[token_name] = matches[0]
+            for token_name, pattern in _JS_TOKEN_PATTERNS:
+                match = pattern.search(script.string)
+                if match:
+                    self.tokens[token_name] = match.group(1)
                     logger.debug(f"Found CSRF token in JavaScript: {token_name}")
     
     def _extract_from_data_attributes(self):
@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""
+scanner.py - Single-pass security scanning
+
+Runs CAPTCHA, WAF, honeypot and CSRF detection over one page in a single
+scan of the response body and a single walk of the DOM.
+
+The individual detectors (``CaptchaDetector``, ``WAFDetector``,
+``HoneypotDetector``, ``CSRFTokenExtractor``) each parse or regex-scan the
+page on their own.  ``SecurityScanner`` compiles every body signature from
+``waf_signatures.json``, ``csrf_patterns.json`` and the CAPTCHA pattern
+lists once per process, then produces the same results those detectors
+would, so it can be attached to a crawl as one extractor::
+
+    from crawlit import Crawler
+    from crawlit.security import SecurityScanner
+
+    crawler = Crawler("https://example.com", extractors=[SecurityScanner()])
+
+Results are stored under ``artifact.extracted["security"]``.
+"""
+
+import dataclasses
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from bs4 import BeautifulSoup
+
+from ..interfaces import Extractor
+from ..models.page_artifact import PageArtifact
+from .captcha_detector import CaptchaDetector
+from .csrf import CSRFTokenExtractor, _JS_TOKEN_PATTERNS
+from .honeypot import HoneypotDetectionResult, HoneypotDetector, HoneypotElement
+from .waf import WAFDetectionResult, WAFDetector, WAFType
+
+logger = logging.getLogger(__name__)
+
+# Regex metacharacters that make a pattern more than a plain substring
+_REGEX_META = set('.^$*+?{}[]|()')
+
+# Cookie names inside a (possibly comma-joined) Set-Cookie header
+_SET_COOKIE_NAME_RE = re.compile(r'(?:^|,)\s*([^=;,\s]+)=([^;,]*)')
+
+# Matcher key for a pattern: ('re', regex) or ('lit', substring)
+_Key = Tuple[str, str]
+
+
+def _regex_literal(pattern: str) -> Optional[str]:
+    """
+    Return the plain string matched by *pattern*, or ``None`` if it is a real regex.
+
+    Escaped punctuation (``google\\.com``) is unescaped; any unescaped
+    metacharacter or escape class (``\\s``, ``\\d``) disqualifies the pattern.
+    """
+    chars = []
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == '\\':
+            if i + 1 >= len(pattern) or pattern[i + 1].isalnum():
+                return None
+            chars.append(pattern[i + 1])
+            i += 2
+            continue
+        if ch in _REGEX_META:
+            return None
+        chars.append(ch)
+        i += 1
+    return ''.join(chars)
+
+
+class _MultiPatternMatcher:
+    """
+    Match many signatures against one text in a single left-to-right scan.
+
+    Patterns that are plain substrings are merged into one alternation
+    (longest first) and located with repeated ``search`` calls, so the text
+    is scanned once regardless of how many signatures there are.  Every
+    start position is considered, and a literal also credits any shorter
+    literal it contains, so overlapping signatures are all reported.
+    Patterns that need real regex features are searched individually.
+    """
+
+    def __init__(self, regexes: Iterable[str] = (), literals: Iterable[str] = ()):
+        self._literal_keys: Dict[str, List[_Key]] = {}
+        self._regexes: List[Tuple[_Key, 're.Pattern']] = []
+
+        for pattern in regexes:
+            literal = _regex_literal(pattern)
+            if literal is None:
+                self._regexes.append((('re', pattern), re.compile(pattern, re.IGNORECASE)))
+            else:
+                self._literal_keys.setdefault(literal.lower(), []).append(('re', pattern))
+        for literal in literals:
+            self._literal_keys.setdefault(literal.lower(), []).append(('lit', literal))
+
+        ordered = sorted(self._literal_keys, key=len, reverse=True)
+        self._literal_re = (
+            re.compile('|'.join(re.escape(lit) for lit in ordered)) if ordered else None
+        )
+        # Shorter literals found inside each literal (e.g. "incapsula" in
+        # "incapsula incident id"), credited whenever the longer one matches
+        self._contained: Dict[str, List[str]] = {
+            lit: [other for other in ordered if other != lit and other in lit]
+            for lit in ordered
+        }
+
+    def scan(self, text_lower: str) -> Set[_Key]:
+        """Return the keys of every pattern found in *text_lower*."""
+        hits: Set[_Key] = set()
+        if self._literal_re is not None:
+            found: Set[str] = set()
+            total = len(self._literal_keys)
+            search = self._literal_re.search
+            match = search(text_lower)
+            while match is not None and len(found) < total:
+                literal = match.group(0)
+                if literal not in found:
+                    found.add(literal)
+                    found.update(self._contained[literal])
+                match = search(text_lower, match.start() + 1)
+            for literal in found:
+                hits.update(self._literal_keys[literal])
+        for key, regex in self._regexes:
+            if regex.search(text_lower):
+                hits.add(key)
+        return hits
+
+
+@dataclass
+class SecurityScanResult:
+    """Combined result of a single-pass security scan.
+
+    A field is ``None`` when the corresponding check was disabled.
+    """
+    url: str = ""
+    captcha: Optional[Dict[str, Any]] = None
+    waf: Optional[WAFDetectionResult] = None
+    honeypots: Optional[HoneypotDetectionResult] = None
+    csrf_tokens: Optional[Dict[str, str]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serialisable dictionary."""
+        waf = None
+        if self.waf is not None:
+            waf = dataclasses.asdict(self.waf)
+            waf['waf_type'] = self.waf.waf_type.value
+        return {
+            'url': self.url,
+            'captcha': self.captcha,
+            'waf': waf,
+            'honeypots': dataclasses.asdict(self.honeypots) if self.honeypots is not None else None,
+            'csrf_tokens': self.csrf_tokens,
+        }
+
+
+class SecurityScanner(Extractor):
+    """
+    Unified CAPTCHA / WAF / honeypot / CSRF scanner.
+
+    All signatures are compiled once per process into a shared matcher.  Each
+    call to :meth:`scan` lower-cases the page once, runs that matcher over it,
+    parses the HTML once, and applies every element-level check during a
+    single walk of the tree.  Results match those of the individual
+    detectors.
+    """
+
+    # Compiled body matcher, built on first use and shared by all instances
+    _MATCHER: Optional[_MultiPatternMatcher] = None
+
+    def __init__(self, detect_captcha: bool = True, detect_waf: bool = True,
+                 detect_honeypots: bool = True, extract_csrf: bool = True,
+                 on_captcha_detected: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Initialize the scanner.
+
+        Args:
+            detect_captcha: Run CAPTCHA detection
+            detect_waf: Run WAF detection
+            detect_honeypots: Run honeypot detection
+            extract_csrf: Extract CSRF tokens
+            on_captcha_detected: Optional callback when a CAPTCHA is detected
+        """
+        self.detect_captcha = detect_captcha
+        self.detect_waf = detect_waf
+        self.detect_honeypots = detect_honeypots
+        self.extract_csrf = extract_csrf
+        self._captcha_detector = CaptchaDetector(on_captcha_detected=on_captcha_detected)
+        self._waf_detector = WAFDetector()
+
+    @property
+    def name(self) -> str:
+        return "security"
+
+    @classmethod
+    def _get_matcher(cls) -> _MultiPatternMatcher:
+        """Compile every body-level signature into one matcher (once)."""
+        if cls._MATCHER is None:
+            regexes: List[str] = []
+            for signatures in WAFDetector._load_waf_signatures().values():
+                regexes.extend(signatures.get('body_patterns', []))
+            for patterns in CaptchaDetector.PROVIDER_PATTERNS.values():
+                regexes.extend(patterns)
+            literals = list(CaptchaDetector.PROVIDER_MARKERS) + list(
+                CaptchaDetector.GENERIC_CAPTCHA_KEYWORDS
+            )
+            cls._MATCHER = _MultiPatternMatcher(regexes=regexes, literals=literals)
+        return cls._MATCHER
+
+    def get_captcha_detection_count(self) -> int:
+        """Get the total number of CAPTCHAs detected by this scanner."""
+        return self._captcha_detector.get_detection_count()
+
+    def scan(self, html_content: str, headers: Optional[Dict[str, str]] = None,
+             cookies: Optional[Dict[str, str]] = None, url: str = "") -> SecurityScanResult:
+        """
+        Scan one page for CAPTCHAs, WAFs, honeypots and CSRF tokens.
+
+        Args:
+            html_content: HTML content to analyze
+            headers: HTTP response headers (used for WAF detection)
+            cookies: HTTP cookies (used for WAF detection)
+            url: URL of the page (for logging)
+
+        Returns:
+            SecurityScanResult
+        """
+        result = SecurityScanResult(url=url)
+        html_lower = html_content.lower() if html_content else ""
+        hits = self._get_matcher().scan(html_lower) if html_lower else set()
+
+        # Element-level findings, filled during the single DOM walk
+        captcha_images: List[str] = []
+        captcha_iframes: List[str] = []
+        honeypots_by_check: Dict[str, List[HoneypotElement]] = {
+            check: [] for check in (
+                'invisible', 'hidden_link', 'off_screen', 'zero_dimension',
+                'transparent', 'form_field', 'mouse_trap',
+            )
+        }
+        csrf_sources: Dict[str, Dict[str, str]] = {
+            'forms': {}, 'meta': {}, 'javascript': {}, 'data': {},
+        }
+
+        if html_content and (self.detect_captcha or self.detect_honeypots or self.extract_csrf):
+            try:
+                soup = BeautifulSoup(html_content, 'html.parser')
+            except Exception as e:
+                logger.warning(f"Failed to parse HTML for security scan: {e}")
+                soup = None
+            if soup is not None:
+                self._walk(soup, captcha_images, captcha_iframes,
+                           honeypots_by_check, csrf_sources)
+
+        if self.detect_captcha:
+            result.captcha = self._captcha_result(
+                url, hits, captcha_images, captcha_iframes
+            ) if html_content else CaptchaDetector._build_result(url, set(), set(), [], [], [])
+
+        if self.detect_waf:
+            result.waf = self._waf_result(headers or {}, cookies, hits, bool(html_content))
+
+        if self.detect_honeypots:
+            honeypots = [hp for found in honeypots_by_check.values() for hp in found]
+            result.honeypots = HoneypotDetector._build_result(honeypots, url)
+
+        if self.extract_csrf:
+            tokens: Dict[str, str] = {}
+            # Later sources win, matching CSRFTokenExtractor.extract_all_tokens
+            for source in ('forms', 'meta', 'javascript', 'data'):
+                tokens.update(csrf_sources[source])
+            result.csrf_tokens = tokens
+            if tokens:
+                logger.debug(f"Found {len(tokens)} CSRF token(s) on {url}")
+
+        return result
+
+    def _walk(self, soup: BeautifulSoup, captcha_images: List[str],
+              captcha_iframes: List[str],
+              honeypots_by_check: Dict[str, List[HoneypotElement]],
+              csrf_sources: Dict[str, Dict[str, str]]) -> None:
+        """Apply every element-level check during one pass over the tree."""
+        detect_captcha = self.detect_captcha
+        detect_honeypots = self.detect_honeypots
+        extract_csrf = self.extract_csrf
+
+        for tag in soup.find_all(True):
+            tag_name = tag.name
+            attrs = tag.attrs
+
+            if detect_honeypots:
+                if attrs.get('style') is not None:
+                    for check, method in (
+                        ('invisible', HoneypotDetector._check_invisible),
+                        ('off_screen', HoneypotDetector._check_off_screen),
+                        ('zero_dimension', HoneypotDetector._check_zero_dimension),
+                        ('transparent', HoneypotDetector._check_transparent),
+                    ):
+                        honeypot = method(tag)
+                        if honeypot:
+                            honeypots_by_check[check].append(honeypot)
+                if tag_name == 'a' and attrs.get('href') is not None:
+                    honeypot = HoneypotDetector._check_hidden_link(tag)
+                    if honeypot:
+                        honeypots_by_check['hidden_link'].append(honeypot)
+                if tag_name == 'input':
+                    honeypot = HoneypotDetector._check_form_field(tag)
+                    if honeypot:
+                        honeypots_by_check['form_field'].append(honeypot)
+                if tag_name in ('a', 'button', 'div'):
+                    honeypot = HoneypotDetector._check_mouse_trap(tag)
+                    if honeypot:
+                        honeypots_by_check['mouse_trap'].append(honeypot)
+
+            if detect_captcha:
+                if tag_name == 'img' and CaptchaDetector._is_captcha_image(tag):
+                    captcha_images.append(tag.get('src', ''))
+                elif tag_name == 'iframe' and CaptchaDetector._is_captcha_iframe(tag):
+                    captcha_iframes.append(tag.get('src', ''))
+
+            if extract_csrf:
+                self._check_csrf(tag, csrf_sources)
+
+    @staticmethod
+    def _check_csrf(tag, csrf_sources: Dict[str, Dict[str, str]]) -> None:
+        """Collect CSRF tokens carried by a single tag."""
+        tag_name = tag.name
+        attrs = tag.attrs
+
+        if tag_name == 'input' and attrs.get('type') == 'hidden':
+            field_name = tag.get('name')
+            value = tag.get('value')
+            if field_name and value and tag.find_parent('form') is not None:
+                lowered = field_name.lower()
+                if 'csrf' in lowered or 'token' in lowered or 'xsrf' in lowered:
+                    csrf_sources['forms'][field_name] = value
+                elif field_name in CSRFTokenExtractor.COMMON_TOKEN_NAMES:
+                    # Later forms overwrite earlier ones, as in CSRFTokenExtractor
+                    csrf_sources['forms'][field_name] = value
+
+        elif tag_name == 'meta':
+            meta_name = tag.get('name', '').lower()
+            content = tag.get('content', '')
+            if meta_name in CSRFTokenExtractor.META_TAG_NAMES and content:
+                csrf_sources['meta'][meta_name] = content
+
+        elif tag_name == 'script':
+            script_text = tag.string
+            if script_text:
+                for token_name, pattern in _JS_TOKEN_PATTERNS:
+                    match = pattern.search(script_text)
+                    if match:
+                        csrf_sources['javascript'][token_name] = match.group(1)
+
+        for data_attr in ('data-csrf-token', 'data-token'):
+            value = attrs.get(data_attr)
+            if value:
+                csrf_sources['data'][data_attr] = value
+
+    def _captcha_result(self, url: str, hits: Set[_Key], captcha_images: List[str],
+                        captcha_iframes: List[str]) -> Dict[str, Any]:
+        """Build the CAPTCHA result from matcher hits and DOM findings."""
+        providers = {
+            provider for provider, patterns in CaptchaDetector.PROVIDER_PATTERNS.items()
+            if any(('re', pattern) in hits for pattern in patterns)
+        }
+        markers = {
+            marker for marker in CaptchaDetector.PROVIDER_MARKERS if ('lit', marker) in hits
+        }
+        keyword_matches = [
+            keyword for keyword in CaptchaDetector.GENERIC_CAPTCHA_KEYWORDS
+            if ('lit', keyword) in hits
+        ]
+        result = CaptchaDetector._build_result(
+            url, providers, markers, keyword_matches, captcha_images, captcha_iframes
+        )
+        self._captcha_detector._record_detection(result)
+        return result
+
+    def _waf_result(self, headers: Dict[str, str], cookies: Optional[Dict[str, str]],
+                    hits: Set[_Key], has_body: bool) -> WAFDetectionResult:
+        """Score every WAF signature using precomputed body hits."""
+        normalized_headers = {k.lower(): v for k, v in headers.items()}
+        cookie_names = set(cookies.keys() if cookies else [])
+        server_lower = normalized_headers.get('server', '').lower()
+
+        detection_scores: Dict[WAFType, int] = {}
+        detection_indicators: Dict[WAFType, List[str]] = {}
+
+        for waf_type, signatures in self._waf_detector.WAF_SIGNATURES.items():
+            score = 0
+            indicators = []
+
+            for header in signatures['headers']:
+                if header.lower() in normalized_headers:
+                    score += 3
+                    indicators.append(f"Header: {header}")
+
+            for cookie_pattern in signatures['cookies']:
+                for cookie_name in cookie_names:
+                    if cookie_pattern.lower() in cookie_name.lower():
+                        score += 2
+                        indicators.append(f"Cookie: {cookie_name}")
+
+            for server_pattern in signatures['server']:
+                if server_pattern in server_lower:
+                    score += 4
+                    indicators.append(f"Server: {server_pattern}")
+
+            if has_body:
+                for pattern in signatures['body_patterns']:
+                    if ('re', pattern) in hits:
+                        score += 1
+                        indicators.append(f"Body pattern: {pattern}")
+
+            if score > 0:
+                detection_scores[waf_type] = score
+                detection_indicators[waf_type] = indicators
+
+        return self._waf_detector._build_result(
+            detection_scores, detection_indicators, normalized_headers, cookie_names
+        )
+
+    def extract(self, html_content: str, artifact: PageArtifact) -> Dict[str, Any]:
+        headers = artifact.http.headers or {}
+        cookies: Dict[str, str] = {}
+        for key, value in headers.items():
+            if key.lower() == 'set-cookie' and value:
+                cookies.update(_SET_COOKIE_NAME_RE.findall(value))
+        return self.scan(html_content, headers=headers, cookies=cookies,
+                         url=artifact.url).to_dict()
+
+
+def scan_security(html_content: str, headers: Optional[Dict[str, str]] = None,
+                  cookies: Optional[Dict[str, str]] = None, url: str = "") -> SecurityScanResult:
+    """
+    Convenience function to run a single-pass security scan.
+
+    Args:
+        html_content: HTML content to analyze
+        headers: HTTP response headers (optional)
+        cookies: HTTP cookies (optional)
+        url: URL of the page
+
+    Returns:
+        SecurityScanResult
+    """
+    scanner = SecurityScanner()
+    return scanner.scan(html_content, headers=headers, cookies=cookies, url=url)
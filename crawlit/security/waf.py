@@ -160,6 +160,26 @@ class WAFDetector:
                 detection_scores[waf_type] = score
                 detection_indicators[waf_type] = indicators
         
+        return self._build_result(
+            detection_scores, detection_indicators, normalized_headers, cookie_names
+        )
+    
+    def _build_result(self, detection_scores: Dict[WAFType, int],
+                      detection_indicators: Dict[WAFType, List[str]],
+                      normalized_headers: Dict[str, str],
+                      cookie_names: Set[str]) -> WAFDetectionResult:
+        """
+        Pick the highest-scoring WAF and assemble the detection result.
+        
+        Args:
+            detection_scores: Score per WAF type (only types with score > 0)
+            detection_indicators: Indicators per WAF type
+            normalized_headers: Response headers with lower-cased names
+            cookie_names: Names of cookies set by the response
+            
+        Returns:
+            WAFDetectionResult
+        """
         # Determine detected WAF
         if detection_scores:
             detected_waf = max(detection_scores, key=detection_scores.get)
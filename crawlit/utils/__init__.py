@@ -7,10 +7,19 @@ from crawlit.utils.url_filter import URLFilter
 from crawlit.utils.progress import ProgressTracker, create_progress_callback
 from crawlit.utils.queue_manager import QueueManager
 from crawlit.utils.cache import PageCache, CrawlResume
+from crawlit.utils.checkpoint import (
+    CheckpointWriter,
+    PeriodicCheckpointer,
+    load_checkpoint,
+    read_checkpoint_info
+)
 from crawlit.utils.storage import StorageManager
 from crawlit.utils.sitemap import SitemapParser, get_sitemaps_from_robots, get_sitemaps_from_robots_async
 from crawlit.utils.rate_limiter import RateLimiter, AsyncRateLimiter, DynamicRateLimiter, AsyncDynamicRateLimiter
-from crawlit.utils.deduplication import ContentDeduplicator
+from crawlit.utils.deduplication import ContentDeduplicator, SimHashIndex, simhash
+from crawlit.utils.prefetch_dedup import PrefetchDeduplicator
+from crawlit.utils.warc import WARCRecord, iter_warc_records, read_warc_record
+from crawlit.utils.buffered_writer import BufferedLineWriter
 from crawlit.utils.budget_tracker import BudgetTracker, AsyncBudgetTracker, BudgetLimits
 from crawlit.utils.priority_queue import (
     URLPriorityQueue,
@@ -72,6 +81,10 @@ __all__ = [
     'QueueManager',
     'PageCache',
     'CrawlResume',
+    'CheckpointWriter',
+    'PeriodicCheckpointer',
+    'load_checkpoint',
+    'read_checkpoint_info',
     'StorageManager',
     'SitemapParser',
     'get_sitemaps_from_robots',
@@ -81,6 +94,13 @@ __all__ = [
     'DynamicRateLimiter',
     'AsyncDynamicRateLimiter',
     'ContentDeduplicator',
+    'SimHashIndex',
+    'simhash',
+    'PrefetchDeduplicator',
+    'WARCRecord',
+    'iter_warc_records',
+    'read_warc_record',
+    'BufferedLineWriter',
     'BudgetTracker',
     'AsyncBudgetTracker',
     'BudgetLimits',
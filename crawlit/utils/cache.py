@@ -4,27 +4,199 @@ cache.py - Caching layer for crawled pages
 """
 
 import os
+import gzip
 import json
 import hashlib
 import logging
+import threading
 import time
-from typing import Dict, Any, Optional, Tuple
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Mapping, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+try:
+    import zstandard
+    _ZSTD_AVAILABLE = True
+except ImportError:
+    _ZSTD_AVAILABLE = False
+
+from .checkpoint import is_checkpoint, read_checkpoint_info
+
 logger = logging.getLogger(__name__)
 
+#: Error recorded for URLs that an offline replay crawl cannot serve from cache.
+OFFLINE_CACHE_MISS = "Not in cache (offline replay)"
+
+#: Default byte budget for the in-memory tier (64 MiB).
+DEFAULT_MAX_MEMORY_BYTES = 64 * 1024 * 1024
+
+# Rough per-entry cost of the headers/response dicts, which are not measured
+# individually to keep size accounting O(1).
+_ENTRY_OVERHEAD = 1024
+
+# Status codes that may be cached with a heuristic lifetime (RFC 9110, 15.1)
+_HEURISTICALLY_CACHEABLE = frozenset({200, 203, 204, 206, 300, 301, 308, 404, 405, 410, 414, 501})
+
+_SUFFIXES = {
+    'gzip': '.json.gz',
+    'zstd': '.json.zst',
+    None: '.json',
+}
+
+
+def _header(headers: Optional[Mapping[str, Any]], name: str) -> Optional[str]:
+    """Case-insensitive header lookup on a plain dict or a CaseInsensitiveDict."""
+    if not headers:
+        return None
+    value = headers.get(name)
+    if value is None:
+        lowered = name.lower()
+        value = next((v for k, v in headers.items() if k.lower() == lowered), None)
+    return None if value is None else str(value)
+
+
+def _parse_http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """
+    Parse a ``Cache-Control`` header into a dict of lower-cased directives.
+
+    Directives without an argument map to None, e.g.
+    ``"max-age=60, no-cache"`` -> ``{'max-age': '60', 'no-cache': None}``.
+    """
+    directives: Dict[str, Optional[str]] = {}
+    if not value:
+        return directives
+    for part in value.split(','):
+        name, sep, arg = part.strip().partition('=')
+        name = name.strip().lower()
+        if name:
+            directives[name] = arg.strip().strip('"') if sep else None
+    return directives
+
+
+def _delta_seconds(value: Optional[str]) -> Optional[int]:
+    try:
+        return max(0, int(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def freshness_lifetime(
+    headers: Optional[Mapping[str, Any]],
+    status_code: int = 200,
+    heuristic_fraction: float = 0.1,
+    max_heuristic_lifetime: float = 86400,
+) -> float:
+    """
+    Compute how long a response stays fresh for a private cache (RFC 9111, 4.2.1).
+
+    ``max-age`` wins over ``Expires``; ``no-cache`` (or ``Pragma: no-cache``
+    without a ``Cache-Control`` header) makes the response immediately stale so
+    that every reuse is revalidated.  Without explicit freshness information a
+    heuristic of ``heuristic_fraction`` of the time since ``Last-Modified`` is
+    used, capped at ``max_heuristic_lifetime`` seconds.
+    """
+    cache_control_header = _header(headers, 'Cache-Control')
+    directives = parse_cache_control(cache_control_header)
+    if 'no-cache' in directives:
+        return 0.0
+    if cache_control_header is None and 'no-cache' in (_header(headers, 'Pragma') or '').lower():
+        return 0.0
+
+    max_age = _delta_seconds(directives.get('max-age'))
+    if max_age is not None:
+        return float(max_age)
+
+    date = _parse_http_date(_header(headers, 'Date'))
+    expires_header = _header(headers, 'Expires')
+    if expires_header is not None:
+        expires = _parse_http_date(expires_header)
+        if expires is None:
+            # Invalid dates such as "0" mean "already expired"
+            return 0.0
+        return max(0.0, expires - (date if date is not None else time.time()))
+
+    last_modified = _parse_http_date(_header(headers, 'Last-Modified'))
+    if last_modified is not None and status_code in _HEURISTICALLY_CACHEABLE:
+        reference = date if date is not None else time.time()
+        return min(max(0.0, reference - last_modified) * heuristic_fraction, max_heuristic_lifetime)
+    return 0.0
+
+
+def _vary_key(
+    response_headers: Optional[Mapping[str, Any]],
+    request_headers: Optional[Mapping[str, Any]],
+) -> Optional[Dict[str, Optional[str]]]:
+    """Capture the request header values selected by the response's ``Vary``."""
+    vary = _header(response_headers, 'Vary')
+    if not vary:
+        return None
+    names = sorted({name.strip().lower() for name in vary.split(',') if name.strip()})
+    if '*' in names:
+        return {'*': None}
+    return {name: _header(request_headers, name) for name in names}
+
+
+def _vary_matches(
+    vary: Optional[Dict[str, Optional[str]]],
+    request_headers: Optional[Mapping[str, Any]],
+) -> bool:
+    if not vary:
+        return True
+    if '*' in vary:
+        return False
+    return all(_header(request_headers, name) == value for name, value in vary.items())
+
 
 class PageCache:
     """
     Cache for crawled pages with optional TTL and disk persistence.
+
+    The memory tier is an LRU bounded by an approximate byte budget (and
+    optionally an entry count).  The disk tier stores one compressed, compact
+    JSON file per URL under ``<cache_dir>/<key[:2]>/`` so no single directory
+    grows unbounded.  An in-memory index of disk entries keeps lookups and
+    :meth:`get_stats` O(1); it is built with a single directory scan when the
+    cache is opened.  Expired entries are dropped lazily on access, or
+    eagerly by a background sweeper when ``eviction_interval`` is set.
+
+    With ``http_semantics=True`` the cache behaves like a private HTTP cache:
+    freshness is computed per response from ``Cache-Control``, ``Expires`` and
+    ``Last-Modified``, ``Vary`` is honoured and ``no-store`` responses are not
+    kept.  :meth:`get` then only returns fresh entries; a stale entry yields
+    validators via :meth:`get_conditional_headers`, and a ``304 Not Modified``
+    answer is turned back into a hit with :meth:`revalidate`.  ``ttl`` still
+    bounds how long entries (fresh or stale) are stored at all.
     """
     
     def __init__(
         self,
         cache_dir: Optional[str] = None,
         ttl: Optional[int] = None,
-        enable_disk_cache: bool = False
+        enable_disk_cache: bool = False,
+        max_memory_bytes: Optional[int] = DEFAULT_MAX_MEMORY_BYTES,
+        max_memory_entries: Optional[int] = None,
+        compression: Optional[str] = 'gzip',
+        compression_level: int = 6,
+        eviction_interval: Optional[float] = None,
+        http_semantics: bool = False,
+        heuristic_fraction: float = 0.1,
+        max_heuristic_lifetime: float = 86400,
     ):
         """
         Initialize the page cache.
@@ -33,11 +205,56 @@ class PageCache:
             cache_dir: Directory for disk-based caching (if enable_disk_cache is True)
             ttl: Time-to-live in seconds for cached pages (None = no expiration)
             enable_disk_cache: Whether to persist cache to disk
+            max_memory_bytes: Approximate byte budget for the memory tier
+                (None = unbounded). Least recently used entries are evicted first.
+            max_memory_entries: Optional cap on the number of memory entries.
+            compression: Disk compression, ``'gzip'``, ``'zstd'`` (requires the
+                ``zstandard`` package, falls back to gzip) or None.
+            compression_level: Compression level passed to the codec.
+            eviction_interval: If set together with ``ttl``, run a background
+                thread that removes expired entries every N seconds.
+            http_semantics: Compute freshness from the response headers and
+                revalidate stale entries instead of using ``ttl`` alone.
+            heuristic_fraction: Fraction of the ``Last-Modified`` age used as
+                freshness lifetime when a response carries no explicit expiry.
+            max_heuristic_lifetime: Upper bound in seconds for heuristic freshness.
         """
+        if compression not in _SUFFIXES:
+            raise ValueError(f"Unsupported cache compression: {compression!r}")
+        if compression == 'zstd' and not _ZSTD_AVAILABLE:
+            logger.warning("zstandard not installed; falling back to gzip cache compression")
+            compression = 'gzip'
+
         self.cache_dir = Path(cache_dir) if cache_dir else None
         self.ttl = ttl  # Time-to-live in seconds
         self.enable_disk_cache = enable_disk_cache
-        self.memory_cache: Dict[str, Dict[str, Any]] = {}
+        self.max_memory_bytes = max_memory_bytes
+        self.max_memory_entries = max_memory_entries
+        self.compression = compression
+        self.compression_level = compression_level
+        self.eviction_interval = eviction_interval
+        self.http_semantics = http_semantics
+        self.heuristic_fraction = heuristic_fraction
+        self.max_heuristic_lifetime = max_heuristic_lifetime
+
+        # url -> (cached_data, size_in_bytes, cached_at_epoch), LRU order
+        self.memory_cache: "OrderedDict[str, Tuple[Dict[str, Any], int, float]]" = OrderedDict()
+        self._memory_bytes = 0
+        # cache key -> (path, cached_at_epoch) for every entry on disk
+        self._disk_index: Dict[str, Tuple[Path, float]] = {}
+        self._known_shards: set = set()
+        self._lock = threading.RLock()
+
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expired = 0
+        self._stale = 0
+        self._revalidated = 0
+
+        self._stop_event = threading.Event()
+        self._eviction_thread: Optional[threading.Thread] = None
         
         # Create cache directory if needed
         if self.enable_disk_cache and self.cache_dir:
@@ -50,6 +267,12 @@ class PageCache:
             logger.info(f"Disk cache enabled at default location: {self.cache_dir}")
         else:
             logger.info("Memory-only cache enabled")
+
+        if self.enable_disk_cache:
+            self._load_disk_index()
+
+        if self.ttl is not None and self.eviction_interval:
+            self._start_eviction_thread()
     
     def _get_cache_key(self, url: str) -> str:
         """Generate a cache key from URL"""
@@ -60,120 +283,429 @@ class PageCache:
         if not self.cache_dir:
             raise ValueError("Disk cache not enabled")
         cache_key = self._get_cache_key(url)
-        return self.cache_dir / f"{cache_key}.json"
-    
-    def _is_expired(self, cached_data: Dict[str, Any]) -> bool:
-        """Check if cached data has expired"""
+        return self.cache_dir / cache_key[:2] / f"{cache_key}{_SUFFIXES[self.compression]}"
+
+    def _load_disk_index(self) -> None:
+        """Scan the cache directory once and index existing entries by key."""
+        try:
+            with os.scandir(self.cache_dir) as top:
+                for entry in top:
+                    if entry.is_dir():
+                        self._known_shards.add(entry.name)
+                        with os.scandir(entry.path) as shard:
+                            for item in shard:
+                                self._index_file(item)
+                    else:
+                        # Flat ``<key>.json`` files written by older versions
+                        self._index_file(entry)
+        except OSError as e:
+            logger.warning(f"Error scanning cache directory {self.cache_dir}: {e}")
+
+    def _index_file(self, entry: "os.DirEntry") -> None:
+        name = entry.name
+        if name.endswith('.tmp') or not entry.is_file():
+            return
+        key, _, suffix = name.partition('.')
+        if '.' + suffix not in _SUFFIXES.values():
+            return
+        try:
+            mtime = entry.stat().st_mtime
+        except OSError:
+            return
+        previous = self._disk_index.get(key)
+        if previous is None or previous[1] < mtime:
+            self._disk_index[key] = (Path(entry.path), mtime)
+
+    def _expired_at(self, cached_ts: float, now: Optional[float] = None) -> bool:
         if self.ttl is None:
             return False
+        return ((now if now is not None else time.time()) - cached_ts) > self.ttl
+    
+    @staticmethod
+    def _estimate_size(url: str, content: Optional[str]) -> int:
+        return len(url) + (len(content) if content else 0) + _ENTRY_OVERHEAD
+
+    def _store_in_memory(self, url: str, cached_data: Dict[str, Any], cached_ts: float) -> None:
+        """Insert or refresh an entry in the memory tier and enforce its budget."""
+        size = self._estimate_size(url, cached_data.get('content'))
+        with self._lock:
+            previous = self.memory_cache.pop(url, None)
+            if previous is not None:
+                self._memory_bytes -= previous[1]
+            if self.max_memory_bytes is not None and size > self.max_memory_bytes:
+                # Would evict everything else and still not fit
+                return
+            self.memory_cache[url] = (cached_data, size, cached_ts)
+            self._memory_bytes += size
+            while self.memory_cache and (
+                (self.max_memory_bytes is not None and self._memory_bytes > self.max_memory_bytes)
+                or (self.max_memory_entries is not None and len(self.memory_cache) > self.max_memory_entries)
+            ):
+                _, (_, evicted_size, _) = self.memory_cache.popitem(last=False)
+                self._memory_bytes -= evicted_size
+                self._evictions += 1
+
+    def _drop_from_memory(self, url: str) -> None:
+        with self._lock:
+            previous = self.memory_cache.pop(url, None)
+            if previous is not None:
+                self._memory_bytes -= previous[1]
+
+    def _encode(self, cached_data: Dict[str, Any]) -> bytes:
+        payload = json.dumps(cached_data, default=str, separators=(',', ':')).encode('utf-8')
+        if self.compression == 'gzip':
+            return gzip.compress(payload, compresslevel=self.compression_level)
+        if self.compression == 'zstd':
+            return zstandard.ZstdCompressor(level=self.compression_level).compress(payload)
+        return payload
+
+    @staticmethod
+    def _decode(path: Path) -> Dict[str, Any]:
+        with open(path, 'rb') as f:
+            payload = f.read()
+        if path.name.endswith('.gz'):
+            payload = gzip.decompress(payload)
+        elif path.name.endswith('.zst'):
+            if not _ZSTD_AVAILABLE:
+                raise RuntimeError("zstandard is required to read .zst cache entries")
+            payload = zstandard.ZstdDecompressor().decompress(payload)
+        return json.loads(payload)
+
+    def _unlink(self, path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Error removing cache file {path}: {e}")
+    
+    def _lookup(self, url: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Find a stored entry that has not outlived ``ttl``; returns (data, tier)."""
+        # Check memory cache first
+        with self._lock:
+            entry = self.memory_cache.get(url)
+            if entry is not None:
+                if not self._expired_at(entry[2]):
+                    self.memory_cache.move_to_end(url)
+                    return entry[0], 'memory'
+                # Expired, remove from memory
+                self.memory_cache.pop(url)
+                self._memory_bytes -= entry[1]
+                self._expired += 1
         
-        cached_time = cached_data.get('cached_at')
-        if not cached_time:
+        # Check disk cache if enabled
+        if self.enable_disk_cache and self.cache_dir:
+            key = self._get_cache_key(url)
+            with self._lock:
+                indexed = self._disk_index.get(key)
+            if indexed is not None:
+                cache_path, cached_ts = indexed
+                if self._expired_at(cached_ts):
+                    with self._lock:
+                        if self._disk_index.get(key) == indexed:
+                            del self._disk_index[key]
+                            self._expired += 1
+                    self._unlink(cache_path)
+                    logger.debug(f"Cache expired, removed: {url}")
+                else:
+                    try:
+                        cached_data = self._decode(cache_path)
+                    except FileNotFoundError:
+                        with self._lock:
+                            if self._disk_index.get(key) == indexed:
+                                del self._disk_index[key]
+                    except Exception as e:
+                        logger.warning(f"Error reading cache file {cache_path}: {e}")
+                    else:
+                        if cached_data.get('url', url) == url:
+                            # Also store in memory for faster access
+                            self._store_in_memory(url, cached_data, cached_ts)
+                            return cached_data, 'disk'
+        return None, None
+
+    def is_fresh(
+        self,
+        cached_data: Dict[str, Any],
+        request_headers: Optional[Mapping[str, Any]] = None,
+    ) -> bool:
+        """
+        Whether an entry may be served without contacting the origin.
+
+        Always True outside ``http_semantics`` mode (``ttl`` already applied).
+        """
+        if not self.http_semantics:
             return True
-        
-        # Parse ISO format datetime
-        if isinstance(cached_time, str):
-            cached_time = datetime.fromisoformat(cached_time)
-
-        # Ensure both sides of the subtraction are timezone-aware
-        now = datetime.now(timezone.utc)
-        if cached_time.tzinfo is None:
-            cached_time = cached_time.replace(tzinfo=timezone.utc)
-        elapsed = (now - cached_time).total_seconds()
-        return elapsed > self.ttl
+        if not _vary_matches(cached_data.get('vary'), request_headers):
+            return False
+        fresh_until = cached_data.get('fresh_until')
+        return fresh_until is not None and time.time() < fresh_until
     
-    def get(self, url: str) -> Optional[Dict[str, Any]]:
+    def get(
+        self,
+        url: str,
+        request_headers: Optional[Mapping[str, Any]] = None,
+        allow_stale: bool = False,
+    ) -> Optional[Dict[str, Any]]:
         """
         Get cached page data for a URL.
         
         Args:
             url: The URL to look up
+            request_headers: Headers the request would be sent with; used to
+                match ``Vary`` in ``http_semantics`` mode.
+            allow_stale: Return stored entries even if no longer fresh in
+                ``http_semantics`` mode (used for offline replay).
             
         Returns:
-            Cached data dict or None if not found/expired
+            Cached data dict or None if not found/expired (or stale, in
+            ``http_semantics`` mode)
         """
-        # Check memory cache first
-        if url in self.memory_cache:
-            cached_data = self.memory_cache[url]
-            if not self._is_expired(cached_data):
-                logger.debug(f"Cache hit (memory): {url}")
-                return cached_data
-            else:
-                # Expired, remove from memory
-                del self.memory_cache[url]
-        
-        # Check disk cache if enabled
-        if self.enable_disk_cache and self.cache_dir:
-            cache_path = self._get_cache_path(url)
-            if cache_path.exists():
-                try:
-                    with open(cache_path, 'r', encoding='utf-8') as f:
-                        cached_data = json.load(f)
-                    
-                    # Check expiration
-                    if not self._is_expired(cached_data):
-                        logger.debug(f"Cache hit (disk): {url}")
-                        # Also store in memory for faster access
-                        self.memory_cache[url] = cached_data
-                        return cached_data
+        cached_data, tier = self._lookup(url)
+        if cached_data is not None:
+            if allow_stale or self.is_fresh(cached_data, request_headers):
+                with self._lock:
+                    if tier == 'memory':
+                        self._memory_hits += 1
                     else:
-                        # Expired, remove from disk
-                        cache_path.unlink()
-                        logger.debug(f"Cache expired, removed: {url}")
-                except Exception as e:
-                    logger.warning(f"Error reading cache file {cache_path}: {e}")
+                        self._disk_hits += 1
+                logger.debug(f"Cache hit ({tier}): {url}")
+                return cached_data
+            with self._lock:
+                self._stale += 1
+            logger.debug(f"Cache entry stale: {url}")
+            return None
         
+        with self._lock:
+            self._misses += 1
         logger.debug(f"Cache miss: {url}")
         return None
-    
-    def set(
+
+    def get_conditional_headers(
         self,
         url: str,
-        response_data: Dict[str, Any],
-        status_code: int,
-        headers: Dict[str, Any],
-        content: Optional[str] = None
-    ) -> None:
+        request_headers: Optional[Mapping[str, Any]] = None,
+    ) -> Dict[str, str]:
         """
-        Cache page data for a URL.
-        
+        Validators for revalidating a stored entry with a conditional request.
+
         Args:
-            url: The URL to cache
-            response_data: Response data to cache
-            status_code: HTTP status code
-            headers: Response headers
-            content: Optional HTML content (can be large, so optional)
+            url: URL to check
+            request_headers: Headers the request would be sent with (``Vary``)
+
+        Returns:
+            Dictionary with If-None-Match and/or If-Modified-Since headers,
+            empty if nothing usable is stored
+        """
+        cached_data, _ = self._lookup(url)
+        if cached_data is None or not cached_data.get('content'):
+            return {}
+        vary = cached_data.get('vary')
+        if vary and not _vary_matches(vary, request_headers):
+            return {}
+        headers = {}
+        etag = _header(cached_data.get('headers'), 'ETag')
+        if etag:
+            headers['If-None-Match'] = etag
+        last_modified = _header(cached_data.get('headers'), 'Last-Modified')
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def revalidate(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
         """
+        Refresh a stored entry after the origin answered ``304 Not Modified``.
+
+        Header fields from the 304 response (if available) replace the stored
+        ones, freshness is recomputed from "now", and the entry is re-stored.
+
+        Args:
+            url: URL that was revalidated
+            headers: Headers of the 304 response, if known
+
+        Returns:
+            The refreshed cached data, or None if the entry is gone
+        """
+        cached_data, _ = self._lookup(url)
+        if cached_data is None:
+            return None
+        merged = dict(cached_data.get('headers') or {})
+        if headers:
+            lowered = {k.lower() for k in headers}
+            merged = {k: v for k, v in merged.items() if k.lower() not in lowered}
+            merged.update({
+                k: v for k, v in headers.items()
+                if k.lower() not in ('content-length', 'content-encoding', 'transfer-encoding')
+            })
+        refreshed = self._build_entry(
+            url,
+            cached_data.get('response_data'),
+            cached_data.get('status_code', 200),
+            merged,
+            cached_data.get('content'),
+            cached_data.get('vary'),
+        )
+        self._store(url, refreshed)
+        with self._lock:
+            self._revalidated += 1
+        logger.debug(f"Cache entry revalidated: {url}")
+        return refreshed
+    
+    def _build_entry(
+        self,
+        url: str,
+        response_data: Any,
+        status_code: int,
+        headers: Dict[str, Any],
+        content: Optional[str],
+        vary: Optional[Dict[str, Optional[str]]] = None,
+    ) -> Dict[str, Any]:
+        cached_ts = time.time()
         cached_data = {
             'url': url,
             'status_code': status_code,
             'headers': headers,
             'response_data': response_data,
             'content': content,
-            'cached_at': datetime.now(timezone.utc).isoformat()
+            'cached_at': datetime.fromtimestamp(cached_ts, timezone.utc).isoformat()
         }
-        
+        if self.http_semantics:
+            # Age already spent in upstream caches counts against freshness
+            date = _parse_http_date(_header(headers, 'Date'))
+            apparent_age = max(0.0, cached_ts - date) if date is not None else 0.0
+            initial_age = max(apparent_age, float(_delta_seconds(_header(headers, 'Age')) or 0))
+            lifetime = freshness_lifetime(
+                headers, status_code, self.heuristic_fraction, self.max_heuristic_lifetime
+            )
+            cached_data['fresh_until'] = cached_ts - initial_age + lifetime
+            cached_data['vary'] = vary
+        return cached_data
+
+    def _store(self, url: str, cached_data: Dict[str, Any]) -> None:
+        cached_ts = datetime.fromisoformat(cached_data['cached_at']).timestamp()
+
         # Store in memory cache
-        self.memory_cache[url] = cached_data
+        self._store_in_memory(url, cached_data, cached_ts)
         
         # Store on disk if enabled
         if self.enable_disk_cache and self.cache_dir:
             cache_path = self._get_cache_path(url)
+            key = cache_path.name.partition('.')[0]
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
             try:
-                with open(cache_path, 'w', encoding='utf-8') as f:
-                    json.dump(cached_data, f, indent=2, default=str)
-                logger.debug(f"Cached to disk: {url}")
+                payload = self._encode(cached_data)
+                shard = key[:2]
+                if shard not in self._known_shards:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._known_shards.add(shard)
+                with open(tmp_path, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, cache_path)
             except Exception as e:
                 logger.warning(f"Error writing cache file {cache_path}: {e}")
+                self._unlink(tmp_path)
+                return
+            with self._lock:
+                previous = self._disk_index.get(key)
+                self._disk_index[key] = (cache_path, cached_ts)
+            if previous is not None and previous[0] != cache_path:
+                # Entry migrated from a legacy flat file or a different codec
+                self._unlink(previous[0])
+            logger.debug(f"Cached to disk: {url}")
+    
+    def set(
+        self,
+        url: str,
+        response_data: Dict[str, Any],
+        status_code: int,
+        headers: Dict[str, Any],
+        content: Optional[str] = None,
+        request_headers: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """
+        Cache page data for a URL.
+        
+        Args:
+            url: The URL to cache
+            response_data: Response data to cache
+            status_code: HTTP status code
+            headers: Response headers
+            content: Optional HTML content (can be large, so optional)
+            request_headers: Headers the request was sent with; recorded for
+                ``Vary`` matching in ``http_semantics`` mode.
+        """
+        vary = None
+        if self.http_semantics:
+            if 'no-store' in parse_cache_control(_header(headers, 'Cache-Control')):
+                self.remove(url)
+                return
+            vary = _vary_key(headers, request_headers)
+        self._store(url, self._build_entry(url, response_data, status_code, headers, content, vary))
+
+    def evict_expired(self) -> int:
+        """
+        Remove every expired entry from both tiers.
+
+        Returns:
+            Number of entries removed
+        """
+        if self.ttl is None:
+            return 0
+        now = time.time()
+        with self._lock:
+            expired_urls = [u for u, (_, _, ts) in self.memory_cache.items() if self._expired_at(ts, now)]
+            for url in expired_urls:
+                _, size, _ = self.memory_cache.pop(url)
+                self._memory_bytes -= size
+            expired_files = [
+                (key, item) for key, item in self._disk_index.items()
+                if self._expired_at(item[1], now)
+            ]
+            for key, _ in expired_files:
+                del self._disk_index[key]
+            self._expired += len(expired_urls) + len(expired_files)
+        for _, (path, _) in expired_files:
+            self._unlink(path)
+        removed = len(expired_urls) + len(expired_files)
+        if removed:
+            logger.debug(f"Evicted {removed} expired cache entries")
+        return removed
+
+    def _start_eviction_thread(self) -> None:
+        self._eviction_thread = threading.Thread(
+            target=self._eviction_loop, name="crawlit-cache-eviction", daemon=True
+        )
+        self._eviction_thread.start()
+
+    def _eviction_loop(self) -> None:
+        while not self._stop_event.wait(self.eviction_interval):
+            try:
+                self.evict_expired()
+            except Exception as e:
+                logger.warning(f"Error evicting expired cache entries: {e}")
+
+    def close(self) -> None:
+        """Stop the background eviction thread, if running."""
+        self._stop_event.set()
+        if self._eviction_thread is not None:
+            self._eviction_thread.join(timeout=5)
+            self._eviction_thread = None
     
     def clear(self) -> None:
         """Clear all cached data"""
-        self.memory_cache.clear()
+        with self._lock:
+            self.memory_cache.clear()
+            self._memory_bytes = 0
+            disk_entries = list(self._disk_index.values())
+            self._disk_index.clear()
         
         if self.enable_disk_cache and self.cache_dir:
             try:
-                for cache_file in self.cache_dir.glob('*.json'):
-                    cache_file.unlink()
+                for path, _ in disk_entries:
+                    self._unlink(path)
                 logger.info(f"Cleared disk cache at {self.cache_dir}")
             except Exception as e:
                 logger.warning(f"Error clearing disk cache: {e}")
@@ -181,35 +713,41 @@ class PageCache:
     def remove(self, url: str) -> None:
         """Remove cached data for a specific URL"""
         # Remove from memory
-        if url in self.memory_cache:
-            del self.memory_cache[url]
+        self._drop_from_memory(url)
         
         # Remove from disk
         if self.enable_disk_cache and self.cache_dir:
-            cache_path = self._get_cache_path(url)
-            if cache_path.exists():
-                try:
-                    cache_path.unlink()
-                    logger.debug(f"Removed from cache: {url}")
-                except Exception as e:
-                    logger.warning(f"Error removing cache file {cache_path}: {e}")
+            with self._lock:
+                indexed = self._disk_index.pop(self._get_cache_key(url), None)
+            if indexed is not None:
+                self._unlink(indexed[0])
+                logger.debug(f"Removed from cache: {url}")
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        disk_count = 0
-        if self.enable_disk_cache and self.cache_dir:
-            try:
-                disk_count = len(list(self.cache_dir.glob('*.json')))
-            except Exception:
-                pass
-        
-        return {
-            'memory_entries': len(self.memory_cache),
-            'disk_entries': disk_count,
-            'ttl': self.ttl,
-            'disk_cache_enabled': self.enable_disk_cache,
-            'cache_dir': str(self.cache_dir) if self.cache_dir else None
-        }
+        with self._lock:
+            hits = self._memory_hits + self._disk_hits
+            lookups = hits + self._misses
+            return {
+                'memory_entries': len(self.memory_cache),
+                'memory_bytes': self._memory_bytes,
+                'max_memory_bytes': self.max_memory_bytes,
+                'disk_entries': len(self._disk_index),
+                'hits': hits,
+                'memory_hits': self._memory_hits,
+                'disk_hits': self._disk_hits,
+                'misses': self._misses,
+                'hit_rate': hits / lookups if lookups else 0.0,
+                'evictions': self._evictions,
+                'expired': self._expired,
+                'stale': self._stale,
+                'revalidated': self._revalidated,
+                'http_semantics': self.http_semantics,
+                'ttl': self.ttl,
+                'disk_cache_enabled': self.enable_disk_cache,
+                'compression': self.compression if self.enable_disk_cache else None,
+                'cache_dir': str(self.cache_dir) if self.cache_dir else None
+            }
 
 
 class CrawlResume:
@@ -224,6 +762,10 @@ class CrawlResume:
             return False
         
         try:
+            if is_checkpoint(filepath):
+                # Only the fixed-size header is read
+                read_checkpoint_info(filepath)
+                return True
             with open(filepath, 'r', encoding='utf-8') as f:
                 state = json.load(f)
             # Check if it has required keys
@@ -238,6 +780,10 @@ class CrawlResume:
             return {}
         
         try:
+            if is_checkpoint(filepath):
+                info = read_checkpoint_info(filepath)
+                return {key: info.get(key) for key in (
+                    'saved_at', 'queue_size', 'visited_count', 'results_count', 'metadata')}
             with open(filepath, 'r', encoding='utf-8') as f:
                 state = json.load(f)
             
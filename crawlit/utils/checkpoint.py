@@ -0,0 +1,639 @@
+#!/usr/bin/env python3
+"""
+checkpoint.py - Compact binary crawl checkpoints with incremental deltas.
+
+The JSON state file written by :meth:`QueueManager.save_state` holds the
+queue, every visited URL and every result (HTML included) in one indented
+document that has to be rewritten — and fully parsed — each time.  A
+checkpoint file is instead a small header followed by length-prefixed
+segments::
+
+    b"CRAWLCKP" | version, codec, flags, header size | header (JSON, padded)
+    [kind | length | payload] [kind | length | payload] ... [COMMIT] ...
+
+* The header holds the counts, ``saved_at`` and the crawl metadata and is
+  rewritten in place after every checkpoint, so :func:`read_checkpoint_info`
+  reads a fixed-size prefix of the file whatever the crawl size.
+* Segment payloads are msgpack when installed (JSON otherwise, via orjson
+  when available), zlib-compressed by default.
+* ``html_content`` is kept out of the file: by default it is replaced by an
+  ``html_content_ref`` (``"sha256:<hex>"`` — the same digest a
+  :class:`~crawlit.pipelines.BlobStore` files the page under).
+* :class:`CheckpointWriter` appends *deltas* — the visited URLs and
+  results added since its last checkpoint, plus the whole current queue —
+  instead of rewriting the file.  Every ``snapshot_every`` deltas it
+  compacts the file, copying the committed visited/results segments over
+  without decoding them and dropping the superseded queues.  Each
+  checkpoint ends with a ``COMMIT`` segment; a torn write at the end of the
+  file is ignored on load.
+* :class:`PeriodicCheckpointer` drives a writer from a background thread,
+  every ``interval`` seconds and/or every ``every_pages`` finished pages.
+
+::
+
+    writer = CheckpointWriter("crawl.ckpt")
+    writer.write(queue, visited_urls, results, metadata)   # snapshot
+    writer.write(queue, visited_urls, results, metadata)   # delta
+    writer.append(queue, new_visited, new_results)         # delta of what is new
+    queue, visited_urls, results, metadata = load_checkpoint("crawl.ckpt")
+"""
+
+import hashlib
+import json
+import logging
+import os
+import struct
+import tempfile
+import threading
+import zlib
+from collections import deque
+from datetime import datetime
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import msgpack
+    _MSGPACK_AVAILABLE = True
+except ImportError:
+    _MSGPACK_AVAILABLE = False
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"CRAWLCKP"
+FORMAT_VERSION = 1
+
+#: ``html_content`` handling: replace by a sha256 reference, drop, or keep.
+HTML_MODES = ("ref", "omit", "inline")
+
+_PREFIX = struct.Struct(">8sBBHI")       # magic, version, codec, flags, header size
+_SEGMENT = struct.Struct(">BI")          # kind, payload length
+_FLAG_ZLIB = 0x1
+_MIN_HEADER_SIZE = 1024
+
+_CODEC_JSON = 0
+_CODEC_MSGPACK = 1
+_CODEC_NAMES = {_CODEC_JSON: "json", _CODEC_MSGPACK: "msgpack"}
+
+# Segment kinds.  QUEUE replaces the queue, VISITED and RESULTS add to what
+# earlier segments restored; nothing is applied until the COMMIT that closes
+# the checkpoint is read.
+_COMMIT = 0
+_QUEUE = 1
+_VISITED = 2
+_RESULTS = 3
+
+#: Visited URLs / results per segment, so no single payload grows unbounded.
+DEFAULT_CHUNK_SIZE = 5000
+
+
+def _encoder(codec: int):
+    if codec == _CODEC_MSGPACK:
+        return lambda value: msgpack.packb(value, default=str, use_bin_type=True)
+    if _ORJSON_AVAILABLE:
+        options = orjson.OPT_NON_STR_KEYS
+        return lambda value: orjson.dumps(value, default=str, option=options)
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str)
+    return lambda value: encoder.encode(value).encode("utf-8")
+
+
+def _decoder(codec: int):
+    if codec == _CODEC_MSGPACK:
+        if not _MSGPACK_AVAILABLE:
+            raise ImportError("this checkpoint was written with msgpack, which is not installed")
+        return lambda data: msgpack.unpackb(data, raw=False, strict_map_key=False)
+    return orjson.loads if _ORJSON_AVAILABLE else json.loads
+
+
+def _chunks(items: list, size: int) -> Iterable[list]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def html_ref(html: str) -> str:
+    """Reference stored for *html* in ``html="ref"`` mode (``"sha256:<hex>"``)."""
+    return "sha256:" + hashlib.sha256(html.encode("utf-8", errors="replace")).hexdigest()
+
+
+def _checkpoint_record(data: Any, html: str) -> Dict[str, Any]:
+    """Plain dict of one result with HTML handled per *html*."""
+    record = dict(data)
+    html_content = record.pop("html_content", None)
+    if html_content is not None:
+        if html == "inline":
+            record["html_content"] = html_content
+        elif html == "ref":
+            record["html_content_ref"] = html_ref(html_content)
+    return record
+
+
+def is_checkpoint(filepath: str) -> bool:
+    """``True`` if *filepath* starts with the checkpoint magic bytes."""
+    try:
+        with open(filepath, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _read_header(f) -> Tuple[int, int, Dict[str, Any]]:
+    """Read the prefix and header of an open checkpoint; returns (codec, flags, header)."""
+    prefix = f.read(_PREFIX.size)
+    if len(prefix) < _PREFIX.size:
+        raise ValueError("truncated checkpoint header")
+    magic, version, codec, flags, header_size = _PREFIX.unpack(prefix)
+    if magic != MAGIC:
+        raise ValueError("not a crawlit checkpoint file")
+    if version > FORMAT_VERSION:
+        raise ValueError(f"unsupported checkpoint version {version}")
+    if codec not in _CODEC_NAMES:
+        raise ValueError(f"unknown checkpoint codec {codec}")
+    header = json.loads(f.read(header_size).decode("utf-8"))
+    return codec, flags, header
+
+
+def read_checkpoint_info(filepath: str) -> Dict[str, Any]:
+    """
+    Read the header of a checkpoint without touching its segments.
+
+    Returns ``saved_at``, ``queue_size``, ``visited_count``,
+    ``results_count`` and ``metadata`` (as :meth:`CrawlResume.get_resume_info`),
+    plus ``created_at``, ``deltas``, ``codec``, ``compression`` and ``html``.
+    Raises :class:`ValueError` for files that are not checkpoints.
+    """
+    with open(filepath, "rb") as f:
+        codec, flags, header = _read_header(f)
+    header["codec"] = _CODEC_NAMES[codec]
+    header["compression"] = "zlib" if flags & _FLAG_ZLIB else None
+    return header
+
+
+def load_checkpoint(filepath: str) -> Tuple[deque, Set[str], Dict[str, Any], Dict[str, Any]]:
+    """
+    Restore ``(queue, visited_urls, results, metadata)`` from a checkpoint.
+
+    The snapshot and all committed deltas are applied in order; segments
+    after the last ``COMMIT`` (an interrupted write) are ignored.  Results
+    written in ``html="ref"`` mode carry ``html_content_ref`` instead of
+    ``html_content``.
+    """
+    queue: deque = deque()
+    visited_urls: Set[str] = set()
+    results: Dict[str, Any] = {}
+    with open(filepath, "rb") as f:
+        codec, flags, header = _read_header(f)
+        decode = _decoder(codec)
+        compressed = bool(flags & _FLAG_ZLIB)
+        pending = []
+        while True:
+            prefix = f.read(_SEGMENT.size)
+            if len(prefix) < _SEGMENT.size:
+                break
+            kind, length = _SEGMENT.unpack(prefix)
+            if kind == _COMMIT:
+                for seg_kind, value in pending:
+                    if seg_kind == _QUEUE:
+                        queue = deque(tuple(item) for item in value)
+                    elif seg_kind == _VISITED:
+                        visited_urls.update(value)
+                    elif seg_kind == _RESULTS:
+                        results.update(value)
+                pending = []
+                continue
+            payload = f.read(length)
+            if len(payload) < length:
+                break
+            if compressed:
+                payload = zlib.decompress(payload)
+            pending.append((kind, decode(payload)))
+        if pending:
+            logger.warning(f"Ignoring incomplete checkpoint data at the end of {filepath}")
+    return queue, visited_urls, results, header.get("metadata", {})
+
+
+class CheckpointWriter:
+    """
+    Write snapshots and incremental deltas of a crawl to one checkpoint file.
+
+    Parameters
+    ----------
+    filepath : str
+        Checkpoint file; created (or replaced) by the first :meth:`write`.
+    html : str
+        ``"ref"`` (default) stores ``html_content_ref`` instead of the HTML,
+        ``"omit"`` drops it, ``"inline"`` keeps it.
+    compress : bool
+        zlib-compress segment payloads (default ``True``).
+    snapshot_every : int
+        Compact the file after this many deltas (default 20), dropping the
+        queues superseded by later deltas.
+    chunk_size : int
+        Visited URLs / results per segment.
+
+    :meth:`append` is for callers that know what finished since their last
+    checkpoint (the crawlers do): it writes exactly the visited URLs and
+    results it is given, and the writer keeps no per-URL state.
+    :meth:`write` takes the full visited set instead and remembers which
+    visited URLs and results it has written, so a result is checkpointed
+    once, when it first appears; change a result that was already written
+    and the next checkpoint will not see it unless you call :meth:`write`
+    with ``incremental=False``.  Either way each checkpoint rewrites the
+    whole queue, which is small next to the visited set and results.
+    Compaction copies the visited URLs and results already in the file, so
+    callers may pass only the results that are new since their last write.
+    Thread-safe.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        html: str = "ref",
+        compress: bool = True,
+        snapshot_every: int = 20,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        if html not in HTML_MODES:
+            raise ValueError(f"html must be one of {HTML_MODES}, got {html!r}")
+        if snapshot_every < 0:
+            raise ValueError(f"snapshot_every must be >= 0, got {snapshot_every}")
+        self.filepath = filepath
+        self.html = html
+        self.snapshot_every = snapshot_every
+        self._chunk_size = max(1, chunk_size)
+        self._codec = _CODEC_MSGPACK if _MSGPACK_AVAILABLE else _CODEC_JSON
+        self._flags = _FLAG_ZLIB if compress else 0
+        self._encode = _encoder(self._codec)
+        # URLs written so far, kept only for write(); None until it needs them
+        self._written_visited: Optional[Set[str]] = None
+        self._written_results: Optional[Set[str]] = None
+        self._header: Optional[Dict[str, Any]] = None
+        self._header_size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def codec(self) -> str:
+        """``"msgpack"`` or ``"json"``."""
+        return _CODEC_NAMES[self._codec]
+
+    def reset(self) -> None:
+        """Forget what was written; the next :meth:`write` is a full snapshot."""
+        with self._lock:
+            self._written_visited = None
+            self._written_results = None
+            self._header = None
+
+    # ------------------------------------------------------------------
+    # Encoding
+    # ------------------------------------------------------------------
+
+    def _segment(self, kind: int, value: Any) -> bytes:
+        payload = self._encode(value)
+        if self._flags & _FLAG_ZLIB:
+            payload = zlib.compress(payload, 1)
+        return _SEGMENT.pack(kind, len(payload)) + payload
+
+    def _write_segments(self, f, queue: list, visited: List[str], results: Dict[str, Any]) -> None:
+        f.write(self._segment(_QUEUE, queue))
+        for chunk in _chunks(visited, self._chunk_size):
+            f.write(self._segment(_VISITED, chunk))
+        urls = list(results)
+        for chunk in _chunks(urls, self._chunk_size):
+            f.write(self._segment(_RESULTS, {
+                url: _checkpoint_record(results[url], self.html) for url in chunk
+            }))
+        f.write(_SEGMENT.pack(_COMMIT, 0))
+
+    def _encoded_header(self) -> bytes:
+        return json.dumps(self._header, default=str, separators=(",", ":")).encode("utf-8")
+
+    def _prefix(self) -> bytes:
+        return _PREFIX.pack(MAGIC, FORMAT_VERSION, self._codec, self._flags, self._header_size)
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def write(
+        self,
+        queue: Iterable,
+        visited_urls: Set[str],
+        results: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]] = None,
+        incremental: bool = True,
+    ) -> str:
+        """
+        Checkpoint the crawl; returns ``"snapshot"`` or ``"delta"``.
+
+        *visited_urls* is the full visited set.  With *incremental*, once
+        this writer has written the file, the visited URLs and results it
+        has not written yet are appended as a delta (compacting every
+        ``snapshot_every`` deltas); otherwise the file is replaced
+        atomically by a full snapshot.
+        """
+        queue_list = _queue_list(queue)
+        with self._lock:
+            if incremental and self._has_file():
+                if self._written_visited is None:
+                    # The file was written by append(): learn what it holds
+                    _, self._written_visited, written, _ = load_checkpoint(self.filepath)
+                    self._written_results = set(written)
+                new_visited = [url for url in visited_urls if url not in self._written_visited]
+                new_results = {url: data for url, data in results.items()
+                               if url not in self._written_results}
+                kind = self._checkpoint(queue_list, new_visited, new_results, metadata)
+                self._written_visited.update(new_visited)
+                self._written_results.update(new_results)
+                return kind
+            self._write_snapshot(queue_list, list(visited_urls), results, metadata)
+            self._written_visited = set(visited_urls)
+            self._written_results = set(results)
+        return "snapshot"
+
+    def append(
+        self,
+        queue: Iterable,
+        new_visited: Iterable[str],
+        new_results: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Checkpoint the visited URLs and results added since the previous
+        checkpoint; returns ``"snapshot"`` or ``"delta"``.
+
+        Nothing is compared with what was written before, so the cost is
+        proportional to the delta (and the queue).  The first call on a
+        writer (or after :meth:`reset`) replaces the file with a snapshot
+        of what it is given, so start from the complete state.
+        """
+        queue_list = _queue_list(queue)
+        new_visited = list(new_visited)
+        with self._lock:
+            if self._has_file():
+                kind = self._checkpoint(queue_list, new_visited, new_results, metadata)
+                if self._written_visited is not None:
+                    self._written_visited.update(new_visited)
+                    self._written_results.update(new_results)
+                return kind
+            self._write_snapshot(queue_list, new_visited, new_results, metadata)
+            self._written_visited = self._written_results = None
+        return "snapshot"
+
+    def _has_file(self) -> bool:
+        return self._header is not None and os.path.exists(self.filepath)
+
+    def _checkpoint(self, queue_list: list, new_visited: List[str], new_results: Dict[str, Any],
+                    metadata: Optional[Dict[str, Any]]) -> str:
+        """Append a delta, or compact the file once ``snapshot_every`` deltas were appended."""
+        if (self._header["deltas"] < self.snapshot_every
+                and self._append_delta(queue_list, new_visited, new_results, metadata)):
+            return "delta"
+        # Results from earlier checkpoints may no longer be held by the
+        # caller, so carry them over from the file
+        self._write_snapshot(queue_list, new_visited, new_results, metadata, compact=True)
+        return "snapshot"
+
+    def _write_snapshot(self, queue_list: list, visited: List[str], results: Dict[str, Any],
+                        metadata: Optional[Dict[str, Any]], compact: bool = False) -> None:
+        now = datetime.now().isoformat()
+        base = self._header if compact else {"visited_count": 0, "results_count": 0}
+        self._header = {
+            "version": FORMAT_VERSION,
+            "created_at": now,
+            "saved_at": now,
+            "queue_size": len(queue_list),
+            "visited_count": base["visited_count"] + len(visited),
+            "results_count": base["results_count"] + len(results),
+            "deltas": 0,
+            "html": self.html,
+            "metadata": metadata if metadata is not None else (base.get("metadata") or {}),
+        }
+        encoded = self._encoded_header()
+        # Room for the header to grow as counts and metadata change
+        self._header_size = max(_MIN_HEADER_SIZE, 2 * len(encoded))
+
+        parent = os.path.dirname(os.path.abspath(self.filepath))
+        fd, tmp_path = tempfile.mkstemp(dir=parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self._prefix())
+                f.write(encoded.ljust(self._header_size))
+                if compact:
+                    _copy_committed(self.filepath, f)
+                self._write_segments(f, queue_list, visited, results)
+            os.replace(tmp_path, self.filepath)
+        except Exception:
+            self._header = None
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _append_delta(self, queue_list: list, new_visited: List[str],
+                      new_results: Dict[str, Any], metadata: Optional[Dict[str, Any]]) -> bool:
+        header = dict(self._header)
+        header.update(
+            saved_at=datetime.now().isoformat(),
+            queue_size=len(queue_list),
+            visited_count=header["visited_count"] + len(new_visited),
+            results_count=header["results_count"] + len(new_results),
+            deltas=header["deltas"] + 1,
+        )
+        if metadata is not None:
+            header["metadata"] = metadata
+        previous, self._header = self._header, header
+        encoded = self._encoded_header()
+        if len(encoded) > self._header_size:
+            self._header = previous
+            return False
+
+        with open(self.filepath, "r+b") as f:
+            end = f.seek(0, os.SEEK_END)
+            try:
+                self._write_segments(f, queue_list, new_visited, new_results)
+                f.flush()
+            except Exception:
+                # Leave no partial delta for the next one to be appended after
+                self._header = previous
+                f.truncate(end)
+                raise
+            # Counts are only published once the delta is complete
+            f.seek(_PREFIX.size)
+            f.write(encoded.ljust(self._header_size))
+        return True
+
+
+def _queue_list(queue: Iterable) -> list:
+    return [list(item) if isinstance(item, tuple) else item for item in queue]
+
+
+def _copy_committed(filepath: str, out: BinaryIO) -> None:
+    """
+    Copy the visited and results segments of every committed checkpoint in
+    *filepath* to *out* as they are, without decoding them.  Queue segments
+    (superseded by the one written next) and ``COMMIT`` markers are dropped.
+    """
+    with open(filepath, "rb") as f:
+        _read_header(f)
+        start = f.tell()
+        size = os.fstat(f.fileno()).st_size
+        committed = start
+        while True:
+            prefix = f.read(_SEGMENT.size)
+            if len(prefix) < _SEGMENT.size:
+                break
+            kind, length = _SEGMENT.unpack(prefix)
+            position = f.seek(length, os.SEEK_CUR)
+            if position > size:
+                break
+            if kind == _COMMIT:
+                committed = position
+        f.seek(start)
+        while f.tell() < committed:
+            prefix = f.read(_SEGMENT.size)
+            kind, length = _SEGMENT.unpack(prefix)
+            if kind in (_VISITED, _RESULTS):
+                out.write(prefix)
+                _copy_bytes(f, out, length)
+            else:
+                f.seek(length, os.SEEK_CUR)
+
+
+def _copy_bytes(src: BinaryIO, dst: BinaryIO, length: int) -> None:
+    while length > 0:
+        data = src.read(min(length, 1 << 20))
+        if not data:
+            raise ValueError("truncated checkpoint segment")
+        dst.write(data)
+        length -= len(data)
+
+
+class PeriodicCheckpointer:
+    """
+    Write checkpoints of a running crawl from a background thread.
+
+    Parameters
+    ----------
+    writer : CheckpointWriter
+        Writer for the checkpoint file.
+    snapshot : callable
+        Returns ``(queue, new_visited, new_results, metadata)``: the queue
+        and the visited URLs and results finished since the previous call
+        (everything on the first call), handed to
+        :meth:`CheckpointWriter.append`.  It is called on the checkpoint
+        thread and must return copies taken consistently (the engines hold
+        a brief lock).
+    interval : float | None
+        Seconds between checkpoints (default 60); ``None`` to checkpoint
+        only by page count.
+    every_pages : int | None
+        Also checkpoint after this many :meth:`page_done` calls.
+
+    The crawl keeps running while a checkpoint is encoded and written.  A
+    failed checkpoint is logged and its visited URLs and results are
+    retried with the next.
+    """
+
+    def __init__(
+        self,
+        writer: CheckpointWriter,
+        snapshot: Callable[[], Tuple[Iterable, Set[str], Dict[str, Any], Dict[str, Any]]],
+        interval: Optional[float] = 60.0,
+        every_pages: Optional[int] = None,
+    ):
+        if interval is not None and interval <= 0:
+            raise ValueError(f"interval must be > 0, got {interval}")
+        if every_pages is not None and every_pages < 1:
+            raise ValueError(f"every_pages must be >= 1, got {every_pages}")
+        if interval is None and every_pages is None:
+            raise ValueError("set interval and/or every_pages")
+        self.writer = writer
+        self._snapshot = snapshot
+        self.interval = interval
+        self.every_pages = every_pages
+        self.checkpoints = 0
+        self._pages = 0
+        self._carry: Dict[str, Any] = {}
+        self._carry_visited: List[str] = []
+        self._count_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the checkpoint thread."""
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="crawlit-checkpoint", daemon=True)
+        self._thread.start()
+
+    def page_done(self) -> None:
+        """Count a finished page; wakes the thread every ``every_pages`` pages."""
+        if self.every_pages is None:
+            return
+        with self._count_lock:
+            self._pages += 1
+            if self._pages < self.every_pages:
+                return
+            self._pages = 0
+        self._wake.set()
+
+    def checkpoint(self) -> Optional[str]:
+        """Checkpoint now; returns ``"snapshot"``, ``"delta"`` or ``None`` on failure."""
+        with self._write_lock:
+            try:
+                queue, visited, results, metadata = self._snapshot()
+            except Exception as exc:
+                logger.warning(f"Could not snapshot crawl state for {self.writer.filepath}: {exc}")
+                return None
+            visited = self._carry_visited + list(visited)
+            if self._carry:
+                self._carry.update(results)
+                results = self._carry
+            self._carry, self._carry_visited = {}, []
+            try:
+                kind = self.writer.append(queue, visited, results, metadata)
+            except Exception as exc:
+                self._carry, self._carry_visited = results, visited
+                logger.warning(f"Checkpoint to {self.writer.filepath} failed: {exc}")
+                return None
+            self.checkpoints += 1
+            logger.debug(f"Checkpoint {self.checkpoints} ({kind}) written to {self.writer.filepath}")
+            return kind
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._stopping.is_set():
+                return
+            self.checkpoint()
+
+    def stop(self, final: bool = True) -> None:
+        """Stop the thread, then write a last checkpoint unless *final* is false."""
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stopping.set()
+            self._wake.set()
+            thread.join()
+        if final:
+            self.checkpoint()
+
+
+def save_checkpoint(
+    filepath: str,
+    queue: Iterable,
+    visited_urls: Set[str],
+    results: Dict[str, Any],
+    metadata: Optional[Dict[str, Any]] = None,
+    html: str = "ref",
+) -> None:
+    """Write a one-off full snapshot (see :class:`CheckpointWriter`)."""
+    CheckpointWriter(filepath, html=html).write(queue, visited_urls, results, metadata,
+                                                incremental=False)
@@ -139,7 +139,7 @@ class ContentHashStore:
 
         Useful to avoid re-writing a blob when the content was seen in a
         previous run.  Returns ``None`` (and logs a warning) if the recorded
-        path no longer exists on disk.
+        path (or, for packed blobs, its segment file) no longer exists on disk.
         """
         sha = self.hash_content(content)
         with self._lock, self._connect() as conn:
@@ -147,7 +147,8 @@ class ContentHashStore:
                 "SELECT blob_path FROM content_hashes WHERE sha256 = ?", (sha,)
             ).fetchone()
         if row and row[0]:
-            if Path(row[0]).exists():
+            # Packed blob locators look like "<segment>#<offset>:<length>"
+            if Path(row[0].rpartition("#")[0] or row[0]).exists():
                 return row[0]
             logger.warning(f"Stale blob path for {sha[:12]}…: {row[0]} no longer exists")
         return None
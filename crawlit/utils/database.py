@@ -6,17 +6,63 @@ Provides support for storing crawl results in databases:
 - SQLite (built-in, no extra dependencies)
 - PostgreSQL (requires psycopg2)
 - MongoDB (requires pymongo)
+
+Results are inserted in batches (``executemany``, ``execute_values``,
+``insert_many(ordered=False)``).  Besides :meth:`DatabaseBackend.save_results`
+for a complete results dict, every backend supports incremental writes while
+a crawl runs (see :class:`crawlit.pipelines.DatabasePipeline`)::
+
+    crawl_id = db.begin_crawl({"start_url": url})
+    db.insert_results(crawl_id, [(url, result), ...])
+    db.update_crawl_counts(crawl_id, total_urls=2, successful_urls=1)
 """
 
 import logging
 import json
 import sqlite3
-from typing import Dict, List, Any, Optional, Union
+from functools import partial
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Sequence, Tuple, Union
 from datetime import datetime
 from abc import ABC, abstractmethod
 
 logger = logging.getLogger(__name__)
 
+#: Rows per INSERT batch unless a backend is given another ``batch_size``.
+DEFAULT_BATCH_SIZE = 500
+
+# Result keys stored in dedicated columns; everything else goes to ``metadata``
+_RESULT_COLUMNS = ('url', 'status', 'success', 'depth', 'title',
+                   'content_type', 'html_content', 'links', 'images', 'keywords')
+
+# Extractor output may hold values JSON cannot encode natively (datetimes…)
+_dumps = partial(json.dumps, default=str)
+
+
+def _batches(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield lists of up to *size* items from *items*."""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _result_metadata(result: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in result.items() if k not in _RESULT_COLUMNS}
+
+
+#: Columns of the SQL ``results`` table, usable as ``columns=`` projections.
+RESULT_TABLE_COLUMNS = ('id', 'crawl_id', 'url', 'status_code', 'success', 'depth',
+                        'title', 'content_type', 'html_content', 'links', 'images',
+                        'keywords', 'metadata', 'timestamp')
+
+#: Every ``results`` column except ``html_content``.
+SUMMARY_COLUMNS = tuple(c for c in RESULT_TABLE_COLUMNS if c != 'html_content')
+
+_JSON_COLUMNS = ('links', 'images', 'keywords', 'metadata')
+
 
 class DatabaseBackend(ABC):
     """Abstract base class for database backends"""
@@ -59,6 +105,29 @@ class DatabaseBackend(ABC):
         """Clear results from database"""
         pass
 
+    # Incremental writes (used by crawlit.pipelines.DatabasePipeline).  Not
+    # abstract, so backends written before they existed keep working with
+    # save_results; they only need these to be used with DatabasePipeline.
+
+    def begin_crawl(self, metadata: Optional[Dict[str, Any]] = None):
+        """Register a crawl session with zero counts and return its crawl id"""
+        raise NotImplementedError(self._no_incremental_writes())
+
+    def insert_results(self, crawl_id, results: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """Insert ``(url, result)`` pairs for *crawl_id* in batches; returns the row count"""
+        raise NotImplementedError(self._no_incremental_writes())
+
+    def update_crawl_counts(self, crawl_id, total_urls: int, successful_urls: int):
+        """Record the URL counts of a crawl registered with :meth:`begin_crawl`"""
+        raise NotImplementedError(self._no_incremental_writes())
+
+    def _no_incremental_writes(self) -> str:
+        return (
+            f"{type(self).__name__} does not support incremental writes; implement "
+            f"begin_crawl, insert_results and update_crawl_counts to use it with "
+            f"DatabasePipeline, or call save_results once the crawl is over"
+        )
+
 
 class SQLiteBackend(DatabaseBackend):
     """
@@ -68,16 +137,29 @@ class SQLiteBackend(DatabaseBackend):
     - No external dependencies (uses built-in sqlite3)
     - Lightweight and portable
     - Perfect for local development and testing
+    - WAL journal, so readers can query while a crawl is writing
+    - Paginated, projected reads with :meth:`iter_results`
     """
     
-    def __init__(self, database_path: str = "crawlit_results.db"):
+    def __init__(self, database_path: str = "crawlit_results.db",
+                 batch_size: int = DEFAULT_BATCH_SIZE, wal: bool = True,
+                 cache_size_mb: int = 64, busy_timeout_ms: int = 5000):
         """
         Initialize SQLite backend.
         
         Args:
             database_path: Path to SQLite database file
+            batch_size: Rows per ``executemany`` call
+            wal: Use write-ahead logging (``journal_mode=WAL``,
+                ``synchronous=NORMAL``); readers then do not block the writer
+            cache_size_mb: Page cache size per connection
+            busy_timeout_ms: How long to wait for a lock before failing
         """
         self.database_path = database_path
+        self.batch_size = batch_size
+        self.wal = wal
+        self.cache_size_mb = cache_size_mb
+        self.busy_timeout_ms = busy_timeout_ms
         self.conn = None
         self.cursor = None
         self._create_tables()
@@ -97,8 +179,11 @@ class SQLiteBackend(DatabaseBackend):
     def connect(self):
         """Establish SQLite connection"""
         if self.conn is None:
-            self.conn = sqlite3.connect(self.database_path)
+            # A pipeline may write from crawler worker threads; callers
+            # serialise access (DatabasePipeline holds a lock)
+            self.conn = sqlite3.connect(self.database_path, check_same_thread=False)
             self.conn.row_factory = sqlite3.Row
+            self._apply_pragmas()
             self.cursor = self.conn.cursor()
             logger.info(f"Connected to SQLite database: {self.database_path}")
     
@@ -110,6 +195,19 @@ class SQLiteBackend(DatabaseBackend):
             self.cursor = None
             logger.info("SQLite connection closed")
     
+    def _apply_pragmas(self):
+        """Tune the connection for bulk writes with concurrent readers"""
+        self.conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        self.conn.execute(f"PRAGMA cache_size = {-1024 * int(self.cache_size_mb)}")
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+        if self.wal and self.database_path != ":memory:":
+            mode = self.conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+            if str(mode).lower() == "wal":
+                # Durable at checkpoints; far fewer fsyncs than FULL
+                self.conn.execute("PRAGMA synchronous = NORMAL")
+            else:
+                logger.debug(f"SQLite WAL not available for {self.database_path} (journal_mode={mode})")
+    
     def _create_tables(self):
         """Create database tables if they don't exist"""
         self.connect()
@@ -160,6 +258,12 @@ class SQLiteBackend(DatabaseBackend):
         self.cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_results_status ON results(status_code)
         """)
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_results_depth ON results(depth)
+        """)
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_results_content_type ON results(content_type)
+        """)
         
         self.conn.commit()
         logger.debug("SQLite tables created/verified")
@@ -174,52 +278,46 @@ class SQLiteBackend(DatabaseBackend):
         """
         self.connect()
         
-        # Extract metadata
-        meta = metadata or {}
-        start_url = meta.get('start_url', 'unknown')
-        user_agent = meta.get('user_agent', 'crawlit/1.0')
-        max_depth = meta.get('max_depth', 0)
-        
         # Count statistics
         total_urls = len(results)
         successful_urls = sum(1 for r in results.values() if r.get('success', False))
-        failed_urls = total_urls - successful_urls
         
-        # Insert crawl metadata
+        crawl_id = self._insert_crawl(metadata, total_urls, successful_urls)
+        self._insert_rows(crawl_id, results.items())
+        
+        self.conn.commit()
+        logger.info(f"Saved {total_urls} results to SQLite (crawl_id: {crawl_id})")
+        return crawl_id
+
+    def _insert_crawl(self, metadata: Optional[Dict[str, Any]], total_urls: int,
+                      successful_urls: int) -> int:
+        meta = metadata or {}
         self.cursor.execute("""
             INSERT INTO crawls (start_url, timestamp, user_agent, max_depth, 
                                total_urls, successful_urls, failed_urls, metadata)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """, (
-            start_url,
+            meta.get('start_url', 'unknown'),
             datetime.now().isoformat(),
-            user_agent,
-            max_depth,
+            meta.get('user_agent', 'crawlit/1.0'),
+            meta.get('max_depth', 0),
             total_urls,
             successful_urls,
-            failed_urls,
-            json.dumps(meta)
+            total_urls - successful_urls,
+            _dumps(meta)
         ))
-        
-        crawl_id = self.cursor.lastrowid
-        
-        # Insert individual results
-        for url, result in results.items():
-            links_json = json.dumps(result.get('links', []))
-            images_json = json.dumps(result.get('images', []))
-            keywords_json = json.dumps(result.get('keywords', []))
-            result_metadata = json.dumps({
-                k: v for k, v in result.items()
-                if k not in ['url', 'status', 'success', 'depth', 'title', 
-                           'content_type', 'html_content', 'links', 'images', 'keywords']
-            })
-            
-            self.cursor.execute("""
+        return self.cursor.lastrowid
+
+    def _insert_rows(self, crawl_id: int, results: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        count = 0
+        for batch in _batches(results, self.batch_size):
+            timestamp = datetime.now().isoformat()
+            self.cursor.executemany("""
                 INSERT INTO results (crawl_id, url, status_code, success, depth,
                                    title, content_type, html_content, links,
                                    images, keywords, metadata, timestamp)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            """, [(
                 crawl_id,
                 url,
                 result.get('status', 0),
@@ -228,65 +326,159 @@ class SQLiteBackend(DatabaseBackend):
                 result.get('title', ''),
                 result.get('content_type', ''),
                 result.get('html_content', ''),
-                links_json,
-                images_json,
-                keywords_json,
-                result_metadata,
-                datetime.now().isoformat()
-            ))
-        
+                _dumps(result.get('links', [])),
+                _dumps(result.get('images', [])),
+                _dumps(result.get('keywords', [])),
+                _dumps(_result_metadata(result)),
+                timestamp
+            ) for url, result in batch])
+            count += len(batch)
+        return count
+
+    def begin_crawl(self, metadata: Optional[Dict[str, Any]] = None) -> int:
+        """Register a crawl session with zero counts and return its crawl id"""
+        self.connect()
+        crawl_id = self._insert_crawl(metadata, 0, 0)
         self.conn.commit()
-        logger.info(f"Saved {total_urls} results to SQLite (crawl_id: {crawl_id})")
         return crawl_id
-    
-    def get_results(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        """
-        Retrieve results from SQLite database.
-        
-        Args:
-            filters: Optional filters (crawl_id, url, status_code, etc.)
-            
-        Returns:
-            List of result dictionaries
-        """
+
+    def insert_results(self, crawl_id: int, results: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """Insert ``(url, result)`` pairs for *crawl_id* in batches; returns the row count"""
         self.connect()
-        
-        query = "SELECT * FROM results WHERE 1=1"
-        params = []
+        count = self._insert_rows(crawl_id, results)
+        self.conn.commit()
+        return count
+
+    def update_crawl_counts(self, crawl_id: int, total_urls: int, successful_urls: int):
+        """Record the URL counts of a crawl registered with :meth:`begin_crawl`"""
+        self.connect()
+        self.cursor.execute("""
+            UPDATE crawls SET total_urls = ?, successful_urls = ?, failed_urls = ?
+            WHERE id = ?
+        """, (total_urls, successful_urls, total_urls - successful_urls, crawl_id))
+        self.conn.commit()
+    
+    @staticmethod
+    def _where(filters: Optional[Dict[str, Any]]) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause (without keyword) and parameters for *filters*"""
+        clauses = ["1=1"]
+        params: List[Any] = []
         
         if filters:
             if 'crawl_id' in filters:
-                query += " AND crawl_id = ?"
+                clauses.append("crawl_id = ?")
                 params.append(filters['crawl_id'])
             if 'url' in filters:
-                query += " AND url LIKE ?"
+                clauses.append("url LIKE ?")
                 params.append(f"%{filters['url']}%")
             if 'status_code' in filters:
-                query += " AND status_code = ?"
+                clauses.append("status_code = ?")
                 params.append(filters['status_code'])
             if 'success' in filters:
-                query += " AND success = ?"
+                clauses.append("success = ?")
                 params.append(int(filters['success']))
+            if 'depth' in filters:
+                clauses.append("depth = ?")
+                params.append(filters['depth'])
+            if 'content_type' in filters:
+                clauses.append("content_type = ?")
+                params.append(filters['content_type'])
+        
+        return " AND ".join(clauses), params
+
+    @staticmethod
+    def _select_list(columns: Optional[Sequence[str]]) -> str:
+        if columns is None:
+            return "*"
+        unknown = [c for c in columns if c not in RESULT_TABLE_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown result columns: {', '.join(unknown)}")
+        return ", ".join(columns)
+
+    @staticmethod
+    def _decode_row(row: sqlite3.Row, decode_json: bool = True) -> Dict[str, Any]:
+        result = dict(row)
+        if decode_json:
+            # Parse JSON fields (only those that were selected)
+            for column in _JSON_COLUMNS:
+                if result.get(column):
+                    result[column] = json.loads(result[column])
+        return result
+
+    def get_results(self, filters: Optional[Dict[str, Any]] = None,
+                    columns: Optional[Sequence[str]] = None,
+                    limit: Optional[int] = None, offset: int = 0,
+                    decode_json: bool = True) -> List[Dict[str, Any]]:
+        """
+        Retrieve results from SQLite database.
         
-        self.cursor.execute(query, params)
-        rows = self.cursor.fetchall()
+        Args:
+            filters: Optional filters (crawl_id, url, status_code, success,
+                depth, content_type)
+            columns: Columns to load (default: all); e.g. ``SUMMARY_COLUMNS``
+                to skip ``html_content``
+            limit: Maximum number of rows (default: no limit)
+            offset: Rows to skip, in ``id`` order
+            decode_json: Parse the JSON columns (links, images, keywords, metadata)
+            
+        Returns:
+            List of result dictionaries
+        """
+        self.connect()
         
-        results = []
-        for row in rows:
-            result = dict(row)
-            # Parse JSON fields
-            if result.get('links'):
-                result['links'] = json.loads(result['links'])
-            if result.get('images'):
-                result['images'] = json.loads(result['images'])
-            if result.get('keywords'):
-                result['keywords'] = json.loads(result['keywords'])
-            if result.get('metadata'):
-                result['metadata'] = json.loads(result['metadata'])
-            results.append(result)
+        where, params = self._where(filters)
+        query = f"SELECT {self._select_list(columns)} FROM results WHERE {where}"
+        if limit is not None or offset:
+            query += " ORDER BY id LIMIT ? OFFSET ?"
+            params += [-1 if limit is None else limit, offset]
+        
+        self.cursor.execute(query, params)
+        results = [self._decode_row(row, decode_json) for row in self.cursor.fetchall()]
         
         logger.info(f"Retrieved {len(results)} results from SQLite")
         return results
+
+    def iter_results(self, filters: Optional[Dict[str, Any]] = None,
+                     columns: Optional[Sequence[str]] = SUMMARY_COLUMNS,
+                     page_size: int = 1000,
+                     decode_json: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over results page by page, in ``id`` order.
+        
+        Pages are fetched with keyset pagination (``id > last_id``), so each
+        page is an index range scan and memory holds at most *page_size*
+        rows, however large the table.  Rows inserted while iterating are
+        picked up if their id is past the current page.
+        
+        Args:
+            filters: Same filters as :meth:`get_results`
+            columns: Columns to load; defaults to ``SUMMARY_COLUMNS`` (no
+                ``html_content``), ``None`` loads all.  ``id`` is always included.
+            page_size: Rows fetched per query
+            decode_json: Parse the JSON columns
+            
+        Yields:
+            Result dictionaries
+        """
+        if page_size < 1:
+            raise ValueError(f"page_size must be >= 1, got {page_size}")
+        self.connect()
+        
+        if columns is not None and 'id' not in columns:
+            columns = ('id',) + tuple(columns)
+        where, params = self._where(filters)
+        query = (f"SELECT {self._select_list(columns)} FROM results "
+                 f"WHERE {where} AND id > ? ORDER BY id LIMIT ?")
+        
+        last_id = 0
+        while True:
+            # A fresh cursor per page: callers may use the backend between pages
+            rows = self.conn.execute(query, params + [last_id, page_size]).fetchall()
+            for row in rows:
+                yield self._decode_row(row, decode_json)
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1]['id']
     
     def get_crawls(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get list of crawl sessions"""
@@ -339,7 +531,7 @@ class PostgreSQLBackend(DatabaseBackend):
     
     def __init__(self, host: str = "localhost", port: int = 5432, 
                  database: str = "crawlit", user: str = "postgres",
-                 password: str = "", **kwargs):
+                 password: str = "", batch_size: int = DEFAULT_BATCH_SIZE, **kwargs):
         """
         Initialize PostgreSQL backend.
         
@@ -349,6 +541,7 @@ class PostgreSQLBackend(DatabaseBackend):
             database: Database name
             user: Database user
             password: Database password
+            batch_size: Rows per multi-row ``INSERT`` (``execute_values``)
             **kwargs: Additional psycopg2 connection parameters
         """
         try:
@@ -372,6 +565,7 @@ class PostgreSQLBackend(DatabaseBackend):
             'password': password,
             **kwargs
         }
+        self.batch_size = batch_size
         self.conn = None
         self.cursor = None
         self._ensure_database_exists()
@@ -565,45 +759,46 @@ class PostgreSQLBackend(DatabaseBackend):
         """Save crawl results to PostgreSQL"""
         self.connect()
         
-        # Extract metadata
-        meta = metadata or {}
-        start_url = meta.get('start_url', 'unknown')
-        user_agent = meta.get('user_agent', 'crawlit/1.0')
-        max_depth = meta.get('max_depth', 0)
-        
         # Count statistics
         total_urls = len(results)
         successful_urls = sum(1 for r in results.values() if r.get('success', False))
-        failed_urls = total_urls - successful_urls
         
-        # Insert crawl metadata
+        crawl_id = self._insert_crawl(metadata, total_urls, successful_urls)
+        self._insert_rows(crawl_id, results.items())
+        
+        self.conn.commit()
+        logger.info(f"Saved {total_urls} results to PostgreSQL (crawl_id: {crawl_id})")
+        return crawl_id
+
+    def _json(self, value: Any):
+        return self.extras.Json(value, dumps=_dumps)
+
+    def _insert_crawl(self, metadata: Optional[Dict[str, Any]], total_urls: int,
+                      successful_urls: int) -> int:
+        meta = metadata or {}
         self.cursor.execute("""
             INSERT INTO crawls (start_url, user_agent, max_depth, 
                                total_urls, successful_urls, failed_urls, metadata)
             VALUES (%s, %s, %s, %s, %s, %s, %s)
             RETURNING id
         """, (
-            start_url, user_agent, max_depth,
-            total_urls, successful_urls, failed_urls,
-            self.extras.Json(meta)
+            meta.get('start_url', 'unknown'), meta.get('user_agent', 'crawlit/1.0'),
+            meta.get('max_depth', 0),
+            total_urls, successful_urls, total_urls - successful_urls,
+            self._json(meta)
         ))
-        
-        crawl_id = self.cursor.fetchone()['id']
-        
-        # Insert individual results
-        for url, result in results.items():
-            result_metadata = {
-                k: v for k, v in result.items()
-                if k not in ['url', 'status', 'success', 'depth', 'title',
-                           'content_type', 'html_content', 'links', 'images', 'keywords']
-            }
-            
-            self.cursor.execute("""
+        return self.cursor.fetchone()['id']
+
+    def _insert_rows(self, crawl_id: int, results: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        count = 0
+        for batch in _batches(results, self.batch_size):
+            # One multi-row INSERT per batch instead of a round trip per row
+            self.extras.execute_values(self.cursor, """
                 INSERT INTO results (crawl_id, url, status_code, success, depth,
                                    title, content_type, html_content, links,
                                    images, keywords, metadata)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
+                VALUES %s
+            """, [(
                 crawl_id, url,
                 result.get('status', 0),
                 result.get('success', False),
@@ -611,15 +806,36 @@ class PostgreSQLBackend(DatabaseBackend):
                 result.get('title', ''),
                 result.get('content_type', ''),
                 result.get('html_content', ''),
-                self.extras.Json(result.get('links', [])),
-                self.extras.Json(result.get('images', [])),
-                self.extras.Json(result.get('keywords', [])),
-                self.extras.Json(result_metadata)
-            ))
-        
+                self._json(result.get('links', [])),
+                self._json(result.get('images', [])),
+                self._json(result.get('keywords', [])),
+                self._json(_result_metadata(result))
+            ) for url, result in batch], page_size=len(batch))
+            count += len(batch)
+        return count
+
+    def begin_crawl(self, metadata: Optional[Dict[str, Any]] = None) -> int:
+        """Register a crawl session with zero counts and return its crawl id"""
+        self.connect()
+        crawl_id = self._insert_crawl(metadata, 0, 0)
         self.conn.commit()
-        logger.info(f"Saved {total_urls} results to PostgreSQL (crawl_id: {crawl_id})")
         return crawl_id
+
+    def insert_results(self, crawl_id: int, results: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """Insert ``(url, result)`` pairs for *crawl_id* in batches; returns the row count"""
+        self.connect()
+        count = self._insert_rows(crawl_id, results)
+        self.conn.commit()
+        return count
+
+    def update_crawl_counts(self, crawl_id: int, total_urls: int, successful_urls: int):
+        """Record the URL counts of a crawl registered with :meth:`begin_crawl`"""
+        self.connect()
+        self.cursor.execute("""
+            UPDATE crawls SET total_urls = %s, successful_urls = %s, failed_urls = %s
+            WHERE id = %s
+        """, (total_urls, successful_urls, total_urls - successful_urls, crawl_id))
+        self.conn.commit()
     
     def get_results(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Retrieve results from PostgreSQL"""
@@ -682,7 +898,7 @@ class MongoDBBackend(DatabaseBackend):
     def __init__(self, host: str = "localhost", port: int = 27017,
                  database: str = "crawlit", collection: str = "results",
                  username: Optional[str] = None, password: Optional[str] = None,
-                 **kwargs):
+                 batch_size: int = DEFAULT_BATCH_SIZE, **kwargs):
         """
         Initialize MongoDB backend.
         
@@ -693,6 +909,7 @@ class MongoDBBackend(DatabaseBackend):
             collection: Collection name for results
             username: Optional username
             password: Optional password
+            batch_size: Documents per ``insert_many`` call
             **kwargs: Additional pymongo connection parameters
         """
         try:
@@ -710,6 +927,7 @@ class MongoDBBackend(DatabaseBackend):
         self.collection_name = collection
         self.username = username
         self.password = password
+        self.batch_size = batch_size
         self.kwargs = kwargs
         
         self.client = None
@@ -822,39 +1040,68 @@ class MongoDBBackend(DatabaseBackend):
         """Save crawl results to MongoDB"""
         self.connect()
         
-        # Create crawl document
+        successful_urls = sum(1 for r in results.values() if r.get('success', False))
+        crawl_id = self._insert_crawl(metadata, len(results), successful_urls)
+        self._insert_documents(crawl_id, results.items())
+        
+        logger.info(f"Saved {len(results)} results to MongoDB (crawl_id: {crawl_id})")
+        return str(crawl_id)
+
+    @staticmethod
+    def _object_id(crawl_id):
+        if isinstance(crawl_id, str):
+            from bson import ObjectId
+            return ObjectId(crawl_id)
+        return crawl_id
+
+    def _insert_crawl(self, metadata: Optional[Dict[str, Any]], total_urls: int,
+                      successful_urls: int):
         crawl_doc = {
             'start_url': metadata.get('start_url', 'unknown') if metadata else 'unknown',
             'timestamp': datetime.now(),
             'user_agent': metadata.get('user_agent', 'crawlit/1.0') if metadata else 'crawlit/1.0',
             'max_depth': metadata.get('max_depth', 0) if metadata else 0,
-            'total_urls': len(results),
-            'successful_urls': sum(1 for r in results.values() if r.get('success', False)),
-            'failed_urls': sum(1 for r in results.values() if not r.get('success', False)),
+            'total_urls': total_urls,
+            'successful_urls': successful_urls,
+            'failed_urls': total_urls - successful_urls,
             'metadata': metadata or {}
         }
-        
-        # Insert crawl metadata
-        crawl_result = self.db.crawls.insert_one(crawl_doc)
-        crawl_id = crawl_result.inserted_id
-        
-        # Prepare result documents
-        documents = []
-        for url, result in results.items():
-            doc = {
+        return self.db.crawls.insert_one(crawl_doc).inserted_id
+
+    def _insert_documents(self, crawl_id, results: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        count = 0
+        for batch in _batches(results, self.batch_size):
+            timestamp = datetime.now()
+            documents = [{
                 'crawl_id': crawl_id,
                 'url': url,
-                'timestamp': datetime.now(),
+                'timestamp': timestamp,
                 **result
-            }
-            documents.append(doc)
-        
-        # Bulk insert results
-        if documents:
-            self.collection.insert_many(documents)
-        
-        logger.info(f"Saved {len(results)} results to MongoDB (crawl_id: {crawl_id})")
-        return str(crawl_id)
+            } for url, result in batch]
+            # Unordered: the server may insert in parallel and one bad
+            # document does not abort the rest of the batch
+            self.collection.insert_many(documents, ordered=False)
+            count += len(documents)
+        return count
+
+    def begin_crawl(self, metadata: Optional[Dict[str, Any]] = None) -> str:
+        """Register a crawl session with zero counts and return its crawl id"""
+        self.connect()
+        return str(self._insert_crawl(metadata, 0, 0))
+
+    def insert_results(self, crawl_id, results: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """Insert ``(url, result)`` pairs for *crawl_id* in batches; returns the document count"""
+        self.connect()
+        return self._insert_documents(self._object_id(crawl_id), results)
+
+    def update_crawl_counts(self, crawl_id, total_urls: int, successful_urls: int):
+        """Record the URL counts of a crawl registered with :meth:`begin_crawl`"""
+        self.connect()
+        self.db.crawls.update_one({'_id': self._object_id(crawl_id)}, {'$set': {
+            'total_urls': total_urls,
+            'successful_urls': successful_urls,
+            'failed_urls': total_urls - successful_urls,
+        }})
     
     def get_results(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Retrieve results from MongoDB"""
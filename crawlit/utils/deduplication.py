@@ -3,15 +3,178 @@
 deduplication.py - Content-based deduplication for crawler
 """
 
+import html
 import logging
 import hashlib
 import threading
-from typing import Set, Optional, Dict, Any
-from bs4 import BeautifulSoup
+from typing import Set, Optional, Dict, Any, List
 import re
 
 logger = logging.getLogger(__name__)
 
+# Comments and script/style/noscript elements (unterminated ones run to EOF)
+_NON_CONTENT_RE = re.compile(
+    r'<!--.*?(?:-->|\Z)|<(script|style|noscript)\b[^>]*>.*?(?:</\1\s*>|\Z)',
+    re.IGNORECASE | re.DOTALL
+)
+# Any remaining tag, doctype or processing instruction; a bare "<" followed by
+# a space or digit is text, as in an HTML parser
+_TAG_RE = re.compile(r'<[a-zA-Z/!?][^>]*>?')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+SIMHASH_BITS = 64
+
+# Words per shingle fed to SimHash
+_SHINGLE_SIZE = 3
+
+_WORD_RE = re.compile(r'\w+')
+
+# Width of each per-bit counter packed into one integer by ``simhash``;
+# 2**20 features per document is far beyond any real page.
+_COUNTER_WIDTH = 20
+_COUNTER_MASK = (1 << _COUNTER_WIDTH) - 1
+
+
+def _build_spread_tables() -> List[List[int]]:
+    """
+    For each byte position of a 64-bit hash, map a byte value to an integer
+    with bit ``k`` of the byte moved into counter field ``position * 8 + k``.
+    Summing these lets ``simhash`` add a feature to all 64 counters with
+    eight lookups instead of a 64-step loop.
+    """
+    tables = []
+    for position in range(SIMHASH_BITS // 8):
+        table = []
+        for value in range(256):
+            spread = 0
+            for k in range(8):
+                if value >> k & 1:
+                    spread |= 1 << ((position * 8 + k) * _COUNTER_WIDTH)
+            table.append(spread)
+        tables.append(table)
+    return tables
+
+
+_SPREAD_TABLES = _build_spread_tables()
+
+
+def simhash(text: str) -> int:
+    """
+    Compute a 64-bit SimHash of *text* over lower-cased word shingles.
+    
+    Documents that share most of their shingles get fingerprints that differ
+    in only a few bits, so Hamming distance approximates dissimilarity.
+    
+    Args:
+        text: Text to fingerprint
+        
+    Returns:
+        64-bit fingerprint as an int (0 for text without words)
+    """
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < _SHINGLE_SIZE:
+        shingles = [' '.join(words)] if words else []
+    else:
+        shingles = [
+            ' '.join(words[i:i + _SHINGLE_SIZE])
+            for i in range(len(words) - _SHINGLE_SIZE + 1)
+        ]
+    if not shingles:
+        return 0
+    
+    t0, t1, t2, t3, t4, t5, t6, t7 = _SPREAD_TABLES
+    counters = 0
+    for shingle in shingles:
+        h = int.from_bytes(
+            hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'little'
+        )
+        counters += (
+            t0[h & 255] + t1[h >> 8 & 255] + t2[h >> 16 & 255] + t3[h >> 24 & 255]
+            + t4[h >> 32 & 255] + t5[h >> 40 & 255] + t6[h >> 48 & 255] + t7[h >> 56]
+        )
+    
+    # A bit is set when it was set in more than half of the shingles
+    fingerprint = 0
+    total = len(shingles)
+    for bit in range(SIMHASH_BITS):
+        if (counters >> (bit * _COUNTER_WIDTH) & _COUNTER_MASK) * 2 > total:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints."""
+    return bin(a ^ b).count('1')
+
+
+class SimHashIndex:
+    """
+    Banded index for finding 64-bit fingerprints within a Hamming distance.
+    
+    The fingerprint is split into ``max_distance + 1`` bands.  By the
+    pigeonhole principle two fingerprints within ``max_distance`` bits agree
+    exactly on at least one band, so a lookup only compares against entries
+    sharing a band value instead of scanning everything.
+    
+    Not thread-safe; callers hold their own lock.
+    """
+    
+    def __init__(self, max_distance: int = 3):
+        """
+        Args:
+            max_distance: Largest Hamming distance treated as a match
+        """
+        if not 0 <= max_distance < SIMHASH_BITS:
+            raise ValueError(f"max_distance must be between 0 and {SIMHASH_BITS - 1}")
+        self.max_distance = max_distance
+        num_bands = max_distance + 1
+        width, extra = divmod(SIMHASH_BITS, num_bands)
+        self._bands = []  # (shift, mask) per band
+        shift = 0
+        for band in range(num_bands):
+            band_width = width + (1 if band < extra else 0)
+            self._bands.append((shift, (1 << band_width) - 1))
+            shift += band_width
+        self._tables: List[Dict[int, List[str]]] = [{} for _ in self._bands]
+        self._fingerprints: Dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+    
+    def add(self, key: str, fingerprint: int) -> None:
+        """Index *fingerprint* under *key*."""
+        if key in self._fingerprints:
+            return
+        self._fingerprints[key] = fingerprint
+        for (shift, mask), table in zip(self._bands, self._tables):
+            table.setdefault(fingerprint >> shift & mask, []).append(key)
+    
+    def find(self, fingerprint: int) -> Optional[str]:
+        """
+        Return the key of the closest indexed fingerprint within
+        ``max_distance`` bits, or None.
+        """
+        best_key = None
+        best_distance = self.max_distance + 1
+        seen = set()
+        for (shift, mask), table in zip(self._bands, self._tables):
+            for key in table.get(fingerprint >> shift & mask, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                distance = hamming_distance(fingerprint, self._fingerprints[key])
+                if distance < best_distance:
+                    best_key, best_distance = key, distance
+                    if distance == 0:
+                        return best_key
+        return best_key
+    
+    def clear(self) -> None:
+        """Remove all fingerprints."""
+        for table in self._tables:
+            table.clear()
+        self._fingerprints.clear()
+
 
 class ContentDeduplicator:
     """
@@ -20,14 +183,16 @@ class ContentDeduplicator:
     Supports:
     - Exact content matching (hash-based)
     - Normalized content matching (whitespace/structure normalized)
-    - Content similarity detection (optional, using hash-based approach)
+    - Near-duplicate detection (optional, 64-bit SimHash with a banded index)
     """
     
     def __init__(
         self,
         normalize_content: bool = True,
         min_content_length: int = 100,
-        enabled: bool = True
+        enabled: bool = True,
+        near_duplicates: bool = False,
+        similarity_threshold: float = 0.95
     ):
         """
         Initialize the content deduplicator.
@@ -36,18 +201,31 @@ class ContentDeduplicator:
             normalize_content: Whether to normalize content before hashing (removes extra whitespace, normalizes HTML)
             min_content_length: Minimum content length to consider for deduplication (in characters)
             enabled: Whether deduplication is enabled
+            near_duplicates: Also treat content as duplicate when its SimHash is close to
+                previously seen content (catches pages differing only in timestamps, ads, etc.)
+            similarity_threshold: Fraction of the 64 SimHash bits that must agree for a
+                near-duplicate match (0.95 allows 3 differing bits)
         """
+        if not 0.0 < similarity_threshold <= 1.0:
+            raise ValueError("similarity_threshold must be in (0, 1]")
         self.normalize_content = normalize_content
         self.min_content_length = min_content_length
         self.enabled = enabled
+        self.near_duplicates = near_duplicates
+        self.similarity_threshold = similarity_threshold
+        self.max_hamming_distance = int((1.0 - similarity_threshold) * SIMHASH_BITS + 1e-9)
         
         # Track seen content hashes
         self._content_hashes: Set[str] = set()
         self._content_to_urls: Dict[str, Set[str]] = {}  # Hash -> set of URLs
+        self._url_to_hash: Dict[str, str] = {}  # URL -> hash of its content group
+        self._simhash_index = SimHashIndex(self.max_hamming_distance)
         self._lock = threading.Lock()  # Thread-safe access
         
         # Statistics
         self._duplicates_found = 0
+        self._exact_duplicates = 0
+        self._near_duplicates = 0
         self._total_checked = 0
     
     def is_duplicate(self, content: str, url: str) -> bool:
@@ -67,26 +245,23 @@ class ContentDeduplicator:
         if not content or len(content) < self.min_content_length:
             return False
         
+        # Normalising and hashing are the expensive part; do them before
+        # taking the lock so concurrent checks only serialise on the set update
+        if self.normalize_content:
+            normalized = self._normalize_content(content)
+        else:
+            normalized = content
+        content_hash = self._hash_content(normalized)
+        fingerprint = simhash(normalized) if self.near_duplicates else None
+        
         with self._lock:
             self._total_checked += 1
             
-            # Normalize content if enabled
-            if self.normalize_content:
-                normalized = self._normalize_content(content)
-            else:
-                normalized = content
-            
-            # Generate hash
-            content_hash = self._hash_content(normalized)
-            
             # Check if we've seen this hash before
             if content_hash in self._content_hashes:
                 self._duplicates_found += 1
-                
-                # Track which URLs have this content
-                if content_hash not in self._content_to_urls:
-                    self._content_to_urls[content_hash] = set()
-                self._content_to_urls[content_hash].add(url)
+                self._exact_duplicates += 1
+                self._record_url(content_hash, url)
                 
                 # Get original URL(s) with this content
                 original_urls = self._content_to_urls[content_hash]
@@ -96,14 +271,34 @@ class ContentDeduplicator:
                 )
                 return True
             
+            # Check for near-duplicates of previously seen content
+            if fingerprint is not None:
+                match = self._simhash_index.find(fingerprint)
+                if match is not None:
+                    self._duplicates_found += 1
+                    self._near_duplicates += 1
+                    self._record_url(match, url)
+                    logger.debug(
+                        f"Near-duplicate content detected for {url}. "
+                        f"Similar URL(s): {', '.join(self._content_to_urls[match])}"
+                    )
+                    return True
+            
             # Add to seen content
             self._content_hashes.add(content_hash)
-            if content_hash not in self._content_to_urls:
-                self._content_to_urls[content_hash] = set()
-            self._content_to_urls[content_hash].add(url)
+            self._record_url(content_hash, url)
+            if fingerprint is not None:
+                self._simhash_index.add(content_hash, fingerprint)
             
             return False
     
+    def _record_url(self, content_hash: str, url: str) -> None:
+        """Attach *url* to the content group *content_hash* (caller holds the lock)."""
+        if content_hash not in self._content_to_urls:
+            self._content_to_urls[content_hash] = set()
+        self._content_to_urls[content_hash].add(url)
+        self._url_to_hash.setdefault(url, content_hash)
+    
     def _normalize_content(self, content: str) -> str:
         """
         Normalize content for better duplicate detection.
@@ -121,27 +316,15 @@ class ContentDeduplicator:
             Normalized content string
         """
         try:
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            # Remove script and style tags (they often vary but don't affect content)
-            for tag in soup(['script', 'style', 'noscript']):
-                tag.decompose()
-            
-            # Remove comments
-            from bs4 import Comment
-            comments = soup.find_all(string=lambda text: isinstance(text, Comment))
-            for comment in comments:
-                comment.extract()
-            
-            # Get text content
-            text = soup.get_text()
+            # Strip comments and script/style/noscript blocks (they often vary
+            # but don't affect content), then the remaining tags, with
+            # compiled regexes rather than a full parse
+            text = _NON_CONTENT_RE.sub('', content)
+            text = _TAG_RE.sub('', text)
+            text = html.unescape(text)
             
             # Normalize whitespace
-            text = re.sub(r'\s+', ' ', text)
-            text = text.strip()
-            
-            return text
+            return _WHITESPACE_RE.sub(' ', text).strip()
         except Exception as e:
             logger.warning(f"Error normalizing content: {e}. Using original content.")
             return content
@@ -172,11 +355,30 @@ class ContentDeduplicator:
             return None
         
         with self._lock:
-            for content_hash, urls in self._content_to_urls.items():
-                if url in urls:
-                    # Return all URLs with this content, excluding the given URL
-                    return urls - {url}
-        return None
+            content_hash = self._url_to_hash.get(url)
+            if content_hash is None:
+                return None
+            # Return all URLs with this content, excluding the given URL
+            return self._content_to_urls[content_hash] - {url}
+
+    def get_content_hash(self, url: str) -> Optional[str]:
+        """
+        Get the hash of the content group *url* was assigned to by :meth:`is_duplicate`.
+
+        The hash is taken over the normalised content, and near-duplicates
+        share the hash of the page they matched.
+
+        Args:
+            url: URL to look up
+
+        Returns:
+            Hexadecimal hash string, or None if *url* was not checked
+            (deduplication disabled or content too short)
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            return self._url_to_hash.get(url)
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -192,6 +394,10 @@ class ContentDeduplicator:
                 'min_content_length': self.min_content_length,
                 'total_checked': self._total_checked,
                 'duplicates_found': self._duplicates_found,
+                'exact_duplicates': self._exact_duplicates,
+                'near_duplicates': self._near_duplicates,
+                'near_duplicate_detection': self.near_duplicates,
+                'similarity_threshold': self.similarity_threshold,
                 'unique_content_count': len(self._content_hashes),
                 'duplicate_rate': (
                     self._duplicates_found / self._total_checked 
@@ -204,7 +410,11 @@ class ContentDeduplicator:
         with self._lock:
             self._content_hashes.clear()
             self._content_to_urls.clear()
+            self._url_to_hash.clear()
+            self._simhash_index.clear()
             self._duplicates_found = 0
+            self._exact_duplicates = 0
+            self._near_duplicates = 0
             self._total_checked = 0
             logger.debug("Content deduplicator cleared")
     
@@ -212,6 +422,8 @@ class ContentDeduplicator:
         """Reset statistics while keeping tracked content."""
         with self._lock:
             self._duplicates_found = 0
+            self._exact_duplicates = 0
+            self._near_duplicates = 0
             self._total_checked = 0
 
 
@@ -11,6 +11,7 @@ significant event during a crawl run.  One JSON object per line::
 Event types
 -----------
 CRAWL_START       — job began (emitted once by the engine)
+CRAWL_RESUME      — job continued from a saved state or checkpoint
 CRAWL_END         — job finished (emitted once by the engine)
 FETCH_RETRY       — a fetch failed and will be retried
 FETCH_ERROR       — final fetch failure after all retries exhausted
@@ -35,17 +36,22 @@ Inject into the crawler::
 
 The :class:`~crawlit.pipelines.ArtifactStore` automatically creates an
 ``events.jsonl`` inside its store directory when you pass ``event_log=True``.
+
+Events are buffered and written in groups (see
+:class:`~crawlit.utils.buffered_writer.BufferedLineWriter`); the engines flush
+the log when a crawl ends and :meth:`CrawlEventLog.close` drains it.
 """
 
 from __future__ import annotations
 
 import json
 import logging
-import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from .buffered_writer import DEFAULT_BUFFER_SIZE, DEFAULT_FLUSH_INTERVAL, BufferedLineWriter
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -53,6 +59,7 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 CRAWL_START     = "CRAWL_START"
+CRAWL_RESUME    = "CRAWL_RESUME"
 CRAWL_END       = "CRAWL_END"
 FETCH_RETRY     = "FETCH_RETRY"
 FETCH_ERROR     = "FETCH_ERROR"
@@ -66,6 +73,7 @@ DEDUPE_HIT      = "DEDUPE_HIT"
 #: All valid event types (for validation / documentation).
 EVENT_TYPES = {
     CRAWL_START,
+    CRAWL_RESUME,
     CRAWL_END,
     FETCH_RETRY,
     FETCH_ERROR,
@@ -91,14 +99,27 @@ class CrawlEventLog:
     run_id : str | None
         Crawl run identifier stamped on every event.  Pass the same value as
         ``Crawler(run_id=…)`` so events can be joined with artifact records.
+    flush_interval : float
+        Seconds between group flushes (default 1.0); ``0`` flushes every event.
+    buffer_size : int
+        Pending bytes that trigger an early flush (default 1 MiB).
+    fsync : str
+        ``"never"`` (default), ``"flush"`` or ``"close"``.
     """
 
-    def __init__(self, path: "str | Path", run_id: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        path: "str | Path",
+        run_id: Optional[str] = None,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        fsync: str = "never",
+    ) -> None:
         self._path = Path(path)
-        self._path.parent.mkdir(parents=True, exist_ok=True)
         self._run_id = run_id
-        self._lock = threading.Lock()
-        self._fh = self._path.open("a", encoding="utf-8")
+        self._fh = BufferedLineWriter(
+            self._path, flush_interval=flush_interval, buffer_size=buffer_size, fsync=fsync
+        )
 
     # ------------------------------------------------------------------
     # Core emit
@@ -135,10 +156,7 @@ class CrawlEventLog:
             "url": url,
             "details": details if details else {},
         }
-        line = json.dumps(record, ensure_ascii=False, default=str)
-        with self._lock:
-            self._fh.write(line + "\n")
-            self._fh.flush()
+        self._fh.write(json.dumps(record, ensure_ascii=False, default=str))
 
     # ------------------------------------------------------------------
     # Convenience methods matching each event type
@@ -148,6 +166,10 @@ class CrawlEventLog:
         """Emit ``CRAWL_START``."""
         self.emit(CRAWL_START, url="", seed_urls=seed_urls, **details)
 
+    def crawl_resume(self, source: str, **details: Any) -> None:
+        """Emit ``CRAWL_RESUME`` (instead of ``CRAWL_START``) for a resumed crawl."""
+        self.emit(CRAWL_RESUME, url="", source=source, **details)
+
     def crawl_end(self, pages_crawled: int = 0, **details: Any) -> None:
         """Emit ``CRAWL_END``."""
         self.emit(CRAWL_END, url="", pages_crawled=pages_crawled, **details)
@@ -202,12 +224,13 @@ class CrawlEventLog:
         """Update the run_id stamped on subsequent events."""
         self._run_id = run_id
 
+    def flush(self) -> None:
+        """Write buffered events to disk now."""
+        self._fh.flush()
+
     def close(self) -> None:
         """Flush and close the underlying file handle."""
-        with self._lock:
-            if not self._fh.closed:
-                self._fh.flush()
-                self._fh.close()
+        self._fh.close()
 
     def __del__(self) -> None:
         try:
@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+prefetch_dedup.py - Skip likely duplicates before their body is downloaded
+
+:class:`ContentDeduplicator` can only judge a page once its HTML has been
+downloaded and decoded.  :class:`PrefetchDeduplicator` predicts duplicates
+from cheap signals so the fetch can be skipped entirely:
+
+- **Canonical hints** – a URL whose page declared a ``rel="canonical"``
+  target (in this run or a previous one) is skipped once that target has been
+  fetched.
+- **Learned URL rules** – when content deduplication confirms that two URLs
+  on the same host differ only in some query parameters, those parameters
+  are voted irrelevant (one vote per duplicate URL and parameter); after
+  ``min_rule_observations`` votes URLs are compared with them removed.
+- **Header fingerprints** – with ``head_requests=True`` the crawler sends a
+  HEAD request first, and a response whose ETag (or Content-Length plus
+  Last-Modified) matches a page already fetched on the same host is skipped.
+
+A configurable fraction of would-be skips is fetched anyway as an audit; if
+the audited page's content differs from the page it was predicted to
+duplicate, it counts as a false skip.  Skip and audit figures are reported by
+:meth:`PrefetchDeduplicator.get_stats`.
+
+Hints and learned rules can be persisted with ``state_path`` so later runs
+start with them.
+"""
+
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Optional, Set, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+
+logger = logging.getLogger(__name__)
+
+# Skip reasons reported in stats
+REASON_CANONICAL = 'canonical'
+REASON_URL_RULE = 'url_rule'
+REASON_ETAG = 'etag'
+REASON_LENGTH_MODIFIED = 'length_last_modified'
+
+_CANONICAL_LINK_RE = re.compile(r'<link\b[^>]*>', re.IGNORECASE)
+_REL_CANONICAL_RE = re.compile(r'\brel\s*=\s*["\']?canonical\b', re.IGNORECASE)
+_HREF_RE = re.compile(r'\bhref\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))', re.IGNORECASE)
+
+
+def _header(headers: Optional[Dict[str, Any]], name: str) -> Optional[str]:
+    """Case-insensitive header lookup on a plain dict or mapping."""
+    if not headers:
+        return None
+    value = headers.get(name)
+    if value is None:
+        lower = name.lower()
+        for key, val in headers.items():
+            if key.lower() == lower:
+                value = val
+                break
+    return str(value) if value is not None else None
+
+
+def _find_canonical(html: str, base_url: str) -> Optional[str]:
+    """Return the absolute ``rel="canonical"`` URL declared in *html*, if any."""
+    # Canonical links live in <head>; don't scan the whole body for them
+    head_end = html.lower().find('</head>')
+    scope = html if head_end == -1 else html[:head_end]
+    for tag in _CANONICAL_LINK_RE.finditer(scope):
+        tag_text = tag.group(0)
+        if not _REL_CANONICAL_RE.search(tag_text):
+            continue
+        href = _HREF_RE.search(tag_text)
+        if href:
+            value = next(g for g in href.groups() if g is not None).strip()
+            if value:
+                return urljoin(base_url, value)
+    return None
+
+
+class PrefetchDeduplicator:
+    """
+    Predicts duplicate pages before they are fetched.
+
+    Thread-safe; a single instance can be shared by the sync and async
+    crawlers.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        head_requests: bool = False,
+        use_canonical_hints: bool = True,
+        learn_url_rules: bool = True,
+        min_rule_observations: int = 3,
+        audit_rate: float = 0.05,
+        audit_sample_size: int = 50,
+        state_path: Optional[Union[str, Path]] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize the pre-fetch deduplicator.
+
+        Args:
+            enabled: Whether pre-fetch deduplication is active
+            head_requests: Send a HEAD request before each fetch and compare
+                its ETag / Content-Length+Last-Modified with pages already seen
+            use_canonical_hints: Skip URLs whose known canonical target was fetched
+            learn_url_rules: Learn ignorable query parameters from confirmed duplicates
+            min_rule_observations: Confirmed duplicates needed before a query
+                parameter is treated as irrelevant for a host
+            audit_rate: Fraction of would-be skips fetched anyway to measure
+                false skips (0 disables auditing)
+            audit_sample_size: Number of recent audit outcomes kept for stats
+            state_path: JSON file that canonical hints and learned rules are
+                loaded from and saved to
+            seed: Seed for the audit sampler (for reproducible runs)
+        """
+        if not 0.0 <= audit_rate <= 1.0:
+            raise ValueError("audit_rate must be between 0 and 1")
+        self.enabled = enabled
+        self.head_requests = head_requests
+        self.use_canonical_hints = use_canonical_hints
+        self.learn_url_rules = learn_url_rules
+        self.min_rule_observations = min_rule_observations
+        self.audit_rate = audit_rate
+        self.state_path = Path(state_path) if state_path else None
+
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+
+        # Pages fetched in this run: URL -> content hash (None if unknown)
+        self._fetched: Dict[str, Optional[str]] = {}
+        # Normalised URL key -> first fetched URL with that key
+        self._url_keys: Dict[str, str] = {}
+        # URL -> canonical URL it declared (persisted)
+        self._canonical_hints: Dict[str, str] = {}
+        # host -> query parameters learned to be irrelevant (persisted)
+        self._ignored_params: Dict[str, Set[str]] = {}
+        # (host, param) -> confirmed duplicates that differed in param
+        self._param_votes: Dict[Tuple[str, str], int] = {}
+        # (url, param) pairs that have voted, so a URL votes once per param
+        self._param_voters: Set[Tuple[str, str]] = set()
+        # Header fingerprints of fetched pages -> URL
+        self._etags: Dict[Tuple[str, str], str] = {}
+        self._length_modified: Dict[Tuple[str, str, str], str] = {}
+
+        # Audits awaiting the fetched content: URL -> (predicted original, reason)
+        self._pending_audits: Dict[str, Tuple[str, str]] = {}
+        self._audit_samples: Deque[Dict[str, Any]] = deque(maxlen=audit_sample_size)
+
+        # Statistics
+        self._checked = 0
+        self._skipped = 0
+        self._skipped_by_reason: Dict[str, int] = {}
+        self._audited = 0
+        self._false_skips = 0
+
+        if self.state_path and self.state_path.exists():
+            self.load()
+
+    # ------------------------------------------------------------------
+    # Checks
+    # ------------------------------------------------------------------
+
+    def check_url(self, url: str) -> Optional[str]:
+        """
+        Decide from the URL alone whether it is a likely duplicate.
+
+        Args:
+            url: URL about to be fetched
+
+        Returns:
+            The URL it is predicted to duplicate (skip the fetch), or None
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            self._checked += 1
+            if self.use_canonical_hints:
+                canonical = self._canonical_hints.get(url)
+                if canonical and canonical != url and canonical in self._fetched:
+                    return self._skip_or_audit(url, canonical, REASON_CANONICAL)
+            if self.learn_url_rules and self._ignored_params:
+                original = self._url_keys.get(self._url_key(url))
+                if original and original != url:
+                    return self._skip_or_audit(url, original, REASON_URL_RULE)
+        return None
+
+    def check_headers(self, url: str, headers: Optional[Dict[str, Any]]) -> Optional[str]:
+        """
+        Decide from response headers (e.g. of a HEAD request) whether *url*
+        is a likely duplicate.
+
+        Args:
+            url: URL about to be fetched
+            headers: Response headers
+
+        Returns:
+            The URL it is predicted to duplicate (skip the fetch), or None
+        """
+        if not self.enabled or not headers:
+            return None
+
+        host = urlparse(url).netloc.lower()
+        etag = _header(headers, 'ETag')
+        length = _header(headers, 'Content-Length')
+        modified = _header(headers, 'Last-Modified')
+
+        with self._lock:
+            if etag:
+                original = self._etags.get((host, etag))
+                if original and original != url:
+                    return self._skip_or_audit(url, original, REASON_ETAG)
+            if length and modified:
+                original = self._length_modified.get((host, length, modified))
+                if original and original != url:
+                    return self._skip_or_audit(url, original, REASON_LENGTH_MODIFIED)
+        return None
+
+    def _skip_or_audit(self, url: str, original: str, reason: str) -> Optional[str]:
+        """Count a predicted duplicate; occasionally let it through for audit (lock held)."""
+        if self.audit_rate and self._random.random() < self.audit_rate:
+            self._pending_audits[url] = (original, reason)
+            logger.debug(f"Auditing predicted duplicate {url} (of {original}, {reason})")
+            return None
+        self._skipped += 1
+        self._skipped_by_reason[reason] = self._skipped_by_reason.get(reason, 0) + 1
+        logger.debug(f"Pre-fetch dedup: skipping {url} as duplicate of {original} ({reason})")
+        return original
+
+    # ------------------------------------------------------------------
+    # Learning
+    # ------------------------------------------------------------------
+
+    def record_fetch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, Any]] = None,
+        content: Optional[str] = None,
+        content_hash: Optional[str] = None,
+        canonical_url: Optional[str] = None,
+    ) -> None:
+        """
+        Record a page that was fully fetched.
+
+        Args:
+            url: URL that was fetched
+            headers: Response headers (ETag, Content-Length, Last-Modified)
+            content: Page body, used for the audit hash and canonical hint
+            content_hash: Pre-computed content hash (takes precedence over
+                content).  The engines pass :class:`ContentDeduplicator`'s
+                normalised hash, so pages the deduplicator treats as equal
+                (differing only in nonces or timestamps) confirm a skip.
+            canonical_url: Canonical URL, if already known (otherwise read from content)
+        """
+        if not self.enabled:
+            return
+
+        if content_hash is None and content is not None:
+            content_hash = hashlib.sha256(content.encode('utf-8', errors='replace')).hexdigest()
+        if canonical_url is None and content and self.use_canonical_hints:
+            canonical_url = _find_canonical(content, url)
+
+        host = urlparse(url).netloc.lower()
+        etag = _header(headers, 'ETag')
+        length = _header(headers, 'Content-Length')
+        modified = _header(headers, 'Last-Modified')
+
+        with self._lock:
+            self._fetched[url] = content_hash
+            self._url_keys.setdefault(self._url_key(url), url)
+            if etag:
+                self._etags.setdefault((host, etag), url)
+            if length and modified:
+                self._length_modified.setdefault((host, length, modified), url)
+            if canonical_url and canonical_url != url:
+                self._canonical_hints[url] = canonical_url
+
+            audit = self._pending_audits.pop(url, None)
+            if audit is not None:
+                original, reason = audit
+                expected = self._fetched.get(original)
+                if content_hash is not None and expected is not None:
+                    confirmed = content_hash == expected
+                    self._audited += 1
+                    if not confirmed:
+                        self._false_skips += 1
+                    self._audit_samples.append({
+                        'url': url,
+                        'predicted_duplicate_of': original,
+                        'reason': reason,
+                        'confirmed': confirmed,
+                    })
+
+    def record_duplicate(self, url: str, duplicate_of: Iterable[str]) -> None:
+        """
+        Learn from a duplicate confirmed after fetching (e.g. by
+        :class:`ContentDeduplicator`).
+
+        Query parameters that differ between *url* and a same-host, same-path
+        original earn a vote; enough votes mark the parameter as irrelevant
+        for that host.  A URL votes at most once per parameter, however many
+        originals it duplicates or however often it is recorded.
+
+        Args:
+            url: URL whose content was a duplicate
+            duplicate_of: URLs with the same content
+        """
+        if not self.enabled or not self.learn_url_rules:
+            return
+
+        parsed = urlparse(url)
+        host = parsed.netloc.lower()
+        params = dict(parse_qsl(parsed.query, keep_blank_values=True))
+
+        differing: Set[str] = set()
+        for other in duplicate_of:
+            other_parsed = urlparse(other)
+            if other_parsed.netloc.lower() != host or other_parsed.path != parsed.path:
+                continue
+            other_params = dict(parse_qsl(other_parsed.query, keep_blank_values=True))
+            differing.update(
+                name for name in set(params) | set(other_params)
+                if params.get(name) != other_params.get(name)
+            )
+
+        with self._lock:
+            for name in differing:
+                if (url, name) in self._param_voters:
+                    continue
+                self._param_voters.add((url, name))
+                votes = self._param_votes.get((host, name), 0) + 1
+                self._param_votes[(host, name)] = votes
+                if votes >= self.min_rule_observations:
+                    learned = self._ignored_params.setdefault(host, set())
+                    if name not in learned:
+                        learned.add(name)
+                        logger.info(f"Pre-fetch dedup: ignoring query parameter '{name}' on {host}")
+                        self._rebuild_url_keys()
+
+    def _url_key(self, url: str) -> str:
+        """URL with learned irrelevant parameters removed (lock held)."""
+        parsed = urlparse(url)
+        host = parsed.netloc.lower()
+        ignored = self._ignored_params.get(host)
+        if not ignored or not parsed.query:
+            return urlunparse(parsed._replace(netloc=host, fragment=''))
+        kept = sorted(
+            (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+            if k not in ignored
+        )
+        return urlunparse(parsed._replace(netloc=host, query=urlencode(kept), fragment=''))
+
+    def _rebuild_url_keys(self) -> None:
+        """Re-key fetched URLs after a new rule is learned (lock held)."""
+        self._url_keys = {}
+        for fetched_url in self._fetched:
+            self._url_keys.setdefault(self._url_key(fetched_url), fetched_url)
+
+    # ------------------------------------------------------------------
+    # Stats and persistence
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pre-fetch deduplication statistics.
+
+        Returns:
+            Dictionary with skip counts, skip rate and audit results
+        """
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'head_requests': self.head_requests,
+                'checked': self._checked,
+                'skipped': self._skipped,
+                'skipped_by_reason': dict(self._skipped_by_reason),
+                'skip_rate': self._skipped / self._checked if self._checked > 0 else 0.0,
+                'audit_rate': self.audit_rate,
+                'audited': self._audited,
+                'false_skips': self._false_skips,
+                'false_skip_rate': (
+                    self._false_skips / self._audited if self._audited > 0 else 0.0
+                ),
+                'audit_samples': list(self._audit_samples),
+                'canonical_hints': len(self._canonical_hints),
+                'ignored_params': {
+                    host: sorted(params) for host, params in self._ignored_params.items()
+                },
+            }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialise the state worth carrying into later runs."""
+        with self._lock:
+            return {
+                'canonical_hints': dict(self._canonical_hints),
+                'ignored_params': {
+                    host: sorted(params) for host, params in self._ignored_params.items()
+                },
+                'param_votes': [
+                    [host, name, votes] for (host, name), votes in self._param_votes.items()
+                ],
+            }
+
+    def from_dict(self, data: Dict[str, Any]) -> None:
+        """Merge state produced by :meth:`to_dict`."""
+        with self._lock:
+            self._canonical_hints.update(data.get('canonical_hints', {}))
+            for host, params in data.get('ignored_params', {}).items():
+                self._ignored_params.setdefault(host, set()).update(params)
+            for host, name, votes in data.get('param_votes', []):
+                key = (host, name)
+                self._param_votes[key] = max(self._param_votes.get(key, 0), votes)
+            self._rebuild_url_keys()
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Save canonical hints and learned rules.
+
+        Args:
+            path: File to write (defaults to ``state_path``)
+        """
+        target = Path(path) if path else self.state_path
+        if target is None:
+            raise ValueError("No path given and no state_path configured")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(target.suffix + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+        tmp.replace(target)
+        logger.debug(f"Saved pre-fetch dedup state to {target}")
+
+    def load(self, path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Load canonical hints and learned rules.
+
+        Args:
+            path: File to read (defaults to ``state_path``)
+        """
+        source = Path(path) if path else self.state_path
+        if source is None:
+            raise ValueError("No path given and no state_path configured")
+        try:
+            with open(source, 'r', encoding='utf-8') as f:
+                self.from_dict(json.load(f))
+            logger.debug(f"Loaded pre-fetch dedup state from {source}")
+        except Exception as e:
+            logger.error(f"Failed to load pre-fetch dedup state from {source}: {e}")
+
+    def clear(self) -> None:
+        """Forget everything, including persisted hints held in memory."""
+        with self._lock:
+            self._fetched.clear()
+            self._url_keys.clear()
+            self._canonical_hints.clear()
+            self._ignored_params.clear()
+            self._param_votes.clear()
+            self._param_voters.clear()
+            self._etags.clear()
+            self._length_modified.clear()
+            self._pending_audits.clear()
+            self._audit_samples.clear()
+            self._checked = 0
+            self._skipped = 0
+            self._skipped_by_reason.clear()
+            self._audited = 0
+            self._false_skips = 0
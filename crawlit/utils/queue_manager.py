@@ -1,32 +1,51 @@
 #!/usr/bin/env python3
 """
 queue_manager.py - Queue management utilities for crawler state persistence
+
+State files ending in ``.json`` are written as a single JSON document; any
+other path gets a compact binary checkpoint (see :mod:`crawlit.utils.checkpoint`).
+Both are recognised on load.
 """
 
 import json
 import logging
+import os
+import tempfile
 from typing import Dict, List, Set, Tuple, Any, Optional
 from datetime import datetime
 from collections import deque
 
+from .checkpoint import CheckpointWriter, is_checkpoint, load_checkpoint
+
 logger = logging.getLogger(__name__)
 
+#: Values accepted by ``QueueManager.save_state(format=...)``.
+STATE_FORMATS = ("auto", "json", "checkpoint")
+
 
 class QueueManager:
     """
     Utility class for managing crawler queue state, including save/load functionality.
     """
     
+    @staticmethod
+    def state_format(filepath: str) -> str:
+        """Format ``save_state(format="auto")`` uses for *filepath*."""
+        return "json" if filepath.lower().endswith(".json") else "checkpoint"
+
     @staticmethod
     def save_state(
         queue: deque,
         visited_urls: Set[str],
         results: Dict[str, Any],
         filepath: str,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        format: str = "auto",
+        writer: Optional[CheckpointWriter] = None,
+        incremental: bool = False
     ) -> None:
         """
-        Save crawler state to a JSON file.
+        Save crawler state to a JSON file or a binary checkpoint.
         
         Args:
             queue: The URL queue (deque of (url, depth) tuples)
@@ -34,25 +53,47 @@ class QueueManager:
             results: Crawl results dictionary
             filepath: Path to save the state file
             metadata: Optional metadata to include (e.g., start_url, max_depth)
+            format: "json", "checkpoint", or "auto" (JSON for ``.json`` paths)
+            writer: CheckpointWriter to reuse across saves of the same file
+            incremental: Append a delta to the checkpoint written earlier by
+                *writer* instead of rewriting it (checkpoint format only)
         """
-        # Convert deque to list for JSON serialization
-        queue_list = list(queue)
-        
-        # Convert set to list for JSON serialization
-        visited_urls_list = list(visited_urls)
-        
-        # Prepare state dictionary
-        state = {
-            'queue': queue_list,
-            'visited_urls': visited_urls_list,
-            'results': results,
-            'metadata': metadata or {},
-            'saved_at': datetime.now().isoformat()
-        }
-        
+        if format not in STATE_FORMATS:
+            raise ValueError(f"format must be one of {STATE_FORMATS}, got {format!r}")
+        if format == "auto":
+            format = QueueManager.state_format(filepath)
+
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(state, f, indent=2, default=str)
+            if format == "checkpoint":
+                if writer is None:
+                    writer = CheckpointWriter(filepath)
+                kind = writer.write(queue, visited_urls, results, metadata, incremental=incremental)
+                logger.info(f"Crawler state saved to {filepath} ({kind})")
+                return
+
+            # Prepare state dictionary
+            state = {
+                'queue': list(queue),
+                'visited_urls': list(visited_urls),
+                'results': results,
+                'metadata': metadata or {},
+                'saved_at': datetime.now().isoformat()
+            }
+
+            # Write to a sibling temp file then rename, so a crash during the
+            # write never leaves a partially-written state file
+            parent = os.path.dirname(os.path.abspath(filepath))
+            fd, tmp_path = tempfile.mkstemp(dir=parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(state, f, indent=2, default=str)
+                os.replace(tmp_path, filepath)
+            except Exception:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
             logger.info(f"Crawler state saved to {filepath}")
         except Exception as e:
             logger.error(f"Failed to save crawler state: {e}")
@@ -61,7 +102,7 @@ class QueueManager:
     @staticmethod
     def load_state(filepath: str) -> Tuple[deque, Set[str], Dict[str, Any], Dict[str, Any]]:
         """
-        Load crawler state from a JSON file.
+        Load crawler state from a JSON file or a binary checkpoint.
         
         Args:
             filepath: Path to the state file
@@ -70,19 +111,22 @@ class QueueManager:
             Tuple of (queue, visited_urls, results, metadata)
         """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                state = json.load(f)
-            
-            # Reconstruct deque from list, converting lists back to tuples
-            queue_data = state.get('queue', [])
-            queue = deque([tuple(item) if isinstance(item, list) else item for item in queue_data])
-            
-            # Reconstruct set from list
-            visited_urls = set(state.get('visited_urls', []))
-            
-            # Get results and metadata
-            results = state.get('results', {})
-            metadata = state.get('metadata', {})
+            if is_checkpoint(filepath):
+                queue, visited_urls, results, metadata = load_checkpoint(filepath)
+            else:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+                
+                # Reconstruct deque from list, converting lists back to tuples
+                queue_data = state.get('queue', [])
+                queue = deque([tuple(item) if isinstance(item, list) else item for item in queue_data])
+                
+                # Reconstruct set from list
+                visited_urls = set(state.get('visited_urls', []))
+                
+                # Get results and metadata
+                results = state.get('results', {})
+                metadata = state.get('metadata', {})
             
             logger.info(f"Crawler state loaded from {filepath}")
             logger.info(f"  - Queue size: {len(queue)}")
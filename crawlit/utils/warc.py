@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+warc.py - Minimal WARC/1.1 record reading and writing
+
+Records are written as individual gzip members ("gzip per record"), the layout
+used by Heritrix, wget and Common Crawl, so any record can be read by seeking to
+its offset and decompressing a single member.  Only what crawlit needs is
+implemented: ``warcinfo``, ``request``, ``response`` and ``metadata`` records,
+with HTTP message blocks for requests and responses.
+"""
+
+import base64
+import hashlib
+import logging
+import uuid
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+WARC_VERSION = "WARC/1.1"
+
+#: Name of the CDXJ-style index written next to WARC files by :class:`WARCWriter`.
+WARC_INDEX_NAME = "index.cdxj"
+
+_CHUNK_SIZE = 1024 * 1024
+
+# Hop-by-hop / transfer framing headers that no longer describe a decoded body
+_FRAMING_HEADERS = frozenset({'content-encoding', 'transfer-encoding', 'content-length'})
+
+
+@dataclass
+class WARCRecord:
+    """One WARC record: its named header fields and raw content block."""
+
+    headers: Dict[str, str] = field(default_factory=dict)
+    block: bytes = b""
+
+    @property
+    def type(self) -> Optional[str]:
+        return self.headers.get('WARC-Type')
+
+    @property
+    def record_id(self) -> Optional[str]:
+        return self.headers.get('WARC-Record-ID')
+
+    @property
+    def target_uri(self) -> Optional[str]:
+        return self.headers.get('WARC-Target-URI')
+
+    @property
+    def date(self) -> Optional[str]:
+        return self.headers.get('WARC-Date')
+
+    def http_response(self) -> Tuple[int, Dict[str, str], bytes]:
+        """Parse the block of a ``response`` record into (status, headers, body)."""
+        return parse_http_response(self.block)
+
+
+def _sha1_digest(data: bytes) -> str:
+    return "sha1:" + base64.b32encode(hashlib.sha1(data).digest()).decode('ascii')
+
+
+def warc_date(moment: Union[datetime, str, None] = None) -> str:
+    """Format *moment* (default: now) as a WARC-Date (UTC, second precision)."""
+    if isinstance(moment, str):
+        try:
+            moment = datetime.fromisoformat(moment.replace('Z', '+00:00'))
+        except ValueError:
+            moment = None
+    moment = moment or datetime.now(timezone.utc)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def new_record_id() -> str:
+    return f"<urn:uuid:{uuid.uuid4()}>"
+
+
+def build_warc_record(
+    warc_type: str,
+    block: bytes,
+    target_uri: Optional[str] = None,
+    content_type: Optional[str] = None,
+    date: Optional[str] = None,
+    record_id: Optional[str] = None,
+    extra_headers: Optional[Dict[str, str]] = None,
+) -> Tuple[str, bytes]:
+    """
+    Serialise one uncompressed WARC record.
+
+    Returns:
+        Tuple of (record id, record bytes)
+    """
+    record_id = record_id or new_record_id()
+    lines = [
+        WARC_VERSION,
+        f"WARC-Type: {warc_type}",
+        f"WARC-Record-ID: {record_id}",
+        f"WARC-Date: {date or warc_date()}",
+    ]
+    if target_uri:
+        lines.append(f"WARC-Target-URI: {target_uri}")
+    for name, value in (extra_headers or {}).items():
+        lines.append(f"{name}: {value}")
+    if content_type:
+        lines.append(f"Content-Type: {content_type}")
+    lines.append(f"WARC-Block-Digest: {_sha1_digest(block)}")
+    lines.append(f"Content-Length: {len(block)}")
+    head = ("\r\n".join(lines) + "\r\n\r\n").encode('utf-8')
+    return record_id, head + block + b"\r\n\r\n"
+
+
+def build_http_response_block(
+    status: int,
+    headers: Dict[str, str],
+    body: bytes,
+    reason: str = "",
+) -> bytes:
+    """
+    Build an HTTP/1.1 response message for a ``response`` record.
+
+    The body is stored decoded, so transfer-framing headers are dropped and a
+    matching ``Content-Length`` is written.
+    """
+    lines = [f"HTTP/1.1 {status} {reason}".rstrip()]
+    for name, value in headers.items():
+        if name.lower() in _FRAMING_HEADERS:
+            continue
+        lines.append(f"{name}: {value}")
+    lines.append(f"Content-Length: {len(body)}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode('utf-8', errors='replace') + body
+
+
+def build_http_request_block(
+    method: str,
+    path: str,
+    headers: Dict[str, str],
+) -> bytes:
+    lines = [f"{method} {path or '/'} HTTP/1.1"]
+    lines.extend(f"{name}: {value}" for name, value in headers.items())
+    return ("\r\n".join(lines) + "\r\n\r\n").encode('utf-8', errors='replace')
+
+
+def _parse_header_lines(data: bytes) -> List[Tuple[str, str]]:
+    fields: List[Tuple[str, str]] = []
+    for line in data.decode('utf-8', errors='replace').split("\r\n"):
+        if not line:
+            continue
+        if line[0] in " \t" and fields:
+            # Obsolete line folding
+            name, value = fields[-1]
+            fields[-1] = (name, value + " " + line.strip())
+            continue
+        name, _, value = line.partition(":")
+        fields.append((name.strip(), value.strip()))
+    return fields
+
+
+def parse_http_response(block: bytes) -> Tuple[int, Dict[str, str], bytes]:
+    """Split an HTTP response message into (status, headers, body)."""
+    head, sep, body = block.partition(b"\r\n\r\n")
+    if not sep:
+        head, sep, body = block.partition(b"\n\n")
+    status_line, _, header_data = head.replace(b"\r\n", b"\n").partition(b"\n")
+    parts = status_line.split(None, 2)
+    try:
+        status = int(parts[1])
+    except (IndexError, ValueError):
+        raise ValueError(f"Malformed HTTP status line: {status_line[:80]!r}")
+    headers: Dict[str, str] = {}
+    for name, value in _parse_header_lines(header_data.replace(b"\n", b"\r\n")):
+        headers[name] = value
+    return status, headers, body
+
+
+def parse_warc_record(data: bytes) -> WARCRecord:
+    """Parse one uncompressed WARC record."""
+    head, sep, rest = data.partition(b"\r\n\r\n")
+    if not sep or not head.startswith(b"WARC/"):
+        raise ValueError("Not a WARC record")
+    version_line, _, header_data = head.partition(b"\r\n")
+    headers = dict(_parse_header_lines(header_data))
+    length = int(headers.get('Content-Length', len(rest)))
+    return WARCRecord(headers=headers, block=rest[:length])
+
+
+def _iter_gzip_members(path: Path) -> Iterator[Tuple[int, int, bytes]]:
+    """Yield (offset, compressed length, decompressed bytes) for each gzip member."""
+    with open(path, 'rb') as f:
+        offset = 0
+        pending = b""
+        while True:
+            if not pending:
+                pending = f.read(_CHUNK_SIZE)
+                if not pending:
+                    return
+            decompressor = zlib.decompressobj(31)
+            output = []
+            consumed = 0
+            while not decompressor.eof:
+                if not pending:
+                    pending = f.read(_CHUNK_SIZE)
+                    if not pending:
+                        raise ValueError(f"Truncated gzip member at offset {offset} in {path}")
+                output.append(decompressor.decompress(pending))
+                consumed += len(pending) - len(decompressor.unused_data)
+                pending = decompressor.unused_data
+            yield offset, consumed, b"".join(output)
+            offset += consumed
+
+
+def _iter_plain_records(path: Path) -> Iterator[Tuple[int, int, bytes]]:
+    with open(path, 'rb') as f:
+        while True:
+            offset = f.tell()
+            head = b""
+            while not head.endswith(b"\r\n\r\n"):
+                line = f.readline()
+                if not line:
+                    if head.strip():
+                        raise ValueError(f"Truncated WARC record at offset {offset} in {path}")
+                    return
+                if not head and not line.strip():
+                    offset = f.tell()
+                    continue
+                head += line
+            length = 0
+            for name, value in _parse_header_lines(head.split(b"\r\n", 1)[1]):
+                if name.lower() == 'content-length':
+                    length = int(value)
+            data = head + f.read(length)
+            f.read(4)  # record terminator
+            yield offset, f.tell() - offset, data
+
+
+def iter_warc_records(path: Union[str, Path]) -> Iterator[Tuple[int, int, WARCRecord]]:
+    """
+    Iterate over the records of a ``.warc`` or ``.warc.gz`` file.
+
+    Yields:
+        Tuples of (offset, length, record); offset/length are positions in the
+        file as stored (compressed for ``.warc.gz``) and can be passed to
+        :func:`read_warc_record`.
+    """
+    path = Path(path)
+    members = _iter_gzip_members(path) if path.suffix == '.gz' else _iter_plain_records(path)
+    for offset, length, data in members:
+        yield offset, length, parse_warc_record(data)
+
+
+def read_warc_record(path: Union[str, Path], offset: int, length: Optional[int] = None) -> WARCRecord:
+    """Read the single record stored at *offset* in a WARC file."""
+    path = Path(path)
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        if path.suffix == '.gz':
+            if length is not None:
+                return parse_warc_record(zlib.decompressobj(31).decompress(f.read(length)))
+            decompressor = zlib.decompressobj(31)
+            output = []
+            while not decompressor.eof:
+                chunk = f.read(_CHUNK_SIZE)
+                if not chunk:
+                    break
+                output.append(decompressor.decompress(chunk))
+            return parse_warc_record(b"".join(output))
+        data = f.read(length) if length is not None else f.read()
+        return parse_warc_record(data)
@@ -1,5 +1,7 @@
 """Tests for crawlit.crawler.async_engine module (AsyncCrawler)."""
 
+import asyncio
+
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 from crawlit.crawler.async_engine import AsyncCrawler
@@ -108,3 +110,321 @@ class TestAsyncCrawlerAttributes:
         mock_extractor = MagicMock()
         crawler = AsyncCrawler("https://example.com", extractors=[mock_extractor])
         assert len(crawler.extractors) >= 1
+
+
+class TestAsyncCrawlerPageCache:
+    @staticmethod
+    def _seed_cache(cache):
+        html_headers = {"Content-Type": "text/html"}
+        cache.set("https://example.com", response_data={}, status_code=200, headers=html_headers,
+                  content='<html><body><a href="/a">a</a><a href="/b">b</a></body></html>')
+        cache.set("https://example.com/a", response_data={}, status_code=200, headers=html_headers,
+                  content="<html><head><title>A</title></head><body>A</body></html>")
+
+    @pytest.mark.asyncio
+    async def test_offline_replay_serves_from_disk_cache(self, tmp_path):
+        from crawlit.utils.cache import PageCache, OFFLINE_CACHE_MISS
+        self._seed_cache(PageCache(cache_dir=str(tmp_path), enable_disk_cache=True))
+
+        cache = PageCache(cache_dir=str(tmp_path), enable_disk_cache=True)
+        crawler = AsyncCrawler("https://example.com", max_depth=1, page_cache=cache,
+                               offline=True, enable_content_extraction=True)
+        assert crawler.respect_robots is False
+        with patch("crawlit.crawler.async_engine.async_fetch_page", new_callable=AsyncMock) as mock_fetch:
+            await crawler.crawl()
+        mock_fetch.assert_not_called()
+
+        results = crawler.get_results()
+        assert results["https://example.com"]["success"] is True
+        assert results["https://example.com/a"]["title"] == "A"
+        assert results["https://example.com/b"]["error"] == OFFLINE_CACHE_MISS
+        assert crawler.get_artifacts()["https://example.com/a"].content.raw_html.startswith("<html>")
+        assert cache.get_stats()["disk_hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_pages_are_not_refetched(self):
+        from crawlit.utils.cache import PageCache
+        cache = PageCache()
+        self._seed_cache(cache)
+        crawler = AsyncCrawler("https://example.com", max_depth=0, page_cache=cache, respect_robots=False)
+        with patch("crawlit.crawler.async_engine.async_fetch_page", new_callable=AsyncMock) as mock_fetch:
+            await crawler.crawl()
+        mock_fetch.assert_not_called()
+        assert crawler.get_results()["https://example.com"]["links"]
+
+    @pytest.mark.asyncio
+    async def test_crawl_flushes_buffered_outputs(self, tmp_path):
+        from crawlit.pipelines import JSONLWriter
+        from crawlit.utils.cache import PageCache
+        cache = PageCache()
+        self._seed_cache(cache)
+        writer = JSONLWriter(tmp_path / "out.jsonl", flush_interval=60)
+        crawler = AsyncCrawler("https://example.com", max_depth=0, page_cache=cache,
+                               respect_robots=False, pipelines=[writer])
+        await crawler.crawl()
+        assert len((tmp_path / "out.jsonl").read_text().splitlines()) == 1
+        writer.close()
+
+    def test_offline_requires_page_cache(self):
+        with pytest.raises(ValueError, match="page_cache"):
+            AsyncCrawler("https://example.com", offline=True)
+
+
+class TestAsyncCrawlerCheckpoints:
+    @pytest.mark.asyncio
+    async def test_periodic_checkpoints_during_crawl(self, tmp_path):
+        from crawlit.utils.cache import PageCache
+        from crawlit.utils.checkpoint import load_checkpoint
+        cache = PageCache()
+        TestAsyncCrawlerPageCache._seed_cache(cache)
+        path = str(tmp_path / "crawl.ckpt")
+        crawler = AsyncCrawler("https://example.com", max_depth=1, page_cache=cache, offline=True,
+                               checkpoint_path=path, checkpoint_interval=None,
+                               checkpoint_every_pages=1)
+        await crawler.crawl()
+        queue, visited, results, metadata = load_checkpoint(path)
+        assert not queue
+        assert visited == crawler.visited_urls
+        assert sorted(results) == sorted(crawler.visited_urls)
+        assert metadata["start_url"] == "https://example.com"
+
+    @pytest.mark.asyncio
+    async def test_resume_from_checkpoint(self, tmp_path):
+        from crawlit.utils.cache import PageCache
+        from crawlit.utils.checkpoint import save_checkpoint
+        cache = PageCache()
+        TestAsyncCrawlerPageCache._seed_cache(cache)
+        path = str(tmp_path / "crawl.ckpt")
+        save_checkpoint(path, [("https://example.com/a", 1)], {"https://example.com"},
+                        {"https://example.com": {"status": 200, "depth": 0}})
+        crawler = AsyncCrawler("https://example.com", max_depth=1, page_cache=cache, offline=True,
+                               enable_content_extraction=True)
+        await crawler.resume_from(path)
+        results = crawler.get_results()
+        assert set(results) == {"https://example.com", "https://example.com/a"}
+        assert results["https://example.com/a"]["title"] == "A"
+
+    @pytest.mark.asyncio
+    async def test_resume_does_not_seed_the_crawl_again(self, tmp_path):
+        import json
+        from crawlit.utils.cache import PageCache
+        from crawlit.utils.checkpoint import save_checkpoint
+        from crawlit.utils.event_log import CrawlEventLog
+        cache = PageCache()
+        TestAsyncCrawlerPageCache._seed_cache(cache)
+        path = str(tmp_path / "crawl.ckpt")
+        save_checkpoint(path, [("https://example.com/a", 1)], {"https://example.com/x"}, {})
+        events = CrawlEventLog(tmp_path / "events.jsonl", flush_interval=0)
+        crawler = AsyncCrawler("https://example.com", max_depth=1, page_cache=cache, offline=True,
+                               event_log=events)
+        await crawler.resume_from(path)
+        events.close()
+        assert set(crawler.get_results()) == {"https://example.com/a"}
+        types = [json.loads(line)["event_type"]
+                 for line in (tmp_path / "events.jsonl").read_text().splitlines()]
+        assert types[0] == "CRAWL_RESUME" and "CRAWL_START" not in types
+
+    @pytest.mark.asyncio
+    async def test_save_state_keeps_queue_intact(self, tmp_path):
+        from crawlit.utils.checkpoint import load_checkpoint
+        crawler = AsyncCrawler("https://example.com", respect_robots=False)
+        for i in range(3):
+            crawler.queue.put_nowait((f"https://example.com/{i}", 1))
+        crawler._in_flight["https://example.com/x"] = 1
+        crawler.visited_urls.add("https://example.com/x")
+        await crawler.save_state(str(tmp_path / "state.ckpt"))
+        assert crawler.queue.qsize() == 3
+        assert crawler.queue._unfinished_tasks == 3
+        queue, visited, _, _ = load_checkpoint(str(tmp_path / "state.ckpt"))
+        assert list(queue)[0] == ("https://example.com/x", 1)
+        assert len(queue) == 4 and not visited
+
+
+class TestAsyncCrawlerPluginStages:
+    @staticmethod
+    def _crawler(**kwargs):
+        from crawlit.utils.cache import PageCache
+        cache = PageCache()
+        html_headers = {"Content-Type": "text/html"}
+        links = "".join(f'<a href="/{i}">{i}</a>' for i in range(5))
+        cache.set("https://example.com", response_data={}, status_code=200, headers=html_headers,
+                  content=f"<html><body>{links}</body></html>")
+        for i in range(5):
+            cache.set(f"https://example.com/{i}", response_data={}, status_code=200,
+                      headers=html_headers, content=f"<html><body>{i}</body></html>")
+        return AsyncCrawler("https://example.com", max_depth=1, page_cache=cache, offline=True,
+                            **kwargs)
+
+    def test_plugins_are_classified_once(self):
+        class SyncStage:
+            def process(self, artifact):
+                return artifact
+
+        class AsyncStage:
+            async def process(self, artifact):
+                return artifact
+
+        class Batched:
+            batch_size = 7
+
+            def process(self, artifact):
+                return artifact
+
+            async def process_batch(self, artifacts):
+                return None
+
+        crawler = AsyncCrawler("https://example.com", pipelines=[SyncStage(), AsyncStage(), Batched()],
+                               pipeline_batch_size=3)
+        stages = crawler._pipeline_stages
+        assert [s.name for s in stages] == ["SyncStage", "AsyncStage", "Batched"]
+        assert [s.is_async for s in stages] == [False, True, False]
+        assert [s.batch_size for s in stages] == [0, 0, 7]
+        assert stages[2].batch_is_async is True
+
+    def test_invalid_plugin_workers(self):
+        with pytest.raises(ValueError, match="plugin_workers"):
+            AsyncCrawler("https://example.com", plugin_workers=0)
+
+    @pytest.mark.asyncio
+    async def test_sync_pipelines_run_in_plugin_executor(self):
+        import threading
+        threads = {}
+
+        class SyncStage:
+            def process(self, artifact):
+                threads.setdefault("sync", set()).add(threading.current_thread().name)
+                return artifact
+
+        class AsyncStage:
+            async def process(self, artifact):
+                threads.setdefault("async", set()).add(threading.current_thread().name)
+                return artifact
+
+        crawler = self._crawler(pipelines=[SyncStage(), AsyncStage()])
+        await crawler.crawl()
+        assert len(crawler.get_artifacts()) == 6
+        assert all(name.startswith("crawlit-plugin") for name in threads["sync"])
+        assert threads["async"] == {threading.current_thread().name}
+        assert crawler._plugin_executor is None  # shut down at crawl end
+
+    @pytest.mark.asyncio
+    async def test_batch_pipeline_receives_batches_in_order(self):
+        batches, seen_after = [], []
+
+        class Batched:
+            def process(self, artifact):
+                return artifact
+
+            def process_batch(self, artifacts):
+                batches.append([a.url for a in artifacts])
+                return [None if a.url.endswith("/2") else a for a in artifacts]
+
+        class After:
+            async def process(self, artifact):
+                seen_after.append(artifact.url)
+                return artifact
+
+        crawler = self._crawler(pipelines=[Batched(), After()], pipeline_batch_size=4)
+        await crawler.crawl()
+        assert [len(batch) for batch in batches] == [4, 2]  # remainder flushed at crawl end
+        processed = [url for batch in batches for url in batch]
+        assert sorted(processed) == sorted(crawler.get_artifacts())
+        assert seen_after == [url for url in processed if not url.endswith("/2")]
+
+    @pytest.mark.asyncio
+    async def test_checkpoints_only_record_persisted_pages(self, tmp_path):
+        class Buffered:
+            def __init__(self):
+                self.buffer, self.persisted = [], set()
+
+            def process(self, artifact):
+                return artifact
+
+            async def process_batch(self, artifacts):
+                self.buffer.extend(a.url for a in artifacts)
+
+            def flush(self):
+                self.persisted.update(self.buffer)
+                self.buffer = []
+
+        sink = Buffered()
+        checkpointed = []
+        crawler = self._crawler(pipelines=[sink], pipeline_batch_size=4,
+                                checkpoint_path=str(tmp_path / "crawl.ckpt"),
+                                checkpoint_interval=None, checkpoint_every_pages=1)
+        append = crawler._checkpointer.writer.append
+
+        def checked_append(queue, new_visited, new_results, metadata):
+            assert set(new_visited) <= sink.persisted
+            checkpointed.extend(new_visited)
+            return append(queue, new_visited, new_results, metadata)
+
+        crawler._checkpointer.writer.append = checked_append
+        await crawler.crawl()
+        assert len(checkpointed) == 6
+
+    @pytest.mark.asyncio
+    async def test_cancelled_page_stays_in_flight(self):
+        started = asyncio.Event()
+
+        class Hang:
+            async def process(self, artifact):
+                started.set()
+                await asyncio.Event().wait()
+
+        crawler = self._crawler(pipelines=[Hang()])
+        crawler.semaphore = asyncio.Semaphore(1)
+        crawler.queue.put_nowait(("https://example.com/2", 1))
+        worker = asyncio.create_task(crawler._worker())
+        await asyncio.wait_for(started.wait(), 2)
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+        # A checkpoint taken now queues the page again
+        assert crawler._in_flight == {"https://example.com/2": 1}
+        assert crawler._copy_state()[0] == [("https://example.com/2", 1)]
+
+    @pytest.mark.asyncio
+    async def test_failing_batch_passes_artifacts_on(self):
+        class Broken:
+            def process(self, artifact):
+                return artifact
+
+            async def process_batch(self, artifacts):
+                for artifact in artifacts:
+                    artifact.extracted["broken"] = True
+                raise RuntimeError("sink down")
+
+        crawler = self._crawler(pipelines=[Broken()], pipeline_batch_size=10)
+        await crawler.crawl()
+        artifacts = crawler.get_artifacts()
+        assert len(artifacts) == 6
+        assert not any("broken" in a.extracted for a in artifacts.values())
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_is_processed_after_max_latency(self):
+        import asyncio
+        from crawlit.interfaces import AsyncBatchPipeline
+        from crawlit.models.page_artifact import PageArtifact
+
+        batches = []
+
+        class Batched(AsyncBatchPipeline):
+            batch_size = 100
+            max_latency_ms = 20
+
+            async def process_batch(self, artifacts):
+                batches.append([a.url for a in artifacts])
+
+        crawler = AsyncCrawler("https://example.com", pipelines=[Batched()])
+        crawler._batch_wake = asyncio.Event()
+        crawler._batch_timer = asyncio.create_task(crawler._run_batch_timer())
+        try:
+            await crawler._run_pipelines(PageArtifact(url="https://example.com/a"))
+            await crawler._run_pipelines(PageArtifact(url="https://example.com/b"))
+            for _ in range(200):
+                if batches:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await crawler._stop_batch_timer()
+        assert batches == [["https://example.com/a", "https://example.com/b"]]
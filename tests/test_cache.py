@@ -70,3 +70,179 @@ class TestPageCache:
         cache.set("https://example.com", response_data={}, status_code=200, headers={})
         stats = cache.get_stats()
         assert isinstance(stats, dict)
+
+
+class TestPageCacheTiers:
+    def test_memory_lru_byte_budget(self):
+        cache = PageCache(max_memory_bytes=3 * 2048)
+        for i in range(5):
+            cache.set(f"https://example.com/{i}", response_data={}, status_code=200,
+                      headers={}, content="x" * 800)
+        stats = cache.get_stats()
+        assert stats['memory_bytes'] <= 3 * 2048
+        assert stats['evictions'] >= 2
+        assert cache.get("https://example.com/0") is None
+        assert cache.get("https://example.com/4") is not None
+
+    def test_lru_order_refreshed_on_hit(self):
+        cache = PageCache(max_memory_bytes=None, max_memory_entries=2)
+        cache.set("https://a.com", response_data={}, status_code=200, headers={})
+        cache.set("https://b.com", response_data={}, status_code=200, headers={})
+        assert cache.get("https://a.com") is not None
+        cache.set("https://c.com", response_data={}, status_code=200, headers={})
+        assert cache.get("https://b.com") is None
+        assert cache.get("https://a.com") is not None
+
+    def test_disk_entries_are_sharded_and_compressed(self, tmp_path):
+        import gzip
+        import json
+        cache = PageCache(cache_dir=str(tmp_path), enable_disk_cache=True)
+        cache.set("https://example.com", response_data={"title": "T"}, status_code=200,
+                  headers={"Content-Type": "text/html"}, content="<html>Hi</html>")
+        files = list(tmp_path.glob("*/*.json.gz"))
+        assert len(files) == 1
+        assert files[0].parent.name == files[0].name[:2]
+        with gzip.open(files[0], "rt", encoding="utf-8") as f:
+            assert json.load(f)["content"] == "<html>Hi</html>"
+
+    def test_disk_index_survives_reopen(self, tmp_path):
+        cache = PageCache(cache_dir=str(tmp_path), enable_disk_cache=True)
+        cache.set("https://example.com", response_data={}, status_code=200,
+                  headers={}, content="<html>Hi</html>")
+        reopened = PageCache(cache_dir=str(tmp_path), enable_disk_cache=True)
+        assert reopened.get_stats()['disk_entries'] == 1
+        result = reopened.get("https://example.com")
+        assert result["content"] == "<html>Hi</html>"
+        assert reopened.get_stats()['disk_hits'] == 1
+        reopened.clear()
+        assert reopened.get_stats()['disk_entries'] == 0
+        assert list(tmp_path.glob("*/*.json.gz")) == []
+
+    def test_reads_legacy_flat_files(self, tmp_path):
+        import hashlib
+        import json
+        from datetime import datetime, timezone
+        url = "https://example.com/legacy"
+        legacy = tmp_path / f"{hashlib.md5(url.encode()).hexdigest()}.json"
+        legacy.write_text(json.dumps({
+            'url': url, 'status_code': 200, 'headers': {}, 'response_data': {},
+            'content': 'old', 'cached_at': datetime.now(timezone.utc).isoformat(),
+        }))
+        cache = PageCache(cache_dir=str(tmp_path), enable_disk_cache=True)
+        assert cache.get(url)["content"] == "old"
+        cache.set(url, response_data={}, status_code=200, headers={}, content="new")
+        assert not legacy.exists()
+        assert cache.get_stats()['disk_entries'] == 1
+
+    def test_evict_expired_sweeps_both_tiers(self, tmp_path):
+        cache = PageCache(cache_dir=str(tmp_path), enable_disk_cache=True, ttl=0)
+        cache.set("https://example.com", response_data={}, status_code=200, headers={})
+        time.sleep(0.01)
+        assert cache.evict_expired() == 2
+        stats = cache.get_stats()
+        assert stats['memory_entries'] == 0
+        assert stats['disk_entries'] == 0
+        assert list(tmp_path.glob("*/*.json.gz")) == []
+
+    def test_background_eviction_thread(self):
+        cache = PageCache(ttl=0, eviction_interval=0.01)
+        try:
+            cache.set("https://example.com", response_data={}, status_code=200, headers={})
+            deadline = time.time() + 2
+            while cache.get_stats()['memory_entries'] and time.time() < deadline:
+                time.sleep(0.01)
+            assert cache.get_stats()['memory_entries'] == 0
+        finally:
+            cache.close()
+
+
+class TestHTTPCacheSemantics:
+    @staticmethod
+    def _http_date(offset=0):
+        from email.utils import formatdate
+        return formatdate(time.time() + offset, usegmt=True)
+
+    def test_freshness_lifetime(self):
+        from crawlit.utils.cache import freshness_lifetime, parse_cache_control
+        assert parse_cache_control('max-age=60, no-cache, private="x"') == {
+            'max-age': '60', 'no-cache': None, 'private': 'x'}
+        assert freshness_lifetime({'Cache-Control': 'max-age=60'}) == 60
+        assert freshness_lifetime({'cache-control': 'max-age=60, no-cache'}) == 0
+        assert freshness_lifetime({'Pragma': 'no-cache', 'Expires': self._http_date(600)}) == 0
+        assert freshness_lifetime({'Expires': '0'}) == 0
+        lifetime = freshness_lifetime({'Date': self._http_date(), 'Expires': self._http_date(600)})
+        assert 599 <= lifetime <= 601
+        heuristic = freshness_lifetime({'Date': self._http_date(), 'Last-Modified': self._http_date(-1000)})
+        assert 99 <= heuristic <= 101
+        assert freshness_lifetime({'Last-Modified': self._http_date(-1000)}, status_code=302) == 0
+        assert freshness_lifetime({}) == 0
+
+    def test_fresh_and_stale_entries(self):
+        cache = PageCache(http_semantics=True)
+        cache.set("https://a.com", response_data={}, status_code=200,
+                  headers={'Cache-Control': 'max-age=600'}, content="<html>a</html>")
+        cache.set("https://b.com", response_data={}, status_code=200,
+                  headers={'ETag': '"v1"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT',
+                           'Cache-Control': 'no-cache'}, content="<html>b</html>")
+        assert cache.get("https://a.com")["content"] == "<html>a</html>"
+        assert cache.get("https://b.com") is None
+        assert cache.get_conditional_headers("https://b.com") == {
+            'If-None-Match': '"v1"', 'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+        assert cache.get_stats()['stale'] == 1
+
+    def test_age_counts_against_freshness(self):
+        cache = PageCache(http_semantics=True)
+        cache.set("https://a.com", response_data={}, status_code=200,
+                  headers={'Cache-Control': 'max-age=60', 'Age': '120'}, content="x")
+        assert cache.get("https://a.com") is None
+
+    def test_no_store_is_not_cached(self):
+        cache = PageCache(http_semantics=True)
+        cache.set("https://a.com", response_data={}, status_code=200,
+                  headers={'Cache-Control': 'no-store'}, content="x")
+        assert cache.get_stats()['memory_entries'] == 0
+
+    def test_vary_matches_request_headers(self):
+        cache = PageCache(http_semantics=True)
+        cache.set("https://a.com", response_data={}, status_code=200,
+                  headers={'Cache-Control': 'max-age=600', 'Vary': 'Accept-Language'},
+                  content="x", request_headers={'Accept-Language': 'en'})
+        assert cache.get("https://a.com", request_headers={'accept-language': 'en'}) is not None
+        assert cache.get("https://a.com", request_headers={'Accept-Language': 'de'}) is None
+
+    def test_revalidate_makes_entry_fresh_again(self, tmp_path):
+        cache = PageCache(cache_dir=str(tmp_path), enable_disk_cache=True, http_semantics=True)
+        cache.set("https://a.com", response_data={}, status_code=200,
+                  headers={'ETag': '"v1"', 'Cache-Control': 'no-cache'}, content="x")
+        refreshed = cache.revalidate("https://a.com", {'Cache-Control': 'max-age=600'})
+        assert refreshed["content"] == "x"
+        assert refreshed["headers"]["ETag"] == '"v1"'
+        reopened = PageCache(cache_dir=str(tmp_path), enable_disk_cache=True, http_semantics=True)
+        assert reopened.get("https://a.com")["content"] == "x"
+        assert cache.get_stats()['revalidated'] == 1
+
+
+class TestCrawlResume:
+    def test_reads_checkpoint_header_and_legacy_json(self, tmp_path):
+        from collections import deque
+        from crawlit.utils.cache import CrawlResume
+        from crawlit.utils.queue_manager import QueueManager
+        results = {"https://a.com": {"status": 200, "html_content": "<p>x</p>"}}
+        for name in ("state.json", "state.ckpt"):
+            path = str(tmp_path / name)
+            QueueManager.save_state(deque([("https://a.com/b", 1)]), {"https://a.com"}, results,
+                                    path, {"start_url": "https://a.com"})
+            assert CrawlResume.can_resume(path)
+            info = CrawlResume.get_resume_info(path)
+            assert info["queue_size"] == 1
+            assert info["visited_count"] == 1 and info["results_count"] == 1
+            assert info["metadata"] == {"start_url": "https://a.com"}
+            assert info["saved_at"]
+
+    def test_rejects_missing_and_corrupt_files(self, tmp_path):
+        from crawlit.utils.cache import CrawlResume
+        assert not CrawlResume.can_resume(str(tmp_path / "missing.ckpt"))
+        corrupt = tmp_path / "corrupt.ckpt"
+        corrupt.write_bytes(b"CRAWLCKP\x01")
+        assert not CrawlResume.can_resume(str(corrupt))
+        assert CrawlResume.get_resume_info(str(corrupt)) == {}
@@ -40,6 +40,11 @@ class TestCLIParsing:
         args = self._parse(["--url", "https://example.com", "--output-format", "csv"])
         assert args.output_format == "csv"
 
+    def test_parse_args_jsonl_low_memory(self):
+        args = self._parse(["--url", "https://example.com", "-f", "jsonl", "--low-memory"])
+        assert args.output_format == "jsonl"
+        assert args.low_memory is True
+
     def test_parse_args_allow_external(self):
         args = self._parse(["--url", "https://example.com", "--allow-external"])
         assert args.allow_external is True
@@ -262,6 +262,72 @@ class TestSQLiteBackendReal:
         backend.disconnect()
 
 
+class TestSQLiteQueries:
+    """Indexes, pragmas, projection and paginated reads."""
+
+    def _backend(self, tmp_path, **kwargs):
+        backend = SQLiteBackend(database_path=str(tmp_path / "query.db"), **kwargs)
+        crawl_id = backend.save_results(_sample_results(), _sample_metadata())
+        return backend, crawl_id
+
+    def test_indexes_created(self, tmp_path):
+        backend, _ = self._backend(tmp_path)
+        backend.cursor.execute("PRAGMA index_list(results)")
+        names = {row["name"] for row in backend.cursor.fetchall()}
+        assert {"idx_results_url", "idx_results_crawl_id", "idx_results_status",
+                "idx_results_depth", "idx_results_content_type"} <= names
+        backend.disconnect()
+
+    def test_wal_mode(self, tmp_path):
+        backend, _ = self._backend(tmp_path)
+        assert backend.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        backend.disconnect()
+        plain = SQLiteBackend(database_path=str(tmp_path / "plain.db"), wal=False)
+        assert plain.conn.execute("PRAGMA journal_mode").fetchone()[0] != "wal"
+        plain.disconnect()
+
+    def test_reader_not_blocked_by_open_write(self, tmp_path):
+        import sqlite3
+        backend, _ = self._backend(tmp_path)
+        backend.cursor.execute("BEGIN IMMEDIATE")
+        backend.cursor.execute("DELETE FROM results")
+        reader = sqlite3.connect(str(tmp_path / "query.db"), timeout=0.1)
+        assert reader.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 3
+        reader.close()
+        backend.conn.rollback()
+        backend.disconnect()
+
+    def test_iter_results_pages(self, tmp_path):
+        backend, crawl_id = self._backend(tmp_path)
+        backend.save_results(_sample_results(), _sample_metadata())
+        rows = list(backend.iter_results({"crawl_id": crawl_id}, page_size=2))
+        assert [r["url"] for r in rows] == list(_sample_results())
+        assert "html_content" not in rows[0]
+        assert rows[0]["links"] == ["https://example.com/about", "https://example.com/contact"]
+        assert len(list(backend.iter_results(page_size=1))) == 6
+        backend.disconnect()
+
+    def test_projection(self, tmp_path):
+        backend, _ = self._backend(tmp_path)
+        rows = list(backend.iter_results(columns=["url", "status_code"]))
+        assert set(rows[0]) == {"id", "url", "status_code"}
+        full = next(backend.iter_results(columns=None))
+        assert full["html_content"].startswith("<html>")
+        rows = backend.get_results(columns=["url", "links"], decode_json=False)
+        assert isinstance(rows[0]["links"], str)
+        with pytest.raises(ValueError):
+            backend.get_results(columns=["url; DROP TABLE results"])
+        backend.disconnect()
+
+    def test_limit_offset_and_filters(self, tmp_path):
+        backend, _ = self._backend(tmp_path)
+        page = backend.get_results(limit=2, offset=1, columns=["url"])
+        assert [r["url"] for r in page] == list(_sample_results())[1:3]
+        assert len(backend.get_results({"depth": 1})) == 2
+        assert len(backend.get_results({"content_type": "text/html", "success": False})) == 1
+        backend.disconnect()
+
+
 # ---------------------------------------------------------------------------
 # get_database_backend factory
 # ---------------------------------------------------------------------------
@@ -289,3 +355,127 @@ class TestGetDatabaseBackend:
             get_database_backend("unknown", check_setup=False)
         assert "Unknown backend type" in str(exc_info.value)
         assert "unknown" in str(exc_info.value).lower()
+
+
+# ---------------------------------------------------------------------------
+# Batched and incremental writes
+# ---------------------------------------------------------------------------
+
+class TestIncrementalWrites:
+    """begin_crawl / insert_results / update_crawl_counts and batching."""
+
+    def test_backends_without_incremental_writes_still_instantiate(self):
+        class LegacyBackend(DatabaseBackend):
+            @classmethod
+            def check_availability(cls, **config): return True, "ok"
+            def connect(self): pass
+            def disconnect(self): pass
+            def save_results(self, results, metadata=None): return 1
+            def get_results(self, filters=None): return []
+            def clear_results(self, filters=None): pass
+
+        backend = LegacyBackend()
+        assert backend.save_results(_sample_results()) == 1
+        with pytest.raises(NotImplementedError, match="DatabasePipeline"):
+            backend.begin_crawl(_sample_metadata())
+        with pytest.raises(NotImplementedError):
+            backend.insert_results(1, [])
+
+    def test_save_results_in_small_batches(self, tmp_path):
+        backend = SQLiteBackend(database_path=str(tmp_path / "batched.db"), batch_size=2)
+        crawl_id = backend.save_results(_sample_results(), _sample_metadata())
+        rows = backend.get_results({"crawl_id": crawl_id})
+        assert sorted(r["url"] for r in rows) == sorted(_sample_results())
+        backend.disconnect()
+
+    def test_incremental_crawl(self, tmp_path):
+        backend = SQLiteBackend(database_path=str(tmp_path / "incremental.db"))
+        crawl_id = backend.begin_crawl(_sample_metadata())
+        assert backend.get_crawls()[0]["total_urls"] == 0
+
+        items = list(_sample_results().items())
+        assert backend.insert_results(crawl_id, items[:2]) == 2
+        assert backend.insert_results(crawl_id, iter(items[2:])) == 1
+        backend.update_crawl_counts(crawl_id, total_urls=3, successful_urls=2)
+
+        crawl = backend.get_crawls()[0]
+        assert (crawl["total_urls"], crawl["successful_urls"], crawl["failed_urls"]) == (3, 2, 1)
+        assert len(backend.get_results({"crawl_id": crawl_id})) == 3
+        backend.disconnect()
+
+    def test_non_json_metadata_values(self, tmp_path):
+        from datetime import datetime
+        backend = SQLiteBackend(database_path=str(tmp_path / "dates.db"))
+        results = {"https://a.com": {"status": 200, "success": True,
+                                     "last_modified": datetime(2026, 1, 1)}}
+        crawl_id = backend.save_results(results)
+        row = backend.get_results({"crawl_id": crawl_id})[0]
+        assert row["metadata"]["last_modified"].startswith("2026-01-01")
+        backend.disconnect()
+
+
+class TestDatabasePipeline:
+    """DatabasePipeline streaming artifacts into SQLite."""
+
+    def _artifact(self, i, status=200):
+        from crawlit.models.page_artifact import PageArtifact, HTTPInfo, CrawlMeta
+        artifact = PageArtifact(url=f"https://example.com/{i}",
+                                http=HTTPInfo(status=status, content_type="text/html"),
+                                crawl=CrawlMeta(depth=1),
+                                links=["https://example.com/"])
+        artifact.extracted["title"] = f"Page {i}"
+        artifact.extracted["keywords"] = ["example"]
+        return artifact
+
+    def test_writes_in_batches_and_on_flush(self, tmp_path):
+        from crawlit.pipelines import DatabasePipeline
+        backend = SQLiteBackend(database_path=str(tmp_path / "pipeline.db"))
+        pipeline = DatabasePipeline(backend, _sample_metadata(), batch_size=2)
+        for i in range(3):
+            assert pipeline.process(self._artifact(i, 200 if i else 404)) is not None
+        # First batch written, third row still buffered
+        assert len(backend.get_results()) == 2
+        pipeline.flush()
+        rows = backend.get_results({"crawl_id": pipeline.crawl_id})
+        assert len(rows) == 3
+        row = next(r for r in rows if r["url"] == "https://example.com/1")
+        assert row["title"] == "Page 1"
+        assert row["keywords"] == ["example"]
+        assert row["links"] == ["https://example.com/"]
+        crawl = backend.get_crawls()[0]
+        assert (crawl["total_urls"], crawl["successful_urls"]) == (3, 2)
+        backend.disconnect()
+
+    def test_success_follows_fetch_outcome(self):
+        from crawlit.models.page_artifact import CrawlError
+        from crawlit.pipelines.database_pipeline import artifact_to_result
+        created = self._artifact(0, 201)
+        not_modified = self._artifact(1, 304)
+        not_modified.add_error(CrawlError.not_modified())
+        too_large = self._artifact(2, 200)
+        too_large.add_error(CrawlError.fetch("Response too large", http_status=200))
+        extractor_failed = self._artifact(3, 200)
+        extractor_failed.add_error(CrawlError.extractor("tables", "boom"))
+        server_error = self._artifact(4, 503)
+        server_error.add_error(CrawlError.fetch("HTTP Error: 503", http_status=503))
+        assert [artifact_to_result(a)["success"] for a in
+                (created, not_modified, too_large, extractor_failed, server_error)] == [
+            True, False, False, True, False]
+
+    def test_concurrent_writers(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+        from crawlit.pipelines import DatabasePipeline
+        backend = SQLiteBackend(database_path=str(tmp_path / "threads.db"))
+        pipeline = DatabasePipeline(backend, batch_size=5)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda i: pipeline.process(self._artifact(i)), range(40)))
+        pipeline.close()
+        assert len(backend.get_results()) == 40
+        backend.disconnect()
+
+    def test_invalid_batch_size(self, tmp_path):
+        from crawlit.pipelines import DatabasePipeline
+        backend = SQLiteBackend(database_path=str(tmp_path / "invalid.db"))
+        with pytest.raises(ValueError):
+            DatabasePipeline(backend, batch_size=0)
+        backend.disconnect()
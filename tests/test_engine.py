@@ -1,5 +1,7 @@
 """Tests for crawlit.crawler.engine module (sync Crawler)."""
 
+import json
+
 import pytest
 from unittest.mock import patch, MagicMock
 from crawlit.crawler.engine import Crawler
@@ -199,3 +201,599 @@ class TestCrawlerCrawl:
         )
         crawler.crawl()
         assert len(crawler.visited_urls) >= 1
+
+
+    @patch("crawlit.crawler.engine.fetch_page")
+    def test_results_are_views_of_artifacts(self, mock_fetch, tmp_path):
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.text = "<html><head><title>Hi</title></head><body><a href='/a'>a</a></body></html>"
+        mock_resp.headers = {"Content-Type": "text/html"}
+        mock_resp.url = "https://example.com"
+        mock_resp.content = mock_resp.text.encode()
+        mock_fetch.return_value = (True, mock_resp, 200)
+
+        crawler = Crawler("https://example.com", max_depth=0, respect_robots=False,
+                          enable_content_extraction=True)
+        crawler.crawl()
+        result = crawler.get_results()["https://example.com"]
+        artifact = crawler.artifacts["https://example.com"]
+        assert result["headers"] is artifact.http.headers
+        assert result["links"] is artifact.links
+        assert result["html_content"] is artifact.content.raw_html
+        assert result["title"] == "Hi"
+        assert json.loads(json.dumps(crawler.get_results()))["https://example.com"]["title"] == "Hi"
+        # State files still hold plain dicts
+        crawler.save_state(str(tmp_path / "state.json"))
+        crawler.load_state(str(tmp_path / "state.json"))
+        assert crawler.results["https://example.com"]["title"] == "Hi"
+
+        lean = Crawler("https://example.com", max_depth=0, respect_robots=False,
+                       retain_artifacts=False, store_html_content=False)
+        lean.crawl()
+        result = lean.get_results()["https://example.com"]
+        assert result.artifact is None  # detached, artifact can be freed
+        assert result["links"] == ["https://example.com/a"]
+        assert "html_content" not in result
+
+    @patch("crawlit.crawler.engine.fetch_page")
+    def test_pipelines_keep_results_sharing_artifact_containers(self, mock_fetch):
+        from crawlit.interfaces import Pipeline
+
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.text = "<html><body><a href='/a'>a</a></body></html>"
+        mock_resp.headers = {"Content-Type": "text/html"}
+        mock_resp.content = mock_resp.text.encode()
+        mock_fetch.return_value = (True, mock_resp, 200)
+
+        class AddLink(Pipeline):
+            def process(self, artifact):
+                artifact.links.append("https://example.com/extra")
+                return artifact
+
+        class Fails(Pipeline):
+            def process(self, artifact):
+                artifact.links.append("https://example.com/rolled-back")
+                raise RuntimeError("boom")
+
+        crawler = Crawler("https://example.com", max_depth=0, respect_robots=False,
+                          pipelines=[AddLink(), Fails()])
+        crawler.crawl()
+        result = crawler.get_results()["https://example.com"]
+        artifact = crawler.artifacts["https://example.com"]
+        assert result["links"] is artifact.links
+        assert result["links"] == ["https://example.com/a", "https://example.com/extra"]
+
+    @patch("crawlit.crawler.engine.fetch_page")
+    def test_results_rebound_after_pipelines_replace_values(self, mock_fetch):
+        from crawlit.interfaces import Pipeline
+
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.text = "<html><head><title>Hi</title></head><body><a href='/a'>a</a></body></html>"
+        mock_resp.headers = {"Content-Type": "text/html"}
+        mock_resp.content = mock_resp.text.encode()
+        mock_fetch.return_value = (True, mock_resp, 200)
+
+        class Rewrite(Pipeline):
+            def process(self, artifact):
+                artifact.links = [link.upper() for link in artifact.links]
+                artifact.extracted["title"] = "Rewritten"
+                return artifact
+
+        crawler = Crawler("https://example.com", max_depth=0, respect_robots=False,
+                          enable_content_extraction=True, pipelines=[Rewrite()])
+        crawler.crawl()
+        result = crawler.get_results()["https://example.com"]
+        artifact = crawler.artifacts["https://example.com"]
+        # One links list per page, shared by the result and the artifact
+        assert result["links"] is artifact.links == ["HTTPS://EXAMPLE.COM/A"]
+        assert result["title"] == "Rewritten"
+        assert result["headers"] is artifact.http.headers
+
+    @patch("crawlit.crawler.engine.fetch_page")
+    def test_incremental_checkpoint_state(self, mock_fetch, tmp_path):
+        from crawlit.utils.checkpoint import read_checkpoint_info
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.text = "<html><head><title>Hi</title></head><body><a href='/a'>a</a></body></html>"
+        mock_resp.headers = {"Content-Type": "text/html"}
+        mock_resp.url = "https://example.com"
+        mock_resp.content = mock_resp.text.encode()
+        mock_fetch.return_value = (True, mock_resp, 200)
+
+        crawler = Crawler("https://example.com", max_depth=1, respect_robots=False,
+                          enable_content_extraction=True)
+        crawler.crawl()
+        path = str(tmp_path / "state.ckpt")
+        crawler.save_state(path)
+        crawler.visited_urls.add("https://example.com/late")
+        crawler.save_state(path, incremental=True)
+        info = read_checkpoint_info(path)
+        assert info["deltas"] == 1
+        assert info["visited_count"] == len(crawler.visited_urls)
+        assert info["metadata"]["start_url"] == "https://example.com"
+
+        resumed = Crawler("https://example.com", max_depth=1, respect_robots=False)
+        resumed.load_state(path)
+        assert resumed.visited_urls == crawler.visited_urls
+        record = resumed.results["https://example.com"]
+        assert record["title"] == "Hi"
+        assert record["html_content_ref"].startswith("sha256:")
+
+    @patch("crawlit.crawler.engine.fetch_page")
+    def test_periodic_checkpoints_during_crawl(self, mock_fetch, tmp_path):
+        from crawlit.utils.checkpoint import load_checkpoint, read_checkpoint_info
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.text = "<html><body><a href='/a'>a</a><a href='/b'>b</a></body></html>"
+        mock_resp.headers = {"Content-Type": "text/html"}
+        mock_resp.content = mock_resp.text.encode()
+        mock_fetch.return_value = (True, mock_resp, 200)
+
+        path = str(tmp_path / "crawl.ckpt")
+        crawler = Crawler("https://example.com", max_depth=1, respect_robots=False,
+                          retain_results=False, checkpoint_path=path,
+                          checkpoint_interval=None, checkpoint_every_pages=1)
+        crawler.crawl()
+        assert read_checkpoint_info(path)["visited_count"] == 3
+        queue, visited, results, _ = load_checkpoint(path)
+        assert visited == crawler.visited_urls
+        # Results dropped from memory (retain_results=False) are still checkpointed
+        assert sorted(results) == sorted(crawler.visited_urls)
+        assert not crawler.results
+
+    @patch("crawlit.crawler.engine.fetch_page")
+    def test_interrupted_page_is_checkpointed_as_queued(self, mock_fetch, tmp_path):
+        from crawlit.utils.checkpoint import load_checkpoint
+
+        def side_effect(url, *args, **kwargs):
+            if url == "https://example.com/b":
+                raise KeyboardInterrupt
+            resp = MagicMock()
+            resp.status_code = 200
+            resp.text = "<html><body><a href='/a'>a</a><a href='/b'>b</a></body></html>"
+            resp.headers = {"Content-Type": "text/html"}
+            resp.content = resp.text.encode()
+            return (True, resp, 200)
+
+        mock_fetch.side_effect = side_effect
+        path = str(tmp_path / "crawl.ckpt")
+        crawler = Crawler("https://example.com", max_depth=1, respect_robots=False,
+                          checkpoint_path=path, checkpoint_interval=None,
+                          checkpoint_every_pages=1)
+        with pytest.raises(KeyboardInterrupt):
+            crawler.crawl()
+        queue, visited, results, _ = load_checkpoint(path)
+        assert queue[0] == ("https://example.com/b", 1)
+        assert "https://example.com/b" not in visited
+        assert "https://example.com/b" not in results
+
+    def test_copy_state_requeues_pages_in_flight(self):
+        crawler = Crawler("https://example.com", respect_robots=False)
+        crawler.queue.append(("https://example.com/b", 1))
+        crawler.visited_urls.update({"https://example.com", "https://example.com/a"})
+        crawler._in_flight["https://example.com/a"] = 1
+        crawler.results["https://example.com/a"] = {"status": None}
+        queue, visited, results = crawler._copy_state(all_results=True)
+        assert queue == [("https://example.com/a", 1), ("https://example.com/b", 1)]
+        assert visited == {"https://example.com"}
+        assert results == {}
+
+    @patch("crawlit.crawler.engine.fetch_page")
+    def test_resume_from_checkpoint(self, mock_fetch, tmp_path):
+        from crawlit.utils.checkpoint import save_checkpoint
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.text = "<html><body>a</body></html>"
+        mock_resp.headers = {"Content-Type": "text/html"}
+        mock_resp.content = mock_resp.text.encode()
+        mock_fetch.return_value = (True, mock_resp, 200)
+
+        path = str(tmp_path / "crawl.ckpt")
+        save_checkpoint(path, [("https://example.com/a", 1)], {"https://example.com"},
+                        {"https://example.com": {"status": 200, "depth": 0}})
+        crawler = Crawler("https://example.com", max_depth=1, respect_robots=False)
+        crawler.resume_from(path)
+        fetched = [call.args[0] for call in mock_fetch.call_args_list]
+        assert fetched == ["https://example.com/a"]
+        assert set(crawler.results) == {"https://example.com", "https://example.com/a"}
+
+    @patch("crawlit.crawler.engine.fetch_page")
+    def test_resume_does_not_seed_the_crawl_again(self, mock_fetch, tmp_path):
+        import json
+        from crawlit.utils.checkpoint import save_checkpoint
+        from crawlit.utils.event_log import CrawlEventLog
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.text = "<html><body>a</body></html>"
+        mock_resp.headers = {"Content-Type": "text/html"}
+        mock_resp.content = mock_resp.text.encode()
+        mock_fetch.return_value = (True, mock_resp, 200)
+
+        # The start URL is neither visited nor queued: it was dropped before
+        # the checkpoint, so resuming must not bring it back
+        path = str(tmp_path / "crawl.ckpt")
+        save_checkpoint(path, [("https://example.com/a", 1)], {"https://example.com/x"}, {})
+        events = CrawlEventLog(tmp_path / "events.jsonl", flush_interval=0)
+        crawler = Crawler("https://example.com", max_depth=1, respect_robots=False,
+                          use_sitemap=True, event_log=events)
+        with patch.object(crawler, "_discover_sitemaps") as discover:
+            crawler.resume_from(path)
+        events.close()
+        assert [call.args[0] for call in mock_fetch.call_args_list] == ["https://example.com/a"]
+        discover.assert_not_called()
+        records = [json.loads(line) for line in (tmp_path / "events.jsonl").read_text().splitlines()]
+        types = [r["event_type"] for r in records]
+        assert types[0] == "CRAWL_RESUME" and "CRAWL_START" not in types
+        assert records[0]["details"]["source"] == path
+        assert crawler._resumed is False
+
+    @patch("crawlit.crawler.engine.fetch_page")
+    def test_crawl_flushes_buffered_outputs(self, mock_fetch, tmp_path):
+        from crawlit.pipelines import JSONLWriter
+        from crawlit.utils.event_log import CrawlEventLog
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.text = "<html><body>Hi</body></html>"
+        mock_resp.headers = {"Content-Type": "text/html"}
+        mock_resp.url = "https://example.com"
+        mock_resp.content = mock_resp.text.encode()
+        mock_fetch.return_value = (True, mock_resp, 200)
+
+        writer = JSONLWriter(tmp_path / "out.jsonl", flush_interval=60)
+        events = CrawlEventLog(tmp_path / "events.jsonl", flush_interval=60)
+        crawler = Crawler(
+            "https://example.com",
+            max_depth=0,
+            respect_robots=False,
+            pipelines=[writer],
+            event_log=events,
+        )
+        crawler.crawl()
+        # Flushed at crawl end without closing
+        assert len((tmp_path / "out.jsonl").read_text().splitlines()) == 1
+        assert "CRAWL_END" in (tmp_path / "events.jsonl").read_text()
+        writer.close()
+        events.close()
+
+    @patch("crawlit.crawler.engine.fetch_page")
+    def test_results_stream_to_sinks(self, mock_fetch, tmp_path):
+        from crawlit.output import JSONLSink
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.text = "<html><body><a href='/a'>a</a></body></html>"
+        mock_resp.headers = {"Content-Type": "text/html"}
+        mock_resp.url = "https://example.com"
+        mock_resp.content = mock_resp.text.encode()
+        mock_fetch.return_value = (True, mock_resp, 200)
+
+        sink = JSONLSink(str(tmp_path / "out.jsonl"))
+        crawler = Crawler(
+            "https://example.com",
+            max_depth=1,
+            respect_robots=False,
+            retain_artifacts=False,
+            retain_results=False,
+            result_sinks=[sink],
+        )
+        crawler.crawl()
+        sink.close()
+        lines = [json.loads(line) for line in (tmp_path / "out.jsonl").read_text().splitlines()]
+        assert [line["url"] for line in lines] == ["https://example.com", "https://example.com/a"]
+        assert lines[0]["links"] == ["https://example.com/a"]
+        # Nothing is kept once written
+        assert crawler.results == {}
+        assert crawler.artifacts == {}
+
+    @patch("crawlit.crawler.engine.fetch_page")
+    def test_failing_pipeline_is_rolled_back(self, mock_fetch):
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.text = "<html><body>Hi</body></html>"
+        mock_resp.headers = {"Content-Type": "text/html"}
+        mock_resp.url = "https://example.com"
+        mock_resp.content = mock_resp.text.encode()
+        mock_fetch.return_value = (True, mock_resp, 200)
+
+        class Broken:
+            def process(self, artifact):
+                artifact.extracted["partial"] = True
+                artifact.links.append("https://example.com/bogus")
+                raise RuntimeError("stage failed")
+
+        class Tag:
+            def process(self, artifact):
+                artifact.extracted["tagged"] = True
+                return artifact
+
+        crawler = Crawler(
+            "https://example.com",
+            max_depth=0,
+            respect_robots=False,
+            pipelines=[Broken(), Tag()],
+        )
+        crawler.crawl()
+        artifact = crawler.artifacts["https://example.com"]
+        assert "partial" not in artifact.extracted
+        assert artifact.extracted["tagged"] is True
+        assert "https://example.com/bogus" not in artifact.links
+
+
+class TestCrawlerPrefetchDedup:
+    @patch("crawlit.crawler.engine.fetch_page")
+    def test_learned_url_rule_skips_fetches(self, mock_fetch):
+        from crawlit.utils.prefetch_dedup import PrefetchDeduplicator
+
+        start_html = "<html><body>%s</body></html>" % "".join(
+            '<a href="/p?ref=%d">p</a>' % i for i in range(1, 5)
+        )
+        page_html = "<html><body><p>%s</p></body></html>" % ("Same article text. " * 20)
+        fetched = []
+
+        def side_effect(url, *args, **kwargs):
+            fetched.append(url)
+            resp = MagicMock()
+            resp.status_code = 200
+            resp.headers = {"Content-Type": "text/html"}
+            resp.text = start_html if url == "https://example.com" else page_html
+            resp.content = resp.text.encode()
+            return (True, resp, 200)
+
+        mock_fetch.side_effect = side_effect
+        prefetch = PrefetchDeduplicator(min_rule_observations=1, audit_rate=0)
+        crawler = Crawler(
+            "https://example.com",
+            max_depth=1,
+            respect_robots=False,
+            enable_content_deduplication=True,
+            prefetch_deduplicator=prefetch,
+        )
+        crawler.crawl()
+
+        # Link discovery order is not deterministic: the first two child pages
+        # are fetched to learn the rule, the remaining two are skipped.
+        assert fetched[0] == "https://example.com"
+        assert len(fetched) == 3
+        children = ["https://example.com/p?ref=%d" % i for i in range(1, 5)]
+        skipped = [u for u in children if u not in fetched]
+        assert len(skipped) == 2
+        results = crawler.get_results()
+        for url in skipped:
+            assert results[url]["prefetch_skipped"] is True
+            assert results[url]["duplicate_of"] == [fetched[1]]
+        assert prefetch.get_stats()["skipped_by_reason"] == {"url_rule": 2}
+
+    @patch("crawlit.crawler.engine.fetch_page")
+    def test_audit_uses_normalised_content_hash(self, mock_fetch):
+        from crawlit.utils.prefetch_dedup import PrefetchDeduplicator
+
+        start_html = "<html><body>%s</body></html>" % "".join(
+            '<a href="/p?ref=%d">p</a>' % i for i in range(1, 5)
+        )
+
+        def side_effect(url, *args, **kwargs):
+            resp = MagicMock()
+            resp.status_code = 200
+            resp.headers = {"Content-Type": "text/html"}
+            # Same article, per-response nonce that the deduplicator ignores
+            resp.text = start_html if url == "https://example.com" else (
+                '<html><script>var nonce="%s";</script><body><p>%s</p></body></html>'
+                % (url, "Same article text. " * 20)
+            )
+            resp.content = resp.text.encode()
+            return (True, resp, 200)
+
+        mock_fetch.side_effect = side_effect
+        prefetch = PrefetchDeduplicator(min_rule_observations=1, audit_rate=1.0)
+        crawler = Crawler(
+            "https://example.com",
+            max_depth=1,
+            respect_robots=False,
+            enable_content_deduplication=True,
+            prefetch_deduplicator=prefetch,
+        )
+        crawler.crawl()
+
+        stats = prefetch.get_stats()
+        assert stats["audited"] == 2
+        assert stats["false_skips"] == 0
+
+
+
+class TestCrawlerHTTPCache:
+    @patch("crawlit.crawler.engine.fetch_page")
+    def test_stale_entry_revalidated_with_conditional_request(self, mock_fetch):
+        from crawlit.utils.cache import PageCache
+
+        html = "<html><head><title>Cached</title></head><body>Hi</body></html>"
+        calls = []
+
+        def side_effect(url, *args, **kwargs):
+            calls.append(kwargs.get("extra_headers"))
+            if kwargs.get("extra_headers"):
+                return (False, "HTTP Error: 304", 304)
+            resp = MagicMock()
+            resp.status_code = 200
+            resp.headers = {"Content-Type": "text/html", "ETag": '"v1"', "Cache-Control": "no-cache"}
+            resp.text = html
+            resp.content = html.encode()
+            return (True, resp, 200)
+
+        mock_fetch.side_effect = side_effect
+        cache = PageCache(http_semantics=True)
+        Crawler("https://example.com", max_depth=0, respect_robots=False, page_cache=cache).crawl()
+
+        crawler = Crawler("https://example.com", max_depth=0, respect_robots=False, page_cache=cache)
+        crawler.crawl()
+
+        assert calls[0] is None
+        assert calls[1] == {"If-None-Match": '"v1"'}
+        result = crawler.get_results()["https://example.com"]
+        assert result["status"] == 200
+        assert result["success"] is True
+        assert cache.get_stats()["revalidated"] == 1
+
+    @patch("crawlit.crawler.engine.fetch_page")
+    def test_fresh_entry_served_without_fetch(self, mock_fetch):
+        from crawlit.utils.cache import PageCache
+
+        cache = PageCache(http_semantics=True)
+        cache.set("https://example.com", response_data={}, status_code=200,
+                  headers={"Content-Type": "text/html", "Cache-Control": "max-age=600"},
+                  content="<html><body>Hi</body></html>")
+        crawler = Crawler("https://example.com", max_depth=0, respect_robots=False, page_cache=cache)
+        crawler.crawl()
+
+        mock_fetch.assert_not_called()
+        assert crawler.get_results()["https://example.com"]["status"] == 200
+
+    @patch("crawlit.crawler.engine.fetch_page")
+    def test_offline_replay_never_fetches(self, mock_fetch):
+        from crawlit.utils.cache import PageCache, OFFLINE_CACHE_MISS
+
+        cache = PageCache(http_semantics=True)
+        cache.set("https://example.com", response_data={}, status_code=200,
+                  headers={"Content-Type": "text/html", "Cache-Control": "no-cache"},
+                  content='<html><body><a href="/missing">m</a></body></html>')
+        crawler = Crawler("https://example.com", max_depth=1, page_cache=cache, offline=True)
+        crawler.crawl()
+
+        mock_fetch.assert_not_called()
+        results = crawler.get_results()
+        assert results["https://example.com"]["success"] is True
+        assert results["https://example.com/missing"]["error"] == OFFLINE_CACHE_MISS
+
+
+class TestCrawlerBatchPipelines:
+    @staticmethod
+    def _crawler(pages=6, interrupt_at=None, **kwargs):
+        from crawlit.interfaces import Fetcher, FetchResult
+
+        class SiteFetcher(Fetcher):
+            def fetch(self, url, headers=None):
+                if url == interrupt_at:
+                    raise KeyboardInterrupt
+                if url == "https://example.com":
+                    body = "".join(f'<a href="/{i}">{i}</a>' for i in range(pages - 1))
+                else:
+                    body = url
+                return FetchResult(success=True, url=url, status_code=200,
+                                   content_type="text/html", text=f"<html><body>{body}</body></html>")
+
+        return Crawler("https://example.com", max_depth=1, respect_robots=False, delay=0,
+                       fetcher=SiteFetcher(), **kwargs)
+
+    def test_batches_by_size_and_flushes_at_crawl_end(self):
+        from crawlit.interfaces import BatchPipeline, Pipeline
+
+        batches, seen_after = [], []
+
+        class Batched(BatchPipeline):
+            batch_size = 4
+
+            def process_batch(self, artifacts):
+                batches.append([a.url for a in artifacts])
+                return [None if a.url.endswith("/1") else a for a in artifacts]
+
+        class After(Pipeline):
+            def process(self, artifact):
+                seen_after.append(artifact.url)
+                return artifact
+
+        crawler = self._crawler(pages=10, max_workers=4, pipelines=[Batched(), After()],
+                                pipeline_batch_latency_ms=None)
+        crawler.crawl()
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        processed = [url for batch in batches for url in batch]
+        assert sorted(processed) == sorted(crawler.get_artifacts())
+        # Survivors leave the batch stage in the order they entered it
+        assert seen_after == [url for url in processed if not url.endswith("/1")]
+
+    def test_interrupted_crawl_processes_buffered_batch(self):
+        from crawlit.interfaces import BatchPipeline
+
+        batches = []
+
+        class Batched(BatchPipeline):
+            def process_batch(self, artifacts):
+                batches.append([a.url for a in artifacts])
+
+        crawler = self._crawler(interrupt_at="https://example.com/2", pipelines=[Batched()],
+                                pipeline_batch_latency_ms=None)
+        with pytest.raises(KeyboardInterrupt):
+            crawler.crawl()
+        assert len(batches) == 1 and batches[0][0] == "https://example.com"
+        assert sorted(batches[0]) == sorted(crawler.get_artifacts())
+
+    def test_checkpoints_only_record_persisted_pages(self, tmp_path):
+        from crawlit.interfaces import BatchPipeline
+
+        class Buffered(BatchPipeline):
+            batch_size = 3
+
+            def __init__(self):
+                self.buffer, self.persisted = [], set()
+
+            def process_batch(self, artifacts):
+                self.buffer.extend(a.url for a in artifacts)
+
+            def flush(self):
+                self.persisted.update(self.buffer)
+                self.buffer = []
+
+        sink = Buffered()
+        checkpointed = []
+        crawler = self._crawler(pages=8, pipelines=[sink], pipeline_batch_latency_ms=None,
+                                checkpoint_path=str(tmp_path / "crawl.ckpt"),
+                                checkpoint_interval=None, checkpoint_every_pages=1)
+        append = crawler._checkpointer.writer.append
+
+        def checked_append(queue, new_visited, new_results, metadata):
+            assert set(new_visited) <= sink.persisted
+            checkpointed.extend(new_visited)
+            return append(queue, new_visited, new_results, metadata)
+
+        crawler._checkpointer.writer.append = checked_append
+        crawler.crawl()
+        assert len(checkpointed) == 8
+
+    def test_partial_batch_is_processed_after_max_latency(self):
+        import time
+        from crawlit.interfaces import BatchPipeline
+        from crawlit.models.page_artifact import PageArtifact
+
+        batches = []
+
+        class Batched(BatchPipeline):
+            batch_size = 100
+            max_latency_ms = 20
+
+            def process_batch(self, artifacts):
+                batches.append(len(artifacts))
+
+        crawler = Crawler("https://example.com", pipelines=[Batched()])
+        crawler._batch_timer = __import__("threading").Thread(target=crawler._run_batch_timer, daemon=True)
+        crawler._batch_timer.start()
+        try:
+            crawler._run_pipelines(PageArtifact(url="https://example.com/a"))
+            crawler._run_pipelines(PageArtifact(url="https://example.com/b"))
+            deadline = time.time() + 2
+            while not batches and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            crawler._stop_batch_timer()
+        assert batches == [2]
+        assert set(crawler.get_artifacts()) == {"https://example.com/a", "https://example.com/b"}
+
+    def test_rejects_async_process_batch(self):
+        class AsyncBatched:
+            def process(self, artifact):
+                return artifact
+
+            async def process_batch(self, artifacts):
+                return None
+
+        with pytest.raises(TypeError, match="process_batch"):
+            Crawler("https://example.com", pipelines=[AsyncBatched()])
@@ -517,6 +517,31 @@ class TestContentExtractor:
         result = ext.extract_content(simple_html, "https://example.com")
         assert len(result.get("images_with_context", [])) > 0
 
+    def test_image_context_neighbours_and_headings(self):
+        html = (
+            "<html><body><h2>Section</h2><img src='/a.png'>"
+            "<div><p>one</p><p>two</p><p>three</p><img src='/b.png'>"
+            "<span></span><p>four</p><p>five</p><p>six</p></div></body></html>"
+        )
+        images = ContentExtractor().extract_content(html, "https://example.com")["images_with_context"]
+        by_src = {img["src"]: img for img in images}
+        assert by_src["/a.png"]["nearby_headings"] == [{"level": 2, "text": "Section"}]
+        b = by_src["/b.png"]
+        assert b["nearby_headings"] == []
+        assert b["context"] == "two three onetwothreefourfivesix four five"
+        assert b["position"]["relative_position"] == "2/2"
+
+    def test_image_context_cap(self):
+        html = "<html><body><div>%s</div></body></html>" % "".join(
+            "<img src='/i%d.png'>" % i for i in range(20)
+        )
+        images = ContentExtractor(max_images_with_context=5).extract_content(
+            html, "https://example.com"
+        )["images_with_context"]
+        assert len(images) == 5
+        assert {img["src"] for img in images} == {"/i%d.png" % i for i in range(5)}
+        assert all(img["position"]["total_images"] == 20 for img in images)
+
     @pytest.mark.parametrize("url,expected_type", [
         ("https://example.com/", "home"),
         ("https://example.com/about", "about"),
@@ -587,6 +612,45 @@ class TestStructuredDataExtractor:
         assert data is not None
 
 
+    def test_streaming_matches_tree_methods(self):
+        from crawlit.extractors.structured_data import StructuredDataExtractor
+        html = """<html><head>
+            <script type="application/ld+json">{"@graph": [{"@type": "A"}, {"@type": "B"}]}</script>
+            <meta name="description" content="Desc"></head>
+            <body vocab="https://schema.org/">
+            <div itemscope itemtype="https://schema.org/Product">
+                <span itemprop="name"> Widget <b>X</b> </span>
+                <div itemprop="offers" itemscope itemtype="https://schema.org/Offer">
+                    <meta itemprop="price" content="9.99"></div>
+                <span itemprop="name">Alias</span>
+            </div>
+            <div typeof="Person"><span property="name">Ann</span>
+                <a property="url" href="/ann">Ann</a></div>
+            </body></html>"""
+        streamed = StructuredDataExtractor(html).extract_all()
+        tree = StructuredDataExtractor(html)
+        assert streamed.json_ld == tree.extract_json_ld() == [{"@type": "A"}, {"@type": "B"}]
+        assert streamed.microdata == tree.extract_microdata()
+        assert streamed.microdata[0]["name"] == ["WidgetX", "Alias"]
+        assert streamed.microdata[0]["offers"]["price"] == "9.99"
+        assert streamed.rdfa == tree.extract_rdfa()
+        assert streamed.rdfa[0]["@context"] == "https://schema.org/"
+        assert streamed.meta_tags == {"description": "Desc"}
+
+    def test_extract_all_does_not_build_tree(self, structured_data_html):
+        from crawlit.extractors.structured_data import StructuredDataExtractor
+        ext = StructuredDataExtractor(structured_data_html)
+        ext.extract_all()
+        assert ext._soup is None
+
+    def test_json_ld_size_cap(self):
+        from crawlit.extractors.structured_data import StructuredDataExtractor
+        html = '<script type="application/ld+json">{"@type": "Product", "sku": "%s"}</script>' % ("x" * 500)
+        assert StructuredDataExtractor(html).extract_all().json_ld[0]["@type"] == "Product"
+        assert StructuredDataExtractor(html, max_json_ld_size=100).extract_all().json_ld == []
+        assert StructuredDataExtractor(html, max_json_ld_size=100).extract_json_ld() == []
+
+
 # -----------------------------------------------------------------------
 # Language Detector
 # -----------------------------------------------------------------------
@@ -618,6 +682,114 @@ class TestLanguageDetector:
         result = det.detect()
         assert result is not None
 
+    def test_content_detected_by_trigram_model(self):
+        from crawlit.extractors.language import LanguageDetector
+        html = (
+            "<html><body><p>Der schnelle braune Fuchs springt über den faulen Hund, "
+            "während die Kinder im Garten hinter ihrem Haus spielten.</p></body></html>"
+        )
+        result = LanguageDetector(html).detect()
+        assert result.primary_language == "de"
+        assert result.content_lang == "de"
+        assert result.detection_methods["ngrams"] == "de"
+
+    def test_model_classifies_text_and_scripts(self):
+        from crawlit.extractors.language import get_language_model
+        model = get_language_model()
+        assert model.classify("El rápido zorro marrón salta sobre el perro perezoso en el jardín")[0] == "es"
+        assert model.classify("素早い茶色の狐は、子供たちが家の裏の庭で遊んでいる間に")[0] == "ja"
+        assert model.classify("Быстрая коричневая лиса прыгает через ленивую собаку")[0] == "ru"
+        assert model.classify("too short") is None
+
+    def test_unprofiled_text_is_not_classified(self):
+        from crawlit.extractors.language import LanguageDetector, get_language_model
+        vietnamese = ("Tiếng Việt là ngôn ngữ của người Việt và là ngôn ngữ chính thức tại Việt Nam. "
+                      "Đây là tiếng mẹ đẻ của khoảng 85% dân cư Việt Nam.")
+        gibberish = "asdkj qwpoe zxmcn vbnrt lkjhg fdsap oiuyt rewqz xcvbn mnbvc asdfg"
+        model = get_language_model()
+        assert model.classify(vietnamese) is None
+        assert model.classify(gibberish) is None
+        result = LanguageDetector(f"<html><body><p>{vietnamese}</p></body></html>").detect()
+        assert (result.primary_language, result.confidence) == ("unknown", 0.0)
+
+    def test_short_sentences_are_classified(self):
+        from crawlit.extractors.language import get_language_model
+        model = get_language_model()
+        sentences = {
+            "uk": "Швидка бура лисиця стрибає через ледачого собаку і тікає в ліс.",
+            "ru": "Быстрая коричневая лиса прыгает через ленивую собаку.",
+            "de": "Der schnelle braune Fuchs springt über den faulen Hund.",
+            "en": "The quick brown fox jumps over the lazy dog.",
+            "pl": "Szybki brązowy lis przeskakuje nad leniwym psem.",
+            "it": "La volpe marrone veloce salta sopra il cane pigro.",
+        }
+        assert [model.classify(text)[0] for text in sentences.values()] == list(sentences)
+        assert model.classify("Con cáo nâu nhanh nhẹn nhảy qua con chó lười biếng.") is None
+        assert model.min_coverage(40) < model.min_coverage(2000) < model.MIN_COVERAGE
+
+    def test_profiles_use_only_their_own_script(self):
+        import unicodedata
+        from crawlit.extractors._language_profiles import TRIGRAM_PROFILES
+        scripts = {"ar": "ARABIC", "el": "GREEK", "he": "HEBREW", "ru": "CYRILLIC",
+                   "uk": "CYRILLIC", "ko": "HANGUL", "th": "THAI"}
+        for lang, ranked in TRIGRAM_PROFILES.items():
+            script = scripts.get(lang, "LATIN")
+            foreign = {ch for ch in ranked if ch != " " and not unicodedata.name(ch, "").startswith(script)}
+            assert not foreign, (lang, foreign)
+
+    def test_batch_scores_match_single_scores(self):
+        from crawlit.extractors.language import get_language_model
+        model = get_language_model()
+        texts = [
+            "Der schnelle braune Fuchs springt über den faulen Hund.",
+            "short",
+            "素早い茶色の狐は、子供たちが家の裏の庭で遊んでいる間に",
+            "The quick brown fox jumps over the lazy dog in the garden",
+            "asdkj qwpoe zxmcn vbnrt lkjhg fdsap oiuyt rewqz xcvbn mnbvc asdfg",
+        ]
+        for batch, single in zip(model.scores_batch(texts), [model.scores(text) for text in texts]):
+            assert [lang for lang, _ in batch] == [lang for lang, _ in single]
+            assert [share for _, share in batch] == pytest.approx([share for _, share in single])
+
+    def test_detector_reads_page_without_building_soup(self):
+        from crawlit.extractors.language import LanguageDetector, detect_languages
+        html = ('<html lang="de-DE"><head><title>Hallo Welt</title>'
+                '<meta http-equiv="Content-Language" content="de">'
+                '<meta name="description" content="Eine Seite über den schnellen Fuchs"></head>'
+                '<body><script>var words = "the and of to in";</script>'
+                '<p>Der schnelle braune Fuchs springt über den faulen Hund.</p>'
+                '<noscript>Please enable JavaScript to see this page</noscript></body></html>')
+        detector = LanguageDetector(html)
+        result = detector.detect()
+        assert detector._soup is None
+        assert "JavaScript" not in detector._get_visible_text()
+        assert result.detection_methods == {
+            "html_lang": "de", "meta_tags": "de", "ngrams": "de", "title_meta": "de",
+        }
+        assert detect_languages([html])[0].detection_methods == result.detection_methods
+        assert detector.soup.find("title").get_text() == "Hallo Welt"
+
+    def test_model_sample_is_bounded(self):
+        from crawlit.extractors.language import TrigramLanguageModel
+        from crawlit.extractors._language_profiles import TRIGRAM_PROFILES
+        model = TrigramLanguageModel(TRIGRAM_PROFILES, max_sample_chars=100)
+        assert len(model.sample("The children were playing in the garden. " * 1000)) <= 100
+
+    def test_batch_apis(self):
+        from crawlit.extractors.language import detect_languages, get_language_model
+        texts = [
+            "The quick brown fox jumps over the lazy dog in the garden",
+            "Le renard brun rapide saute par-dessus le chien paresseux",
+        ]
+        assert [r[0] for r in get_language_model().classify_batch(texts)] == ["en", "fr"]
+        results = detect_languages(
+            ['<html lang="en"><body></body></html>', "<html><body><p>%s</p></body></html>" % texts[1]],
+            urls=["https://example.com", "https://example.fr/page"],
+        )
+        assert [r.primary_language for r in results] == ["en", "fr"]
+        with pytest.raises(ValueError):
+            detect_languages(["<html></html>"], urls=[])
+
 
 # -----------------------------------------------------------------------
 # JS Embedded Data Extractor
@@ -658,6 +830,38 @@ class TestJSEmbeddedDataExtractor:
         result = ext.extract("<html></html>", PageArtifact())
         assert isinstance(result, dict)
 
+    def test_nested_state_with_trailing_code(self):
+        from crawlit.extractors.js_embedded_data import extract_js_embedded_data
+        html = (
+            '<script>window.__APOLLO_STATE__ = {"a": {"b": "}; x"}, "c": [1, {"d": 2}]}; '
+            'window.__NUXT__={"n": 1};init();</script>'
+        )
+        data = extract_js_embedded_data(html)
+        assert data["__APOLLO_STATE__"] == {"a": {"b": "}; x"}, "c": [1, {"d": 2}]}
+        assert data["__NUXT__"] == {"n": 1}
+
+    def test_json_block_keys_and_commented_scripts(self):
+        from crawlit.extractors.js_embedded_data import extract_js_embedded_data
+        html = (
+            '<!-- <script type="application/json" id="old">{"x": 0}</script> -->'
+            "<SCRIPT type='application/json' class='a b'>{\"k\": 1}</SCRIPT>"
+            '<script type=application/json class="a b">{"k": 2}</script>'
+        )
+        data = extract_js_embedded_data(html)
+        assert data == {"a_b": {"k": 1}, "a_b_1": {"k": 2}}
+
+    def test_budgets(self):
+        from crawlit.extractors.js_embedded_data import (
+            JSEmbeddedDataExtractor, extract_js_embedded_data,
+        )
+        from crawlit.models.page_artifact import PageArtifact
+        html = '<script>window.__DATA__ = {"v": "%s"};</script>' % ("x" * 1000)
+        assert "__DATA__" in extract_js_embedded_data(html)
+        assert extract_js_embedded_data(html, max_script_chars=100) == {}
+        assert extract_js_embedded_data(html, max_time_ms=0) == {}
+        ext = JSEmbeddedDataExtractor(max_script_chars=100)
+        assert ext.extract(html, PageArtifact()) == {}
+
 
 # -----------------------------------------------------------------------
 # PDF Extractor
@@ -6,8 +6,8 @@ import pytest
 
 from crawlit.output.formatters import (
     save_results, save_as_json, save_as_csv, save_as_txt,
-    save_as_html, generate_summary_report, create_output_file,
-    _safe_href,
+    save_as_html, save_as_jsonl, generate_summary_report, create_output_file,
+    open_sink, JSONSink, SummarySink, _safe_href,
 )
 
 
@@ -195,3 +195,86 @@ class TestGenerateSummaryReport:
     def test_empty_results(self):
         report = generate_summary_report({})
         assert "Total URLs crawled: 0" in report
+
+
+class TestResultSinks:
+    def test_streamed_json_matches_bulk(self, tmp_path, sample_results):
+        for pretty in (False, True):
+            bulk = str(tmp_path / f"bulk-{pretty}.json")
+            save_as_json(sample_results, bulk, "2026-01-01", pretty_json=pretty)
+            streamed = str(tmp_path / f"streamed-{pretty}.json")
+            with JSONSink(streamed, "2026-01-01", pretty=pretty) as sink:
+                for url, data in sample_results.items():
+                    sink.write(url, data)
+            with open(bulk) as f, open(streamed) as g:
+                assert json.load(f) == json.load(g)
+
+    def test_json_totals_patched_on_close(self, tmp_path, sample_results):
+        output = str(tmp_path / "r.json")
+        sink = open_sink("json", output, timestamp="2026-01-01")
+        for url, data in sample_results.items():
+            sink.write(url, data)
+        sink.close()
+        sink.close()  # idempotent
+        with open(output) as f:
+            data = json.load(f)
+        assert data["metadata"] == {"timestamp": "2026-01-01", "total_urls": 2}
+        assert "html_content" not in data["urls"]["https://example.com"]
+        with pytest.raises(ValueError):
+            sink.write("https://example.com/x", {})
+
+    def test_empty_json(self, tmp_path):
+        for pretty in (False, True):
+            output = str(tmp_path / f"empty-{pretty}.json")
+            open_sink("json", output, pretty_json=pretty).close()
+            with open(output) as f:
+                assert json.load(f)["urls"] == {}
+
+    def test_jsonl_one_object_per_url(self, tmp_path, sample_results):
+        output = str(tmp_path / "r.jsonl")
+        save_results(sample_results, output_format="jsonl", output_file=output)
+        with open(output) as f:
+            lines = [json.loads(line) for line in f]
+        assert [line["url"] for line in lines] == list(sample_results)
+        assert lines[0]["links"] == sample_results["https://example.com"]["links"]
+        assert "html_content" not in lines[0]
+
+    def test_save_as_jsonl(self, tmp_path, sample_results):
+        output = str(tmp_path / "sub" / "r.jsonl")
+        save_as_jsonl(sample_results, output)
+        with open(output) as f:
+            assert len(f.readlines()) == 2
+
+    def test_csv_details_follow_summary_rows(self, tmp_path, sample_results):
+        output = str(tmp_path / "r.csv")
+        save_as_csv(sample_results, output, "2026-01-01")
+        with open(output) as f:
+            content = f.read()
+        assert content.index("https://example.com/about,") < content.index("# DETAILED DATA")
+        assert content.index("# DETAILED DATA") < content.index("# Images for https://example.com")
+        assert content.rstrip().endswith("# Total URLs:,2")
+
+    def test_txt_and_html_totals(self, tmp_path, sample_results):
+        txt = str(tmp_path / "r.txt")
+        save_as_txt(sample_results, txt, "2026-01-01")
+        with open(txt) as f:
+            assert f.read().splitlines()[1].rstrip() == "Total URLs: 2"
+        html = str(tmp_path / "r.html")
+        save_as_html(sample_results, html, "2026-01-01")
+        with open(html) as f:
+            content = f.read()
+        assert "Total URLs: <strong>2" in content
+        assert "Failed requests: <strong>0" in content
+        assert content.rstrip().endswith("</html>")
+
+    def test_summary_sink_matches_report(self, sample_results):
+        sink = SummarySink()
+        for url, data in sample_results.items():
+            sink.write(url, data)
+        assert sink.report() == generate_summary_report(sample_results)
+        assert sink.count == 2 and sink.success_count == 2
+
+    def test_unsupported_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            open_sink("xml", str(tmp_path / "r.xml"))
+        assert not os.path.exists(str(tmp_path / "r.xml"))
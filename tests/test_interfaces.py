@@ -8,6 +8,7 @@ from crawlit.interfaces import (
     Fetcher, AsyncFetcher,
     Extractor, AsyncExtractor,
     Pipeline, AsyncPipeline,
+    BatchPipeline, AsyncBatchPipeline,
 )
 from crawlit.models.page_artifact import PageArtifact
 
@@ -202,3 +203,33 @@ class TestAsyncPipelineABC:
         art = PageArtifact(url="https://example.com")
         result = await pipe.process(art)
         assert result is art
+
+
+class TestBatchPipelineABC:
+    def test_cannot_instantiate_directly(self):
+        with pytest.raises(TypeError):
+            BatchPipeline()
+
+    def test_process_delegates_to_process_batch(self):
+        class DropOdd(BatchPipeline):
+            batch_size = 10
+
+            def process_batch(self, artifacts):
+                return [a if a.url.endswith("0") else None for a in artifacts]
+
+        pipe = DropOdd()
+        assert isinstance(pipe, Pipeline)
+        keep = PageArtifact(url="https://example.com/0")
+        assert pipe.process(keep) is keep
+        assert pipe.process(PageArtifact(url="https://example.com/1")) is None
+
+    @pytest.mark.asyncio
+    async def test_async_batch_pipeline(self):
+        class Passthrough(AsyncBatchPipeline):
+            async def process_batch(self, artifacts):
+                return None
+
+        pipe = Passthrough()
+        assert isinstance(pipe, AsyncPipeline)
+        art = PageArtifact(url="https://example.com")
+        assert await pipe.process(art) is art
@@ -309,3 +309,229 @@ class TestPageArtifact:
         b = PageArtifact()
         a.links.append("https://x.com")
         assert b.links == []
+
+
+class TestArtifactSerializer:
+    @staticmethod
+    def _artifact():
+        from crawlit.models.page_artifact import ContentInfo, CrawlError, HTTPInfo, PageArtifact
+        artifact = PageArtifact(
+            url="https://example.com",
+            fetched_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            http=HTTPInfo(status=200, headers={"Content-Type": "text/html"}),
+            content=ContentInfo(raw_html="<p>héllo</p>", blob_path="blobs/html/ab/ab.html"),
+            links=["https://example.com/a"],
+            extracted={"published": datetime(2024, 5, 1), "err": CrawlError("X", "m"), "tags": {"a"}},
+        )
+        artifact.add_error("boom")
+        return artifact
+
+    def test_to_dict_matches_asdict_semantics(self):
+        artifact = self._artifact()
+        data = artifact.to_dict()
+        assert data["fetched_at"] == "2026-01-01T00:00:00+00:00"
+        assert data["extracted"]["published"] == "2024-05-01T00:00:00"
+        assert data["extracted"]["err"] == {"code": "X", "message": "m", "source": None, "http_status": None}
+        assert data["errors"][0]["source"] is None
+        assert list(data) == [f.name for f in dataclasses.fields(artifact)]
+        # Independent copy
+        data["links"].append("x")
+        data["http"]["headers"]["X"] = "y"
+        assert artifact.links == ["https://example.com/a"]
+        assert "X" not in artifact.http.headers
+
+    @pytest.mark.parametrize("backend", ["auto", "json"])
+    def test_dumps_round_trips(self, backend):
+        import json
+        from crawlit.models.serialization import ArtifactSerializer
+        artifact = self._artifact()
+        decoded = json.loads(ArtifactSerializer(backend=backend).dumps(artifact))
+        expected = artifact.to_dict()
+        expected["extracted"]["tags"] = ["a"]
+        assert decoded == expected
+        assert "héllo".encode("utf-8") in ArtifactSerializer(backend=backend).dumps(artifact)
+
+    def test_projection(self):
+        import json
+        from crawlit.models.serialization import ArtifactSerializer
+        artifact = self._artifact()
+        data = json.loads(ArtifactSerializer(exclude=["content.raw_html", "extracted"]).dumps(artifact))
+        assert "raw_html" not in data["content"] and "extracted" not in data
+        assert data["content"]["blob_path"] == "blobs/html/ab/ab.html"
+        assert json.loads(artifact.to_json(include=["url", "http.status"])) == {
+            "url": "https://example.com", "http": {"status": 200}}
+
+        skip = ArtifactSerializer(skip_blob_html=True)
+        assert "raw_html" not in skip.to_dict(artifact)["content"]
+        artifact.content.blob_path = None
+        assert skip.to_dict(artifact)["content"]["raw_html"] == "<p>héllo</p>"
+
+    def test_invalid_backend(self):
+        from crawlit.models.serialization import ArtifactSerializer
+        with pytest.raises(ValueError):
+            ArtifactSerializer(backend="pickle")
+
+
+class TestArtifactJournal:
+    @staticmethod
+    def _artifact():
+        return PageArtifact(
+            url="https://example.com",
+            http=HTTPInfo(status=200, headers={"A": "1"}),
+            links=["https://example.com/a"],
+            extracted={"title": "T"},
+        )
+
+    def test_rollback_restores_in_place_and_reassigned_changes(self):
+        from crawlit.models.journal import ArtifactJournal
+        artifact = self._artifact()
+        links = artifact.links
+        journal = ArtifactJournal(artifact)
+        assert not journal.dirty
+        artifact.links.append("https://example.com/b")
+        artifact.extracted["title"] = "changed"
+        artifact.add_error("boom")
+        artifact.http.status = 500
+        artifact.url = "https://other.example"
+        assert journal.dirty
+        journal.rollback()
+        assert artifact.links == ["https://example.com/a"]
+        assert artifact.links is links  # restored in place, never replaced
+        assert artifact.extracted == {"title": "T"}
+        assert artifact.errors == []
+        assert artifact.http.status == 200
+        assert artifact.url == "https://example.com"
+
+    def test_journaled_containers_are_saved_on_first_mutation(self):
+        from crawlit.models.journal import ArtifactJournal, JournaledList, journaled
+        artifact = journaled(self._artifact())
+        links, extracted = artifact.links, artifact.extracted
+        assert type(links) is JournaledList
+        journal = ArtifactJournal(artifact)
+        assert not journal._copied and not journal.dirty
+        artifact.links.append("https://example.com/b")
+        artifact.extracted["title"] = "changed"
+        journal.rollback()
+        assert artifact.links is links and links == ["https://example.com/a"]
+        assert artifact.extracted is extracted and extracted == {"title": "T"}
+
+    def test_commit_keeps_changes_and_stops_tracking(self):
+        from crawlit.models.journal import ArtifactJournal
+        artifact = self._artifact()
+        journal = ArtifactJournal(artifact)
+        artifact.links.append("https://example.com/b")
+        journal.commit()
+        artifact.links.append("https://example.com/c")
+        journal.rollback()  # nothing saved after commit
+        assert artifact.links[-1] == "https://example.com/c"
+
+    def test_journaled_containers_pickle_as_builtins(self):
+        import copy
+        import json
+        import pickle
+        from crawlit.models.journal import ArtifactJournal
+        from crawlit.models.serialization import ArtifactSerializer
+        from crawlit.models.journal import journaled
+        artifact = journaled(self._artifact())
+        ArtifactJournal(artifact).commit()
+        assert type(pickle.loads(pickle.dumps(artifact)).links) is list
+        assert type(copy.deepcopy(artifact).extracted) is dict
+        for backend in ("json", "auto"):
+            data = json.loads(ArtifactSerializer(backend=backend).dumps(artifact))
+            assert data["links"] == ["https://example.com/a"]
+
+
+class TestResultView:
+    @staticmethod
+    def _view():
+        from crawlit.models.result_view import ResultView
+        artifact = PageArtifact(
+            url="https://example.com",
+            http=HTTPInfo(status=200, headers={"Content-Type": "text/html"}),
+            content=ContentInfo(raw_html="<p>hi</p>"),
+            links=["https://example.com/a"],
+            extracted={"title": "T", "pdf": {"pages": 1}},
+        )
+        view = ResultView(artifact, depth=0, status=200, headers=None, links=[], success=True)
+        view.bind("headers", "links", "html_content", "title", "pdf_data", "images")
+        return artifact, view
+
+    def test_bound_keys_read_from_artifact(self):
+        artifact, view = self._view()
+        assert view["headers"] is artifact.http.headers
+        assert view["links"] is artifact.links
+        assert view["html_content"] == "<p>hi</p>"
+        assert view["pdf_data"] == {"pages": 1}
+        assert view["images"] is None
+        assert list(view) == ["depth", "status", "headers", "links", "success",
+                              "html_content", "title", "pdf_data", "images"]
+        assert view == view.copy() and type(view.copy()) is dict
+
+    def test_assignment_overrides_binding(self):
+        artifact, view = self._view()
+        view["title"] = "Other"
+        view.update({"error": "boom"})
+        assert view["title"] == "Other" and artifact.extracted["title"] == "T"
+        del view["html_content"]
+        assert "html_content" not in view and view.get("error") == "boom"
+
+    def test_rebind_picks_up_replaced_values(self):
+        artifact, view = self._view()
+        view["depth"] = 3
+        artifact.links = ["https://example.com/b"]
+        artifact.extracted["title"] = "New"
+        view.rebind()
+        assert view["links"] is artifact.links and view["title"] == "New"
+        assert view["depth"] == 3
+        view.detach()
+        artifact.links = []
+        view.rebind()  # no-op once detached
+        assert view["links"] == ["https://example.com/b"]
+
+    def test_detach_and_pickle_give_plain_values(self):
+        import json
+        import pickle
+        artifact, view = self._view()
+        restored = pickle.loads(pickle.dumps(view))
+        assert type(restored) is dict and restored["links"] == artifact.links
+        assert isinstance(view, dict)
+        assert json.loads(json.dumps({"https://example.com": view}))["https://example.com"]["title"] == "T"
+        view.detach()
+        assert view.artifact is None
+        artifact.links.append("https://example.com/b")  # same list object is kept
+        assert view["links"][-1] == "https://example.com/b"
+        with pytest.raises(ValueError):
+            view.bind("links")
+
+
+class TestCompactRecords:
+    def test_sub_records_are_slotted(self):
+        from crawlit.models.page_artifact import SLOTTED
+        if not SLOTTED:
+            pytest.skip("slotted dataclasses need Python 3.10+")
+        for record in (HTTPInfo(), ContentInfo(), CrawlMeta(), ArtifactSource(),
+                       DownloadRecord(), CrawlError("UNKNOWN", "m")):
+            assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            HTTPInfo().not_a_field = 1
+
+    def test_page_artifact_keeps_ad_hoc_attributes(self):
+        import copy
+        import pickle
+        artifact = PageArtifact(url="https://example.com")
+        artifact.note = "kept"
+        assert pickle.loads(pickle.dumps(artifact)).note == "kept"
+        assert copy.deepcopy(artifact).note == "kept"
+        assert dataclasses.replace(artifact).url == "https://example.com"
+
+    def test_repeated_strings_are_interned(self):
+        from crawlit.models.page_artifact import intern_headers
+        run_id = "".join(["run-", "42"])
+        a, b = CrawlMeta(run_id=run_id), CrawlMeta(run_id="".join(["run-", "42"]))
+        assert a.run_id is b.run_id
+        site = "".join(["example", ".com"])
+        assert ArtifactSource(site=site).site is ArtifactSource(site="example.com").site
+        h1 = intern_headers({"".join(["X-", "Id"]): "1"})
+        h2 = intern_headers({"".join(["X-", "Id"]): "2"})
+        assert next(iter(h1)) is next(iter(h2))
+        assert HTTPInfo(content_type=None).content_type is None
@@ -41,6 +41,18 @@ class TestJSONLWriter:
         lines = path.read_text().strip().split("\n")
         assert len(lines) == 5
 
+    def test_process_batch_keeps_order(self, tmp_path):
+        from crawlit.interfaces import BatchPipeline
+        path = tmp_path / "artifacts.jsonl"
+        writer = JSONLWriter(str(path))
+        assert isinstance(writer, BatchPipeline)
+        arts = [PageArtifact(url=f"https://example.com/page{i}") for i in range(5)]
+        assert writer.process_batch(arts) is None  # all passed on
+        writer.close()
+
+        urls = [json.loads(line)["url"] for line in path.read_text().splitlines()]
+        assert urls == [a.url for a in arts]
+
     def test_append_mode(self, tmp_path):
         path = tmp_path / "artifacts.jsonl"
         writer1 = JSONLWriter(str(path), append=True)
@@ -17,6 +17,7 @@ from crawlit.security.honeypot import (
 from crawlit.security.captcha_detector import (
     CaptchaDetector, CaptchaType, detect_captcha,
 )
+from crawlit.security.scanner import SecurityScanner, scan_security
 
 
 # -----------------------------------------------------------------------
@@ -367,3 +368,78 @@ class TestCaptchaDetector:
         assert CaptchaType.RECAPTCHA.value == "reCAPTCHA"
         assert CaptchaType.HCAPTCHA.value == "hCaptcha"
         assert CaptchaType.CLOUDFLARE_TURNSTILE.value == "Cloudflare Turnstile"
+
+
+# -----------------------------------------------------------------------
+# Single-pass security scanner
+# -----------------------------------------------------------------------
+
+class TestSecurityScanner:
+    PAGE = """<html><head><meta name="csrf-token" content="meta_value"></head><body>
+        <div class="g-recaptcha" data-sitekey="abc"></div>
+        <script src="https://www.google.com/recaptcha/api.js"></script>
+        <script>var csrfToken = "js_value";</script>
+        <form action="/submit">
+            <input type="hidden" name="csrf_token" value="form_value">
+            <input type="hidden" name="honeypot" value="">
+        </form>
+        <a href="/trap" id="honeypot" class="bot-trap" style="display:none">T</a>
+        <p>Incapsula incident ID: 42</p>
+    </body></html>"""
+
+    def test_matches_individual_detectors(self):
+        headers = {"cf-ray": "abc123", "Server": "cloudflare"}
+        result = SecurityScanner().scan(self.PAGE, headers=headers)
+
+        captcha = detect_captcha(self.PAGE)
+        assert sorted(result.captcha["captcha_types"]) == sorted(captcha["captcha_types"])
+        assert result.captcha["indicators"] == captcha["indicators"]
+        assert result.honeypots == detect_honeypots(self.PAGE)
+        assert result.waf == detect_waf(headers, None, self.PAGE)
+        assert result.csrf_tokens == CSRFTokenExtractor(self.PAGE).extract_all_tokens()
+
+        forms = "".join(
+            f"""<form action="/f{i}">
+                <input type="hidden" name="csrf_token" value="csrf_{i}">
+                <input type="hidden" name="_wpnonce" value="nonce_{i}">
+                <input type="hidden" name="form_build_id" value="build_{i}">
+            </form>"""
+            for i in (1, 2)
+        )
+        page = f"<html><body>{forms}</body></html>"
+        tokens = SecurityScanner().scan(page).csrf_tokens
+        assert tokens == CSRFTokenExtractor(page).extract_all_tokens()
+        assert tokens["_wpnonce"] == "nonce_2"
+        assert tokens["form_build_id"] == "build_2"
+
+    def test_overlapping_body_signatures(self):
+        result = SecurityScanner().scan("<p>Incapsula incident ID</p>")
+        assert "Body pattern: incapsula" in result.waf.indicators
+        assert "Body pattern: incapsula incident id" in result.waf.indicators
+
+    def test_disabled_checks(self):
+        result = SecurityScanner(detect_waf=False, extract_csrf=False).scan(self.PAGE)
+        assert result.waf is None
+        assert result.csrf_tokens is None
+        assert result.captcha["detected"] is True
+
+    def test_empty_html(self):
+        result = scan_security("", headers={"x-sucuri-id": "1"})
+        assert result.captcha["detected"] is False
+        assert result.honeypots.has_honeypots is False
+        assert result.csrf_tokens == {}
+        assert result.waf.waf_type == WAFType.SUCURI
+
+    def test_extractor_plugin(self):
+        from crawlit.models import PageArtifact, HTTPInfo
+        artifact = PageArtifact(
+            url="https://example.com",
+            http=HTTPInfo(headers={"Set-Cookie": "__cfduid=1; Path=/"}),
+        )
+        scanner = SecurityScanner()
+        data = scanner.extract(self.PAGE, artifact)
+        assert scanner.name == "security"
+        assert data["waf"]["waf_type"] == WAFType.CLOUDFLARE.value
+        assert "Cookie: __cfduid" in data["waf"]["indicators"]
+        assert data["honeypots"]["has_honeypots"] is True
+        assert scanner.get_captcha_detection_count() == 1
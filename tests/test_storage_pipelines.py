@@ -76,6 +76,89 @@ class TestBlobStore:
         assert result is not None
 
 
+def _blob_artifact(url, body, content_type="text/html"):
+    from crawlit.models.page_artifact import HTTPInfo, ContentInfo
+    artifact = PageArtifact(url=url)
+    artifact.http = HTTPInfo(status=200, content_type=content_type)
+    artifact.content = ContentInfo(raw_html=body)
+    return artifact
+
+
+class TestPackedBlobStore:
+    def test_content_addressed_roundtrip(self, tmp_path):
+        from crawlit.pipelines.packed_blob_store import PackedBlobStore, read_blob
+        store = PackedBlobStore(tmp_path / "blobs")
+        html = "<html>" + "repeated text " * 200 + "</html>"
+        first = store.process(_blob_artifact("https://example.com/a", html))
+        second = store.process(_blob_artifact("https://example.com/b", html))
+        pdf = store.process(_blob_artifact("https://example.com/c.pdf", "%PDF-1.4 \xe2\x00", "application/pdf"))
+
+        assert len(store) == 2
+        assert first.content.blob_path == second.content.blob_path
+        assert "#" in first.content.blob_path
+        assert read_blob(first.content.blob_path) == html.encode("utf-8")
+        assert store.get(pdf.content.blob_sha256) == "%PDF-1.4 \xe2\x00".encode("latin-1")
+        assert first.content.blob_sha256 in store
+        assert store.get("0" * 64) is None
+        assert [p.name for p in (tmp_path / "blobs" / "segments").iterdir()] == ["blobs-00000.seg"]
+        assert not (tmp_path / "blobs" / "html").exists()
+        # Compressible pages shrink on disk
+        assert store.locate(first.content.blob_sha256).length < len(html)
+        store.close()
+
+    def test_reopen_and_recover(self, tmp_path):
+        from crawlit.pipelines.packed_blob_store import PackedBlobStore
+        root = tmp_path / "blobs"
+        store = PackedBlobStore(root, max_segment_size=1)
+        shas = [store.process(_blob_artifact(f"https://example.com/{i}", f"page {i}")).content.blob_sha256
+                for i in range(3)]
+        store.close()
+        assert len(list((root / "segments").iterdir())) == 3
+
+        # Lose the last index entry (plus a torn half entry) and leave a torn record
+        index = root / "index.bin"
+        data = index.read_bytes()
+        index.write_bytes(data[:-30])
+        with (root / "segments" / "blobs-00002.seg").open("ab") as fh:
+            fh.write(b"CLB1\x01")
+        reopened = PackedBlobStore(root)
+        assert len(reopened) == 3
+        assert reopened.get(shas[2]) == b"page 2"
+        reopened.close()
+
+        index.unlink()
+        rebuilt = PackedBlobStore(root)
+        assert [rebuilt.get(sha) for sha in shas] == [b"page 0", b"page 1", b"page 2"]
+        rebuilt.process(_blob_artifact("https://example.com/3", "page 3"))
+        rebuilt.close()
+        assert len(PackedBlobStore(root)) == 4
+
+    def test_hash_store_integration(self, tmp_path):
+        from crawlit.pipelines.packed_blob_store import PackedBlobStore
+        from crawlit.utils.content_hash_store import ContentHashStore
+        hashes = ContentHashStore(tmp_path / "dedup.db")
+        hashes.record("https://example.com/a", "<html>same</html>")
+        store = PackedBlobStore(tmp_path / "blobs", hash_store=hashes)
+        blob_path = store.process(_blob_artifact("https://example.com/a", "<html>same</html>")).content.blob_path
+        store.close()
+        assert hashes.get_blob_path("<html>same</html>") == blob_path
+
+        other = PackedBlobStore(tmp_path / "other", hash_store=hashes)
+        reused = other.process(_blob_artifact("https://example.com/b", "<html>same</html>"))
+        assert reused.content.blob_path == blob_path
+        assert len(other) == 0
+        other.close()
+
+    def test_artifact_store_packed_blobs(self, tmp_path):
+        from crawlit.pipelines.artifact_store import ArtifactStore
+        from crawlit.pipelines.packed_blob_store import read_blob
+        store = ArtifactStore(tmp_path / "store", packed_blobs=True)
+        artifact = store.process(_blob_artifact("https://example.com", "<html>x</html>"))
+        store.close()
+        assert (tmp_path / "store" / "blobs" / "index.bin").exists()
+        assert read_blob(artifact.content.blob_path) == b"<html>x</html>"
+
+
 class TestEdgesWriter:
     def test_init(self, tmp_path):
         from crawlit.pipelines.edges_writer import EdgesWriter
@@ -100,6 +183,17 @@ class TestEdgesWriter:
         writer = EdgesWriter(path=str(tmp_path / "edges.jsonl"))
         writer.close()
 
+    def test_process_batch_skips_seeds(self, tmp_path):
+        from crawlit.pipelines.edges_writer import EdgesWriter
+        writer = EdgesWriter(path=str(tmp_path / "edges.jsonl"))
+        seed = PageArtifact(url="https://example.com")
+        child = PageArtifact(url="https://example.com/a")
+        child.crawl.discovered_from = "https://example.com"
+        assert writer.process_batch([seed, child]) is None
+        writer.close()
+        edges = [json.loads(line) for line in (tmp_path / "edges.jsonl").read_text().splitlines()]
+        assert [(e["from_url"], e["to_url"]) for e in edges] == [("https://example.com", "https://example.com/a")]
+
 
 class TestStorageManager:
     def test_init_memory(self):
@@ -124,3 +218,133 @@ class TestStorageManager:
         from crawlit.utils.storage import StorageManager
         sm = StorageManager(store_html_content=False)
         assert sm.store_html_content is False
+
+
+def _warc_artifact(url, html, content_type="text/html; charset=utf-8", status=200):
+    from crawlit.models.page_artifact import HTTPInfo, ContentInfo
+    artifact = PageArtifact(url=url)
+    artifact.http = HTTPInfo(status=status, headers={"Content-Type": content_type,
+                                                    "Content-Encoding": "gzip"},
+                             content_type=content_type)
+    artifact.content = ContentInfo(raw_html=html)
+    artifact.links = ["https://example.com/next"]
+    return artifact
+
+
+class TestWARCWriter:
+    def test_writes_gzip_per_record_warc(self, tmp_path):
+        from crawlit.pipelines.warc_writer import WARCWriter
+        from crawlit.utils.warc import iter_warc_records
+        writer = WARCWriter(tmp_path, request_headers={"User-Agent": "crawlit/1.0"})
+        writer.process(_warc_artifact("https://example.com/a?x=1", "<html>Grüße</html>"))
+        writer.close()
+
+        records = list(iter_warc_records(writer.current_path))
+        assert [r.type for _, _, r in records] == ["warcinfo", "response", "request", "metadata"]
+        response = records[1][2]
+        assert response.target_uri == "https://example.com/a?x=1"
+        status, headers, body = response.http_response()
+        assert status == 200
+        assert body.decode("utf-8") == "<html>Grüße</html>"
+        assert "Content-Encoding" not in headers
+        assert headers["Content-Length"] == str(len(body))
+        request = records[2][2]
+        assert request.block.startswith(b"GET /a?x=1 HTTP/1.1\r\nHost: example.com\r\nUser-Agent: crawlit/1.0")
+        assert request.headers["WARC-Concurrent-To"] == response.record_id
+        metadata = json.loads(records[3][2].block)
+        assert metadata["links"] == ["https://example.com/next"]
+        assert "raw_html" not in metadata["content"]
+
+    def test_skips_artifacts_without_content(self, tmp_path):
+        from crawlit.pipelines.warc_writer import WARCWriter
+        writer = WARCWriter(tmp_path)
+        writer.process(PageArtifact(url="https://example.com"))
+        assert writer.records_written == 0
+        assert writer.current_path is None
+
+    def test_rotates_files_and_indexes_offsets(self, tmp_path):
+        from crawlit.pipelines.warc_writer import WARCWriter
+        from crawlit.utils.warc import read_warc_record
+        writer = WARCWriter(tmp_path, max_file_size=1)
+        for i in range(3):
+            writer.process(_warc_artifact(f"https://example.com/{i}", f"<html>{i}</html>"))
+        writer.close()
+
+        assert len(list(tmp_path.glob("*.warc.gz"))) == 3
+        lines = (tmp_path / "index.cdxj").read_text().splitlines()
+        assert len(lines) == 3
+        entry = json.loads(lines[2].split(" ", 2)[2])
+        record = read_warc_record(tmp_path / entry["filename"], entry["offset"], entry["length"])
+        assert record.target_uri == "https://example.com/2"
+
+
+class TestWARCFetcher:
+    def _archive(self, tmp_path):
+        from crawlit.pipelines.warc_writer import WARCWriter
+        writer = WARCWriter(tmp_path)
+        writer.process(_warc_artifact("https://example.com", "<html>Grüße</html>",
+                                      content_type="text/html; charset=iso-8859-1"))
+        writer.process(_warc_artifact("https://example.com/gone", "", status=404))
+        writer.close()
+
+    @pytest.mark.parametrize("use_index", [True, False])
+    def test_replays_archived_response(self, tmp_path, use_index):
+        from crawlit.fetchers import WARCFetcher
+        self._archive(tmp_path)
+        fetcher = WARCFetcher(tmp_path, use_index=use_index)
+        assert len(fetcher) == 2
+
+        result = fetcher.fetch("https://example.com")
+        assert result.success is True
+        assert result.text == "<html>Grüße</html>"
+        assert result.raw_bytes == "<html>Grüße</html>".encode("iso-8859-1")
+
+        gone = fetcher.fetch("https://example.com/gone")
+        assert gone.success is False and gone.status_code == 404
+        missing = fetcher.fetch("https://example.com/missing")
+        assert missing.success is False and missing.error == "Not in WARC archive"
+
+    def test_crawl_round_trip_without_network(self, tmp_path):
+        from crawlit import Crawler
+        from crawlit.fetchers import WARCFetcher
+        from crawlit.pipelines.warc_writer import WARCWriter
+
+        pages = {
+            "https://example.com": '<html><head><title>Home</title></head><body><a href="/a">a</a></body></html>',
+            "https://example.com/a": "<html><head><title>A</title></head><body>A</body></html>",
+        }
+
+        def fake_fetch(url, *args, **kwargs):
+            resp = MagicMock()
+            resp.status_code = 200
+            resp.headers = {"Content-Type": "text/html"}
+            resp.text = pages[url]
+            resp.content = pages[url].encode()
+            return (True, resp, 200)
+
+        writer = WARCWriter(tmp_path)
+        with patch("crawlit.crawler.engine.fetch_page", side_effect=fake_fetch):
+            Crawler("https://example.com", max_depth=1, respect_robots=False,
+                    pipelines=[writer]).crawl()
+        writer.close()
+
+        with patch("crawlit.crawler.engine.fetch_page") as mock_fetch:
+            replay = Crawler("https://example.com", max_depth=1, respect_robots=False,
+                             enable_content_extraction=True, fetcher=WARCFetcher(tmp_path))
+            replay.crawl()
+        mock_fetch.assert_not_called()
+        results = replay.get_results()
+        assert results["https://example.com/a"]["title"] == "A"
+        assert replay.get_artifacts()["https://example.com/a"].content.raw_html == pages["https://example.com/a"]
+
+    @pytest.mark.asyncio
+    async def test_async_crawl_replays_warc(self, tmp_path):
+        from crawlit import AsyncCrawler
+        from crawlit.fetchers import AsyncWARCFetcher
+        self._archive(tmp_path)
+        crawler = AsyncCrawler("https://example.com", max_depth=0, respect_robots=False,
+                               fetcher=AsyncWARCFetcher(tmp_path))
+        await crawler.crawl()
+        result = crawler.get_results()["https://example.com"]
+        assert result["success"] is True
+        assert crawler.get_artifacts()["https://example.com"].content.raw_html == "<html>Grüße</html>"
@@ -1,8 +1,10 @@
 """Tests for crawlit utility modules."""
 
+import os
 import re
 import time
 import asyncio
+from collections import deque
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -21,7 +23,7 @@ from crawlit.utils.errors import (
     ExtractionError, handle_fetch_error,
 )
 from crawlit.utils.event_log import (
-    CrawlEventLog, EVENT_TYPES, CRAWL_START, CRAWL_END,
+    CrawlEventLog, EVENT_TYPES, CRAWL_START, CRAWL_RESUME, CRAWL_END,
     FETCH_RETRY, FETCH_ERROR, ROBOTS_REJECT, PIPELINE_DROP,
     PIPELINE_ERROR, EXTRACTOR_ERROR, INCREMENTAL_HIT, DEDUPE_HIT,
 )
@@ -350,6 +352,162 @@ class TestContentDeduplicator:
         assert stats["duplicates_found"] == 0
         assert stats["unique_content_count"] == 1
 
+    ARTICLE = " ".join("word%d" % (i * 7 % 113) for i in range(400))
+
+    def test_near_duplicate_detection(self):
+        dd = ContentDeduplicator(near_duplicates=True)
+        page = "<html><body><p>%s</p><p>Posted %s</p></body></html>"
+        assert dd.is_duplicate(page % (self.ARTICLE, "2024-01-01 10:00"), "https://a.com/1") is False
+        assert dd.is_duplicate(page % (self.ARTICLE, "2024-03-09 17:45"), "https://a.com/2") is True
+        assert dd.is_duplicate(self.CONTENT_B, "https://b.com") is False
+        assert dd.get_duplicate_urls("https://a.com/2") == {"https://a.com/1"}
+        stats = dd.get_stats()
+        assert stats["near_duplicates"] == 1
+        assert stats["exact_duplicates"] == 0
+        assert stats["unique_content_count"] == 2
+
+    def test_near_duplicates_off_by_default(self):
+        dd = ContentDeduplicator()
+        page = "<html><body><p>%s</p><p>Posted %s</p></body></html>"
+        dd.is_duplicate(page % (self.ARTICLE, "2024-01-01"), "https://a.com/1")
+        assert dd.is_duplicate(page % (self.ARTICLE, "2024-03-09"), "https://a.com/2") is False
+
+    def test_invalid_similarity_threshold(self):
+        with pytest.raises(ValueError):
+            ContentDeduplicator(similarity_threshold=0)
+
+    def test_normalize_strips_markup_without_parsing(self):
+        dd = ContentDeduplicator()
+        html = (
+            "<html><head><style>p {}</style></head><body><!-- ad slot -->"
+            "<p>Fish &amp; chips   cost < 5</p><SCRIPT>track()</script >"
+            "<noscript>enable js</noscript><b>Hel</b>lo</body></html>"
+        )
+        assert dd._normalize_content(html) == "Fish & chips cost < 5Hello"
+
+    def test_concurrent_checks_count_each_content_once(self):
+        import threading
+        dd = ContentDeduplicator()
+        pages = ["<html><body><p>%s</p></body></html>" % (("page%d " % i) * 30) for i in range(20)]
+        duplicates = []
+
+        def worker(offset):
+            for i, page in enumerate(pages):
+                duplicates.append(dd.is_duplicate(page, "https://a.com/%d/%d" % (offset, i)))
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert duplicates.count(False) == len(pages)
+        assert dd.get_stats()["duplicates_found"] == 3 * len(pages)
+
+
+class TestPrefetchDeduplicator:
+    PAGE = "<html><head><link rel='canonical' href='/article'></head><body>text</body></html>"
+
+    def test_canonical_hint_skips_after_target_fetched(self):
+        from crawlit.utils.prefetch_dedup import PrefetchDeduplicator
+        pd = PrefetchDeduplicator(audit_rate=0)
+        pd.record_fetch("https://a.com/article?print=1", content=self.PAGE)
+        assert pd.check_url("https://a.com/article?print=1") is None
+        pd.record_fetch("https://a.com/article", content="<html>article</html>")
+        assert pd.check_url("https://a.com/article?print=1") == "https://a.com/article"
+        stats = pd.get_stats()
+        assert stats["skipped_by_reason"] == {"canonical": 1}
+        assert stats["skip_rate"] == 0.5
+
+    def test_url_rules_learned_from_duplicates(self):
+        from crawlit.utils.prefetch_dedup import PrefetchDeduplicator
+        pd = PrefetchDeduplicator(min_rule_observations=2, audit_rate=0)
+        pd.record_fetch("https://a.com/p?id=1&utm_source=x")
+        pd.record_duplicate("https://a.com/p?id=1&utm_source=y", ["https://a.com/p?id=1&utm_source=x"])
+        assert pd.check_url("https://a.com/p?id=1&utm_source=z") is None
+        pd.record_duplicate("https://a.com/p?id=1&utm_source=z", ["https://a.com/p?id=1&utm_source=x"])
+        assert pd.check_url("https://a.com/p?utm_source=q&id=1") == "https://a.com/p?id=1&utm_source=x"
+        assert pd.check_url("https://a.com/p?id=2&utm_source=q") is None
+        assert pd.get_stats()["ignored_params"] == {"a.com": ["utm_source"]}
+
+    def test_url_votes_once_per_parameter(self):
+        from crawlit.utils.prefetch_dedup import PrefetchDeduplicator
+        pd = PrefetchDeduplicator(min_rule_observations=2, audit_rate=0)
+        originals = [f"https://a.com/p?id={i}" for i in range(1, 4)]
+        for original in originals:
+            pd.record_fetch(original)
+        # One duplicate of three originals, recorded twice: still one vote
+        pd.record_duplicate("https://a.com/p?id=9", originals)
+        pd.record_duplicate("https://a.com/p?id=9", originals[:1])
+        assert pd.get_stats()["ignored_params"] == {}
+        assert pd.check_url("https://a.com/p?id=8") is None
+        pd.record_duplicate("https://a.com/p?id=8", originals)
+        assert pd.get_stats()["ignored_params"] == {"a.com": ["id"]}
+
+    def test_header_fingerprints(self):
+        from crawlit.utils.prefetch_dedup import PrefetchDeduplicator
+        pd = PrefetchDeduplicator(audit_rate=0)
+        pd.record_fetch("https://a.com/x", headers={"ETag": '"v1"', "Content-Length": "10",
+                                                     "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+        assert pd.check_headers("https://a.com/y", {"etag": '"v1"'}) == "https://a.com/x"
+        assert pd.check_headers("https://b.com/y", {"etag": '"v1"'}) is None
+        assert pd.check_headers("https://a.com/z", {
+            "Content-Length": "10", "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }) == "https://a.com/x"
+        assert pd.check_headers("https://a.com/x", {"ETag": '"v1"'}) is None
+
+    def test_audit_records_false_skips(self):
+        from crawlit.utils.prefetch_dedup import PrefetchDeduplicator
+        pd = PrefetchDeduplicator(audit_rate=1.0)
+        pd.record_fetch("https://a.com/x", headers={"ETag": '"v1"'}, content="one")
+        assert pd.check_headers("https://a.com/y", {"ETag": '"v1"'}) is None  # audited, not skipped
+        pd.record_fetch("https://a.com/y", content="two")
+        stats = pd.get_stats()
+        assert stats["audited"] == 1
+        assert stats["false_skips"] == 1
+        assert stats["audit_samples"][0]["confirmed"] is False
+
+    def test_state_persists_between_runs(self, tmp_path):
+        from crawlit.utils.prefetch_dedup import PrefetchDeduplicator
+        path = tmp_path / "prefetch.json"
+        first = PrefetchDeduplicator(state_path=path, min_rule_observations=1, audit_rate=0)
+        first.record_fetch("https://a.com/article?print=1", content=self.PAGE)
+        first.record_duplicate("https://a.com/p?s=1", ["https://a.com/p?s=2"])
+        first.save()
+        second = PrefetchDeduplicator(state_path=path, audit_rate=0)
+        second.record_fetch("https://a.com/article")
+        second.record_fetch("https://a.com/p?s=9")
+        assert second.check_url("https://a.com/article?print=1") == "https://a.com/article"
+        assert second.check_url("https://a.com/p?s=3") == "https://a.com/p?s=9"
+
+    def test_disabled(self):
+        from crawlit.utils.prefetch_dedup import PrefetchDeduplicator
+        pd = PrefetchDeduplicator(enabled=False)
+        pd.record_fetch("https://a.com/x", headers={"ETag": '"v1"'})
+        assert pd.check_headers("https://a.com/y", {"ETag": '"v1"'}) is None
+        assert pd.get_stats()["checked"] == 0
+
+
+class TestSimHash:
+    def test_similar_texts_are_close(self):
+        from crawlit.utils.deduplication import simhash, hamming_distance
+        base = " ".join("w%d" % (i * 13 % 997) for i in range(2000))
+        assert hamming_distance(simhash(base), simhash(base + " extra words here")) <= 3
+        other = " ".join("v%d" % (i * 17 % 991) for i in range(2000))
+        assert hamming_distance(simhash(base), simhash(other)) > 10
+        assert simhash("") == 0
+
+    def test_index_finds_within_distance(self):
+        from crawlit.utils.deduplication import SimHashIndex
+        index = SimHashIndex(max_distance=3)
+        index.add("a", 0b1011)
+        index.add("b", 1 << 63)
+        assert index.find(0b1011) == "a"
+        assert index.find(0b1011 ^ (1 << 20) ^ (1 << 40) ^ (1 << 60)) == "a"
+        assert index.find(0b1011 ^ 0b1111 << 30) is None
+        assert len(index) == 2
+        index.clear()
+        assert index.find(0b1011) is None
+
 
 # -----------------------------------------------------------------------
 # Budget Tracker
@@ -565,6 +723,7 @@ class TestHandleFetchError:
 class TestEventTypes:
     def test_all_constants_in_set(self):
         assert CRAWL_START in EVENT_TYPES
+        assert CRAWL_RESUME in EVENT_TYPES
         assert CRAWL_END in EVENT_TYPES
         assert FETCH_RETRY in EVENT_TYPES
         assert FETCH_ERROR in EVENT_TYPES
@@ -576,7 +735,7 @@ class TestEventTypes:
         assert DEDUPE_HIT in EVENT_TYPES
 
     def test_event_types_count(self):
-        assert len(EVENT_TYPES) == 10
+        assert len(EVENT_TYPES) == 11
 
 
 class TestCrawlEventLog:
@@ -725,3 +884,269 @@ class TestCrawlEventLog:
         log.emit("CRAWL_START")
         log.close()
         assert path.exists()
+
+
+class TestBufferedLineWriter:
+    def test_buffers_until_flush(self, tmp_path):
+        from crawlit.utils.buffered_writer import BufferedLineWriter
+        path = tmp_path / "out.jsonl"
+        writer = BufferedLineWriter(path, flush_interval=60)
+        writer.write('{"a": 1}')
+        writer.write('{"a": 2}')
+        assert path.read_text() == ""
+        writer.flush()
+        assert path.read_text() == '{"a": 1}\n{"a": 2}\n'
+        writer.write('{"a": 3}')
+        writer.close()
+        writer.close()  # idempotent
+        assert path.read_text().count("\n") == 3
+        with pytest.raises(ValueError):
+            writer.write("late")
+
+    def test_write_many(self, tmp_path):
+        from crawlit.utils.buffered_writer import BufferedLineWriter
+        buffered = BufferedLineWriter(tmp_path / "buffered.jsonl", flush_interval=60)
+        direct = BufferedLineWriter(tmp_path / "direct.jsonl", flush_interval=0)
+        for writer in (buffered, direct):
+            writer.write("a")
+            writer.write_many(["b", b"c"])
+            writer.write_many([])
+            writer.close()
+        assert (tmp_path / "buffered.jsonl").read_text() == "a\nb\nc\n"
+        assert (tmp_path / "direct.jsonl").read_text() == "a\nb\nc\n"
+
+    def test_background_and_size_triggered_flush(self, tmp_path):
+        from crawlit.utils.buffered_writer import BufferedLineWriter
+        timed = BufferedLineWriter(tmp_path / "timed.jsonl", flush_interval=0.05)
+        timed.write("x")
+        sized = BufferedLineWriter(tmp_path / "sized.jsonl", flush_interval=60, buffer_size=10)
+        sized.write("0123456789")
+        deadline = time.time() + 2
+        while time.time() < deadline and not (
+            (tmp_path / "timed.jsonl").read_text() and (tmp_path / "sized.jsonl").read_text()
+        ):
+            time.sleep(0.01)
+        assert (tmp_path / "timed.jsonl").read_text() == "x\n"
+        assert (tmp_path / "sized.jsonl").read_text() == "0123456789\n"
+        timed.close()
+        sized.close()
+
+    def test_write_through_and_fsync_policy(self, tmp_path):
+        from crawlit.utils.buffered_writer import BufferedLineWriter
+        path = tmp_path / "out.jsonl"
+        writer = BufferedLineWriter(path, append=False, flush_interval=0, fsync="flush")
+        writer.write("now")
+        assert path.read_text() == "now\n"
+        writer.close()
+        with pytest.raises(ValueError):
+            BufferedLineWriter(path, fsync="sometimes")
+
+    def test_concurrent_writes_keep_whole_lines(self, tmp_path):
+        import threading
+        from crawlit.utils.buffered_writer import BufferedLineWriter
+        path = tmp_path / "out.jsonl"
+        writer = BufferedLineWriter(path, flush_interval=0.01, buffer_size=256)
+
+        def produce(n):
+            for i in range(200):
+                writer.write(f"{n}-{i}")
+
+        threads = [threading.Thread(target=produce, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        writer.close()
+        lines = path.read_text().splitlines()
+        assert sorted(lines) == sorted(f"{n}-{i}" for n in range(4) for i in range(200))
+        # Per-producer order is preserved
+        assert [l for l in lines if l.startswith("0-")] == [f"0-{i}" for i in range(200)]
+
+
+class TestCheckpoint:
+    def _state(self, n):
+        queue = deque((f"https://a.com/q{i}", 1) for i in range(3))
+        visited = {f"https://a.com/{i}" for i in range(n)}
+        results = {f"https://a.com/{i}": {"status": 200, "depth": 1, "html_content": f"<p>{i}</p>",
+                                          "links": [], "title": f"page {i}"} for i in range(n)}
+        return queue, visited, results
+
+    def test_snapshot_roundtrip_stores_html_by_reference(self, tmp_path):
+        from crawlit.utils.checkpoint import CheckpointWriter, html_ref, load_checkpoint
+        path = str(tmp_path / "crawl.ckpt")
+        queue, visited, results = self._state(10)
+        assert CheckpointWriter(path).write(queue, visited, results, {"start_url": "https://a.com"}) == "snapshot"
+        loaded_queue, loaded_visited, loaded_results, metadata = load_checkpoint(path)
+        assert list(loaded_queue) == list(queue)
+        assert loaded_visited == visited
+        assert metadata == {"start_url": "https://a.com"}
+        record = loaded_results["https://a.com/3"]
+        assert "html_content" not in record
+        assert record["html_content_ref"] == html_ref("<p>3</p>")
+        assert record["title"] == "page 3"
+
+    def test_html_modes(self, tmp_path):
+        from crawlit.utils.checkpoint import CheckpointWriter, load_checkpoint
+        queue, visited, results = self._state(2)
+        CheckpointWriter(str(tmp_path / "inline.ckpt"), html="inline").write(queue, visited, results)
+        CheckpointWriter(str(tmp_path / "omit.ckpt"), html="omit").write(queue, visited, results)
+        assert load_checkpoint(str(tmp_path / "inline.ckpt"))[2] == results
+        omitted = load_checkpoint(str(tmp_path / "omit.ckpt"))[2]["https://a.com/0"]
+        assert "html_content" not in omitted and "html_content_ref" not in omitted
+        with pytest.raises(ValueError):
+            CheckpointWriter(str(tmp_path / "x.ckpt"), html="gzip")
+
+    def test_incremental_deltas_append_and_update_header(self, tmp_path):
+        from crawlit.utils.checkpoint import CheckpointWriter, load_checkpoint, read_checkpoint_info
+        path = str(tmp_path / "crawl.ckpt")
+        queue, visited, results = self._state(5)
+        writer = CheckpointWriter(path, chunk_size=2)
+        writer.write(queue, visited, results)
+        size = os.path.getsize(path)
+
+        queue.popleft()
+        queue.append(("https://a.com/q9", 2))
+        visited.add("https://a.com/5")
+        results["https://a.com/5"] = {"status": 404, "depth": 2}
+        assert writer.write(queue, visited, results, {"step": 2}) == "delta"
+        assert os.path.getsize(path) > size
+
+        info = read_checkpoint_info(path)
+        assert info["visited_count"] == 6 and info["results_count"] == 6
+        assert info["queue_size"] == 3 and info["deltas"] == 1
+        assert info["metadata"] == {"step": 2}
+        loaded_queue, loaded_visited, loaded_results, _ = load_checkpoint(path)
+        assert list(loaded_queue) == list(queue)
+        assert loaded_visited == visited
+        assert loaded_results["https://a.com/5"] == {"status": 404, "depth": 2}
+
+    def test_snapshot_every_compacts(self, tmp_path):
+        from crawlit.utils.checkpoint import CheckpointWriter, read_checkpoint_info
+        path = str(tmp_path / "crawl.ckpt")
+        queue, visited, results = self._state(3)
+        writer = CheckpointWriter(path, snapshot_every=1)
+        assert [writer.write(queue, visited, results) for _ in range(3)] == ["snapshot", "delta", "snapshot"]
+        assert writer.write(queue, visited, results, incremental=False) == "snapshot"
+        assert read_checkpoint_info(path)["deltas"] == 0
+
+    def test_incomplete_trailing_delta_is_ignored(self, tmp_path):
+        from crawlit.utils.checkpoint import CheckpointWriter, load_checkpoint
+        path = str(tmp_path / "crawl.ckpt")
+        queue, visited, results = self._state(3)
+        writer = CheckpointWriter(path)
+        writer.write(queue, visited, results)
+        complete = os.path.getsize(path)
+        visited.add("https://a.com/new")
+        writer.write(queue, visited, results)
+        with open(path, "r+b") as f:
+            f.truncate(complete + 10)
+        assert "https://a.com/new" not in load_checkpoint(path)[1]
+        assert len(load_checkpoint(path)[1]) == 3
+
+    def test_queue_manager_picks_format_by_extension(self, tmp_path):
+        from crawlit.utils.checkpoint import is_checkpoint
+        from crawlit.utils.queue_manager import QueueManager
+        queue, visited, results = self._state(2)
+        for name in ("state.json", "state.ckpt"):
+            path = str(tmp_path / name)
+            QueueManager.save_state(queue, visited, results, path, {"k": 1})
+            assert is_checkpoint(path) == name.endswith(".ckpt")
+            loaded_queue, loaded_visited, _, metadata = QueueManager.load_state(path)
+            assert list(loaded_queue) == list(queue)
+            assert loaded_visited == visited and metadata == {"k": 1}
+        with pytest.raises(ValueError):
+            QueueManager.save_state(queue, visited, results, path, format="xml")
+
+    def test_compaction_keeps_results_from_the_file(self, tmp_path):
+        from crawlit.utils.checkpoint import CheckpointWriter, load_checkpoint
+        path = str(tmp_path / "crawl.ckpt")
+        writer = CheckpointWriter(path, snapshot_every=1)
+        visited = {"https://a.com/0"}
+        writer.write([], visited, {"https://a.com/0": {"status": 200}})
+        visited.add("https://a.com/1")
+        writer.write([], visited, {"https://a.com/1": {"status": 200}})
+        visited.add("https://a.com/2")
+        # Only the new result is passed; the snapshot still holds all three
+        assert writer.write([], visited, {"https://a.com/2": {"status": 200}}) == "snapshot"
+        assert sorted(load_checkpoint(path)[2]) == sorted(visited)
+
+    def test_append_writes_deltas_and_compacts_without_decoding(self, tmp_path):
+        from crawlit.utils import checkpoint
+        path = str(tmp_path / "crawl.ckpt")
+        writer = checkpoint.CheckpointWriter(path, snapshot_every=1, chunk_size=2)
+        assert writer.append([("https://a.com/q0", 1)], ["https://a.com/0"],
+                             {"https://a.com/0": {"status": 200}}) == "snapshot"
+        with patch.object(checkpoint, "_decoder", side_effect=AssertionError("decoded")):
+            kinds = [writer.append([(f"https://a.com/q{i}", 1)], [f"https://a.com/{i}"],
+                                   {f"https://a.com/{i}": {"status": 200}}) for i in (1, 2, 3)]
+        assert kinds == ["delta", "snapshot", "delta"]
+        queue, visited, results, _ = checkpoint.load_checkpoint(path)
+        assert list(queue) == [("https://a.com/q3", 1)]
+        assert visited == set(results) == {f"https://a.com/{i}" for i in range(4)}
+        info = checkpoint.read_checkpoint_info(path)
+        assert info["visited_count"] == info["results_count"] == 4
+        assert writer._written_visited is None  # append keeps no per-URL state
+
+    def test_write_after_append_appends_only_new_urls(self, tmp_path):
+        from crawlit.utils.checkpoint import CheckpointWriter, read_checkpoint_info
+        path = str(tmp_path / "crawl.ckpt")
+        queue, visited, results = self._state(3)
+        writer = CheckpointWriter(path)
+        writer.append(queue, visited, results)
+        visited.add("https://a.com/3")
+        assert writer.write(queue, visited, results) == "delta"
+        assert read_checkpoint_info(path)["visited_count"] == 4
+
+
+class TestPeriodicCheckpointer:
+    def test_page_count_triggers_checkpoint_and_stop_writes_final(self, tmp_path):
+        from crawlit.utils.checkpoint import (
+            CheckpointWriter, PeriodicCheckpointer, load_checkpoint, read_checkpoint_info,
+        )
+        path = str(tmp_path / "crawl.ckpt")
+        state = {"visited": [], "pending": {}}
+
+        def snapshot():
+            visited, state["visited"] = state["visited"], []
+            pending, state["pending"] = state["pending"], {}
+            return [], visited, pending, {"run": 1}
+
+        checkpointer = PeriodicCheckpointer(CheckpointWriter(path), snapshot,
+                                            interval=None, every_pages=2)
+        checkpointer.start()
+        for i in range(2):
+            url = f"https://a.com/{i}"
+            state["visited"].append(url)
+            state["pending"][url] = {"status": 200}
+            checkpointer.page_done()
+        deadline = time.time() + 5
+        while checkpointer.checkpoints < 1 and time.time() < deadline:
+            time.sleep(0.01)
+        assert checkpointer.checkpoints == 1
+        assert len(load_checkpoint(path)[1]) == 2
+
+        state["visited"].append("https://a.com/2")
+        state["pending"]["https://a.com/2"] = {"status": 404}
+        checkpointer.stop()
+        _, visited, results, metadata = load_checkpoint(path)
+        assert len(visited) == 3 and results["https://a.com/2"] == {"status": 404}
+        assert metadata == {"run": 1}
+        assert read_checkpoint_info(path)["visited_count"] == 3
+
+    def test_failed_checkpoint_carries_results_over(self, tmp_path):
+        from crawlit.utils.checkpoint import CheckpointWriter, PeriodicCheckpointer, load_checkpoint
+        path = str(tmp_path / "crawl.ckpt")
+        batches = [{"https://a.com/0": {"status": 200}}, {"https://a.com/1": {"status": 200}}]
+        checkpointer = PeriodicCheckpointer(
+            CheckpointWriter(path), lambda: ([], list(batches[0]), batches.pop(0), {}), interval=60)
+        with patch.object(checkpointer.writer, "append", side_effect=OSError("disk full")):
+            assert checkpointer.checkpoint() is None
+        assert checkpointer.checkpoint() == "snapshot"
+        _, visited, results, _ = load_checkpoint(path)
+        assert sorted(results) == sorted(visited) == ["https://a.com/0", "https://a.com/1"]
+
+    def test_requires_a_trigger(self, tmp_path):
+        from crawlit.utils.checkpoint import CheckpointWriter, PeriodicCheckpointer
+        with pytest.raises(ValueError):
+            PeriodicCheckpointer(CheckpointWriter(str(tmp_path / "x.ckpt")), lambda: None,
+                                 interval=None, every_pages=None)